@@ -28,6 +28,9 @@ from app.models import user, community, audit  # noqa: F401
 from app.models import password_reset  # noqa: F401
 from app.models import notification  # noqa: F401
 from app.models import design  # noqa: F401
+from app.models import scheduler  # noqa: E402, F401
+from app.models import rate_limit  # noqa: E402, F401
+from app.models import cache_version  # noqa: E402, F401
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
@@ -0,0 +1,86 @@
+"""task assignee tables
+
+Revision ID: 012_task_assignee_tables
+Revises: 011_hot_filter_indexes
+Create Date: 2026-10-17
+
+活动任务 / 检查项 / 运营任务的责任人由 JSON 数组 assignee_ids 迁移到关联表，
+回填时跳过已不存在的用户与重复 ID。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '012_task_assignee_tables'
+down_revision: Union[str, None] = '011_hot_filter_indexes'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (任务表, 关联表)
+TASK_TABLES = (
+    ('event_tasks', 'event_task_assignees'),
+    ('checklist_items', 'checklist_item_assignees'),
+    ('campaign_tasks', 'campaign_task_assignees'),
+)
+
+
+def _create_link_table(task_table: str, link_table: str) -> None:
+    op.create_table(link_table,
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('task_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('assigned_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['task_id'], [f'{task_table}.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('task_id', 'user_id', name=f'uq_{link_table}_task_user')
+    )
+    with op.batch_alter_table(link_table, schema=None) as batch_op:
+        batch_op.create_index(f'ix_{link_table}_user_task', ['user_id', 'task_id'], unique=False)
+
+
+def _backfill(conn, task_table: str, link_table: str, user_ids: set[int]) -> None:
+    tasks = sa.table(task_table, sa.column('id', sa.Integer), sa.column('assignee_ids', sa.JSON))
+    links = sa.table(link_table, sa.column('task_id', sa.Integer), sa.column('user_id', sa.Integer))
+    rows = []
+    for task_id, assignee_ids in conn.execute(sa.select(tasks.c.id, tasks.c.assignee_ids)):
+        for uid in dict.fromkeys(assignee_ids or []):
+            if uid in user_ids:
+                rows.append({'task_id': task_id, 'user_id': uid})
+    if rows:
+        op.bulk_insert(links, rows)
+
+
+def _restore(conn, task_table: str, link_table: str) -> None:
+    tasks = sa.table(task_table, sa.column('id', sa.Integer), sa.column('assignee_ids', sa.JSON))
+    links = sa.table(link_table, sa.column('id', sa.Integer), sa.column('task_id', sa.Integer),
+                     sa.column('user_id', sa.Integer))
+    by_task: dict[int, list[int]] = {}
+    for task_id, uid in conn.execute(sa.select(links.c.task_id, links.c.user_id).order_by(links.c.id)):
+        by_task.setdefault(task_id, []).append(uid)
+    for task_id, user_ids in by_task.items():
+        conn.execute(tasks.update().where(tasks.c.id == task_id).values(assignee_ids=user_ids))
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    user_ids = set(conn.execute(sa.text('SELECT id FROM users')).scalars())
+    for task_table, link_table in TASK_TABLES:
+        _create_link_table(task_table, link_table)
+        _backfill(conn, task_table, link_table, user_ids)
+        with op.batch_alter_table(task_table, schema=None) as batch_op:
+            batch_op.drop_column('assignee_ids')
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    for task_table, link_table in reversed(TASK_TABLES):
+        with op.batch_alter_table(task_table, schema=None) as batch_op:
+            batch_op.add_column(sa.Column('assignee_ids', sa.JSON(), nullable=True))
+        _restore(conn, task_table, link_table)
+        with op.batch_alter_table(link_table, schema=None) as batch_op:
+            batch_op.drop_index(f'ix_{link_table}_user_task')
+        op.drop_table(link_table)
@@ -0,0 +1,111 @@
+"""user work items
+
+Revision ID: 016_user_work_items
+Revises: 015_campaign_contact_assignee_index
+Create Date: 2026-10-17
+
+个人负责事项投影表，按现有责任人数据回填。
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '016_user_work_items'
+down_revision: Union[str, None] = '015_campaign_contact_assignee_index'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TASK_STATUS = (
+    "CASE {s} WHEN 'not_started' THEN 'planning' WHEN 'in_progress' THEN 'in_progress' "
+    "WHEN 'completed' THEN 'completed' WHEN 'blocked' THEN 'in_progress' ELSE 'planning' END"
+)
+
+# 事项类型 -> (FROM 子句, 责任人, 所属活动, 状态列, 工作状态表达式, 截止时间列, 截止时间是否为日期)
+_SOURCES = {
+    "content": (
+        "contents t JOIN content_assignees a ON a.content_id = t.id", "a.user_id", "NULL", "t.status",
+        "CASE WHEN t.work_status IN ('planning', 'in_progress', 'completed') THEN t.work_status END",
+        "t.scheduled_publish_at", False,
+    ),
+    "meeting": (
+        "meetings t JOIN meeting_assignees a ON a.meeting_id = t.id", "a.user_id", "NULL", "t.status",
+        "CASE t.status WHEN 'scheduled' THEN 'planning' WHEN 'in_progress' THEN 'in_progress' "
+        "WHEN 'completed' THEN 'completed' WHEN 'cancelled' THEN 'completed' ELSE 'planning' END",
+        "t.scheduled_at", False,
+    ),
+    "event_task": (
+        "event_tasks t JOIN event_task_assignees a ON a.task_id = t.id", "a.user_id", "t.event_id", "t.status",
+        _TASK_STATUS.format(s="t.status"), "t.end_date", True,
+    ),
+    "checklist_item": (
+        "checklist_items t JOIN checklist_item_assignees a ON a.task_id = t.id", "a.user_id", "t.event_id",
+        "t.status", "CASE WHEN t.status IN ('done', 'skipped') THEN 'completed' ELSE 'planning' END",
+        "t.due_date", True,
+    ),
+    "campaign_task": (
+        "campaign_tasks t JOIN campaign_task_assignees a ON a.task_id = t.id", "a.user_id", "t.campaign_id",
+        "t.status", _TASK_STATUS.format(s="t.status"), "t.deadline", True,
+    ),
+    "design_task": (
+        "design_tasks t", "t.assignee_id", "NULL", "t.status",
+        "CASE t.status WHEN 'not_started' THEN 'planning' WHEN 'in_progress' THEN 'in_progress' "
+        "WHEN 'review' THEN 'in_progress' WHEN 'completed' THEN 'completed' ELSE 'planning' END",
+        "t.due_date", True,
+    ),
+}
+
+
+def _backfill(item_type: str, dialect: str) -> str:
+    source, user_id, parent_id, status, work_status, due_at, is_date = _SOURCES[item_type]
+    if is_date:
+        # 日期型截止日取当天 00:00（SQLite 的 CAST AS TIMESTAMP 会得到数值，需用 datetime()）
+        due_at = f"datetime({due_at})" if dialect == "sqlite" else f"CAST({due_at} AS TIMESTAMP)"
+    return f"""
+INSERT INTO user_work_items (user_id, item_type, item_id, parent_id, title, status, work_status, due_at, updated_at)
+SELECT DISTINCT {user_id}, '{item_type}', t.id, {parent_id}, t.title, CAST({status} AS VARCHAR(50)),
+    {work_status}, {due_at}, CURRENT_TIMESTAMP
+FROM {source}
+WHERE {user_id} IS NOT NULL
+"""
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('user_work_items',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('item_type', sa.String(length=30), nullable=False),
+    sa.Column('item_id', sa.Integer(), nullable=False),
+    sa.Column('parent_id', sa.Integer(), nullable=True),
+    sa.Column('title', sa.String(length=500), nullable=False),
+    sa.Column('status', sa.String(length=50), nullable=True),
+    sa.Column('work_status', sa.String(length=20), nullable=True),
+    sa.Column('due_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'item_type', 'item_id', name='uq_user_work_items_user_item')
+    )
+    with op.batch_alter_table('user_work_items', schema=None) as batch_op:
+        batch_op.create_index('ix_user_work_items_item', ['item_type', 'item_id'], unique=False)
+        batch_op.create_index('ix_user_work_items_user_due', ['user_id', 'due_at', 'id'], unique=False)
+        batch_op.create_index('ix_user_work_items_user_type_due', ['user_id', 'item_type', 'due_at', 'id'], unique=False)
+
+    # ### end Alembic commands ###
+    dialect = op.get_bind().dialect.name
+    for item_type in _SOURCES:
+        op.execute(_backfill(item_type, dialect))
+
+
+def downgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('user_work_items', schema=None) as batch_op:
+        batch_op.drop_index('ix_user_work_items_user_type_due')
+        batch_op.drop_index('ix_user_work_items_user_due')
+        batch_op.drop_index('ix_user_work_items_item')
+
+    op.drop_table('user_work_items')
+    # ### end Alembic commands ###
@@ -1,4 +1,4 @@
-"""管理员专用 API — 配置 Schema 查询 + 审计日志查询。"""
+"""管理员专用 API — 配置 Schema 查询 + 审计日志查询 + 定时任务执行历史 + 路由性能汇总 + 只读副本状态。"""
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query
@@ -6,8 +6,11 @@ from sqlalchemy.orm import Session
 
 from app.config import Settings, settings
 from app.core.dependencies import get_current_active_superuser, get_current_admin_or_superuser
-from app.database import get_db
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total
+from app.core.sql_instrumentation import route_sql_summary
+from app.database import get_read_db, replica_router
 from app.models.audit import AuditLog
+from app.models.scheduler import SchedulerJobRun, SchedulerLease
 from app.models.user import User
 
 router = APIRouter()
@@ -17,6 +20,7 @@ _SENSITIVE_FIELDS = {
     "JWT_SECRET_KEY",
     "DEFAULT_ADMIN_PASSWORD",
     "SMTP_PASSWORD",
+    "DATABASE_REPLICA_URLS",
     "S3_SECRET_KEY",
 }
 
@@ -49,6 +53,8 @@ def get_config_schema(
 
 # ─── 审计日志 ───────────────────────────────────────────────────────────────────
 
+AUDIT_KEYSET = Keyset(AuditLog.created_at, AuditLog.id, descending=True)
+
 @router.get("/audit-logs")
 def list_audit_logs(
     action: str | None = Query(None, description="操作类型过滤，如 create_content"),
@@ -59,8 +65,10 @@ def list_audit_logs(
     to_date: datetime | None = Query(None, description="结束时间（ISO 8601）"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=200),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
     current_user: User = Depends(get_current_admin_or_superuser),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """分页查询审计日志，需要管理员或超级管理员权限。"""
     query = (
@@ -80,13 +88,9 @@ def list_audit_logs(
     if to_date:
         query = query.filter(AuditLog.created_at <= to_date)
 
-    total = query.count()
-    rows = (
-        query.order_by(AuditLog.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
-    )
+    totals = page_total(db, query, include_total=include_total, cursor=cursor)
+    rows = AUDIT_KEYSET.apply(query, cursor=cursor, offset=(page - 1) * page_size, limit=page_size).all()
+    rows, next_cursor = AUDIT_KEYSET.page(rows, page_size, key=lambda row: row[0])
 
     items = [
         {
@@ -103,4 +107,90 @@ def list_audit_logs(
         }
         for log, uname, fname in rows
     ]
+    return {"items": items, "page": page, "page_size": page_size, "next_cursor": next_cursor, **totals}
+
+
+# ─── 定时任务 ───────────────────────────────────────────────────────────────────
+
+@router.get("/scheduler/leases")
+def list_scheduler_leases(
+    current_user: User = Depends(get_current_active_superuser),
+    db: Session = Depends(get_read_db),
+):
+    """查看调度器 Leader 租约（当前由哪个 worker 执行定时任务），仅超级管理员可访问。"""
+    leases = db.query(SchedulerLease).order_by(SchedulerLease.name).all()
+    return [
+        {
+            "name": lease.name,
+            "holder_id": lease.holder_id,
+            "acquired_at": lease.acquired_at.isoformat() if lease.acquired_at else None,
+            "heartbeat_at": lease.heartbeat_at.isoformat() if lease.heartbeat_at else None,
+            "expires_at": lease.expires_at.isoformat() if lease.expires_at else None,
+        }
+        for lease in leases
+    ]
+
+
+@router.get("/scheduler/runs")
+def list_scheduler_runs(
+    job_id: str | None = Query(None, description="任务 ID 过滤，如 issue_sync"),
+    status: str | None = Query(None, description="状态过滤：running / success / failed"),
+    page: int = Query(1, ge=1),
+    page_size: int = Query(20, ge=1, le=200),
+    current_user: User = Depends(get_current_active_superuser),
+    db: Session = Depends(get_read_db),
+):
+    """分页查询定时任务执行历史（开始/结束时间、耗时、结果），仅超级管理员可访问。"""
+    query = db.query(SchedulerJobRun)
+    if job_id:
+        query = query.filter(SchedulerJobRun.job_id == job_id)
+    if status:
+        query = query.filter(SchedulerJobRun.status == status)
+
+    total = query.count()
+    runs = (
+        query.order_by(SchedulerJobRun.started_at.desc(), SchedulerJobRun.id.desc())
+        .offset((page - 1) * page_size)
+        .limit(page_size)
+        .all()
+    )
+
+    items = [
+        {
+            "id": run.id,
+            "job_id": run.job_id,
+            "holder_id": run.holder_id,
+            "status": run.status,
+            "started_at": run.started_at.isoformat() if run.started_at else None,
+            "finished_at": run.finished_at.isoformat() if run.finished_at else None,
+            "duration_ms": run.duration_ms,
+            "result": run.result,
+            "error": run.error,
+        }
+        for run in runs
+    ]
     return {"items": items, "total": total, "page": page, "page_size": page_size}
+
+
+# ─── 性能观测 ───────────────────────────────────────────────────────────────────
+
+@router.get("/perf/routes")
+def list_route_perf(
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """按路由汇总最近请求的 SQL 语句数、数据库耗时与疑似 N+1 次数（当前 worker 进程内统计）。
+
+    按窗口内数据库总耗时降序排列，仅超级管理员可访问。
+    """
+    return {"window": settings.PERF_ROUTE_WINDOW, "routes": route_sql_summary.snapshot()}
+
+
+@router.get("/db/replicas")
+def list_db_replicas(
+    current_user: User = Depends(get_current_active_superuser),
+):
+    """只读副本健康状态（当前 worker 进程视角），未配置 DATABASE_REPLICA_URLS 时为空列表。"""
+    return {
+        "sticky_seconds": settings.DB_REPLICA_STICKY_SECONDS,
+        "replicas": replica_router.status() if replica_router is not None else [],
+    }
@@ -6,7 +6,7 @@ from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_admin_or_superuser, get_current_community, get_current_user
 from app.core.logging import get_logger
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import User
 from app.models.channel import ChannelConfig
 from app.models.content import Content
@@ -25,7 +25,7 @@ SENSITIVE_FIELDS = {"app_secret", "cookie", "token", "secret", "password", "api_
 @router.get("/overview", response_model=AnalyticsOverview)
 def get_overview(
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     获取当前社区的内容发布分析概览。
@@ -82,7 +82,7 @@ def _mask_sensitive_config(config: dict) -> dict:
 def get_channel_settings(
     community_id: int = Depends(get_current_community),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     获取当前社区所有渠道配置（含默认渠道）。
@@ -177,7 +177,7 @@ def update_channel_settings(
 def get_publish_trend(
     days: int = 30,
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     获取最近 N 天内每天的发布数量（仅统计 published 状态），用于趋势折线图。
@@ -213,7 +213,7 @@ def get_publish_trend(
 def get_content_analytics(
     content_id: int,
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     获取指定内容的发布分析数据（含发布渠道统计）。
@@ -1,10 +1,14 @@
 import os
 
 from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, UploadFile
-from sqlalchemy.orm import Session
-
-from app.core.dependencies import get_current_community, get_current_user
-from app.database import get_db
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from starlette.concurrency import run_in_threadpool
+
+from app.core.dependencies import get_current_community_async, get_current_user_async
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total_async
+from app.database import get_async_db, get_async_read_db
 from app.models.design import Asset
 from app.models.user import User
 from app.schemas.design import AssetOut, AssetUpdate
@@ -19,6 +23,8 @@ ALLOWED_ASSET_EXTENSIONS = {
 }
 MAX_ASSET_SIZE = 50 * 1024 * 1024  # 50 MB
 
+LIST_KEYSET = Keyset(Asset.created_at, Asset.id, descending=True)
+
 
 def _build_asset_out(asset: Asset) -> AssetOut:
     uploader_name = None
@@ -41,18 +47,28 @@ def _build_asset_out(asset: Asset) -> AssetOut:
     )
 
 
-def _check_asset_permission(asset: Asset, current_user: User, db: Session) -> None:
+async def _get_asset(db: AsyncSession, asset_id: int, community_id: int) -> Asset | None:
+    """按 ID 加载社区素材，并预加载上传者（异步 Session 不支持隐式懒加载）。"""
+    result = await db.execute(
+        select(Asset)
+        .where(Asset.id == asset_id, Asset.community_id == community_id)
+        .options(selectinload(Asset.uploader))
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
+
+
+async def _check_asset_permission(asset: Asset, current_user: User, db: AsyncSession) -> None:
     """上传者或社区管理员/超级用户可操作。"""
     if current_user.is_superuser:
         return
     if asset.uploaded_by_user_id == current_user.id:
         return
-    from sqlalchemy import text
-
-    row = db.execute(
+    result = await db.execute(
         text("SELECT role FROM community_users WHERE user_id = :uid AND community_id = :cid"),
         {"uid": current_user.id, "cid": asset.community_id},
-    ).fetchone()
+    )
+    row = result.fetchone()
     if row and row[0] == "admin":
         return
     raise HTTPException(status_code=403, detail="没有权限操作此素材")
@@ -65,32 +81,39 @@ async def list_assets(
     tags: str | None = Query(None, description="逗号分隔的标签列表"),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> dict:
     """列出社区素材库（支持过滤和分页）。"""
-    query = db.query(Asset).filter(Asset.community_id == community_id)
+    query = select(Asset).where(Asset.community_id == community_id)
     if asset_type:
-        query = query.filter(Asset.asset_type == asset_type)
+        query = query.where(Asset.asset_type == asset_type)
     if keyword:
-        query = query.filter(Asset.name.ilike(f"%{keyword}%"))
+        query = query.where(Asset.name.ilike(f"%{keyword}%"))
 
-    total = query.count()
-    assets = query.order_by(Asset.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
+    totals = await page_total_async(db, query, include_total=include_total, cursor=cursor)
+    query = LIST_KEYSET.apply(
+        query.options(selectinload(Asset.uploader)), cursor=cursor, offset=(page - 1) * page_size, limit=page_size
+    )
+    assets, next_cursor = LIST_KEYSET.page((await db.execute(query)).scalars().all(), page_size)
 
     # Filter by tags in Python (JSON column filtering is DB-specific)
     items = [_build_asset_out(a) for a in assets]
     if tags:
         tag_list = [t.strip() for t in tags.split(",") if t.strip()]
         items = [a for a in items if any(tag in a.tags for tag in tag_list)]
-        total = len(items)
+        if totals["total"] is not None:
+            totals = {"total": len(items), "total_exact": True}
 
     return {
         "items": items,
-        "total": total,
         "page": page,
         "page_size": page_size,
+        "next_cursor": next_cursor,
+        **totals,
     }
 
 
@@ -101,9 +124,9 @@ async def upload_asset(
     asset_type: str = Form(...),
     description: str | None = Form(None),
     tags: str | None = Form(None, description="逗号分隔的标签"),
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> AssetOut:
     """上传素材文件并创建素材记录。"""
     valid_types = {"image", "icon", "brand_file", "template"}
@@ -126,7 +149,7 @@ async def upload_asset(
 
     storage = get_storage()
     key = StorageService.generate_key(ext, "assets")
-    file_url = storage.save(file_content, key)
+    file_url = await run_in_threadpool(storage.save, file_content, key)
 
     tag_list = [t.strip() for t in tags.split(",") if t.strip()] if tags else []
 
@@ -143,20 +166,19 @@ async def upload_asset(
         uploaded_by_user_id=current_user.id,
     )
     db.add(asset)
-    db.commit()
-    db.refresh(asset)
-    return _build_asset_out(asset)
+    await db.commit()
+    return _build_asset_out(await _get_asset(db, asset.id, community_id))
 
 
 @router.get("/{asset_id}", response_model=AssetOut)
 async def get_asset(
     asset_id: int,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> AssetOut:
     """获取素材详情。"""
-    asset = db.query(Asset).filter(Asset.id == asset_id, Asset.community_id == community_id).first()
+    asset = await _get_asset(db, asset_id, community_id)
     if not asset:
         raise HTTPException(status_code=404, detail="素材不存在")
     return _build_asset_out(asset)
@@ -166,43 +188,42 @@ async def get_asset(
 async def update_asset(
     asset_id: int,
     data: AssetUpdate,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> AssetOut:
     """更新素材元数据（名称、描述、标签等）。"""
-    asset = db.query(Asset).filter(Asset.id == asset_id, Asset.community_id == community_id).first()
+    asset = await _get_asset(db, asset_id, community_id)
     if not asset:
         raise HTTPException(status_code=404, detail="素材不存在")
-    _check_asset_permission(asset, current_user, db)
+    await _check_asset_permission(asset, current_user, db)
 
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(asset, field, value)
-    db.commit()
-    db.refresh(asset)
-    return _build_asset_out(asset)
+    await db.commit()
+    return _build_asset_out(await _get_asset(db, asset.id, community_id))
 
 
 @router.delete("/{asset_id}", status_code=204)
 async def delete_asset(
     asset_id: int,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """删除素材（同时从存储中删除文件）。"""
-    asset = db.query(Asset).filter(Asset.id == asset_id, Asset.community_id == community_id).first()
+    asset = await _get_asset(db, asset_id, community_id)
     if not asset:
         raise HTTPException(status_code=404, detail="素材不存在")
-    _check_asset_permission(asset, current_user, db)
+    await _check_asset_permission(asset, current_user, db)
 
     # Delete from storage
     try:
         storage = get_storage()
-        storage.delete(asset.file_key)
+        await run_in_threadpool(storage.delete, asset.file_key)
     except Exception:
         pass  # Storage deletion failure should not block DB record deletion
 
-    db.delete(asset)
-    db.commit()
+    await db.delete(asset)
+    await db.commit()
@@ -2,15 +2,17 @@ import secrets
 from datetime import timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, Request, status
+from slowapi.util import get_remote_address
 from sqlalchemy.orm import Session
 
 from app.config import settings
 from app.core.dependencies import get_current_active_superuser, get_current_user
 from app.core.logging import get_logger
+from app.core.principal_cache import invalidate_principal_cache
 from app.core.rate_limit import limiter
 from app.core.security import create_access_token, get_password_hash, verify_password
 from app.core.timezone import utc_now
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import User
 from app.models.password_reset import PasswordResetToken
 from app.schemas import (
@@ -33,7 +35,7 @@ logger = get_logger(__name__)
 
 
 @router.get("/status", response_model=SystemStatusResponse)
-def get_system_status(db: Session = Depends(get_db)):
+def get_system_status(db: Session = Depends(get_read_db)):
     """
     Check if the system needs initial setup.
     Returns True if only the default admin exists (no real admin has been created).
@@ -51,7 +53,7 @@ def get_system_status(db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-@limiter.limit(settings.RATE_LIMIT_LOGIN)
+@limiter.limit(settings.RATE_LIMIT_LOGIN, key_func=get_remote_address)
 def login(request: Request, login_request: LoginRequest, db: Session = Depends(get_db)):
     """
     User login endpoint.
@@ -143,6 +145,7 @@ def initial_setup(
     # Delete the default admin account
     db.delete(current_user)
 
+    invalidate_principal_cache(db)
     db.commit()
     db.refresh(new_admin)
 
@@ -209,7 +212,7 @@ def register(
 @router.get("/me", response_model=UserInfoResponse)
 def get_current_user_info(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get current user information and their accessible communities with roles.
@@ -287,6 +290,7 @@ def update_current_user_profile(
     if profile_update.new_password is not None:
         current_user.hashed_password = get_password_hash(profile_update.new_password)
 
+    invalidate_principal_cache(db)
     db.commit()
     db.refresh(current_user)
     logger.info("用户 %s 更新了个人资料", current_user.username)
@@ -296,7 +300,7 @@ def update_current_user_profile(
 @router.get("/users", response_model=list[UserOut])
 def list_all_users(
     current_user: User = Depends(get_current_active_superuser),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     List all users in the system.
@@ -359,6 +363,7 @@ def update_user(
     for field, value in update_data.items():
         setattr(target_user, field, value)
 
+    invalidate_principal_cache(db)
     db.commit()
     db.refresh(target_user)
     return target_user
@@ -399,6 +404,7 @@ def delete_user(
             )
 
     db.delete(target_user)
+    invalidate_principal_cache(db)
     db.commit()
 
 
@@ -491,6 +497,7 @@ def confirm_password_reset(
     user.hashed_password = get_password_hash(reset_confirm.new_password)
     reset_token.used = True
 
+    invalidate_principal_cache(db)
     db.commit()
 
     return {"message": "密码已成功重置，请使用新密码登录。"}
@@ -6,9 +6,11 @@ from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
 from app.core.dependencies import get_current_user
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total
 from app.core.timezone import utc_now
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import User
+from app.models.assignee import known_assignees
 from app.models.campaign import Campaign, CampaignActivity, CampaignContact, CampaignTask
 from app.models.committee import Committee, CommitteeMember
 from app.models.event import Event, EventAttendee
@@ -38,6 +40,9 @@ from app.schemas.campaign import (
 
 router = APIRouter()
 
+# 联系人按加入顺序分页
+CONTACT_KEYSET = Keyset(CampaignContact.id)
+
 VALID_TYPES = {
     "default", "community_care", "developer_care",  # 新版三类
     "promotion", "care", "invitation", "survey",   # 旧版兼容
@@ -53,7 +58,7 @@ def list_campaigns(
     type: str | None = None,
     status: str | None = None,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     query = db.query(Campaign)
     if type:
@@ -86,7 +91,7 @@ def create_campaign(
 def get_campaign(
     cid: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     campaign = db.query(Campaign).filter(
         Campaign.id == cid
@@ -138,7 +143,7 @@ def delete_campaign(
 def campaign_funnel(
     cid: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     campaign = db.query(Campaign).filter(
         Campaign.id == cid
@@ -169,8 +174,10 @@ def list_contacts(
     status: str | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     campaign = db.query(Campaign).filter(
         Campaign.id == cid
@@ -180,9 +187,12 @@ def list_contacts(
     query = db.query(CampaignContact).filter(CampaignContact.campaign_id == cid)
     if status:
         query = query.filter(CampaignContact.status == status)
-    total = query.count()
-    items = query.options(joinedload(CampaignContact.person)).offset((page - 1) * page_size).limit(page_size).all()
-    return PaginatedContacts(items=items, total=total, page=page, page_size=page_size)
+    totals = page_total(db, query, include_total=include_total, cursor=cursor)
+    query = CONTACT_KEYSET.apply(
+        query.options(joinedload(CampaignContact.person)), cursor=cursor, offset=(page - 1) * page_size, limit=page_size
+    )
+    items, next_cursor = CONTACT_KEYSET.page(query.all(), page_size)
+    return PaginatedContacts(items=items, page=page, page_size=page_size, next_cursor=next_cursor, **totals)
 
 
 @router.post("/{cid}/contacts", response_model=ContactOut, status_code=201)
@@ -333,7 +343,7 @@ def import_from_people(
 def list_available_committees(
     cid: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """列出该运营活动关联社区下的所有委员会（用于 community_care 类型导入选择）。"""
     campaign = db.query(Campaign).filter(Campaign.id == cid).first()
@@ -566,7 +576,7 @@ def list_activities(
     cid: int,
     contact_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     contact = db.query(CampaignContact).filter(
         CampaignContact.id == contact_id,
@@ -619,7 +629,7 @@ def add_activity(
 def list_campaign_tasks(
     cid: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取运营活动的任务列表"""
     campaign = db.query(Campaign).filter(Campaign.id == cid).first()
@@ -648,7 +658,7 @@ def create_campaign_task(
     task = CampaignTask(
         campaign_id=cid,
         created_by_id=current_user.id,
-        **data.model_dump(),
+        **known_assignees(db, data.model_dump()),
     )
     db.add(task)
     db.commit()
@@ -670,7 +680,7 @@ def update_campaign_task(
     ).first()
     if not task:
         raise HTTPException(404, "任务不存在")
-    for field, value in data.model_dump(exclude_unset=True).items():
+    for field, value in known_assignees(db, data.model_dump(exclude_unset=True)).items():
         setattr(task, field, value)
     db.commit()
     db.refresh(task)
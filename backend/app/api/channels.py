@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_active_superuser, get_current_community
 from app.core.security import encrypt_value
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import User
 from app.models.channel import ChannelConfig
 from app.schemas.publish import ChannelConfigCreate, ChannelConfigOut, ChannelConfigUpdate
@@ -42,7 +42,7 @@ def _config_to_out(cfg: ChannelConfig) -> ChannelConfigOut:
 @router.get("", response_model=list[ChannelConfigOut])
 def list_channels(
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """列出当前社区已配置的渠道。"""
     configs = (
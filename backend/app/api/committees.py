@@ -10,7 +10,7 @@ from app.core.dependencies import (
     get_current_community,
     get_current_user,
 )
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import Committee, CommitteeMember, User
 from app.schemas.governance import (
     CommitteeCreate,
@@ -62,7 +62,7 @@ def _committee_to_out(committee: Committee) -> dict:
 def list_committees(
     community_id: int = Depends(get_current_community),
     is_active: bool | None = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取当前社区的委员会列表。"""
     query = db.query(Committee).filter(Committee.community_id == community_id)
@@ -109,7 +109,7 @@ def create_committee(
 def get_committee(
     committee_id: int,
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取委员会详情，包含所有成员信息。"""
     committee = _get_committee_or_404(committee_id, community_id, db)
@@ -159,7 +159,7 @@ def list_members(
     community_id: int = Depends(get_current_community),
     role: str | None = Query(None, description="按角色筛选"),
     is_active: bool | None = Query(None),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取委员会成员列表。"""
     committee = _get_committee_or_404(committee_id, community_id, db)
@@ -210,7 +210,7 @@ def export_members_csv(
     committee_id: int,
     community_id: int = Depends(get_current_community),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """导出委员会成员为CSV文件（需要社区管理员权限）。"""
     committee = _get_committee_or_404(committee_id, community_id, db)
@@ -408,7 +408,7 @@ def get_member(
     committee_id: int,
     member_id: int,
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取成员详情。"""
     _get_committee_or_404(committee_id, community_id, db)
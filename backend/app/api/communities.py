@@ -10,7 +10,8 @@ from app.core.dependencies import (
     get_user_community_role,
 )
 from app.core.logging import get_logger
-from app.database import get_db
+from app.core.principal_cache import invalidate_principal_cache
+from app.database import get_db, get_read_db
 from app.models import Community, User
 from app.models.user import community_users
 from app.schemas import (
@@ -36,7 +37,7 @@ def list_communities(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get paginated list of communities accessible to current user.
@@ -108,6 +109,7 @@ def create_community(
     )
     db.execute(stmt)
 
+    invalidate_principal_cache(db)
     db.commit()
     db.refresh(new_community)
 
@@ -118,7 +120,7 @@ def create_community(
 def get_community(
     community_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get community details including members.
@@ -261,6 +263,7 @@ def delete_community(
         )
 
     db.delete(community)
+    invalidate_principal_cache(db)
     db.commit()
 
 
@@ -268,7 +271,7 @@ def delete_community(
 def get_community_users(
     community_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get users of a community with their roles.
@@ -341,6 +344,7 @@ def add_user_to_community(
 
     # Add user to community
     community.members.append(user)
+    invalidate_principal_cache(db)
     db.commit()
     db.refresh(community)
     return community
@@ -379,6 +383,7 @@ def remove_user_from_community(
 
     # Remove user from community
     community.members.remove(user)
+    invalidate_principal_cache(db)
     db.commit()
     db.refresh(community)
     return community
@@ -441,6 +446,7 @@ def update_user_role(
         .values(role=role)
     )
     db.execute(stmt)
+    invalidate_principal_cache(db)
     db.commit()
 
     return {"message": f"User role updated to {role} successfully"}
@@ -450,7 +456,7 @@ def update_user_role(
 def get_email_settings(
     community_id: int,
     current_user: User = Depends(get_current_active_superuser),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取社区 SMTP 邮件配置（仅超级管理员可访问，凭证属于敏感信息）。"""
     community = db.query(Community).filter(Community.id == community_id).first()
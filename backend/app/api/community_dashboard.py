@@ -7,16 +7,18 @@
 权限：社区成员（admin / user）均可访问，Superuser 可访问任意社区。
 """
 
-from datetime import timedelta
+from datetime import date, timedelta
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy import case, func, select
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 
+from app.config import settings
+from app.core.conditional import VersionSource, conditional_response, version_token
 from app.core.dependencies import get_current_user, get_user_community_role
 from app.core.logging import get_logger
-from app.core.timezone import utc_now
-from app.database import get_db
+from app.core.timezone import get_app_tz, utc_now
+from app.database import get_read_db
 from app.models import Community, User
 from app.models.campaign import Campaign
 from app.models.channel import ChannelConfig
@@ -32,12 +34,16 @@ from app.schemas.community_dashboard import (
     CommunityDashboardResponse,
     CommunityMetrics,
     CommunityOverviewItem,
+    MetricsHistoryPoint,
+    MetricsHistoryResponse,
     MonthlyTrend,
     RecentCampaignItem,
     RecentContentItem,
     SuperuserOverviewResponse,
     UpcomingMeetingItem,
 )
+from app.services.community_counters import all_community_counts, community_counts
+from app.services.community_metrics import GRANULARITIES, metrics_history
 
 router = APIRouter()
 logger = get_logger(__name__)
@@ -45,11 +51,56 @@ logger = get_logger(__name__)
 
 # ── 社区工作台 ────────────────────────────────────────────────────────
 
+def _dashboard_version_sources(community_id: int) -> list[VersionSource]:
+    """社区工作台依赖的数据范围（用于 ETag 版本令牌）。"""
+    return [
+        VersionSource(Community, Community.id == community_id, watch=[Community.updated_at]),
+        VersionSource(Content, Content.community_id == community_id, watch=[Content.updated_at]),
+        VersionSource(Committee, Committee.community_id == community_id, watch=[Committee.updated_at]),
+        VersionSource(community_users, community_users.c.community_id == community_id),
+        VersionSource(Meeting, Meeting.community_id == community_id, watch=[Meeting.updated_at]),
+        VersionSource(
+            ChannelConfig,
+            ChannelConfig.community_id == community_id,
+            ChannelConfig.enabled == True,  # noqa: E712
+        ),
+        VersionSource(Campaign, Campaign.community_id == community_id, watch=[Campaign.updated_at]),
+        VersionSource(
+            PublishRecord,
+            PublishRecord.community_id == community_id,
+            PublishRecord.status == "published",
+            watch=[PublishRecord.id, PublishRecord.published_at],
+        ),
+        VersionSource(Event, Event.community_id == community_id, watch=[Event.updated_at]),
+    ]
+
+
+def _community_metrics(db: Session, community_id: int, now) -> CommunityMetrics:
+    """指标卡片：读取社区计数行，即将召开的会议数随时间变化，按索引实时统计。"""
+    upcoming_meetings = db.scalar(
+        select(func.count()).select_from(Meeting).where(
+            Meeting.community_id == community_id,
+            Meeting.status == "scheduled",
+            Meeting.scheduled_at >= now,
+        )
+    )
+    return CommunityMetrics(**community_counts(db, community_id), upcoming_meetings=upcoming_meetings)
+
+
+def _month_bucket(db: Session, column):
+    """按 "YYYY-MM" 分组的月份表达式（PostgreSQL 按 UTC 取月份，SQLite 存储即为 UTC）。"""
+    if db.get_bind().dialect.name == "postgresql":
+        return func.to_char(func.timezone("UTC", column), "YYYY-MM").label("month")
+    return func.strftime("%Y-%m", column).label("month")
+
+
 @router.get("/{community_id}/dashboard", response_model=CommunityDashboardResponse)
 def get_community_dashboard(
     community_id: int,
+    request: Request,
+    response: Response,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     获取社区工作台聚合数据。
@@ -62,6 +113,8 @@ def get_community_dashboard(
     - 即将召开的 5 场会议
     - 日历事件（近 30 天 + 未来 60 天）
 
+    支持条件请求：携带上次响应的 ETag（If-None-Match），数据未变化时返回 304。
+
     权限：社区成员（admin / user）均可访问。
     """
     # 权限校验：验证用户有权访问该社区
@@ -80,105 +133,33 @@ def get_community_dashboard(
             detail="社区不存在",
         )
 
-    now = utc_now()
-
-    # ── 1. 指标卡片聚合（单批查询）──────────────────────────────────────
-
-    # 内容指标（4 个）—— 用分开的 count 查询，兼容 SQLite 和 PostgreSQL
-    total_contents = db.query(Content).filter(Content.community_id == community_id).count()
-    published_contents = (
-        db.query(Content)
-        .filter(Content.community_id == community_id, Content.status == "published")
-        .count()
-    )
-    pending_review_contents = (
-        db.query(Content)
-        .filter(Content.community_id == community_id, Content.status == "reviewing")
-        .count()
-    )
-    draft_contents = (
-        db.query(Content)
-        .filter(Content.community_id == community_id, Content.status == "draft")
-        .count()
-    )
-
-    # 治理指标（4 个）
-    committees_count = (
-        db.query(Committee)
-        .filter(Committee.community_id == community_id)
-        .count()
-    )
-
-    members_count = db.execute(
-        select(func.count()).select_from(community_users).where(
-            community_users.c.community_id == community_id
-        )
-    ).scalar() or 0
-
-    upcoming_meetings_count = (
-        db.query(Meeting)
-        .filter(
-            Meeting.community_id == community_id,
-            Meeting.scheduled_at >= now,
-            Meeting.status == "scheduled",
-        )
-        .count()
-    )
+    etag = version_token(db, *_dashboard_version_sources(community_id), scope=("community", community_id))
+    cached = conditional_response(request, response, etag, max_age=settings.HTTP_CACHE_DASHBOARD_MAX_AGE)
+    if cached is not None:
+        return cached
 
-    active_channels_count = (
-        db.query(ChannelConfig)
-        .filter(
-            ChannelConfig.community_id == community_id,
-            ChannelConfig.enabled == True,  # noqa: E712
-        )
-        .count()
-    )
+    now = utc_now()
 
-    active_campaigns_count = (
-        db.query(Campaign)
-        .filter(
-            Campaign.community_id == community_id,
-            Campaign.status == "active",
-        )
-        .count()
-    )
+    # ── 1. 指标卡片（社区计数表）────────────────────────────────────────
 
-    metrics = CommunityMetrics(
-        total_contents=total_contents,
-        published_contents=published_contents,
-        reviewing_contents=pending_review_contents,
-        draft_contents=draft_contents,
-        total_committees=committees_count,
-        total_members=members_count,
-        upcoming_meetings=upcoming_meetings_count,
-        active_channels=active_channels_count,
-        active_campaigns=active_campaigns_count,
-    )
+    metrics = _community_metrics(db, community_id, now)
 
-    # ── 2. 发布趋势（近 6 个月）──────────────────────────────────────────
+    # ── 2. 发布趋势（近 6 个月，数据库按月分组）────────────────────────
 
     six_months_ago = now - timedelta(days=180)
-
-    # 查询近 6 个月已发布的记录
-    published_records = (
-        db.query(
-            PublishRecord.published_at,
-        )
-        .filter(
-            PublishRecord.community_id == community_id,
-            PublishRecord.status == "published",
-            PublishRecord.published_at >= six_months_ago,
-        )
-        .all()
+    month = _month_bucket(db, PublishRecord.published_at)
+    month_counts = dict(
+        db.execute(
+            select(month, func.count())
+            .where(
+                PublishRecord.community_id == community_id,
+                PublishRecord.status == "published",
+                PublishRecord.published_at >= six_months_ago,
+            )
+            .group_by(month)
+        ).all()
     )
 
-    # 按年月聚合
-    month_counts: dict[str, int] = {}
-    for (published_at,) in published_records:
-        if published_at:
-            month_key = published_at.strftime("%Y-%m")
-            month_counts[month_key] = month_counts.get(month_key, 0) + 1
-
     # 生成连续 6 个月的趋势数据（补零）
     publish_trend = []
     for i in range(5, -1, -1):
@@ -209,30 +190,24 @@ def get_community_dashboard(
 
     # ── 4. 最近 5 条内容 ───────────────────────────────────────────────
 
-    recent_raw = (
-        db.query(Content)
-        .filter(Content.community_id == community_id)
+    recent_raw = db.execute(
+        select(Content, User.full_name, User.username)
+        .outerjoin(User, User.id == Content.owner_id)
+        .where(Content.community_id == community_id)
         .order_by(Content.created_at.desc())
         .limit(5)
-        .all()
-    )
-    # 预取 owner 用户名
-    recent_contents = []
-    for c in recent_raw:
-        owner_name = None
-        if c.owner_id:
-            owner = db.query(User).filter(User.id == c.owner_id).first()
-            owner_name = owner.full_name or owner.username if owner else None
-        recent_contents.append(
-            RecentContentItem(
-                id=c.id,
-                title=c.title,
-                status=c.status,
-                work_status=c.work_status or "planning",
-                created_at=c.created_at,
-                owner_name=owner_name,
-            )
+    ).all()
+    recent_contents = [
+        RecentContentItem(
+            id=c.id,
+            title=c.title,
+            status=c.status,
+            work_status=c.work_status or "planning",
+            created_at=c.created_at,
+            owner_name=full_name or username,
         )
+        for c, full_name, username in recent_raw
+    ]
 
     # ── 4b. 近期运营活动（最近 5 条 active/draft 活动）────────────────
 
@@ -246,13 +221,19 @@ def get_community_dashboard(
         .limit(5)
         .all()
     )
+    # 所有活动的 owner 一次 IN 查询取回
+    owner_ids = {oid for camp in recent_campaigns_raw for oid in camp.owner_ids or []}
+    owner_display: dict[int, str] = {}
+    if owner_ids:
+        owner_display = {
+            uid: full_name or username
+            for uid, full_name, username in db.execute(
+                select(User.id, User.full_name, User.username).where(User.id.in_(owner_ids))
+            )
+        }
     recent_campaigns: list[RecentCampaignItem] = []
     for camp in recent_campaigns_raw:
-        owner_names: list[str] = []
-        for oid in (camp.owner_ids or []):
-            owner = db.query(User).filter(User.id == oid).first()
-            if owner:
-                owner_names.append(owner.full_name or owner.username)
+        owner_names = [owner_display[oid] for oid in camp.owner_ids or [] if oid in owner_display]
         recent_campaigns.append(
             RecentCampaignItem(
                 id=camp.id,
@@ -344,34 +325,33 @@ def get_community_dashboard(
         )
         .all()
     )
-    # 内容发布事件（绿色 #10b981）
-    publish_events = (
-        db.query(PublishRecord)
-        .filter(
+    # 内容发布事件（绿色 #10b981）：同一内容只取第一条发布记录，标题随记录一并取出
+    publish_events = db.execute(
+        select(PublishRecord.id, PublishRecord.content_id, PublishRecord.published_at, Content.title)
+        .join(Content, Content.id == PublishRecord.content_id)
+        .where(
             PublishRecord.community_id == community_id,
             PublishRecord.status == "published",
             PublishRecord.published_at >= cal_start,
             PublishRecord.published_at <= cal_end,
         )
-        .all()
-    )
+        .order_by(PublishRecord.id)
+    ).all()
     seen_content_ids = set()
-    for pr in publish_events:
-        if pr.content_id not in seen_content_ids:
-            seen_content_ids.add(pr.content_id)
-            content = db.query(Content).filter(Content.id == pr.content_id).first()
-            if content:
-                calendar_events.append(
-                    CalendarEvent(
-                        id=pr.id,
-                        type="publish",
-                        title=content.title,
-                        date=pr.published_at,
-                        color="#10b981",
-                        resource_id=pr.content_id,
-                        resource_type="content",
-                    )
+    for record_id, content_id, published_at, title in publish_events:
+        if content_id not in seen_content_ids:
+            seen_content_ids.add(content_id)
+            calendar_events.append(
+                CalendarEvent(
+                    id=record_id,
+                    type="publish",
+                    title=title,
+                    date=published_at,
+                    color="#10b981",
+                    resource_id=content_id,
+                    resource_type="content",
                 )
+            )
 
     # 排期内容事件（橙色 #f59e0b）—— 已设排期但尚未发布的内容
     scheduled_contents = (
@@ -436,8 +416,8 @@ def get_community_dashboard(
         "工作台数据加载完成",
         extra={
             "community_id": community_id,
-            "contents": total_contents,
-            "meetings": upcoming_meetings_count,
+            "contents": metrics.total_contents,
+            "meetings": metrics.upcoming_meetings,
             "events": len(calendar_events),
         },
     )
@@ -456,18 +436,76 @@ def get_community_dashboard(
     )
 
 
+# ── 社区指标历史 ────────────────────────────────────────────────────
+
+@router.get("/{community_id}/metrics/history", response_model=MetricsHistoryResponse)
+def get_community_metrics_history(
+    community_id: int,
+    from_: date | None = Query(None, alias="from", description="起始日期（含），默认结束日期前 90 天"),
+    to: date | None = Query(None, description="结束日期（含），默认今天"),
+    granularity: str = Query("day", description="汇总粒度：day / week / month"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+):
+    """
+    获取社区指标历史（长周期趋势图）。
+
+    只读取每日快照表 community_metrics_daily，不查询内容、发布记录等业务表。
+    按周 / 月汇总时，时点指标（内容数、成员数等）取区间内最后一天的快照，
+    当日发生量（发布数、会议数、阅读数）求和；没有快照的区间不返回。
+
+    权限：社区成员（admin / user）均可访问。
+    """
+    if not current_user.is_superuser:
+        role = get_user_community_role(current_user, community_id, db)
+        if role is None:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="无权访问该社区",
+            )
+
+    if granularity not in GRANULARITIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"granularity 仅支持 {' / '.join(GRANULARITIES)}",
+        )
+
+    end = to or utc_now().astimezone(get_app_tz()).date()
+    start = from_ or end - timedelta(days=90)
+    if start > end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="起始日期不能晚于结束日期",
+        )
+
+    if db.scalar(select(Community.id).where(Community.id == community_id)) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="社区不存在",
+        )
+
+    points = metrics_history(db, community_id, start, end, granularity)
+    return MetricsHistoryResponse(
+        community_id=community_id,
+        granularity=granularity,
+        start_date=start,
+        end_date=end,
+        points=[MetricsHistoryPoint(**point) for point in points],
+    )
+
+
 # ── 超管社区总览 ────────────────────────────────────────────────────
 
 @router.get("/overview/stats", response_model=SuperuserOverviewResponse)
 def get_superuser_overview(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     获取平台所有社区的汇总统计（仅超级管理员可用）。
 
-    解决 N+1 查询问题：使用聚合 SQL 一次性返回所有社区统计，
-    而非对每个社区逐一发起请求。
+    解决 N+1 查询问题：计数读取社区计数表，会议与最近活动时间用聚合 SQL
+    一次性返回，而非对每个社区逐一发起请求。
     """
     if not current_user.is_superuser:
         raise HTTPException(
@@ -478,48 +516,11 @@ def get_superuser_overview(
     now = utc_now()
     communities = db.query(Community).order_by(Community.created_at.desc()).all()
 
-    # 批量查询各社区统计（避免 N+1）
-    # 成员数
-    member_counts = dict(
-        db.execute(
-            select(
-                community_users.c.community_id,
-                func.count(community_users.c.user_id).label("cnt"),
-            ).group_by(community_users.c.community_id)
-        ).all()
-    )
-
-    # 内容数 & 已发布数 & 待审核数
-    content_rows = db.execute(
-        select(
-            Content.community_id,
-            func.count(Content.id).label("total"),
-            func.sum(
-                case((Content.status == "published", 1), else_=0)
-            ).label("published"),
-            func.sum(
-                case((Content.status == "reviewing", 1), else_=0)
-            ).label("reviewing"),
-        ).group_by(Content.community_id)
-    ).all()
-    content_stats_map = {
-        row.community_id: {
-            "total": row.total or 0,
-            "published": row.published or 0,
-            "reviewing": row.reviewing or 0,
-        }
-        for row in content_rows
-    }
-
-    # 委员会数
-    committee_counts = dict(
-        db.execute(
-            select(
-                Committee.community_id,
-                func.count(Committee.id).label("cnt"),
-            ).group_by(Committee.community_id)
-        ).all()
-    )
+    # 各社区计数（计数表每个社区一行；尚无计数行的社区现算）
+    counts = all_community_counts(db)
+    for community in communities:
+        if community.id not in counts:
+            counts[community.id] = community_counts(db, community.id)
 
     # 即将召开会议数
     upcoming_meeting_counts = dict(
@@ -534,18 +535,6 @@ def get_superuser_overview(
         ).all()
     )
 
-    # 活跃渠道数
-    channel_counts = dict(
-        db.execute(
-            select(
-                ChannelConfig.community_id,
-                func.count(ChannelConfig.id).label("cnt"),
-            ).where(
-                ChannelConfig.enabled == True  # noqa: E712
-            ).group_by(ChannelConfig.community_id)
-        ).all()
-    )
-
     # 最近活动时间（最新内容的 created_at）
     latest_content_rows = db.execute(
         select(
@@ -559,7 +548,7 @@ def get_superuser_overview(
     overview_items = []
     for community in communities:
         cid = community.id
-        cs = content_stats_map.get(cid, {"total": 0, "published": 0, "reviewing": 0})
+        cs = counts[cid]
         overview_items.append(
             CommunityOverviewItem(
                 id=cid,
@@ -567,19 +556,19 @@ def get_superuser_overview(
                 slug=community.slug,
                 logo_url=community.logo_url,
                 is_active=community.is_active,
-                members_count=member_counts.get(cid, 0),
-                contents_count=cs["total"],
-                published_count=cs["published"],
-                pending_review_count=cs["reviewing"],
-                committees_count=committee_counts.get(cid, 0),
+                members_count=cs["total_members"],
+                contents_count=cs["total_contents"],
+                published_count=cs["published_contents"],
+                pending_review_count=cs["reviewing_contents"],
+                committees_count=cs["total_committees"],
                 upcoming_meetings_count=upcoming_meeting_counts.get(cid, 0),
-                active_channels_count=channel_counts.get(cid, 0),
+                active_channels_count=cs["active_channels"],
                 last_activity_at=latest_activity_map.get(cid),
             )
         )
 
-    total_members = sum(member_counts.values()) if member_counts else 0
-    total_contents = sum(cs["total"] for cs in content_stats_map.values())
+    total_members = sum(counts[c.id]["total_members"] for c in communities)
+    total_contents = sum(counts[c.id]["total_contents"] for c in communities)
 
     return SuperuserOverviewResponse(
         total_communities=len(communities),
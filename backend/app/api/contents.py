@@ -3,17 +3,24 @@ from datetime import datetime
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import insert, or_
 from sqlalchemy import select as sa_select
-from sqlalchemy.orm import Session, joinedload
-
-from app.core.dependencies import check_content_edit_permission, get_current_community, get_current_user
-from app.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, defer, joinedload, load_only, selectinload
+
+from app.core.dependencies import (
+    check_content_edit_permission,
+    get_current_community_async,
+    get_current_user,
+    get_current_user_async,
+)
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total
+from app.core.responses import model_response
+from app.database import get_async_db, get_async_read_db, get_db, get_read_db
 from app.models import Content, User
 from app.models.content import content_communities
 from app.models.design import Asset
 from app.schemas.content import (
     ContentCalendarOut,
     ContentCreate,
-    ContentListOut,
     ContentOut,
     ContentScheduleUpdate,
     ContentStatusUpdate,
@@ -28,6 +35,8 @@ router = APIRouter()
 VALID_STATUSES = {"draft", "reviewing", "approved", "published"}
 VALID_SOURCE_TYPES = {"contribution", "release_note", "event_summary"}
 
+LIST_KEYSET = Keyset(Content.updated_at, Content.id, descending=True)
+
 
 def _build_community_filter(community_id: int):
     """返回社区内容过滤条件（OR 逻辑，兼容遷移期间）。
@@ -53,6 +62,13 @@ def _get_content_community_ids(db: Session, content_id: int) -> list[int]:
     return [r[0] for r in rows]
 
 
+def _content_out(db: Session, content: Content) -> ContentOut:
+    """ORM 内容 → ContentOut（assignee_ids 为模型属性，community_ids 需单独查询）。"""
+    out = ContentOut.model_validate(content)
+    out.community_ids = _get_content_community_ids(db, content.id)
+    return out
+
+
 def _write_content_communities(db: Session, content_id: int, community_ids: list[int], linked_by_id: int | None) -> None:
     """向 content_communities 写入关联行（幂等，已存在则跳过）。"""
     existing = {r[0] for r in db.query(content_communities.c.community_id).filter(
@@ -73,13 +89,15 @@ def _write_content_communities(db: Session, content_id: int, community_ids: list
 def list_contents(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
     status: str | None = None,
     source_type: str | None = None,
     keyword: str | None = None,
     community_id: int | None = Query(None),
     unscheduled: bool = Query(False, description="若为 true，只返回未设置 scheduled_publish_at 的内容"),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     query = db.query(Content)
     if community_id is not None:
@@ -93,23 +111,19 @@ def list_contents(
         query = query.filter(Content.title.contains(keyword))
     if unscheduled:
         query = query.filter(Content.scheduled_publish_at.is_(None))
-    total = query.count()
-    items_raw = (
-        query
-        .options(joinedload(Content.assignees))
-        .order_by(Content.updated_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-        .all()
+    totals = page_total(db, query, include_total=include_total, cursor=cursor)
+    query = query.options(
+        joinedload(Content.assignees),
+        defer(Content.content_markdown),  # 列表不返回正文
+        defer(Content.content_html),
+    )
+    rows = LIST_KEYSET.apply(query, cursor=cursor, offset=(page - 1) * page_size, limit=page_size).all()
+    items_raw, next_cursor = LIST_KEYSET.page(rows, page_size)
+    # ContentListOut 直接读取 ORM 属性（assignee_names 为模型属性），只校验一次
+    return model_response(
+        PaginatedContents,
+        {"items": items_raw, "page": page, "page_size": page_size, "next_cursor": next_cursor, **totals},
     )
-    items = [
-        ContentListOut(
-            **{c.name: getattr(item, c.name) for c in item.__table__.columns},
-            assignee_names=[u.full_name or u.username for u in item.assignees],
-        )
-        for item in items_raw
-    ]
-    return PaginatedContents(items=items, total=total, page=page, page_size=page_size)
 
 
 @router.post("", response_model=ContentOut, status_code=201)
@@ -154,30 +168,20 @@ def create_content(
 
     db.commit()
     db.refresh(content)
-    content_dict = {
-        **{c.name: getattr(content, c.name) for c in content.__table__.columns},
-        "assignee_ids": [a.id for a in content.assignees],
-        "community_ids": _get_content_community_ids(db, content.id),
-    }
-    return content_dict
+    return _content_out(db, content)
 
 
 @router.get("/{content_id}", response_model=ContentOut)
 def get_content(
     content_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     content = db.query(Content).filter(Content.id == content_id).first()
     if not content:
         raise HTTPException(404, "Content not found")
 
-    content_dict = {
-        **{c.name: getattr(content, c.name) for c in content.__table__.columns},
-        "assignee_ids": [a.id for a in content.assignees],
-        "community_ids": _get_content_community_ids(db, content_id),
-    }
-    return content_dict
+    return model_response(ContentOut, _content_out(db, content))
 
 
 @router.put("/{content_id}", response_model=ContentOut)
@@ -228,16 +232,20 @@ def update_content(
 
     if "content_markdown" in update_data:
         update_data["content_html"] = convert_markdown_to_html(update_data["content_markdown"])
+    if "scheduled_publish_at" in update_data:
+        _reset_auto_publish(content)
     for key, value in update_data.items():
         setattr(content, key, value)
     db.commit()
     db.refresh(content)
-    content_dict = {
-        **{c.name: getattr(content, c.name) for c in content.__table__.columns},
-        "assignee_ids": [a.id for a in content.assignees],
-        "community_ids": _get_content_community_ids(db, content_id),
-    }
-    return content_dict
+    return _content_out(db, content)
+
+
+def _reset_auto_publish(content: Content) -> None:
+    """排期时间变更后重新进入定时自动发布（已成功发布的渠道不会重复发布）。"""
+    content.auto_publish_status = None
+    content.auto_publish_locked_by = None
+    content.auto_publish_locked_until = None
 
 
 @router.delete("/{content_id}", status_code=204)
@@ -278,12 +286,7 @@ def update_content_status(
     content.status = data.status
     db.commit()
     db.refresh(content)
-    content_dict = {
-        **{c.name: getattr(content, c.name) for c in content.__table__.columns},
-        "assignee_ids": [a.id for a in content.assignees],
-        "community_ids": _get_content_community_ids(db, content_id),
-    }
-    return content_dict
+    return _content_out(db, content)
 
 
 # Collaborators Management Endpoints
@@ -292,7 +295,7 @@ def update_content_status(
 def list_collaborators(
     content_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     List collaborators of a content.
@@ -401,12 +404,7 @@ def transfer_ownership(
     db.commit()
     db.refresh(content)
 
-    content_dict = {
-        **{c.name: getattr(content, c.name) for c in content.__table__.columns},
-        "assignee_ids": [a.id for a in content.assignees],
-        "community_ids": _get_content_community_ids(db, content_id),
-    }
-    return content_dict
+    return _content_out(db, content)
 
 
 # ==================== Calendar API Endpoints ====================
@@ -419,7 +417,7 @@ def list_calendar_events(
     status: str | None = None,
     community_id: int | None = Query(None),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     获取日历视图的内容事件。
@@ -458,8 +456,24 @@ def list_calendar_events(
         )
     )
 
-    items = query.order_by(Content.scheduled_publish_at.asc().nullslast()).all()
-    return items
+    # 日历只需少量列，不加载正文（content_markdown / content_html）
+    items = (
+        query.options(
+            load_only(
+                Content.id,
+                Content.title,
+                Content.status,
+                Content.source_type,
+                Content.author,
+                Content.category,
+                Content.scheduled_publish_at,
+                Content.created_at,
+            )
+        )
+        .order_by(Content.scheduled_publish_at.asc().nullslast())
+        .all()
+    )
+    return model_response(list[ContentCalendarOut], items)
 
 
 @router.patch("/{content_id}/schedule", response_model=ContentOut)
@@ -481,14 +495,10 @@ def update_content_schedule(
         raise HTTPException(403, "You don't have permission to update this content's schedule")
 
     content.scheduled_publish_at = data.scheduled_publish_at
+    _reset_auto_publish(content)
     db.commit()
     db.refresh(content)
-    content_dict = {
-        **{c.name: getattr(content, c.name) for c in content.__table__.columns},
-        "assignee_ids": [a.id for a in content.assignees],
-        "community_ids": _get_content_community_ids(db, content_id),
-    }
-    return content_dict
+    return _content_out(db, content)
 
 
 # ─── Content ↔ Asset endpoints ────────────────────────────────────────────────
@@ -515,15 +525,25 @@ def _build_asset_out_simple(asset: Asset) -> AssetOut:
     )
 
 
+async def _get_content_with_assets(db: AsyncSession, content_id: int) -> Content | None:
+    """加载内容及其素材（含上传者），异步 Session 下需显式预加载关联。"""
+    result = await db.execute(
+        sa_select(Content)
+        .where(Content.id == content_id)
+        .options(selectinload(Content.assets).selectinload(Asset.uploader))
+    )
+    return result.scalar_one_or_none()
+
+
 @router.get("/{content_id}/assets", response_model=list[AssetOut])
 async def list_content_assets(
     content_id: int,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> list[AssetOut]:
     """获取内容关联的素材列表。"""
-    content = db.query(Content).filter(Content.id == content_id).first()
+    content = await _get_content_with_assets(db, content_id)
     if not content:
         raise HTTPException(404, "Content not found")
     return [_build_asset_out_simple(a) for a in content.assets]
@@ -533,24 +553,29 @@ async def list_content_assets(
 async def link_asset_to_content(
     content_id: int,
     asset_id: int,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> AssetOut:
     """将素材关联到内容。"""
-    content = db.query(Content).filter(Content.id == content_id).first()
+    content = await _get_content_with_assets(db, content_id)
     if not content:
         raise HTTPException(404, "Content not found")
-    if not check_content_edit_permission(content, current_user, db):
+    if not await db.run_sync(lambda s: check_content_edit_permission(content, current_user, s)):
         raise HTTPException(403, "没有权限编辑此内容")
 
-    asset = db.query(Asset).filter(Asset.id == asset_id, Asset.community_id == community_id).first()
+    result = await db.execute(
+        sa_select(Asset)
+        .where(Asset.id == asset_id, Asset.community_id == community_id)
+        .options(selectinload(Asset.uploader))
+    )
+    asset = result.scalar_one_or_none()
     if not asset:
         raise HTTPException(404, "素材不存在")
 
     if asset not in content.assets:
         content.assets.append(asset)
-        db.commit()
+        await db.commit()
     return _build_asset_out_simple(asset)
 
 
@@ -558,18 +583,18 @@ async def link_asset_to_content(
 async def unlink_asset_from_content(
     content_id: int,
     asset_id: int,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """解除素材与内容的关联。"""
-    content = db.query(Content).filter(Content.id == content_id).first()
+    content = await _get_content_with_assets(db, content_id)
     if not content:
         raise HTTPException(404, "Content not found")
-    if not check_content_edit_permission(content, current_user, db):
+    if not await db.run_sync(lambda s: check_content_edit_permission(content, current_user, s)):
         raise HTTPException(403, "没有权限编辑此内容")
 
-    asset = db.query(Asset).filter(Asset.id == asset_id).first()
+    asset = await db.get(Asset, asset_id)
     if asset and asset in content.assets:
         content.assets.remove(asset)
-        db.commit()
+        await db.commit()
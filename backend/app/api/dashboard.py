@@ -1,18 +1,23 @@
 """
 个人工作台 API - 用户视角的统一视图
 """
-from collections import defaultdict
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, subqueryload
-
-from app.core.dependencies import get_current_active_superuser, get_current_user, get_db
-from app.models.campaign import Campaign, CampaignContact, CampaignTask
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload, selectinload
+
+from app.config import settings
+from app.core.conditional import VersionSource, conditional_response, version_token_async
+from app.core.dependencies import get_current_active_superuser_async, get_current_user_async
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total_async
+from app.database import get_async_db, get_async_read_db
+from app.models.campaign import Campaign, CampaignContact, CampaignTask, campaign_task_assignees
 from app.models.content import Content, content_assignees
 from app.models.design import DesignTask
-from app.models.event import ChecklistItem, Event, EventTask
+from app.models.event import ChecklistItem, Event, EventTask, checklist_item_assignees, event_task_assignees
 from app.models.meeting import Meeting, meeting_assignees
 from app.models.user import User
+from app.models.user_work_item import WORK_ITEM_TYPES, UserWorkItem
 from app.schemas.dashboard import (
     AssignedCampaignTask,
     AssignedChecklistItem,
@@ -23,17 +28,65 @@ from app.schemas.dashboard import (
     DashboardResponse,
     UpdateWorkStatusRequest,
     UserWorkloadItem,
+    WorkItemListOut,
     WorkloadOverviewResponse,
     WorkStatusStats,
 )
+from app.services.user_work_items import assigned_query, work_items_query
+from app.services.work_status_stats import (
+    WORK_ITEM_KINDS,
+    WorkStatusCount,
+    all_work_status_counts,
+    content_type_counts,
+)
 
 router = APIRouter()
 
+WORK_ITEM_KEYSET = Keyset(UserWorkItem.due_at, UserWorkItem.id)
+
+
+def _dashboard_version_sources(user_id: int) -> list[VersionSource]:
+    """个人工作台依赖的数据范围（用于 ETag 版本令牌）。"""
+    return [
+        VersionSource(content_assignees, content_assignees.c.user_id == user_id),
+        VersionSource(
+            Content,
+            Content.id.in_(select(content_assignees.c.content_id).where(content_assignees.c.user_id == user_id)),
+            watch=[Content.updated_at],
+        ),
+        VersionSource(meeting_assignees, meeting_assignees.c.user_id == user_id),
+        VersionSource(
+            Meeting,
+            Meeting.id.in_(select(meeting_assignees.c.meeting_id).where(meeting_assignees.c.user_id == user_id)),
+            watch=[Meeting.updated_at],
+        ),
+        *_task_version_sources(EventTask, event_task_assignees, user_id),
+        *_task_version_sources(ChecklistItem, checklist_item_assignees, user_id),
+        *_task_version_sources(CampaignTask, campaign_task_assignees, user_id),
+        VersionSource(DesignTask, DesignTask.assignee_id == user_id, watch=[DesignTask.updated_at]),
+        VersionSource(CampaignContact, CampaignContact.assigned_to_id == user_id, watch=[CampaignContact.updated_at]),
+        # 列表取自投影：对账修复投影时 ETag 也随之变化
+        VersionSource(UserWorkItem, UserWorkItem.user_id == user_id, watch=[UserWorkItem.updated_at]),
+    ]
+
+
+def _task_version_sources(model, link_table, user_id: int) -> list[VersionSource]:
+    return [
+        VersionSource(link_table, link_table.c.user_id == user_id),
+        VersionSource(
+            model,
+            model.id.in_(select(link_table.c.task_id).where(link_table.c.user_id == user_id)),
+            watch=[model.updated_at],
+        ),
+    ]
+
 
 @router.get("/dashboard", response_model=DashboardResponse)
 async def get_user_dashboard(
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    request: Request,
+    response: Response,
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     获取用户个人工作台数据（跨所有社区）
@@ -41,54 +94,43 @@ async def get_user_dashboard(
     - 我负责的内容（assigned_contents）
     - 我负责的会议（assigned_meetings）
     - 工作状态统计
-    """
 
-    # 获取我负责的内容（所有社区）—— subqueryload 预加载 assignees ，避免后续 len() 触发悰性加载
-    assigned_contents = (
-        db.query(Content)
-        .join(Content.assignees)
-        .filter(User.id == current_user.id)
-        .options(subqueryload(Content.assignees))
-        .order_by(Content.updated_at.desc())
-        .limit(50)
-        .all()
+    支持条件请求：携带上次响应的 ETag（If-None-Match），数据未变化时返回 304。
+    """
+    etag = await version_token_async(
+        db, *_dashboard_version_sources(current_user.id), scope=("user", current_user.id)
     )
-
-    # 获取我负责的会议（所有社区）—— subqueryload 预加载 assignees
-    assigned_meetings = (
-        db.query(Meeting)
-        .join(Meeting.assignees)
-        .filter(User.id == current_user.id)
-        .options(subqueryload(Meeting.assignees))
-        .order_by(Meeting.scheduled_at.desc())
-        .limit(50)
-        .all()
+    cached = conditional_response(request, response, etag, max_age=settings.HTTP_CACHE_DASHBOARD_MAX_AGE)
+    if cached is not None:
+        return cached
+
+    # 以下列表均从负责事项投影（user_work_items）按截止时间取前 N 条，事项按主键回表
+
+    # 获取我负责的内容（所有社区）—— selectinload 预加载 assignees / creator，异步 Session 不支持懒加载
+    assigned_contents = await _scalars(
+        db,
+        assigned_query(Content, current_user.id)
+        .options(selectinload(Content.assignees), selectinload(Content.creator))
+        .limit(50),
     )
 
-    # 统计工作状态
-    content_stats = _calculate_work_status_stats(assigned_contents)
-    meeting_stats = _calculate_work_status_stats(assigned_meetings)
-
-    # 获取我负责的活动任务（Python 层过滤 JSON 数组）
-    all_event_tasks = (
-        db.query(EventTask)
-        .join(Event, EventTask.event_id == Event.id)
-        .filter(EventTask.assignee_ids.isnot(None))
-        .order_by(EventTask.end_date.asc().nullslast())
-        .limit(200)
-        .all()
+    # 获取我负责的会议（所有社区）—— selectinload 预加载 assignees / created_by
+    assigned_meetings = await _scalars(
+        db,
+        assigned_query(Meeting, current_user.id)
+        .options(selectinload(Meeting.assignees), selectinload(Meeting.created_by))
+        .limit(50),
     )
-    # 过滤出包含当前用户 ID 的任务
-    my_event_tasks = [
-        t for t in all_event_tasks
-        if current_user.id in (t.assignee_ids or [])
-    ]
-    # 预查询 event 标题
-    event_ids = list({t.event_id for t in my_event_tasks})
-    event_titles: dict[int, str] = {}
-    if event_ids:
-        events = db.query(Event).filter(Event.id.in_(event_ids)).all()
-        event_titles = {e.id: e.title for e in events}
+
+    # 获取我负责的活动任务（活动标题一并取出）
+    my_event_tasks = (
+        await db.execute(
+            assigned_query(EventTask, current_user.id, Event.title)
+            .join(Event, EventTask.event_id == Event.id)
+            .options(raiseload(EventTask.assignee_links))
+            .limit(200)
+        )
+    ).all()
 
     event_task_items = [
         AssignedEventTask(
@@ -101,29 +143,20 @@ async def get_user_dashboard(
             end_date=t.end_date,
             progress=t.progress,
             event_id=t.event_id,
-            event_title=event_titles.get(t.event_id),
+            event_title=event_title,
         )
-        for t in my_event_tasks
+        for t, event_title in my_event_tasks
     ]
 
-    # 获取我负责的活动清单项（Python 层过滤 JSON 数组）
-    all_checklist_items = (
-        db.query(ChecklistItem)
-        .join(Event, ChecklistItem.event_id == Event.id)
-        .filter(ChecklistItem.assignee_ids.isnot(None))
-        .order_by(ChecklistItem.due_date.asc().nullslast())
-        .limit(200)
-        .all()
-    )
-    my_checklist_items = [
-        c for c in all_checklist_items
-        if current_user.id in (c.assignee_ids or [])
-    ]
-    # 预查询清单项所属的 event 标题（合并 event_ids）
-    checklist_event_ids = list({c.event_id for c in my_checklist_items} - set(event_ids))
-    if checklist_event_ids:
-        extra_events = db.query(Event).filter(Event.id.in_(checklist_event_ids)).all()
-        event_titles.update({e.id: e.title for e in extra_events})
+    # 获取我负责的活动清单项
+    my_checklist_items = (
+        await db.execute(
+            assigned_query(ChecklistItem, current_user.id, Event.title)
+            .join(Event, ChecklistItem.event_id == Event.id)
+            .options(raiseload(ChecklistItem.assignee_links))
+            .limit(200)
+        )
+    ).all()
 
     checklist_items_out = [
         AssignedChecklistItem(
@@ -133,29 +166,20 @@ async def get_user_dashboard(
             status=c.status,
             due_date=c.due_date,
             event_id=c.event_id,
-            event_title=event_titles.get(c.event_id),
+            event_title=event_title,
         )
-        for c in my_checklist_items
+        for c, event_title in my_checklist_items
     ]
 
-    # 获取我负责的运营活动任务（Python 层过滤 JSON 数组）
-    all_campaign_tasks = (
-        db.query(CampaignTask)
-        .filter(CampaignTask.assignee_ids.isnot(None))
-        .order_by(CampaignTask.deadline.asc().nullslast())
-        .limit(200)
-        .all()
-    )
-    my_campaign_tasks = [
-        t for t in all_campaign_tasks
-        if current_user.id in (t.assignee_ids or [])
-    ]
-    # 预查询活动名称
-    campaign_ids = list({t.campaign_id for t in my_campaign_tasks})
-    campaign_names: dict[int, str] = {}
-    if campaign_ids:
-        campaigns = db.query(Campaign).filter(Campaign.id.in_(campaign_ids)).all()
-        campaign_names = {c.id: c.name for c in campaigns}
+    # 获取我负责的运营活动任务
+    my_campaign_tasks = (
+        await db.execute(
+            assigned_query(CampaignTask, current_user.id, Campaign.name)
+            .join(Campaign, CampaignTask.campaign_id == Campaign.id)
+            .options(raiseload(CampaignTask.assignee_links))
+            .limit(200)
+        )
+    ).all()
 
     campaign_task_items = [
         AssignedCampaignTask(
@@ -165,18 +189,17 @@ async def get_user_dashboard(
             priority=t.priority,
             deadline=t.deadline,
             campaign_id=t.campaign_id,
-            campaign_name=campaign_names.get(t.campaign_id),
+            campaign_name=campaign_name,
         )
-        for t in my_campaign_tasks
+        for t, campaign_name in my_campaign_tasks
     ]
 
     # 获取分配给我的设计任务（跨所有社区）
-    my_design_tasks = (
-        db.query(DesignTask)
-        .filter(DesignTask.assignee_id == current_user.id)
-        .order_by(DesignTask.due_date.asc().nullslast())
-        .limit(100)
-        .all()
+    my_design_tasks = await _scalars(
+        db,
+        assigned_query(DesignTask, current_user.id)
+        .options(selectinload(DesignTask.content))
+        .limit(100),
     )
 
     design_task_items = [
@@ -225,6 +248,10 @@ async def get_user_dashboard(
         for meeting in assigned_meetings
     ]
 
+    # 工作状态统计：覆盖全部负责事项（不受上面列表条数限制），数据库内分组计数
+    counts = await all_work_status_counts(db, [current_user.id])
+    uid = current_user.id
+
     return DashboardResponse(
         contents=content_items,
         meetings=meeting_items,
@@ -232,41 +259,59 @@ async def get_user_dashboard(
         checklist_items=checklist_items_out,
         campaign_tasks=campaign_task_items,
         design_tasks=design_task_items,
-        content_stats=content_stats,
-        meeting_stats=meeting_stats,
-        event_task_stats=_calculate_work_status_stats(my_event_tasks),
-        checklist_item_stats=_calculate_work_status_stats(my_checklist_items),
-        campaign_task_stats=_calculate_work_status_stats(my_campaign_tasks),
-        care_contact_stats=_calculate_care_contact_stats(
-            db.query(CampaignContact)
-            .filter(CampaignContact.assigned_to_id == current_user.id)
-            .all()
-        ),
-        design_task_stats=_calculate_work_status_stats(my_design_tasks),
-        total_assigned_items=len(assigned_contents) + len(assigned_meetings) + len(my_event_tasks) + len(my_checklist_items) + len(my_campaign_tasks) + len(my_design_tasks),
+        content_stats=_stats(counts, "content", uid),
+        meeting_stats=_stats(counts, "meeting", uid),
+        event_task_stats=_stats(counts, "event_task", uid),
+        checklist_item_stats=_stats(counts, "checklist_item", uid),
+        campaign_task_stats=_stats(counts, "campaign_task", uid),
+        care_contact_stats=_stats(counts, "care_contact", uid),
+        design_task_stats=_stats(counts, "design_task", uid),
+        # 关怀联系人不计入负责事项总数
+        total_assigned_items=sum(_total(counts, kind, uid) for kind in counts if kind != "care_contact"),
     )
 
 
+@router.get("/work-items", response_model=WorkItemListOut)
+async def list_work_items(
+    item_type: str | None = Query(None, description="事项类型：" + " / ".join(WORK_ITEM_TYPES)),
+    work_status: str | None = Query(None, description="planning / in_progress / completed"),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    """我负责的全部事项（跨类型、跨社区），按截止时间排序分页；传入 cursor 时忽略 skip。"""
+    if item_type is not None and item_type not in WORK_ITEM_TYPES:
+        raise HTTPException(status_code=400, detail=f"item_type 仅支持 {' / '.join(WORK_ITEM_TYPES)}")
+
+    query = work_items_query(current_user.id, item_type, work_status)
+    totals = await page_total_async(db, query, include_total=include_total, cursor=cursor)
+    rows = await _scalars(db, WORK_ITEM_KEYSET.apply(query, cursor=cursor, offset=skip, limit=limit))
+    items, next_cursor = WORK_ITEM_KEYSET.page(rows, limit)
+    return WorkItemListOut(items=items, next_cursor=next_cursor, **totals)
+
+
 @router.get("/assigned/contents", response_model=list[AssignedItem])
 async def get_assigned_contents(
     work_status: str | None = Query(None, description="Filter by work_status"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    """获取我负责的所有内容（跨所有社区）"""
-    query = (
-        db.query(Content)
-        .join(Content.assignees)
-        .filter(User.id == current_user.id)
-    )
+    """获取我负责的内容（跨所有社区），按截止时间排序分页"""
+    query = assigned_query(Content, current_user.id)
 
     if work_status:
-        query = query.filter(Content.work_status == work_status)
+        query = query.where(UserWorkItem.work_status == work_status)
 
-    contents = (
-        query.options(subqueryload(Content.assignees))
-        .order_by(Content.updated_at.desc())
-        .all()
+    contents = await _scalars(
+        db,
+        query.options(selectinload(Content.assignees), selectinload(Content.creator))
+        .offset(skip)
+        .limit(limit),
     )
 
     return [
@@ -289,31 +334,22 @@ async def get_assigned_contents(
 @router.get("/assigned/meetings", response_model=list[AssignedItem])
 async def get_assigned_meetings(
     work_status: str | None = Query(None, description="Filter by work_status"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=200),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
-    """获取我负责的所有会议（跨所有社区）"""
-    query = (
-        db.query(Meeting)
-        .join(Meeting.assignees)
-        .filter(User.id == current_user.id)
-    )
+    """获取我负责的会议（跨所有社区），按会议时间排序分页；work_status 按会议状态映射后筛选"""
+    query = assigned_query(Meeting, current_user.id)
 
-    # Map work_status filter to meeting status
     if work_status:
-        status_mapping = {
-            'planning': 'scheduled',
-            'in_progress': 'in_progress',
-            'completed': 'completed'
-        }
-        meeting_status = status_mapping.get(work_status)
-        if meeting_status:
-            query = query.filter(Meeting.status == meeting_status)
-
-    meetings = (
-        query.options(subqueryload(Meeting.assignees))
-        .order_by(Meeting.scheduled_at.desc())
-        .all()
+        query = query.where(UserWorkItem.work_status == work_status)
+
+    meetings = await _scalars(
+        db,
+        query.options(selectinload(Meeting.assignees), selectinload(Meeting.created_by))
+        .offset(skip)
+        .limit(limit),
     )
 
     return [
@@ -337,11 +373,14 @@ async def get_assigned_meetings(
 async def update_content_work_status(
     content_id: int,
     request: UpdateWorkStatusRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """更新内容的工作状态"""
-    content = db.query(Content).filter(Content.id == content_id).first()
+    result = await db.execute(
+        select(Content).where(Content.id == content_id).options(selectinload(Content.assignees))
+    )
+    content = result.scalar_one_or_none()
 
     if not content:
         raise HTTPException(status_code=404, detail="Content not found")
@@ -355,8 +394,7 @@ async def update_content_work_status(
 
     old_status = content.work_status
     content.work_status = request.work_status
-    db.commit()
-    db.refresh(content)
+    await db.commit()
 
     return {
         "id": content.id,
@@ -370,11 +408,14 @@ async def update_content_work_status(
 async def update_meeting_work_status(
     meeting_id: int,
     request: UpdateWorkStatusRequest,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """更新会议的工作状态（映射到 meeting.status）"""
-    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
+    result = await db.execute(
+        select(Meeting).where(Meeting.id == meeting_id).options(selectinload(Meeting.assignees))
+    )
+    meeting = result.scalar_one_or_none()
 
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
@@ -396,8 +437,7 @@ async def update_meeting_work_status(
     old_status = meeting.status
     new_status = status_mapping.get(request.work_status, 'scheduled')
     meeting.status = new_status
-    db.commit()
-    db.refresh(meeting)
+    await db.commit()
 
     return {
         "id": meeting.id,
@@ -410,19 +450,19 @@ async def update_meeting_work_status(
 
 @router.get("/workload-overview", response_model=WorkloadOverviewResponse)
 async def get_workload_overview(
-    current_user: User = Depends(get_current_active_superuser),
-    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_superuser_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ):
     """
     获取所有用户的工作量总览（仅超级管理员）
     统计每个用户的内容和会议数量，按状态和类别分组
     """
     # 获取所有非默认管理员用户
-    users = (
-        db.query(User)
-        .filter(User.is_default_admin == False)  # noqa: E712
-        .order_by(User.id)
-        .all()
+    users = await _scalars(
+        db,
+        select(User)
+        .where(User.is_default_admin == False)  # noqa: E712
+        .order_by(User.id),
     )
 
     if not users:
@@ -430,226 +470,46 @@ async def get_workload_overview(
 
     user_ids = [u.id for u in users]
 
-    # 一次性加载所有用户的内容分配（下面 2 次 DB 查询替代 N×2 次）
-    content_rows = (
-        db.query(Content, content_assignees.c.user_id)
-        .join(content_assignees, Content.id == content_assignees.c.content_id)
-        .filter(content_assignees.c.user_id.in_(user_ids))
-        .all()
-    )
-    user_contents: dict[int, list] = defaultdict(list)
-    for content, uid in content_rows:
-        user_contents[uid].append(content)
-
-    # 一次性加载所有用户的会议分配
-    meeting_rows = (
-        db.query(Meeting, meeting_assignees.c.user_id)
-        .join(meeting_assignees, Meeting.id == meeting_assignees.c.meeting_id)
-        .filter(meeting_assignees.c.user_id.in_(user_ids))
-        .all()
-    )
-    user_meetings: dict[int, list] = defaultdict(list)
-    for meeting, uid in meeting_rows:
-        user_meetings[uid].append(meeting)
-
-    # 一次性加载所有活动任务（JSON 过滤在 Python 层做）
-    all_event_tasks = (
-        db.query(EventTask)
-        .filter(EventTask.assignee_ids.isnot(None))
-        .all()
-    )
-    user_event_tasks: dict[int, list] = defaultdict(list)
-    for t in all_event_tasks:
-        for uid in (t.assignee_ids or []):
-            if uid in set(user_ids):
-                user_event_tasks[uid].append(t)
-
-    # 一次性加载所有清单项（JSON 过滤在 Python 层做）
-    all_checklist_items_wl = (
-        db.query(ChecklistItem)
-        .filter(ChecklistItem.assignee_ids.isnot(None))
-        .all()
-    )
-    user_checklist_items: dict[int, list] = defaultdict(list)
-    for c in all_checklist_items_wl:
-        for uid in (c.assignee_ids or []):
-            if uid in set(user_ids):
-                user_checklist_items[uid].append(c)
-
-    # 一次性加载所有运营活动任务（JSON 过滤在 Python 层做）
-    all_campaign_tasks_wl = (
-        db.query(CampaignTask)
-        .filter(CampaignTask.assignee_ids.isnot(None))
-        .all()
-    )
-    user_campaign_tasks: dict[int, list] = defaultdict(list)
-    for t in all_campaign_tasks_wl:
-        for uid in (t.assignee_ids or []):
-            if uid in set(user_ids):
-                user_campaign_tasks[uid].append(t)
-
-    # 一次性加载关怀联系人（按 assigned_to_id 分组）
-    all_care_contacts_wl = (
-        db.query(CampaignContact)
-        .filter(CampaignContact.assigned_to_id.isnot(None))
-        .all()
-    )
-    user_care_contacts: dict[int, list] = defaultdict(list)
-    user_id_set = set(user_ids)
-    for c in all_care_contacts_wl:
-        if c.assigned_to_id in user_id_set:
-            user_care_contacts[c.assigned_to_id].append(c)
-
-    # 一次性加载所有设计任务（按 assignee_id 分组）
-    all_design_tasks_wl = (
-        db.query(DesignTask)
-        .filter(DesignTask.assignee_id.in_(user_ids))
-        .all()
-    )
-    user_design_tasks: dict[int, list] = defaultdict(list)
-    for t in all_design_tasks_wl:
-        if t.assignee_id is not None:
-            user_design_tasks[t.assignee_id].append(t)
+    # 每类事项一条分组统计语句，不加载事项对象
+    counts = await all_work_status_counts(db, user_ids)
+    content_types = await content_type_counts(db, user_ids)
 
     result = []
     for user in users:
-        assigned_contents = user_contents.get(user.id, [])
-        assigned_meetings = user_meetings.get(user.id, [])
-        assigned_event_tasks = user_event_tasks.get(user.id, [])
-        assigned_checklist = user_checklist_items.get(user.id, [])
-        assigned_campaign_tasks = user_campaign_tasks.get(user.id, [])
-        assigned_care_contacts = user_care_contacts.get(user.id, [])
-        assigned_design_tasks = user_design_tasks.get(user.id, [])
-
-        content_stats = _calculate_work_status_stats(assigned_contents)
-        meeting_stats = _calculate_work_status_stats(assigned_meetings)
-        event_task_stats = _calculate_work_status_stats(assigned_event_tasks)
-        checklist_item_stats = _calculate_work_status_stats(assigned_checklist)
-        campaign_task_stats = _calculate_work_status_stats(assigned_campaign_tasks)
-        care_contact_stats = _calculate_care_contact_stats(assigned_care_contacts)
-        design_task_stats = _calculate_work_status_stats(assigned_design_tasks)
-
-        type_stats = {"contribution": 0, "release_note": 0, "event_summary": 0}
-        for content in assigned_contents:
-            st = content.source_type or "contribution"
-            if st in type_stats:
-                type_stats[st] += 1
-
-        event_tasks_count = len(assigned_event_tasks)
-        checklist_count = len(assigned_checklist)
-        campaign_task_count = len(assigned_campaign_tasks)
-        design_task_count = len(assigned_design_tasks)
-
         result.append(UserWorkloadItem(
             user_id=user.id,
             username=user.username,
             full_name=user.full_name,
-            content_stats=content_stats,
-            meeting_stats=meeting_stats,
-            event_task_stats=event_task_stats,
-            checklist_item_stats=checklist_item_stats,
-            campaign_task_stats=campaign_task_stats,
-            care_contact_stats=care_contact_stats,
-            design_task_stats=design_task_stats,
-            content_by_type=ContentByTypeStats(**type_stats),
-            total=len(assigned_contents) + len(assigned_meetings) + event_tasks_count + checklist_count + campaign_task_count + len(assigned_care_contacts) + design_task_count,
+            content_stats=_stats(counts, "content", user.id),
+            meeting_stats=_stats(counts, "meeting", user.id),
+            event_task_stats=_stats(counts, "event_task", user.id),
+            checklist_item_stats=_stats(counts, "checklist_item", user.id),
+            campaign_task_stats=_stats(counts, "campaign_task", user.id),
+            care_contact_stats=_stats(counts, "care_contact", user.id),
+            design_task_stats=_stats(counts, "design_task", user.id),
+            content_by_type=content_types.get(user.id, ContentByTypeStats()),
+            total=sum(_total(counts, kind, user.id) for kind in counts),
         ))
 
     return WorkloadOverviewResponse(users=result)
 
 
-def _calculate_work_status_stats(items) -> WorkStatusStats:
-    """计算工作状态统计（含逾期：未完成且截止日已过）
-    支持 Content / Meeting / EventTask / ChecklistItem 对象。
-    """
-    from datetime import date as date_type
-    from datetime import datetime as datetime_type
-
-    from app.core.timezone import utc_now
-    now = utc_now()
-    today = now.date()
-    stats = {"planning": 0, "in_progress": 0, "completed": 0, "overdue": 0}
-
-    for item in items:
-        if isinstance(item, ChecklistItem):
-            # pending → planning；done / skipped → completed
-            status = item.status
-            work_status = "completed" if status in ("done", "skipped") else "planning"
-            deadline = item.due_date  # date | None
-        elif isinstance(item, EventTask):
-            _et_map = {
-                "not_started": "planning",
-                "in_progress": "in_progress",
-                "completed": "completed",
-                "blocked": "in_progress",
-            }
-            work_status = _et_map.get(item.status, "planning")
-            deadline = item.end_date  # date | None
-        elif isinstance(item, CampaignTask):
-            _ct_map = {
-                "not_started": "planning",
-                "in_progress": "in_progress",
-                "completed": "completed",
-                "blocked": "in_progress",
-            }
-            work_status = _ct_map.get(item.status, "planning")
-            deadline = item.deadline  # date | None
-        elif isinstance(item, DesignTask):
-            _dt_map = {
-                "not_started": "planning",
-                "in_progress": "in_progress",
-                "review": "in_progress",
-                "completed": "completed",
-            }
-            work_status = _dt_map.get(item.status, "planning")
-            deadline = item.due_date  # date | None
-        elif isinstance(item, Meeting):
-            work_status = _map_meeting_status_to_work_status(item.status)
-            deadline = getattr(item, "scheduled_at", None)
-        else:
-            work_status = getattr(item, "work_status", "planning")
-            deadline = getattr(item, "scheduled_publish_at", None)
-
-        if work_status in stats:
-            stats[work_status] += 1
-
-        # 逾期：未完成 且 有截止日 且 已过截止日
-        if work_status != "completed" and deadline is not None:
-            if isinstance(deadline, date_type) and not isinstance(deadline, datetime_type):
-                # date 对象（ChecklistItem.due_date / EventTask.end_date）
-                if deadline < today:
-                    stats["overdue"] += 1
-            else:
-                # datetime 对象（Content / Meeting）
-                dl = deadline.replace(tzinfo=None) if deadline.tzinfo else deadline
-                nw = now.replace(tzinfo=None) if now.tzinfo else now
-                if dl < nw:
-                    stats["overdue"] += 1
-
-    return WorkStatusStats(**stats)
+async def _scalars(db: AsyncSession, stmt) -> list:
+    """执行查询并返回 ORM 对象列表。"""
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
 
 
-def _map_meeting_status_to_work_status(status: str) -> str:
-    """将会议 status 映射为 work_status"""
-    mapping = {
-        'scheduled': 'planning',
-        'in_progress': 'in_progress',
-        'completed': 'completed',
-        'cancelled': 'completed'  # 已取消的会议也算作已完成
-    }
-    return mapping.get(status, 'planning')
+def _stats(counts: dict[str, dict[int, WorkStatusCount]], kind: str, user_id: int) -> WorkStatusStats:
+    count = counts[kind].get(user_id)
+    return count.stats if count else WorkStatusStats()
 
 
-def _calculate_care_contact_stats(contacts) -> WorkStatusStats:
-    """统计关怀联系人的工作状态（按 assigned_to_id 分配的联系人）:
-    pending   → planning（待联系）
-    contacted → in_progress（已联系）
-    blocked   → in_progress（阻塞中，仍属于进行中）
-    """
-    stats = WorkStatusStats()
-    for c in contacts:
-        if c.status == "pending":
-            stats.planning += 1
-        elif c.status in ("contacted", "blocked"):
-            stats.in_progress += 1
-    return stats
+def _total(counts: dict[str, dict[int, WorkStatusCount]], kind: str, user_id: int) -> int:
+    count = counts[kind].get(user_id)
+    return count.total if count else 0
+
+
+def _map_meeting_status_to_work_status(status: str) -> str:
+    """将会议 status 映射为 work_status（与统计口径一致，已取消的会议也算作已完成）"""
+    return WORK_ITEM_KINDS["meeting"].mapping.get(status, "planning")
@@ -1,9 +1,12 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
-from app.core.dependencies import get_current_community, get_current_user
-from app.database import get_db
+from app.core.dependencies import get_current_community_async, get_current_user_async
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total_async
+from app.database import get_async_db, get_async_read_db
 from app.models.design import DesignTask
 from app.models.user import User
 from app.schemas.design import (
@@ -16,6 +19,8 @@ from app.schemas.design import (
 
 router = APIRouter()
 
+LIST_KEYSET = Keyset(DesignTask.created_at, DesignTask.id, descending=True)
+
 
 def _build_task_out(task: DesignTask) -> DesignTaskOut:
     assignee_name = None
@@ -66,6 +71,18 @@ def _build_list_item(task: DesignTask) -> DesignTaskListItem:
     )
 
 
+def _with_relations(query):
+    """预加载负责人与关联内容（异步 Session 不支持隐式懒加载）。"""
+    return query.options(selectinload(DesignTask.assignee), selectinload(DesignTask.content))
+
+
+async def _get_task(db: AsyncSession, task_id: int, community_id: int) -> DesignTask | None:
+    result = await db.execute(
+        _with_relations(select(DesignTask))
+        .where(DesignTask.id == task_id, DesignTask.community_id == community_id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalar_one_or_none()
 
 
 @router.get("/", response_model=dict)
@@ -76,37 +93,41 @@ async def list_design_tasks(
     assignee_id: int | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> dict:
     """列出社区的设计任务（支持过滤和分页）。"""
-    query = db.query(DesignTask).filter(DesignTask.community_id == community_id)
+    query = select(DesignTask).where(DesignTask.community_id == community_id)
     if status:
-        query = query.filter(DesignTask.status == status)
+        query = query.where(DesignTask.status == status)
     if task_type:
-        query = query.filter(DesignTask.task_type == task_type)
+        query = query.where(DesignTask.task_type == task_type)
     if priority:
-        query = query.filter(DesignTask.priority == priority)
+        query = query.where(DesignTask.priority == priority)
     if assignee_id is not None:
-        query = query.filter(DesignTask.assignee_id == assignee_id)
+        query = query.where(DesignTask.assignee_id == assignee_id)
 
-    total = query.count()
-    tasks = query.order_by(DesignTask.created_at.desc()).offset((page - 1) * page_size).limit(page_size).all()
+    totals = await page_total_async(db, query, include_total=include_total, cursor=cursor)
+    query = LIST_KEYSET.apply(_with_relations(query), cursor=cursor, offset=(page - 1) * page_size, limit=page_size)
+    tasks, next_cursor = LIST_KEYSET.page((await db.execute(query)).scalars().all(), page_size)
     return {
         "items": [_build_list_item(t) for t in tasks],
-        "total": total,
         "page": page,
         "page_size": page_size,
+        "next_cursor": next_cursor,
+        **totals,
     }
 
 
 @router.post("/", response_model=DesignTaskOut, status_code=201)
 async def create_design_task(
     data: DesignTaskCreate,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DesignTaskOut:
     """创建设计任务。"""
     task = DesignTask(
@@ -121,26 +142,25 @@ async def create_design_task(
         created_by_user_id=current_user.id,
     )
     db.add(task)
-    db.commit()
-    db.refresh(task)
-    return _build_task_out(task)
+    await db.commit()
+    return _build_task_out(await _get_task(db, task.id, community_id))
 
 
 @router.get("/{task_id}", response_model=DesignTaskOut)
 async def get_design_task(
     task_id: int,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> DesignTaskOut:
     """获取设计任务详情。"""
-    task = db.query(DesignTask).filter(DesignTask.id == task_id, DesignTask.community_id == community_id).first()
+    task = await _get_task(db, task_id, community_id)
     if not task:
         raise HTTPException(status_code=404, detail="设计任务不存在")
     return _build_task_out(task)
 
 
-def _check_permission(task: DesignTask, current_user: User, db: Session) -> None:
+async def _check_permission(task: DesignTask, current_user: User, db: AsyncSession) -> None:
     """创建者、被分配人或超级用户可操作。"""
     if current_user.is_superuser:
         return
@@ -149,12 +169,11 @@ def _check_permission(task: DesignTask, current_user: User, db: Session) -> None
     if task.assignee_id == current_user.id:
         return
     # Community admin check
-    from sqlalchemy import text
-
-    row = db.execute(
+    result = await db.execute(
         text("SELECT role FROM community_users WHERE user_id = :uid AND community_id = :cid"),
         {"uid": current_user.id, "cid": task.community_id},
-    ).fetchone()
+    )
+    row = result.fetchone()
     if row and row[0] == "admin":
         return
     raise HTTPException(status_code=403, detail="没有权限操作此设计任务")
@@ -164,60 +183,58 @@ def _check_permission(task: DesignTask, current_user: User, db: Session) -> None
 async def update_design_task(
     task_id: int,
     data: DesignTaskUpdate,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DesignTaskOut:
     """更新设计任务。"""
-    task = db.query(DesignTask).filter(DesignTask.id == task_id, DesignTask.community_id == community_id).first()
+    task = await _get_task(db, task_id, community_id)
     if not task:
         raise HTTPException(status_code=404, detail="设计任务不存在")
-    _check_permission(task, current_user, db)
+    await _check_permission(task, current_user, db)
 
     update_data = data.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(task, field, value)
-    db.commit()
-    db.refresh(task)
-    return _build_task_out(task)
+    await db.commit()
+    return _build_task_out(await _get_task(db, task.id, community_id))
 
 
 @router.patch("/{task_id}/status", response_model=DesignTaskOut)
 async def update_design_task_status(
     task_id: int,
     data: DesignTaskStatusUpdate,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DesignTaskOut:
     """快速更新设计任务状态。"""
     valid_statuses = {"not_started", "in_progress", "review", "completed"}
     if data.status not in valid_statuses:
         raise HTTPException(status_code=422, detail=f"无效状态，可选值：{', '.join(valid_statuses)}")
 
-    task = db.query(DesignTask).filter(DesignTask.id == task_id, DesignTask.community_id == community_id).first()
+    task = await _get_task(db, task_id, community_id)
     if not task:
         raise HTTPException(status_code=404, detail="设计任务不存在")
-    _check_permission(task, current_user, db)
+    await _check_permission(task, current_user, db)
 
     task.status = data.status
-    db.commit()
-    db.refresh(task)
-    return _build_task_out(task)
+    await db.commit()
+    return _build_task_out(await _get_task(db, task.id, community_id))
 
 
 @router.delete("/{task_id}", status_code=204)
 async def delete_design_task(
     task_id: int,
-    community_id: int = Depends(get_current_community),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    community_id: int = Depends(get_current_community_async),
+    current_user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """删除设计任务。"""
-    task = db.query(DesignTask).filter(DesignTask.id == task_id, DesignTask.community_id == community_id).first()
+    task = await _get_task(db, task_id, community_id)
     if not task:
         raise HTTPException(status_code=404, detail="设计任务不存在")
-    _check_permission(task, current_user, db)
+    await _check_permission(task, current_user, db)
 
-    db.delete(task)
-    db.commit()
+    await db.delete(task)
+    await db.commit()
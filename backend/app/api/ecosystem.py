@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
-from app.config import settings
 from app.core.dependencies import get_current_user
-from app.database import get_db
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total
+from app.database import get_db, get_read_db
 from app.models import User
 from app.models.ecosystem import EcosystemContributor, EcosystemProject
 from app.models.people import PersonProfile
@@ -13,14 +13,17 @@ from app.schemas.ecosystem import (
     ProjectListOut,
     ProjectOut,
     ProjectUpdate,
-    SyncResult,
 )
-from app.services.ecosystem.github_crawler import sync_project
+from app.schemas.job import JobOut
+from app.services.jobs import enqueue
+from app.services.jobs.handlers import ECOSYSTEM_SYNC
 
 router = APIRouter()
 
 VALID_PLATFORMS = {"github", "gitee", "gitcode"}
 
+CONTRIBUTOR_KEYSET = Keyset(EcosystemContributor.commit_count_90d, EcosystemContributor.id, descending=True)
+
 
 # ─── Project CRUD ─────────────────────────────────────────────────────────────
 
@@ -28,7 +31,7 @@ VALID_PLATFORMS = {"github", "gitee", "gitcode"}
 def list_projects(
     community_id: int | None = Query(None),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     query = db.query(EcosystemProject)
     if community_id is not None:
@@ -58,7 +61,7 @@ def create_project(
 def get_project(
     pid: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     project = db.query(EcosystemProject).filter(EcosystemProject.id == pid).first()
     if not project:
@@ -99,19 +102,24 @@ def delete_project(
 
 # ─── Sync ─────────────────────────────────────────────────────────────────────
 
-@router.post("/{pid}/sync", response_model=SyncResult)
+@router.post("/{pid}/sync", response_model=JobOut, status_code=202)
 def trigger_sync(
     pid: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """手动触发单个项目同步。"""
+    """手动触发单个项目同步（后台执行，任务结果为 SyncResult）。"""
     project = db.query(EcosystemProject).filter(EcosystemProject.id == pid).first()
     if not project:
         raise HTTPException(404, "项目不存在")
-    token = settings.GITHUB_TOKEN
-    result = sync_project(db, project, token)
-    return result
+    return enqueue(
+        db,
+        ECOSYSTEM_SYNC,
+        {"project_id": project.id},
+        user_id=current_user.id,
+        community_id=project.community_id,
+        dedupe_key=f"project:{project.id}",
+    )
 
 
 # ─── Contributors ─────────────────────────────────────────────────────────────
@@ -123,8 +131,10 @@ def list_contributors(
     unlinked: bool = False,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     project = db.query(EcosystemProject).filter(EcosystemProject.id == pid).first()
     if not project:
@@ -139,10 +149,10 @@ def list_contributors(
         )
     if unlinked:
         query = query.filter(EcosystemContributor.person_id == None)  # noqa: E711
-    query = query.order_by(EcosystemContributor.commit_count_90d.desc().nullslast())
-    total = query.count()
-    items = query.offset((page - 1) * page_size).limit(page_size).all()
-    return PaginatedContributors(items=items, total=total, page=page, page_size=page_size)
+    totals = page_total(db, query, include_total=include_total, cursor=cursor)
+    rows = CONTRIBUTOR_KEYSET.apply(query, cursor=cursor, offset=(page - 1) * page_size, limit=page_size).all()
+    items, next_cursor = CONTRIBUTOR_KEYSET.page(rows, page_size)
+    return PaginatedContributors(items=items, page=page, page_size=page_size, next_cursor=next_cursor, **totals)
 
 
 @router.post("/{pid}/contributors/{handle}/import-person", status_code=200)
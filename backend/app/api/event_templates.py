@@ -3,7 +3,7 @@ from sqlalchemy import or_
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import User
 from app.models.event import ChecklistTemplateItem, EventTemplate
 from app.schemas.event import (
@@ -22,7 +22,7 @@ router = APIRouter()
 @router.get("", response_model=list[EventTemplateListOut])
 def list_templates(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     return (
         db.query(EventTemplate)
@@ -67,7 +67,7 @@ def create_template(
 def get_template(
     template_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     template = db.query(EventTemplate).filter(EventTemplate.id == template_id).first()
     if not template:
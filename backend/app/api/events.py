@@ -4,9 +4,11 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total
 from app.core.timezone import utc_now
-from app.database import get_db
+from app.database import get_db, get_read_db
 from app.models import User
+from app.models.assignee import known_assignees
 from app.models.community import Community
 from app.models.event import (
     ChecklistItem,
@@ -41,13 +43,15 @@ from app.schemas.event import (
     PersonnelConfirmUpdate,
     TaskReorderRequest,
 )
-from app.services.notify import create_notification
+from app.services.notify import create_notifications
 
 router = APIRouter()
 
 VALID_EVENT_STATUSES = {"planning", "ongoing", "completed"}
 VALID_EVENT_TYPES = {"online", "offline", "hybrid"}
 
+LIST_KEYSET = Keyset(Event.planned_at, Event.id, descending=True)
+
 
 # ─── Event CRUD ───────────────────────────────────────────────────────────────
 
@@ -59,8 +63,10 @@ def list_events(
     keyword: str | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     query = db.query(Event)
     if community_id is not None:
@@ -71,9 +77,10 @@ def list_events(
         query = query.filter(Event.event_type == event_type)
     if keyword:
         query = query.filter(Event.title.ilike(f"%{keyword}%"))
-    total = query.count()
-    items = query.order_by(Event.planned_at.desc().nullslast()).offset((page - 1) * page_size).limit(page_size).all()
-    return PaginatedEvents(items=items, total=total, page=page, page_size=page_size)
+    totals = page_total(db, query, include_total=include_total, cursor=cursor)
+    rows = LIST_KEYSET.apply(query, cursor=cursor, offset=(page - 1) * page_size, limit=page_size).all()
+    items, next_cursor = LIST_KEYSET.page(rows, page_size)
+    return PaginatedEvents(items=items, page=page, page_size=page_size, next_cursor=next_cursor, **totals)
 
 
 @router.post("", response_model=EventOut, status_code=201)
@@ -129,7 +136,7 @@ def create_event(
 def get_event(
     event_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
@@ -197,7 +204,7 @@ def delete_event(
 def get_checklist(
     event_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
@@ -218,7 +225,7 @@ def update_checklist_item(
     ).first()
     if not item:
         raise HTTPException(404, "检查项不存在")
-    for key, value in data.model_dump(exclude_unset=True).items():
+    for key, value in known_assignees(db, data.model_dump(exclude_unset=True)).items():
         setattr(item, key, value)
     if data.status == "done" and item.completed_at is None:
         item.completed_at = utc_now()
@@ -239,7 +246,7 @@ def create_checklist_item(
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(404, "活动不存在")
-    item = ChecklistItem(event_id=event_id, **data.model_dump())
+    item = ChecklistItem(event_id=event_id, **known_assignees(db, data.model_dump()))
     db.add(item)
     db.commit()
     db.refresh(item)
@@ -268,7 +275,7 @@ def delete_checklist_item(
 def list_personnel(
     event_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
@@ -359,7 +366,7 @@ def import_attendees(
 def list_feedback(
     event_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
@@ -448,7 +455,7 @@ def _build_task_tree(tasks: list[EventTask]) -> list[EventTask]:
 def list_tasks(
     event_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
@@ -467,23 +474,21 @@ def create_task(
     event = db.query(Event).filter(Event.id == event_id).first()
     if not event:
         raise HTTPException(404, "活动不存在")
-    task = EventTask(event_id=event_id, **data.model_dump())
+    task = EventTask(event_id=event_id, **known_assignees(db, data.model_dump()))
     db.add(task)
     db.commit()
     db.refresh(task)
     task.children = []
     # 通知：任务被指派（不通知自己）
-    for uid in task.assignee_ids or []:
-        if uid != current_user.id:
-            create_notification(
-                db,
-                user_id=uid,
-                ntype=NotificationType.TASK_ASSIGNED,
-                title=f"你被指派了任务：{task.title}",
-                body=f"活动：{event.title}",
-                resource_type="event_task",
-                resource_id=task.id,
-            )
+    create_notifications(
+        db,
+        [uid for uid in task.assignee_ids or [] if uid != current_user.id],
+        NotificationType.TASK_ASSIGNED,
+        title=f"你被指派了任务：{task.title}",
+        body=f"活动：{event.title}",
+        resource_type="event_task",
+        resource_id=task.id,
+    )
     return task
 
 
@@ -501,27 +506,25 @@ def update_task(
     if not task:
         raise HTTPException(404, "任务不存在")
     old_assignee_ids = set(task.assignee_ids or [])
-    for key, value in data.model_dump(exclude_unset=True).items():
+    for key, value in known_assignees(db, data.model_dump(exclude_unset=True)).items():
         setattr(task, key, value)
     db.commit()
     db.refresh(task)
     task.children = []
     # 通知：新增的 assignee（不通知自己）
     new_assignee_ids = set(task.assignee_ids or [])
-    added_ids = new_assignee_ids - old_assignee_ids
+    added_ids = new_assignee_ids - old_assignee_ids - {current_user.id}
     if added_ids:
         event = db.query(Event).filter(Event.id == event_id).first()
-        for uid in added_ids:
-            if uid != current_user.id:
-                create_notification(
-                    db,
-                    user_id=uid,
-                    ntype=NotificationType.TASK_ASSIGNED,
-                    title=f"你被指派了任务：{task.title}",
-                    body=f"活动：{event.title}" if event else None,
-                    resource_type="event_task",
-                    resource_id=task.id,
-                )
+        create_notifications(
+            db,
+            sorted(added_ids),
+            NotificationType.TASK_ASSIGNED,
+            title=f"你被指派了任务：{task.title}",
+            body=f"活动：{event.title}" if event else None,
+            resource_type="event_task",
+            resource_id=task.id,
+        )
     return task
 
 
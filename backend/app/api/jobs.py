@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.core.dependencies import get_current_user
+from app.database import get_read_db
+from app.models import User
+from app.models.job import Job
+from app.schemas.job import JobOut
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=JobOut)
+def get_job(
+    job_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_read_db),
+):
+    """查询后台任务状态（仅任务创建者与超级管理员可见）。"""
+    # 配置只读副本时，副本延迟只会让某次轮询晚一步看到新状态
+    job = db.get(Job, job_id)
+    if job is None or (job.created_by_user_id != current_user.id and not current_user.is_superuser):
+        raise HTTPException(404, "任务不存在")
+    return job
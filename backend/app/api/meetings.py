@@ -2,10 +2,13 @@ import logging
 from datetime import date, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session, joinedload, selectinload
 
+from app.config import settings
 from app.core.dependencies import get_current_community, get_current_user
-from app.database import get_db
+from app.core.responses import model_response
+from app.core.timezone import utc_now
+from app.database import get_db, get_read_db
 from app.models import User
 from app.models.committee import Committee, CommitteeMember
 from app.models.meeting import Meeting, MeetingParticipant, MeetingReminder
@@ -20,6 +23,7 @@ from app.schemas.governance import (
     MeetingReminderOut,
     MeetingUpdate,
 )
+from app.services.scheduler_lease import HOLDER_ID
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +38,7 @@ def list_meetings(
     end_date: date | None = Query(None, description="结束日期（含）"),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=500),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     列出社区的会议记录。
@@ -54,18 +58,10 @@ def list_meetings(
 
     query = query.order_by(Meeting.scheduled_at.desc())
 
-    meetings = query.offset(skip).limit(limit).all()
-
-    # Build response with assignee_ids for each meeting
-    result = []
-    for meeting in meetings:
-        meeting_dict = {
-            **{c.name: getattr(meeting, c.name) for c in meeting.__table__.columns},
-            "assignee_ids": [a.id for a in meeting.assignees]
-        }
-        result.append(meeting_dict)
+    meetings = query.options(selectinload(Meeting.assignees)).offset(skip).limit(limit).all()
 
-    return result
+    # MeetingOut 直接读取 ORM 属性（assignee_ids 为模型属性），只校验一次
+    return model_response(list[MeetingOut], meetings)
 
 
 @router.post("", response_model=MeetingOut, status_code=status.HTTP_201_CREATED)
@@ -122,19 +118,14 @@ def create_meeting(
     db.commit()
     db.refresh(meeting)
 
-    # Build response with assignee_ids
-    meeting_dict = {
-        **{c.name: getattr(meeting, c.name) for c in meeting.__table__.columns},
-        "assignee_ids": [a.id for a in meeting.assignees]
-    }
-    return meeting_dict
+    return meeting
 
 
 @router.get("/{meeting_id}", response_model=MeetingDetail)
 def get_meeting(
     meeting_id: int,
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取会议详情，包含委员会信息。"""
     meeting = (
@@ -236,12 +227,7 @@ def update_meeting(
     db.commit()
     db.refresh(meeting)
 
-    # Build response with assignee_ids
-    meeting_dict = {
-        **{c.name: getattr(meeting, c.name) for c in meeting.__table__.columns},
-        "assignee_ids": [a.id for a in meeting.assignees]
-    }
-    return meeting_dict
+    return meeting
 
 
 @router.delete("/{meeting_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -284,7 +270,7 @@ def create_reminder(
     """
     为会议创建提醒记录。
 
-    实际的通知发送依赖角色4的通知服务（预留）。
+    immediate 提醒在请求中立即发送，其余类型到期后由会议提醒分发器（app.services.meeting_reminders）发送。
     reminder_type: 'preparation', 'one_week', 'three_days', 'one_day', 'two_hours', 'immediate'
     """
     # 验证会议存在
@@ -319,18 +305,22 @@ def create_reminder(
 
     hours_before = hours_map.get(reminder_type, 24)
 
-    # For immediate reminders, set scheduled_at to now
-    if reminder_type == 'immediate':
-        scheduled_at = datetime.now()
+    # For immediate reminders, set scheduled_at to now（与会议时间一致，存 naive UTC）
+    immediate = reminder_type == 'immediate'
+    if immediate:
+        scheduled_at = utc_now().replace(tzinfo=None)
     else:
         scheduled_at = meeting.scheduled_at - timedelta(hours=hours_before)
 
+    # 立即提醒在本请求中发送，创建时即持有租约，避免到期提醒分发器同时领取
     reminder = MeetingReminder(
         meeting_id=meeting_id,
         reminder_type=reminder_type,
         scheduled_at=scheduled_at,
         notification_channels=['email'],
-        status="pending",
+        status="sending" if immediate else "pending",
+        locked_by=HOLDER_ID if immediate else None,
+        locked_until=utc_now() + timedelta(seconds=settings.MEETING_REMINDER_LEASE_SECONDS) if immediate else None,
     )
 
     db.add(reminder)
@@ -338,7 +328,7 @@ def create_reminder(
     db.refresh(reminder)
 
     # If immediate, trigger sending right away
-    if reminder_type == 'immediate':
+    if immediate:
         from app.services.notification import send_meeting_reminder
         try:
             send_meeting_reminder(db, reminder.id)
@@ -355,7 +345,7 @@ def create_reminder(
 def list_reminders(
     meeting_id: int,
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """列出会议的所有提醒记录。"""
     # 验证会议存在且属于当前社区
@@ -384,7 +374,7 @@ def list_reminders(
 def list_participants(
     meeting_id: int,
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """列出会议的与会人。"""
     meeting = db.query(Meeting).filter(
@@ -554,7 +544,7 @@ def import_participants(
 def get_meeting_minutes(
     meeting_id: int,
     community_id: int = Depends(get_current_community),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     获取会议纪要。
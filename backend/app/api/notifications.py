@@ -6,14 +6,19 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
+from app.core.count_cache import count_rows
 from app.core.dependencies import get_current_user, get_db
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total
 from app.core.timezone import utc_now
+from app.database import get_read_db
 from app.models.notification import Notification
 from app.models.user import User
 from app.schemas.notification import NotificationListOut, NotificationOut
 
 router = APIRouter()
 
+LIST_KEYSET = Keyset(Notification.created_at, Notification.id, descending=True)
+
 
 # ─── 列表 + 未读数 ────────────────────────────────────────────────────────────
 
@@ -22,39 +27,35 @@ def list_notifications(
     unread_only: bool = Query(False, description="True = 仅返回未读通知"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
-    """获取当前用户的通知列表（分页），同时返回总数和未读总数。"""
+    """获取当前用户的通知列表（分页），同时返回总数和未读总数；传入 cursor 时忽略 skip。"""
     base_q = db.query(Notification).filter(Notification.user_id == current_user.id)
-    total = base_q.count()
-    unread_count = base_q.filter(Notification.is_read == False).count()  # noqa: E712
+    totals = page_total(db, base_q, include_total=include_total, cursor=cursor)
+    unread_q = base_q.filter(Notification.is_read == False)  # noqa: E712
+    unread_count = count_rows(db, unread_q, allow_estimate=False).value
 
     if unread_only:
-        base_q = base_q.filter(Notification.is_read == False)  # noqa: E712
-
-    items = (
-        base_q
-        .order_by(Notification.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-    return NotificationListOut(items=items, total=total, unread_count=unread_count)
+        base_q = unread_q
+
+    rows = LIST_KEYSET.apply(base_q, cursor=cursor, offset=skip, limit=limit).all()
+    items, next_cursor = LIST_KEYSET.page(rows, limit)
+    return NotificationListOut(items=items, unread_count=unread_count, next_cursor=next_cursor, **totals)
 
 
 @router.get("/unread-count")
 def get_unread_count(
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """返回当前用户未读通知数量（前端轮询专用，响应体极小）。"""
-    count = (
-        db.query(Notification)
-        .filter(Notification.user_id == current_user.id, Notification.is_read == False)  # noqa: E712
-        .count()
+    unread_q = db.query(Notification).filter(
+        Notification.user_id == current_user.id, Notification.is_read == False  # noqa: E712
     )
-    return {"count": count}
+    return {"count": count_rows(db, unread_q, allow_estimate=False).value}
 
 
 # ─── 标记已读 ─────────────────────────────────────────────────────────────────
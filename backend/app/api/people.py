@@ -2,7 +2,8 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_user
-from app.database import get_db
+from app.core.pagination import CURSOR_DOC, INCLUDE_TOTAL_DOC, Keyset, page_total
+from app.database import get_db, get_read_db
 from app.models import User
 from app.models.people import CommunityRole, PersonProfile
 from app.schemas.people import (
@@ -18,6 +19,8 @@ from app.services.people_service import find_or_suggest
 
 router = APIRouter()
 
+LIST_KEYSET = Keyset(PersonProfile.display_name, PersonProfile.id)
+
 
 @router.get("", response_model=PaginatedPeople)
 def list_people(
@@ -27,8 +30,10 @@ def list_people(
     source: str | None = None,
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
+    cursor: str | None = Query(None, description=CURSOR_DOC),
+    include_total: bool | None = Query(None, description=INCLUDE_TOTAL_DOC),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     query = db.query(PersonProfile)
     if q:
@@ -43,9 +48,10 @@ def list_people(
         query = query.filter(PersonProfile.company.ilike(f"%{company}%"))
     if source:
         query = query.filter(PersonProfile.source == source)
-    total = query.count()
-    items = query.order_by(PersonProfile.display_name).offset((page - 1) * page_size).limit(page_size).all()
-    return PaginatedPeople(items=items, total=total, page=page, page_size=page_size)
+    totals = page_total(db, query, include_total=include_total, cursor=cursor)
+    rows = LIST_KEYSET.apply(query, cursor=cursor, offset=(page - 1) * page_size, limit=page_size).all()
+    items, next_cursor = LIST_KEYSET.page(rows, page_size)
+    return PaginatedPeople(items=items, page=page, page_size=page_size, next_cursor=next_cursor, **totals)
 
 
 @router.post("", response_model=PersonOut, status_code=201)
@@ -72,7 +78,7 @@ def create_person(
 def get_person(
     person_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     person = db.query(PersonProfile).filter(PersonProfile.id == person_id).first()
     if not person:
@@ -115,7 +121,7 @@ def delete_person(
 def list_roles(
     person_id: int,
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     person = db.query(PersonProfile).filter(PersonProfile.id == person_id).first()
     if not person:
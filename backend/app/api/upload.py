@@ -1,5 +1,4 @@
 import os
-import tempfile
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
 from sqlalchemy.orm import Session
@@ -10,7 +9,9 @@ from app.database import get_db
 from app.models.content import Content
 from app.models.user import User
 from app.schemas.content import ContentOut
-from app.services.converter import convert_docx_to_markdown, convert_markdown_to_html
+from app.schemas.job import JobOut
+from app.services.jobs import enqueue
+from app.services.jobs.handlers import CONTENT_UPLOAD
 from app.services.storage import StorageService, get_storage
 
 router = APIRouter()
@@ -19,12 +20,13 @@ ALLOWED_EXTENSIONS = {".docx", ".md", ".markdown"}
 ALLOWED_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 
 
-@router.post("/upload", response_model=ContentOut, status_code=201)
+@router.post("/upload", response_model=JobOut, status_code=202)
 async def upload_file(
     file: UploadFile = File(...),
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
+    """保存原始文件后入队转换；任务结果为新建内容（ContentOut）。"""
     if not file.filename:
         raise HTTPException(400, "No filename provided")
 
@@ -36,42 +38,13 @@ async def upload_file(
     if len(file_content) > settings.MAX_UPLOAD_SIZE:
         raise HTTPException(400, f"File too large. Max size: {settings.MAX_UPLOAD_SIZE // 1024 // 1024}MB")
 
-    title = os.path.splitext(file.filename)[0]
-
-    if ext == ".docx":
-        # python-docx requires a real file path; write to a temp file, parse, then clean up
-        with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-            tmp.write(file_content)
-            tmp_path = tmp.name
-        try:
-            markdown_text, _image_paths = convert_docx_to_markdown(tmp_path)
-        finally:
-            os.unlink(tmp_path)
-    else:
-        # Markdown files can be decoded in-memory without touching the filesystem
-        markdown_text = file_content.decode("utf-8", errors="replace").strip()
-
-    content_html = convert_markdown_to_html(markdown_text) if markdown_text else ""
-
-    # Persist to configured storage backend (local or S3/MinIO)
+    # Persist to configured storage backend (local or S3/MinIO); the worker reads it back from there
     storage = get_storage()
     key = StorageService.generate_key(ext)
     storage.save(file_content, key)
 
-    content = Content(
-        title=title,
-        content_markdown=markdown_text,
-        content_html=content_html,
-        source_type="contribution",
-        source_file=key,
-        status="draft",
-        community_id=None,
-        created_by_user_id=current_user.id,
-    )
-    db.add(content)
-    db.commit()
-    db.refresh(content)
-    return content
+    payload = {"key": key, "ext": ext, "title": os.path.splitext(file.filename)[0], "user_id": current_user.id}
+    return enqueue(db, CONTENT_UPLOAD, payload, user_id=current_user.id)
 
 
 @router.post("/{content_id}/cover", response_model=ContentOut)
@@ -10,23 +10,24 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.dependencies import get_current_community, get_current_user
-from app.database import get_db
+from app.core.responses import model_response
+from app.database import get_db, get_read_db
 from app.models import User
 from app.models.publish_record import PublishRecord
+from app.schemas.job import JobOut
 from app.schemas.wechat_stats import (
     ArticleCategoryUpdate,
     ArticleRankItem,
-    SyncArticlesResponse,
     SyncStatsRequest,
-    SyncStatsResponse,
     TrendResponse,
     WechatArticleStatOut,
     WechatDailyStatBatchCreate,
     WechatDailyStatCreate,
     WechatStatsOverview,
 )
+from app.services.jobs import enqueue
+from app.services.jobs.handlers import WECHAT_REBUILD_AGGREGATES, WECHAT_SYNC_ARTICLES, WECHAT_SYNC_STATS
 from app.services.wechat_stats import wechat_stats_service
-from app.services.wechat_sync import wechat_sync_service
 
 router = APIRouter()
 
@@ -37,7 +38,7 @@ router = APIRouter()
 def get_wechat_stats_overview(
     community_id: int = Depends(get_current_community),
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取微信公众号统计概览。"""
     return wechat_stats_service.get_overview(db, community_id=community_id)
@@ -60,7 +61,7 @@ def get_wechat_stats_trend(
     end_date: date | None = Query(default=None),
     community_id: int = Depends(get_current_community),
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取微信统计趋势折线图数据。"""
     return wechat_stats_service.get_trend(
@@ -81,11 +82,12 @@ def get_wechat_article_ranking(
     limit: int = Query(default=100, ge=1, le=200),
     community_id: int = Depends(get_current_community),
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取微信文章阅读量排名（最新前 N 篇）。"""
-    return wechat_stats_service.get_article_ranking(
-        db, community_id=community_id, category=category, limit=limit
+    return model_response(
+        list[ArticleRankItem],
+        wechat_stats_service.get_article_ranking(db, community_id=community_id, category=category, limit=limit),
     )
 
 
@@ -97,7 +99,7 @@ def get_article_daily_stats(
     start_date: date | None = Query(default=None),
     end_date: date | None = Query(default=None),
     user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """获取某篇文章的每日统计数据。"""
     record = db.query(PublishRecord).get(publish_record_id)
@@ -166,7 +168,7 @@ def batch_create_daily_stats(
 
 # ── 聚合重建 ──
 
-@router.post("/aggregates/rebuild")
+@router.post("/aggregates/rebuild", response_model=JobOut, status_code=202)
 def rebuild_aggregates(
     period_type: str = Query(
         default="daily",
@@ -178,58 +180,64 @@ def rebuild_aggregates(
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """重建统计聚合数据。"""
-    count = wechat_stats_service.rebuild_aggregates(
+    """重建统计聚合数据（后台执行，任务结果含 rebuilt_count）。"""
+    payload = {
+        "community_id": community_id,
+        "period_type": period_type,
+        "start_date": start_date.isoformat() if start_date else None,
+        "end_date": end_date.isoformat() if end_date else None,
+    }
+    return enqueue(
         db,
+        WECHAT_REBUILD_AGGREGATES,
+        payload,
+        user_id=user.id,
         community_id=community_id,
-        period_type=period_type,
-        start_date=start_date,
-        end_date=end_date,
+        dedupe_key=f"community:{community_id}:{period_type}:{payload['start_date']}:{payload['end_date']}",
     )
-    return {"rebuilt_count": count, "period_type": period_type}
 
 
 # ── 微信数据同步 ──
 
-@router.post("/sync/articles", response_model=SyncArticlesResponse)
-async def sync_wechat_articles(
+@router.post("/sync/articles", response_model=JobOut, status_code=202)
+def sync_wechat_articles(
     community_id: int = Depends(get_current_community),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """从微信公众号同步已发布文章列表。"""
-    try:
-        result = await wechat_sync_service.sync_articles(
-            db, community_id=community_id, user_id=user.id
-        )
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from None
-    except Exception as e:
-        raise HTTPException(status_code=502, detail=str(e)) from e
-
-
-@router.post("/sync/stats", response_model=SyncStatsResponse)
-async def sync_wechat_stats(
+    """从微信公众号同步已发布文章列表（后台执行，任务结果为 SyncArticlesResponse）。"""
+    return enqueue(
+        db,
+        WECHAT_SYNC_ARTICLES,
+        {"community_id": community_id, "user_id": user.id},
+        user_id=user.id,
+        community_id=community_id,
+        dedupe_key=f"community:{community_id}",
+    )
+
+
+@router.post("/sync/stats", response_model=JobOut, status_code=202)
+def sync_wechat_stats(
     body: SyncStatsRequest,
     community_id: int = Depends(get_current_community),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    """从微信公众号同步文章阅读统计数据。"""
+    """从微信公众号同步文章阅读统计数据（后台执行，任务结果为 SyncStatsResponse）。"""
     if (body.end_date - body.start_date).days > 30:
         raise HTTPException(status_code=400, detail="日期范围不能超过30天")
     if body.end_date < body.start_date:
         raise HTTPException(status_code=400, detail="结束日期不能早于开始日期")
-    try:
-        result = await wechat_sync_service.sync_stats(
-            db,
-            community_id=community_id,
-            start_date=body.start_date,
-            end_date=body.end_date,
-        )
-        return result
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e)) from None
-    except Exception as e:
-        raise HTTPException(status_code=502, detail=str(e)) from e
+    payload = {
+        "community_id": community_id,
+        "start_date": body.start_date.isoformat(),
+        "end_date": body.end_date.isoformat(),
+    }
+    return enqueue(
+        db,
+        WECHAT_SYNC_STATS,
+        payload,
+        user_id=user.id,
+        community_id=community_id,
+        dedupe_key=f"community:{community_id}:{payload['start_date']}:{payload['end_date']}",
+    )
@@ -0,0 +1,262 @@
+"""
+响应压缩（gzip / Brotli）
+
+- CompressionMiddleware：按 Accept-Encoding 协商（优先 br，其次 gzip），只压缩白名单内的
+  Content-Type 且不小于 COMPRESSION_MIN_SIZE 的响应；已带 Content-Encoding 的响应
+  （如预压缩的上传文件）、图片等已压缩格式原样透传。流式响应逐块压缩。
+- schedule_precompressed / PrecompressedStaticFiles：本地存储模式下，文本类上传文件写入后
+  由后台线程生成 ``.br`` / ``.gz`` 副本（最高压缩级别，不阻塞上传请求；完成前返回原文件），
+  /uploads 按 Accept-Encoding 直接返回副本，不再逐请求压缩。
+
+Brotli 依赖 ``brotli`` 包，未安装时只使用 gzip。
+"""
+
+import mimetypes
+import os
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - 取决于部署环境
+    brotli = None
+
+# 预压缩副本后缀，按协商优先级排列
+PRECOMPRESSED_SUFFIXES: dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+
+def available_encodings() -> tuple[str, ...]:
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def negotiate_encoding(accept_encoding: str, supported: tuple[str, ...]) -> str | None:
+    """按 Accept-Encoding（含 q 值）在 supported 中选出编码；q 相同时按 supported 顺序。"""
+    weights: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        name = name.strip().lower()
+        if not name:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name] = q
+    best, best_q = None, 0.0
+    for encoding in supported:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+
+def is_compressible(content_type: str, allowlist: list[str]) -> bool:
+    """content_type 是否命中白名单；以 ``/`` 结尾的条目按前缀匹配（如 ``text/``）。"""
+    media_type = content_type.split(";", 1)[0].strip().lower()
+    if not media_type:
+        return False
+    for allowed in allowlist:
+        if media_type == allowed or (allowed.endswith("/") and media_type.startswith(allowed)):
+            return True
+    return False
+
+
+def compress_bytes(data: bytes, encoding: str, level: int | None = None) -> bytes:
+    if encoding == "br":
+        quality = settings.COMPRESSION_BROTLI_QUALITY if level is None else level
+        return brotli.compress(data, quality=quality)
+    compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL if level is None else level, zlib.DEFLATED, 31)
+    return compressor.compress(data) + compressor.flush()
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        self.encoding = encoding
+        if encoding == "br":
+            self._br = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._gz = zlib.compressobj(gzip_level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.flush()
+        return self._gz.compress(data) + self._gz.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._br.process(data) + self._br.finish()
+        return self._gz.compress(data) + self._gz.flush()
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int,
+        content_types: list[str],
+        gzip_level: int,
+        brotli_quality: int,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = content_types
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""), available_encodings())
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        compressor: _StreamCompressor | None = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is not None:
+                data = compressor.chunk(body) if more_body else compressor.finish(body)
+                await send({"type": "http.response.body", "body": data, "more_body": more_body})
+                return
+
+            # 首个 body 消息：决定是否压缩
+            start["headers"] = list(start.get("headers", []))
+            headers = MutableHeaders(raw=start["headers"])
+            if start["status"] < 200 or start["status"] in (204, 206, 304) or "content-encoding" in headers:
+                passthrough = True
+            elif not is_compressible(headers.get("content-type", ""), self.content_types):
+                passthrough = True
+            else:
+                headers.add_vary_header("Accept-Encoding")
+                passthrough = not more_body and len(body) < self.minimum_size
+            if passthrough:
+                await send(start)
+                await send(message)
+                return
+
+            headers["Content-Encoding"] = encoding
+            compressor = _StreamCompressor(encoding, self.gzip_level, self.brotli_quality)
+            if more_body:
+                del headers["Content-Length"]
+                await send(start)
+                await send({"type": "http.response.body", "body": compressor.chunk(body), "more_body": True})
+            else:
+                data = compressor.finish(body)
+                headers["Content-Length"] = str(len(data))
+                await send(start)
+                await send({"type": "http.response.body", "body": data})
+
+        await self.app(scope, receive, send_compressed)
+
+
+def write_precompressed(path: Path, data: bytes) -> list[Path]:
+    """为文本类文件写入 ``.br`` / ``.gz`` 预压缩副本（仅当压缩后更小），返回写入的路径。"""
+    content_type = mimetypes.guess_type(path.name)[0] or ""
+    if (
+        not settings.COMPRESSION_ENABLED
+        or len(data) < settings.COMPRESSION_MIN_SIZE
+        or not is_compressible(content_type, settings.compression_content_types_list)
+    ):
+        return []
+    written = []
+    for encoding in available_encodings():
+        # 一次写入、多次读取：使用最高压缩级别
+        compressed = compress_bytes(data, encoding, level=11 if encoding == "br" else 9)
+        if len(compressed) < len(data):
+            target = path.with_name(path.name + PRECOMPRESSED_SUFFIXES[encoding])
+            # 先写临时文件再原子替换，/uploads 不会读到写了一半的副本
+            partial = target.with_name(target.name + ".tmp")
+            partial.write_bytes(compressed)
+            os.replace(partial, target)
+            written.append(target)
+    return written
+
+
+# 单线程依次处理：同一文件先后两次上传时，后一次的副本最后写入
+_precompress_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="precompress")
+
+
+def schedule_precompressed(path: Path, data: bytes) -> Future[list[Path]]:
+    """在后台线程中为刚写入的 path 生成预压缩副本。"""
+    stat = path.stat()
+    return _precompress_executor.submit(_write_precompressed_if_current, path, data, (stat.st_size, stat.st_mtime_ns))
+
+
+def _write_precompressed_if_current(path: Path, data: bytes, signature: tuple[int, int]) -> list[Path]:
+    """原文件在排队或压缩期间被覆盖、删除时放弃，避免留下与原文件不一致的副本。"""
+
+    def is_current() -> bool:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return False
+        return (stat.st_size, stat.st_mtime_ns) == signature
+
+    if not is_current():
+        return []
+    written = write_precompressed(path, data)
+    if not is_current():
+        for target in written:
+            target.unlink(missing_ok=True)
+        return []
+    return written
+
+
+def remove_precompressed(path: Path) -> None:
+    for suffix in PRECOMPRESSED_SUFFIXES.values():
+        sibling = path.with_name(path.name + suffix)
+        if sibling.exists():
+            sibling.unlink()
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """存在预压缩副本且客户端接受对应编码时返回副本（保持原文件的 Content-Type）。"""
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        response = await super().get_response(path, scope)
+        if response.status_code != 200 or not isinstance(response, FileResponse):
+            return response
+        accept_encoding = Headers(scope=scope).get("accept-encoding", "")
+        original = Path(response.path)
+        existing = tuple(
+            encoding
+            for encoding, suffix in PRECOMPRESSED_SUFFIXES.items()
+            if original.with_name(original.name + suffix).is_file()
+        )
+        encoding = negotiate_encoding(accept_encoding, existing) if existing else None
+        if encoding is None:
+            if existing:
+                response.headers.add_vary_header("Accept-Encoding")
+            return response
+        sibling = original.with_name(original.name + PRECOMPRESSED_SUFFIXES[encoding])
+        return FileResponse(
+            sibling,
+            media_type=response.media_type,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            stat_result=os.stat(sibling),
+        )
@@ -0,0 +1,98 @@
+"""
+条件请求（ETag / If-None-Match）
+
+聚合类接口（工作台、洞察）计算量大但数据变化不频繁。这里为一个资源范围计算廉价的
+"版本令牌"：对若干表按条件取 ``count(*)`` 与 ``max(更新时间列)``，全部作为标量子查询
+合并成一条 SELECT，再与调用方给出的范围键（社区 ID、用户 ID 等）一起取摘要作为 ETag。
+客户端携带的 If-None-Match 命中时直接返回 304，跳过聚合查询。
+
+- 新增行改变 count / max(id)，删除改变 count，修改改变 max(updated_at)。
+- 没有更新时间列的表（或令牌未覆盖的关联数据，如用户名）由时间分桶兜底：
+  令牌中包含 ``当前时间 // HTTP_CACHE_BUCKET_SECONDS``，最长陈旧时间不超过一个分桶。
+
+用法::
+
+    sources = [VersionSource(Content, Content.community_id == cid, watch=[Content.updated_at])]
+    etag = version_token(db, *sources, scope=("community", cid))
+    if (cached := conditional_response(request, response, etag, max_age=0)) is not None:
+        return cached
+"""
+
+import hashlib
+import time
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from fastapi import Request, Response
+from sqlalchemy import Select, func, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.config import settings
+
+
+class VersionSource:
+    """版本令牌的一个分量：``entity`` 中满足 ``criteria`` 的行数及 ``watch`` 各列的最大值。
+
+    ``entity`` 可以是 ORM 模型或 Table；``watch`` 省略时取主键列（仅能感知增删）。
+    """
+
+    def __init__(self, entity: Any, *criteria: Any, watch: Sequence[Any] | None = None):
+        self.entity = entity
+        self.criteria = criteria
+        if watch is None:
+            watch = list(inspect(entity).primary_key)
+        self.watch = list(watch)
+
+    def columns(self) -> list[Any]:
+        def scalar(expr: Any) -> Any:
+            return select(expr).select_from(self.entity).where(*self.criteria).scalar_subquery()
+
+        return [scalar(func.count()), *(scalar(func.max(col)) for col in self.watch)]
+
+
+def _version_query(sources: Iterable[VersionSource]) -> Select:
+    return select(*(col for source in sources for col in source.columns()))
+
+
+def _digest(row: Sequence[Any], scope: Sequence[Any]) -> str:
+    bucket_seconds = settings.HTTP_CACHE_BUCKET_SECONDS
+    bucket = int(time.time() // bucket_seconds) if bucket_seconds > 0 else 0
+    raw = repr((tuple(scope), bucket, tuple(row)))
+    return 'W/"' + hashlib.blake2b(raw.encode(), digest_size=12).hexdigest() + '"'
+
+
+def version_token(db: Session, *sources: VersionSource, scope: Sequence[Any] = ()) -> str:
+    """一次查询计算 ``sources`` 的版本令牌，返回弱 ETag 字符串。"""
+    row = db.execute(_version_query(sources)).one()
+    return _digest(row, scope)
+
+
+async def version_token_async(db: AsyncSession, *sources: VersionSource, scope: Sequence[Any] = ()) -> str:
+    """version_token 的异步版本。"""
+    row = (await db.execute(_version_query(sources))).one()
+    return _digest(row, scope)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    # If-None-Match 使用弱比较：忽略 W/ 前缀，支持逗号分隔的多个值与 "*"
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def conditional_response(request: Request, response: Response, etag: str, max_age: int = 0) -> Response | None:
+    """为响应写入 ETag / Cache-Control；If-None-Match 命中时返回 304 响应，否则返回 None。"""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={max_age}",
+        "Vary": "Authorization, X-Community-Id",
+    }
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,251 @@
+"""
+列表总数（COUNT）缓存
+
+分页接口每次请求都要对同一组过滤条件执行 ``COUNT(*)``；通知接口每次还要再数一遍未读数。
+这里按 (计数 SQL, 绑定参数) 缓存精确计数：
+
+- 有界 LRU + TTL，进程内共享；条目记录查询涉及的表及其"代数"；
+- 写入驱动失效：Session 的 ``after_flush`` / ``do_orm_execute``（批量 insert/update/delete）
+  收集本事务写过的表，``after_commit`` 时递增这些表的代数，相关条目随即作废；
+  回滚则丢弃收集结果。其他 worker 的写入不可见，最多陈旧 COUNT_CACHE_TTL_SECONDS；
+- PostgreSQL 下，规划器估算行数（无过滤条件的单表取 ``pg_class.reltuples``，否则取
+  ``EXPLAIN`` 的 Plan Rows）达到 COUNT_ESTIMATE_THRESHOLD 时直接返回估算值，
+  不再执行精确 COUNT，结果标记为非精确。
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import Table, event, func, select, text
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement
+
+from app.config import settings
+from app.core.metrics import COUNT_CACHE_LOOKUPS
+
+# Session.info 中暂存本事务写过的表名
+_PENDING_KEY = "count_cache_tables"
+
+
+@dataclass(frozen=True)
+class CountResult:
+    value: int
+    exact: bool = True
+
+
+@dataclass(frozen=True)
+class CachedCount:
+    result: CountResult
+    tables: tuple[str, ...]
+    generations: tuple[int, ...]
+    expires_at: float
+
+
+class CountCache:
+    """有界 TTL/LRU 计数缓存，按表代数失效。"""
+
+    def __init__(self, maxsize: int, ttl_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[tuple, CachedCount] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl_seconds > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def generations(self, tables: tuple[str, ...]) -> tuple[int, ...]:
+        with self._lock:
+            return tuple(self._generations.get(name, 0) for name in tables)
+
+    def get(self, key: tuple) -> CountResult | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            current = tuple(self._generations.get(name, 0) for name in entry.tables)
+            if entry.expires_at <= now or current != entry.generations:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.result
+
+    def put(self, key: tuple, result: CountResult, tables: tuple[str, ...], generations: tuple[int, ...]) -> None:
+        """generations 须在执行计数之前取得，计数期间提交的写入会使条目立即作废。"""
+        entry = CachedCount(result, tables, generations, time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate_tables(self, tables: set[str]) -> None:
+        with self._lock:
+            for name in tables:
+                self._generations[name] = self._generations.get(name, 0) + 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+count_cache = CountCache(maxsize=settings.COUNT_CACHE_SIZE, ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS)
+
+
+# ── 写入驱动失效 ──────────────────────────────────────────────────────
+
+
+def _table_names(element: Any) -> set[str]:
+    return {node.name for node in visitors.iterate(element) if isinstance(node, Table)}
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_flushed_tables(session: Session, _flush_context) -> None:
+    # after_flush 时 new / dirty / deleted 仍是 flush 前的状态
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        mapper = sa_inspect(obj).mapper
+        pending.update(table.name for table in mapper.tables)
+        for rel in mapper.relationships:
+            if rel.secondary is not None:
+                pending.update(_table_names(rel.secondary))
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_tables(orm_execute_state) -> None:
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        pending = orm_execute_state.session.info.setdefault(_PENDING_KEY, set())
+        pending.update(_table_names(orm_execute_state.statement.table))
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_committed_tables(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        count_cache.invalidate_tables(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending_tables(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+# ── 计数 ──────────────────────────────────────────────────────────────
+
+
+class _Explain(Executable, ClauseElement):
+    """``EXPLAIN (FORMAT JSON) <select>``，绑定参数按驱动正常传递。"""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Any):
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+@dataclass(frozen=True)
+class _CountPlan:
+    key: tuple
+    tables: tuple[str, ...]
+    inner: Any
+    count_statement: Any
+    estimate: bool
+
+
+def _plan(db: Session | AsyncSession, query: Any, allow_estimate: bool) -> _CountPlan:
+    if isinstance(query, Query):
+        inner = query.enable_eagerloads(False).order_by(None).statement
+    else:
+        inner = query.order_by(None)
+    count_statement = select(func.count()).select_from(inner.subquery())
+    dialect = db.get_bind().dialect
+    compiled = count_statement.compile(dialect=dialect)
+    key = (dialect.name, compiled.string, repr(sorted(compiled.params.items())))
+    estimate = allow_estimate and dialect.name == "postgresql" and settings.COUNT_ESTIMATE_THRESHOLD > 0
+    return _CountPlan(key, tuple(sorted(_table_names(inner))), inner, count_statement, estimate)
+
+
+def _reltuples_statement(plan: _CountPlan) -> Any | None:
+    """无过滤条件的单表查询直接读统计信息（从未 ANALYZE 的表为 -1，视为无估算）。"""
+    if plan.inner.whereclause is not None or len(plan.tables) != 1:
+        return None
+    return text("SELECT reltuples FROM pg_class WHERE oid = to_regclass(:name)").bindparams(name=plan.tables[0])
+
+
+def _plan_rows(explain_output: Any) -> float | None:
+    if isinstance(explain_output, str):
+        explain_output = json.loads(explain_output)
+    try:
+        return float(explain_output[0]["Plan"]["Plan Rows"])
+    except (LookupError, TypeError, ValueError):
+        return None
+
+
+def _estimated(rows: float | None) -> CountResult | None:
+    if rows is None or rows < settings.COUNT_ESTIMATE_THRESHOLD:
+        return None
+    return CountResult(int(rows), exact=False)
+
+
+def _remember(plan: _CountPlan, result: CountResult, generations: tuple[int, ...]) -> CountResult:
+    COUNT_CACHE_LOOKUPS.labels(result="exact" if result.exact else "estimate").inc()
+    if count_cache.enabled:
+        count_cache.put(plan.key, result, plan.tables, generations)
+    return result
+
+
+def count_rows(db: Session, query: Query | Any, *, allow_estimate: bool = True) -> CountResult:
+    """返回 query（ORM Query 或 select）的总行数，优先使用缓存与规划器估算。"""
+    plan = _plan(db, query, allow_estimate)
+    if count_cache.enabled and (cached := count_cache.get(plan.key)) is not None:
+        COUNT_CACHE_LOOKUPS.labels(result="hit").inc()
+        return cached
+    generations = count_cache.generations(plan.tables)
+
+    if plan.estimate:
+        reltuples = _reltuples_statement(plan)
+        rows = db.execute(reltuples).scalar() if reltuples is not None else None
+        if rows is None or rows < 0:
+            rows = _plan_rows(db.execute(_Explain(plan.inner)).scalar())
+        if (result := _estimated(rows)) is not None:
+            return _remember(plan, result, generations)
+
+    return _remember(plan, CountResult(db.execute(plan.count_statement).scalar() or 0), generations)
+
+
+async def count_rows_async(db: AsyncSession, statement: Any, *, allow_estimate: bool = True) -> CountResult:
+    """count_rows 的 AsyncSession 版本。"""
+    plan = _plan(db, statement, allow_estimate)
+    if count_cache.enabled and (cached := count_cache.get(plan.key)) is not None:
+        COUNT_CACHE_LOOKUPS.labels(result="hit").inc()
+        return cached
+    generations = count_cache.generations(plan.tables)
+
+    if plan.estimate:
+        reltuples = _reltuples_statement(plan)
+        rows = await db.scalar(reltuples) if reltuples is not None else None
+        if rows is None or rows < 0:
+            rows = _plan_rows(await db.scalar(_Explain(plan.inner)))
+        if (result := _estimated(rows)) is not None:
+            return _remember(plan, result, generations)
+
+    return _remember(plan, CountResult(await db.scalar(plan.count_statement) or 0), generations)
@@ -0,0 +1,188 @@
+"""
+读写分离与只读副本路由
+
+配置 DATABASE_REPLICA_URLS 后，只读依赖（get_read_db / get_async_read_db）按轮询
+分发到健康的副本；写操作始终走主库 engine。
+
+- 健康检查：每个 worker 的 APScheduler 每 DB_REPLICA_HEALTH_CHECK_SECONDS 对副本执行
+  ``SELECT 1``；请求中出现连接失败/断开时立即摘除，所有副本不可用时回落主库。
+- 读己之写：请求期间若在主库执行了写语句，响应会带上 ``og_primary_until`` Cookie，
+  DB_REPLICA_STICKY_SECONDS 内该客户端的读请求仍走主库，避开副本复制延迟。
+  Cookie 跨 worker / 跨节点生效；不保存 Cookie 的客户端不享有该保证。
+  带 ``SKIP_WRITE_TRACKING`` 执行选项的连接（如 database:// 限流计数器）写入不计入。
+"""
+
+import re
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from http.cookies import SimpleCookie
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+PRIMARY_COOKIE = "og_primary_until"
+# 连接 / engine 执行选项：为 True 时其写语句不触发主库粘滞
+SKIP_WRITE_TRACKING = "skip_write_tracking"
+
+_WRITE_RE = re.compile(r"^\s*(INSERT|UPDATE|DELETE|REPLACE|MERGE|UPSERT|CREATE|ALTER|DROP|TRUNCATE)\b", re.I)
+
+
+@dataclass
+class RoutingState:
+    force_primary: bool = False  # 请求携带的 Cookie 仍在粘滞窗口内
+    wrote: bool = False  # 本次请求已在主库执行过写语句
+
+
+_routing_state: ContextVar[RoutingState | None] = ContextVar("db_routing_state", default=None)
+
+
+def primary_required() -> bool:
+    """当前请求的读操作是否必须走主库。"""
+    state = _routing_state.get()
+    return state is not None and (state.force_primary or state.wrote)
+
+
+def track_primary_writes(engine: Engine) -> None:
+    """监听主库 engine：请求上下文中执行写语句时标记本次请求已写入。
+
+    带 SKIP_WRITE_TRACKING 执行选项的写入是内部簿记（不影响业务数据读取），不计入。
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _mark_write(conn, cursor, statement, parameters, context, executemany):
+        state = _routing_state.get()
+        if state is None or state.wrote or not _WRITE_RE.match(statement):
+            return
+        if context is not None and context.execution_options.get(SKIP_WRITE_TRACKING):
+            return
+        state.wrote = True
+
+
+@dataclass(eq=False)
+class Replica:
+    name: str
+    engine: Engine
+    async_engine: AsyncEngine
+    healthy: bool = True
+    last_error: str | None = None
+    checked_at: float = field(default=0.0)
+
+
+class ReplicaRouter:
+    """在健康副本间轮询；全部不可用时 choose() 返回 None，由调用方回落主库。"""
+
+    def __init__(self, replicas: list[Replica]):
+        self.replicas = replicas
+        self._next = 0
+        self._lock = threading.Lock()
+        for replica in replicas:
+            self._watch_errors(replica)
+
+    def _watch_errors(self, replica: Replica) -> None:
+        def _on_error(context) -> None:
+            # 连接阶段失败（connection 为 None）或连接断开时立即摘除，等待下次健康检查恢复
+            if context.is_disconnect or context.connection is None:
+                self.mark_down(replica, str(context.original_exception))
+
+        event.listen(replica.engine, "handle_error", _on_error)
+        event.listen(replica.async_engine.sync_engine, "handle_error", _on_error)
+
+    def choose(self) -> Replica | None:
+        with self._lock:
+            for _ in range(len(self.replicas)):
+                replica = self.replicas[self._next % len(self.replicas)]
+                self._next += 1
+                if replica.healthy:
+                    return replica
+        return None
+
+    def mark_down(self, replica: Replica, error: str) -> None:
+        if replica.healthy:
+            logger.warning("只读副本不可用，已摘除", extra={"replica": replica.name, "error": error})
+        replica.healthy = False
+        replica.last_error = error
+
+    def check_health(self) -> None:
+        """对每个副本执行 SELECT 1 并更新健康状态（由定时任务调用）。"""
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            except Exception as exc:
+                self.mark_down(replica, str(exc))
+            else:
+                if not replica.healthy:
+                    logger.info("只读副本已恢复", extra={"replica": replica.name})
+                replica.healthy = True
+                replica.last_error = None
+            replica.checked_at = time.time()
+
+    def status(self) -> list[dict]:
+        return [
+            {
+                "name": r.name,
+                "healthy": r.healthy,
+                "last_error": r.last_error,
+                "checked_at": r.checked_at or None,
+            }
+            for r in self.replicas
+        ]
+
+
+def replica_display_name(url: str) -> str:
+    """隐藏密码的副本 URL，用于日志与状态接口。"""
+    return make_url(url).render_as_string(hide_password=True)
+
+
+class ReadYourWritesMiddleware:
+    """为每个请求建立路由状态；写入主库后下发粘滞 Cookie。
+
+    限流计数器写入（database:// 存储）带 SKIP_WRITE_TRACKING 选项，无论发生在
+    SlowAPIMiddleware 还是路由依赖（社区配额）中都不算作用户写操作。
+    """
+
+    def __init__(self, app: ASGIApp, sticky_seconds: float):
+        self.app = app
+        self.sticky_seconds = sticky_seconds
+
+    def _sticky_until(self, scope: Scope) -> float:
+        for name, value in scope.get("headers", []):
+            if name == b"cookie":
+                morsel = SimpleCookie(value.decode("latin-1")).get(PRIMARY_COOKIE)
+                if morsel is not None:
+                    try:
+                        return float(morsel.value)
+                    except ValueError:
+                        return 0.0
+        return 0.0
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.sticky_seconds <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        state = RoutingState(force_primary=self._sticky_until(scope) > time.time())
+        token = _routing_state.set(state)
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.wrote:
+                until = time.time() + self.sticky_seconds
+                cookie = (
+                    f"{PRIMARY_COOKIE}={until:.3f}; Max-Age={int(self.sticky_seconds) + 1}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [*message.get("headers", []), (b"set-cookie", cookie.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            _routing_state.reset(token)
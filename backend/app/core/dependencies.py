@@ -1,53 +1,47 @@
 
-from fastapi import Depends, Header, HTTPException, status
+from fastapi import Depends, Header, HTTPException, Request, status
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
+from app.core.principal_cache import cached_community_roles, principal_cache
+from app.core.rate_limit import limiter
 from app.core.security import decode_access_token
-from app.database import get_db
+from app.database import get_async_db, get_db
 from app.models import Community, User
 from app.models.user import community_users
 
 
-async def get_current_user(
-    authorization: str | None = Header(None),
-    db: Session = Depends(get_db),
-) -> User:
-    """
-    Dependency to get the current authenticated user from JWT token.
-
-    Args:
-        authorization: Authorization header with Bearer token
-        db: Database session
-
-    Returns:
-        User: The authenticated user
-
-    Raises:
-        HTTPException: If token is invalid or user not found
-    """
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _get_token_principal(authorization: str | None) -> tuple[str, int | None]:
+    """Extract (username, issued-at) from a Bearer token, raising 401 on failure."""
     if not authorization or not authorization.startswith("Bearer "):
-        raise credentials_exception
+        raise _credentials_exception()
 
     token = authorization.replace("Bearer ", "")
     payload = decode_access_token(token)
 
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     username: str = payload.get("sub")
     if username is None:
-        raise credentials_exception
+        raise _credentials_exception()
+    # Tokens issued before iat was added fall back to exp for the cache key
+    return username, payload.get("iat", payload.get("exp"))
+
 
-    user = db.query(User).filter(User.username == username).first()
+def _ensure_active_user(user: User | None) -> User:
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     if not user.is_active:
         raise HTTPException(
@@ -58,7 +52,72 @@ async def get_current_user(
     return user
 
 
-async def get_current_community(
+def get_current_user(
+    authorization: str | None = Header(None),
+    db: Session = Depends(get_db),
+) -> User:
+    """
+    Dependency to get the current authenticated user from JWT token.
+
+    Declared as a plain ``def`` so the blocking Session query runs in
+    FastAPI's threadpool instead of the event loop. Users are resolved
+    through the principal cache, so repeat requests with the same token
+    usually issue no query at all.
+
+    Args:
+        authorization: Authorization header with Bearer token
+        db: Database session
+
+    Returns:
+        User: The authenticated user
+
+    Raises:
+        HTTPException: If token is invalid or user not found
+    """
+    username, issued_at = _get_token_principal(authorization)
+    user = principal_cache.resolve(db, username, issued_at)
+    return _ensure_active_user(user)
+
+
+async def get_current_user_async(
+    authorization: str | None = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+) -> User:
+    """
+    AsyncSession variant of :func:`get_current_user` for ``async def`` routes.
+
+    Keeps those routes entirely on the async engine, so they never hold a
+    connection from the synchronous pool while awaiting.
+    """
+    username, issued_at = _get_token_principal(authorization)
+    user = await db.run_sync(principal_cache.resolve, username, issued_at)
+    return _ensure_active_user(user)
+
+
+def _require_community_header(x_community_id: int | None) -> None:
+    if x_community_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="X-Community-Id header is required",
+        )
+
+
+def _community_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Community not found",
+    )
+
+
+def _community_forbidden() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_403_FORBIDDEN,
+        detail="You do not have access to this community",
+    )
+
+
+def get_current_community(
+    request: Request,
     x_community_id: int | None = Header(None),
     user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -66,7 +125,11 @@ async def get_current_community(
     """
     Dependency to get and validate the current community ID.
 
+    The community's shared rate-limit quota is counted only after access
+    has been verified, so a spoofed header cannot consume or dodge it.
+
     Args:
+        request: Current request
         x_community_id: Community ID from X-Community-Id header
         user: Current authenticated user
         db: Database session
@@ -76,25 +139,31 @@ async def get_current_community(
 
     Raises:
         HTTPException: If community ID is missing or user has no access
+        RateLimitExceeded: If the community quota is exhausted
     """
-    if x_community_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="X-Community-Id header is required",
-        )
+    _require_community_header(x_community_id)
+    _verify_community_access(x_community_id, user, db)
+    limiter.hit_community(request, x_community_id)
+    return x_community_id
+
 
+def _verify_community_access(x_community_id: int, user: User, db: Session) -> None:
+    """Raise 404/403 unless the user may access the community."""
     # Superusers can access all communities
     if user.is_superuser:
         # Verify community exists
         community = db.query(Community).filter(Community.id == x_community_id).first()
         if not community:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Community not found",
-            )
-        return x_community_id
+            raise _community_not_found()
+        return
 
     # Regular users can only access their assigned communities
+    roles = cached_community_roles(user)
+    if roles is not None:
+        if x_community_id not in roles:
+            raise _community_forbidden()
+        return
+
     community = (
         db.query(Community)
         .filter(Community.id == x_community_id)
@@ -103,14 +172,47 @@ async def get_current_community(
     )
 
     if not community:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You do not have access to this community",
-        )
+        raise _community_forbidden()
+
 
+async def get_current_community_async(
+    request: Request,
+    x_community_id: int | None = Header(None),
+    user: User = Depends(get_current_user_async),
+    db: AsyncSession = Depends(get_async_db),
+) -> int:
+    """AsyncSession variant of :func:`get_current_community`."""
+    _require_community_header(x_community_id)
+    await _verify_community_access_async(x_community_id, user, db)
+    # 限流存储（database:// / redis://）是阻塞 I/O，放到线程池执行
+    await run_in_threadpool(limiter.hit_community, request, x_community_id)
     return x_community_id
 
 
+async def _verify_community_access_async(x_community_id: int, user: User, db: AsyncSession) -> None:
+    """AsyncSession variant of :func:`_verify_community_access`."""
+    if user.is_superuser:
+        community_id = await db.scalar(select(Community.id).where(Community.id == x_community_id))
+        if community_id is None:
+            raise _community_not_found()
+        return
+
+    roles = cached_community_roles(user)
+    if roles is not None:
+        if x_community_id not in roles:
+            raise _community_forbidden()
+        return
+
+    membership = await db.scalar(
+        select(community_users.c.community_id).where(
+            community_users.c.user_id == user.id,
+            community_users.c.community_id == x_community_id,
+        )
+    )
+    if membership is None:
+        raise _community_forbidden()
+
+
 async def get_current_active_superuser(
     current_user: User = Depends(get_current_user),
 ) -> User:
@@ -134,6 +236,18 @@ async def get_current_active_superuser(
     return current_user
 
 
+async def get_current_active_superuser_async(
+    current_user: User = Depends(get_current_user_async),
+) -> User:
+    """AsyncSession variant of :func:`get_current_active_superuser`."""
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+    return current_user
+
+
 def get_user_community_role(
     user: User,
     community_id: int,
@@ -153,6 +267,10 @@ def get_user_community_role(
     if user.is_superuser:
         return "superuser"
 
+    roles = cached_community_roles(user)
+    if roles is not None:
+        return roles.get(community_id)
+
     # Query the community_users table for the role
     stmt = select(community_users.c.role).where(
         community_users.c.user_id == user.id,
@@ -185,13 +303,17 @@ async def get_current_admin_or_superuser(
     if current_user.is_superuser:
         return current_user
 
-    stmt = select(community_users.c.role).where(
-        community_users.c.user_id == current_user.id,
-        community_users.c.role == "admin",
-    ).limit(1)
-    result = db.execute(stmt).scalar()
-
-    if not result:
+    roles = cached_community_roles(current_user)
+    if roles is not None:
+        is_admin = "admin" in roles.values()
+    else:
+        stmt = select(community_users.c.role).where(
+            community_users.c.user_id == current_user.id,
+            community_users.c.role == "admin",
+        ).limit(1)
+        is_admin = db.execute(stmt).scalar() is not None
+
+    if not is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="管理员权限不足",
@@ -270,8 +392,8 @@ def check_content_edit_permission(
     if content.owner_id == user.id:
         return True
 
-    # Collaborators can edit
-    if user in content.collaborators:
+    # Collaborators can edit（按 ID 比较：user 可能来自另一个 Session）
+    if any(c.id == user.id for c in content.collaborators):
         return True
 
     # Community admin can edit
@@ -0,0 +1,298 @@
+"""
+Prometheus 指标
+
+所有指标在此集中定义，由 ``GET /api/metrics`` 以 Prometheus 文本格式导出：
+
+- HTTP：按路由模板的请求数、延迟直方图、进行中请求数
+- 数据库连接池：已借出连接数、溢出连接数、获取连接超时次数（同步 / 异步 engine）
+- 列表总数缓存：命中 / 精确计数 / 规划器估算次数
+- APScheduler：任务耗时与失败次数
+- 生态采集器：项目同步结果、GitHub API 调用、令牌桶限速等待
+- 微信公众号 API 调用延迟
+
+多进程（gunicorn 多 worker）部署时设置环境变量 ``PROMETHEUS_MULTIPROC_DIR``，
+各 worker 将指标写入该目录下的共享文件，导出时由 MultiProcessCollector 汇总，
+因此任一 worker 响应的都是整个 Pod 的数据。该变量必须在进程导入 prometheus_client
+之前设置（见 gunicorn.conf.py 与 docker-compose.prod.yml）。
+"""
+
+import os
+import time
+
+import httpx
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import event
+from sqlalchemy import exc as sa_exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# ── HTTP ──────────────────────────────────────────────────────────────
+HTTP_REQUESTS = Counter(
+    "opengecko_http_requests_total",
+    "HTTP 请求数",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "opengecko_http_request_duration_seconds",
+    "HTTP 请求处理耗时",
+    ["method", "route"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HTTP_IN_FLIGHT = Gauge(
+    "opengecko_http_requests_in_flight",
+    "正在处理的 HTTP 请求数",
+    multiprocess_mode="livesum",
+)
+
+# ── 数据库连接池 ──────────────────────────────────────────────────────
+DB_POOL_CHECKED_OUT = Gauge(
+    "opengecko_db_pool_checked_out",
+    "连接池中已借出的连接数",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "opengecko_db_pool_overflow",
+    "超出 pool_size 额外创建的连接数",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_TIMEOUTS = Counter(
+    "opengecko_db_pool_timeouts_total",
+    "等待连接超过 pool_timeout 的次数",
+    ["engine"],
+)
+
+# ── 列表总数缓存 ──────────────────────────────────────────────────────
+COUNT_CACHE_LOOKUPS = Counter(
+    "opengecko_count_cache_lookups_total",
+    "列表总数查询次数（hit=缓存命中，exact=执行 COUNT，estimate=采用规划器估算）",
+    ["result"],
+)
+
+# ── 定时任务 ──────────────────────────────────────────────────────────
+SCHEDULER_JOB_DURATION = Histogram(
+    "opengecko_scheduler_job_duration_seconds",
+    "定时任务执行耗时",
+    ["job_id"],
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 1800.0, 3600.0),
+)
+SCHEDULER_JOB_FAILURES = Counter(
+    "opengecko_scheduler_job_failures_total",
+    "定时任务失败次数",
+    ["job_id"],
+)
+
+# ── 后台任务队列 ──────────────────────────────────────────────────────
+JOB_DURATION = Histogram(
+    "opengecko_job_duration_seconds",
+    "后台任务单次执行耗时",
+    ["kind", "status"],
+    buckets=(0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 300.0, 900.0, 1800.0),
+)
+JOB_RETRIES = Counter(
+    "opengecko_job_retries_total",
+    "后台任务失败后重新入队的次数",
+    ["kind"],
+)
+
+# ── 通知邮件发件箱 ────────────────────────────────────────────────────
+NOTIFY_OUTBOX_DELIVERIES = Counter(
+    "opengecko_notify_outbox_deliveries_total",
+    "通知邮件投递结果（sent / retry / failed）",
+    ["status"],
+)
+NOTIFY_OUTBOX_BATCH_DURATION = Histogram(
+    "opengecko_notify_outbox_batch_duration_seconds",
+    "通知邮件分发器单批投递耗时（含建立 SMTP 连接）",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+
+# ── 会议提醒分发 ──────────────────────────────────────────────────────
+MEETING_REMINDERS_DISPATCHED = Counter(
+    "opengecko_meeting_reminders_dispatched_total",
+    "分发器处理的到期会议提醒（sent / failed）",
+    ["status"],
+)
+MEETING_REMINDER_BATCH_DURATION = Histogram(
+    "opengecko_meeting_reminder_batch_duration_seconds",
+    "会议提醒分发器单批处理耗时",
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0),
+)
+MEETING_REMINDER_LAG = Histogram(
+    "opengecko_meeting_reminder_lag_seconds",
+    "会议提醒实际发送时间与计划时间（scheduled_at）之差",
+    buckets=(1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 900.0, 3600.0),
+)
+
+# ── 定时自动发布 ──────────────────────────────────────────────────────
+AUTO_PUBLISH_RESULTS = Counter(
+    "opengecko_auto_publish_results_total",
+    "定时自动发布各渠道的发布结果",
+    ["channel", "status"],
+)
+AUTO_PUBLISH_BATCH_DURATION = Histogram(
+    "opengecko_auto_publish_batch_duration_seconds",
+    "定时发布器单批处理耗时（含各渠道并发发布）",
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0),
+)
+
+# ── 生态采集器 ────────────────────────────────────────────────────────
+COLLECTOR_PROJECTS_SYNCED = Counter(
+    "opengecko_collector_projects_synced_total",
+    "采集器同步的项目数",
+    ["result"],
+)
+GITHUB_API_CALLS = Counter(
+    "opengecko_github_api_calls_total",
+    "GitHub API 调用次数",
+    ["status"],
+)
+COLLECTOR_RATE_LIMIT_WAITS = Counter(
+    "opengecko_collector_rate_limit_waits_total",
+    "令牌不足、需要等待的 RateLimiter.acquire 次数",
+)
+COLLECTOR_RATE_LIMIT_WAIT_SECONDS = Counter(
+    "opengecko_collector_rate_limit_wait_seconds_total",
+    "RateLimiter.acquire 累计等待时长",
+)
+
+# ── 微信公众号 ────────────────────────────────────────────────────────
+WECHAT_API_DURATION = Histogram(
+    "opengecko_wechat_api_duration_seconds",
+    "微信公众号 API 调用耗时",
+    ["endpoint", "status"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+def render_metrics() -> tuple[bytes, str]:
+    """返回 (指标文本, Content-Type)；多进程模式下汇总所有 worker 的数据。"""
+    if "PROMETHEUS_MULTIPROC_DIR" in os.environ:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+# ── HTTP 中间件 ───────────────────────────────────────────────────────
+
+
+def _route_path(scope: Scope) -> str:
+    # 使用路由模板（/api/contents/{content_id}）而非原始路径，避免标签基数失控
+    route = scope.get("route")
+    return getattr(route, "path", None) or "<unmatched>"
+
+
+class MetricsMiddleware:
+    """记录每个 HTTP 请求的路由、状态码与耗时。"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_IN_FLIGHT.dec()
+            method = scope.get("method", "")
+            route = _route_path(scope)
+            HTTP_REQUEST_DURATION.labels(method=method, route=route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(method=method, route=route, status=str(status_code)).inc()
+
+
+# ── 数据库连接池 ──────────────────────────────────────────────────────
+
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool：获取连接超时时计数。"""
+
+    metrics_engine = "sync"
+
+    def connect(self):
+        try:
+            return super().connect()
+        except sa_exc.TimeoutError:
+            DB_POOL_TIMEOUTS.labels(engine=self.metrics_engine).inc()
+            raise
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool：获取连接超时时计数。"""
+
+    metrics_engine = "async"
+
+    def connect(self):
+        try:
+            return super().connect()
+        except sa_exc.TimeoutError:
+            DB_POOL_TIMEOUTS.labels(engine=self.metrics_engine).inc()
+            raise
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """在连接借出/归还时刷新连接池指标（异步 engine 传入其 sync_engine）。"""
+
+    def _update(returning: int) -> None:
+        pool = engine.pool
+        if hasattr(pool, "checkedout"):
+            DB_POOL_CHECKED_OUT.labels(engine=name).set(max(pool.checkedout() - returning, 0))
+        if hasattr(pool, "overflow"):
+            DB_POOL_OVERFLOW.labels(engine=name).set(max(pool.overflow(), 0))
+
+    # checkin 事件在连接放回池之前触发，此时 checkedout() 仍包含该连接
+    event.listen(engine, "checkout", lambda *_: _update(0))
+    event.listen(engine, "checkin", lambda *_: _update(1))
+
+
+# ── 外部 API ──────────────────────────────────────────────────────────
+
+
+def wechat_event_hooks() -> dict:
+    """httpx 事件钩子：按接口路径记录微信 API 调用耗时。"""
+
+    async def on_request(request: httpx.Request) -> None:
+        request.extensions["metrics_start"] = time.perf_counter()
+
+    async def on_response(response: httpx.Response) -> None:
+        start = response.request.extensions.get("metrics_start")
+        if start is not None:
+            WECHAT_API_DURATION.labels(
+                endpoint=response.request.url.path, status=str(response.status_code)
+            ).observe(time.perf_counter() - start)
+
+    return {"request": [on_request], "response": [on_response]}
+
+
+def github_event_hooks() -> dict:
+    """httpx 事件钩子：按状态码统计 GitHub API 调用次数。"""
+
+    def on_response(response: httpx.Response) -> None:
+        GITHUB_API_CALLS.labels(status=str(response.status_code)).inc()
+
+    return {"response": [on_response]}
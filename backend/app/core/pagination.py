@@ -0,0 +1,153 @@
+"""
+游标（keyset）分页
+
+列表接口默认仍是 ``page`` / ``page_size`` 偏移分页；传入 ``cursor`` 后改为游标分页：
+按排序键（如 ``updated_at, id``）取"上一页最后一行之后"的数据，深翻页的代价与第一页相同，
+且默认不再计算 COUNT（``include_total=true`` 时才计算）。总数经 app/core/count_cache.py 缓存，
+大表在 PostgreSQL 下可能是规划器估算值，此时响应 ``total_exact`` 为 false。
+
+两种模式的响应都带 ``next_cursor``（无下一页时为 null），前端可在任意一页切换到游标模式。
+游标是排序键取值的 base64url JSON，对客户端不透明；排序键以主键收尾，保证顺序稳定。
+
+用法::
+
+    KEYSET = Keyset(Content.updated_at, Content.id, descending=True)
+
+    query = KEYSET.apply(query, cursor=cursor, offset=(page - 1) * page_size, limit=page_size)
+    items, next_cursor = KEYSET.page(query.all(), page_size)
+"""
+
+import base64
+import binascii
+import json
+from datetime import date, datetime
+from typing import Any, TypeVar
+
+from fastapi import HTTPException, status
+from sqlalchemy import Date, DateTime, and_, false, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.count_cache import CountResult, count_rows, count_rows_async
+
+T = TypeVar("T")
+
+# 列表接口 Query 参数说明
+CURSOR_DOC = "游标分页：上一页返回的 next_cursor，传入时忽略 page"
+INCLUDE_TOTAL_DOC = "是否返回 total；默认偏移分页返回、游标分页省略"
+
+
+class Keyset:
+    """一组排序键（同一方向），最后一列须唯一（通常为主键）。"""
+
+    def __init__(self, *columns: Any, descending: bool = False):
+        self.columns = columns
+        self.descending = descending
+        # 游标中记录排序键名，拒绝其他接口的游标
+        self._tag = ",".join(f"{col.class_.__tablename__}.{col.key}" for col in columns)
+
+    @staticmethod
+    def _nullable(column: Any) -> bool:
+        """可空列按 NULL 处理（NULLS LAST）。
+
+        只看列定义的 nullable：有默认值的列仍可能存有默认值加入前写入的 NULL。
+        ``col < v OR col IS NULL`` 无法走索引范围扫描，常用的排序时间戳列因此声明为 NOT NULL。
+        """
+        return bool(getattr(column.expression, "nullable", False))
+
+    def order_by(self) -> list[Any]:
+        """排序子句；可空列统一 NULLS LAST，与游标条件一致。"""
+        clauses = []
+        for col in self.columns:
+            clause = col.desc() if self.descending else col.asc()
+            clauses.append(clause.nullslast() if self._nullable(col) else clause)
+        return clauses
+
+    # ── 游标编解码 ────────────────────────────────────────────────────
+
+    def encode(self, row: Any) -> str:
+        values = []
+        for col in self.columns:
+            value = getattr(row, col.key)
+            values.append(value.isoformat() if isinstance(value, date) else value)
+        raw = json.dumps({"k": self._tag, "v": values}, separators=(",", ":"), ensure_ascii=False)
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list[Any]:
+        try:
+            raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            if payload["k"] != self._tag or len(payload["v"]) != len(self.columns):
+                raise ValueError("cursor mismatch")
+            values = []
+            for col, value in zip(self.columns, payload["v"], strict=True):
+                if value is not None and isinstance(col.type, DateTime):
+                    value = datetime.fromisoformat(value)
+                elif value is not None and isinstance(col.type, Date):
+                    value = date.fromisoformat(value)
+                values.append(value)
+            return values
+        except (ValueError, KeyError, TypeError, binascii.Error, UnicodeDecodeError):
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="无效的分页游标") from None
+
+    # ── 查询 ─────────────────────────────────────────────────────────
+
+    def after(self, cursor: str) -> Any:
+        """排在游标所指行之后的行：(k1 > v1) OR (k1 = v1 AND k2 > v2) OR ...（NULL 视为最后）。"""
+        values = self.decode(cursor)
+        branches = []
+        for i, (col, value) in enumerate(zip(self.columns, values, strict=True)):
+            equal = [c.is_(None) if v is None else c == v for c, v in zip(self.columns[:i], values[:i], strict=True)]
+            if value is None:
+                continue  # NULL 排在最后，其后没有更大的值
+            beyond = col < value if self.descending else col > value
+            if self._nullable(col):
+                beyond = or_(beyond, col.is_(None))
+            branches.append(and_(*equal, beyond))
+        if not branches:
+            return false()
+        head, value = self.columns[0], values[0]
+        if value is None or self._nullable(head):
+            return or_(*branches)
+        # 首列的闭区间冗余条件：各分支的参数是独立绑定的，数据库据此才能做索引范围扫描
+        return and_(head <= value if self.descending else head >= value, or_(*branches))
+
+    def apply(self, query: Any, *, cursor: str | None, offset: int, limit: int) -> Any:
+        """为 Query / Select 加上排序、游标条件（或偏移）与 limit + 1（用于判断是否有下一页）。"""
+        query = query.order_by(*self.order_by())
+        if cursor:
+            query = query.where(self.after(cursor))
+        elif offset:
+            query = query.offset(offset)
+        return query.limit(limit + 1)
+
+    def page(self, rows: list[T], limit: int, key: Any = None) -> tuple[list[T], str | None]:
+        """截取一页并生成 next_cursor；rows 为元组时用 ``key`` 取出实体。"""
+        items = list(rows[:limit])
+        if len(rows) <= limit or not items:
+            return items, None
+        last = key(items[-1]) if key else items[-1]
+        return items, self.encode(last)
+
+
+def want_total(include_total: bool | None, cursor: str | None) -> bool:
+    """偏移模式默认返回总数；游标模式默认省略（include_total=true 时仍计算）。"""
+    return include_total if include_total is not None else not cursor
+
+
+def _total_fields(counted: CountResult | None) -> dict[str, Any]:
+    if counted is None:
+        return {"total": None, "total_exact": True}
+    return {"total": counted.value, "total_exact": counted.exact}
+
+
+def page_total(db: Session, query: Any, *, include_total: bool | None, cursor: str | None) -> dict[str, Any]:
+    """列表响应的 ``total`` / ``total_exact`` 字段（经 COUNT 缓存，大表可能为估算值）。"""
+    return _total_fields(count_rows(db, query) if want_total(include_total, cursor) else None)
+
+
+async def page_total_async(
+    db: AsyncSession, statement: Any, *, include_total: bool | None, cursor: str | None
+) -> dict[str, Any]:
+    counted = await count_rows_async(db, statement) if want_total(include_total, cursor) else None
+    return _total_fields(counted)
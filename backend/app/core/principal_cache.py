@@ -0,0 +1,151 @@
+"""
+认证主体缓存
+
+每个需要登录的请求原本都要查一次 users 表，带社区头的请求再查一次成员关系/角色。
+这里按 (token sub, token iat) 缓存用户行快照及其 {community_id: role} 映射：
+
+- 有界 LRU + TTL，进程内共享；
+- 命中时用 ``Session.merge(load=False)`` 把快照挂回当前请求的 Session，不产生查询；
+- 用户或成员关系变更时调用 :func:`invalidate_principal_cache`，在同一事务内递增
+  cache_versions 中的版本号；各 worker 每隔 PRINCIPAL_CACHE_VERSION_CHECK_SECONDS
+  比对一次版本号，发现变化即清空本地缓存。
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy import select
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from app.config import settings
+from app.models.user import User, community_users
+from app.services.cache_version import bump_cache_version, get_cache_version
+
+PRINCIPAL_CACHE_NAME = "principal"
+
+# 挂在当前请求 User 实例上的角色映射属性名（非映射属性，仅在本次请求内有效）
+_ROLES_ATTR = "_cached_community_roles"
+
+
+@dataclass(frozen=True)
+class CachedPrincipal:
+    user: User  # 仅含列属性的 detached 快照，不可直接修改
+    community_roles: dict[int, str]
+    version: int
+    expires_at: float
+
+
+def _snapshot(user: User) -> User:
+    """复制用户的列属性为一个 detached 实例，与原 Session 完全脱钩。"""
+    values = {attr.key: getattr(user, attr.key) for attr in sa_inspect(User).column_attrs}
+    snapshot = User(**values)
+    make_transient_to_detached(snapshot)
+    return snapshot
+
+
+def _load_community_roles(db: Session, user_id: int) -> dict[int, str]:
+    rows = db.execute(
+        select(community_users.c.community_id, community_users.c.role).where(
+            community_users.c.user_id == user_id
+        )
+    ).all()
+    return dict(rows)
+
+
+class PrincipalCache:
+    """有界 TTL/LRU 认证主体缓存，失效由数据库版本号驱动。"""
+
+    def __init__(self, maxsize: int, ttl_seconds: float, version_check_seconds: float):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self._entries: OrderedDict[tuple[str, int | None], CachedPrincipal] = OrderedDict()
+        self._lock = threading.Lock()
+        self._version: int | None = None
+        self._version_checked_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0 and self.ttl_seconds > 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _current_version(self, db: Session) -> int:
+        now = time.monotonic()
+        if self._version is not None and now - self._version_checked_at < self.version_check_seconds:
+            return self._version
+
+        version = get_cache_version(db, PRINCIPAL_CACHE_NAME)
+        with self._lock:
+            if version != self._version:
+                self._entries.clear()
+                self._version = version
+            self._version_checked_at = now
+        return version
+
+    def resolve(self, db: Session, subject: str, issued_at: int | None) -> User | None:
+        """返回绑定到 db 的 User（附带社区角色映射），用户不存在时返回 None。"""
+        if not self.enabled:
+            return db.query(User).filter(User.username == subject).first()
+
+        key = (subject, issued_at)
+        version = self._current_version(db)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (entry.version != version or entry.expires_at <= now):
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None:
+            user = db.merge(entry.user, load=False)
+            setattr(user, _ROLES_ATTR, entry.community_roles)
+            return user
+
+        user = db.query(User).filter(User.username == subject).first()
+        if user is None:
+            return None
+        roles = _load_community_roles(db, user.id)
+        entry = CachedPrincipal(
+            user=_snapshot(user),
+            community_roles=roles,
+            version=version,
+            expires_at=now + self.ttl_seconds,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        setattr(user, _ROLES_ATTR, roles)
+        return user
+
+    def invalidate(self) -> None:
+        """清空本地缓存，并在下次访问时重新读取版本号。"""
+        with self._lock:
+            self._entries.clear()
+            self._version = None
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE,
+    ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+    version_check_seconds=settings.PRINCIPAL_CACHE_VERSION_CHECK_SECONDS,
+)
+
+
+def cached_community_roles(user: User) -> dict[int, str] | None:
+    """返回本次请求随认证主体一起缓存的社区角色映射；未经缓存加载的 User 返回 None。"""
+    return getattr(user, _ROLES_ATTR, None)
+
+
+def invalidate_principal_cache(db: Session) -> None:
+    """用户信息或社区成员关系变更后调用：递增版本号（随调用方事务提交）并清空本地缓存。"""
+    bump_cache_version(db, PRINCIPAL_CACHE_NAME)
+    principal_cache.invalidate()
@@ -1,18 +1,78 @@
 """
 速率限制模块
 
-使用 slowapi 实现基于 IP 的速率限制。
+使用 slowapi 实现速率限制。
 Limiter 实例在此处创建，在 main.py 中挂载到应用，
 在各路由文件中通过装饰器使用。
+
+- 限流键由 IP + 用户组合而成，同一出口 IP 下的不同用户互不影响；登录接口只按 IP 限流；
+- 每个社区另有一份所有路由共享的总配额（RATE_LIMIT_COMMUNITY），避免单个租户耗尽整体容量。
+  X-Community-Id 由客户端任意填写，不参与中间件阶段的限流键；社区配额在
+  get_current_community 确认用户属于该社区（或为超级管理员）后才计数；
+- 计数存储由 RATE_LIMIT_STORAGE_URI 决定，多 worker 部署需使用共享存储
+  （database:// 或 redis://），见 app/core/rate_limit_storage.py。
 """
 
 from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from slowapi.wrappers import LimitGroup
+from starlette.requests import Request
 
 from app.config import settings
+from app.core import rate_limit_storage  # noqa: F401  注册 database:// 等存储 scheme
+from app.core.security import decode_access_token
+
+
+def _token_subject(request: Request) -> str | None:
+    """从 Bearer Token 中取出用户名（仅解码签名，不查库；无效 Token 视为匿名）。"""
+    authorization = request.headers.get("authorization")
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+    payload = decode_access_token(authorization[len("Bearer "):])
+    return payload.get("sub") if payload else None
+
+
+def client_key(request: Request) -> str:
+    """单个客户端的限流键：IP + 用户。"""
+    user = _token_subject(request) or "anon"
+    return f"{get_remote_address(request)}:{user}"
+
+
+def community_key(community_id: int) -> str:
+    """社区总配额的限流键。"""
+    return f"community:{community_id}"
+
+
+class CommunityLimiter(Limiter):
+    """在 slowapi Limiter 基础上增加按社区聚合、所有路由共享的配额。"""
+
+    def __init__(self, *, community_limits: list[str], **kwargs) -> None:
+        super().__init__(**kwargs)
+        self._community_limits = [
+            limit
+            for raw in community_limits
+            for limit in LimitGroup(raw, get_remote_address, "community", False, None, None, None, 1, False)
+        ]
+
+    def hit_community(self, request: Request, community_id: int) -> None:
+        """为已确认可访问的社区计数一次，超出总配额时抛出 RateLimitExceeded。"""
+        if not self.enabled:
+            return
+        args = [community_key(community_id), "community"]
+        if self._key_prefix:
+            args.insert(0, self._key_prefix)
+        for limit in self._community_limits:
+            if not self.limiter.hit(limit.limit, *args):
+                request.state.view_rate_limit = (limit.limit, args)
+                raise RateLimitExceeded(limit)
+
 
-# 全局 Limiter 实例，基于客户端 IP 进行限制
-limiter = Limiter(
-    key_func=get_remote_address,
+# 全局 Limiter 实例
+limiter = CommunityLimiter(
+    key_func=client_key,
     default_limits=[settings.RATE_LIMIT_DEFAULT],
+    community_limits=[settings.RATE_LIMIT_COMMUNITY] if settings.RATE_LIMIT_COMMUNITY else [],
+    strategy=settings.RATE_LIMIT_STRATEGY,
+    storage_uri=settings.RATE_LIMIT_STORAGE_URI,
 )
@@ -0,0 +1,209 @@
+"""
+速率限制共享存储
+
+slowapi 默认使用进程内存计数，gunicorn 多 worker（或多节点）部署时每个进程各算各的，
+实际限额变成配置值的 N 倍。这里为 limits 库注册一个基于 SQLite / PostgreSQL 的存储后端，
+支持 fixed-window 与 sliding-window-counter 两种策略：
+
+- ``database://``                       复用应用的 DATABASE_URL 连接池
+- ``sqlalchemy+sqlite:///path.db``      独立的 SQLite 文件
+- ``sqlalchemy+postgresql://...``       独立的 PostgreSQL 库
+
+Redis 协议存储直接使用 limits 自带的 ``redis://`` 后端（需安装 redis 包）。
+"""
+
+import time
+from math import floor
+
+from limits.errors import ConfigurationError
+from limits.storage import SlidingWindowCounterSupport, Storage
+from limits.storage.base import TimestampedSlidingWindow
+from sqlalchemy import case, create_engine, delete, select, text, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.models.rate_limit import rate_limit_counters
+
+_UPSERT_DIALECTS = {
+    "sqlite": sqlite.insert,
+    "postgresql": postgresql.insert,
+}
+
+# 每处理这么多次 incr 顺带清理一次过期计数行
+_PURGE_EVERY = 1000
+
+
+class DatabaseStorage(Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow):
+    """基于 rate_limit_counters 表的 limits 存储后端（SQLite / PostgreSQL）"""
+
+    STORAGE_SCHEME = ["database", "sqlalchemy+sqlite", "sqlalchemy+postgresql"]
+
+    def __init__(
+        self,
+        uri: str,
+        engine: Engine | None = None,
+        wrap_exceptions: bool = False,
+        **options: float | str | bool,
+    ) -> None:
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        if engine is not None:
+            self.engine = engine
+            self._owns_table = True
+        elif uri.startswith("database://"):
+            # 表由 init_db / alembic 迁移创建；计数器写入不触发读己之写的主库粘滞
+            from app.core.db_routing import SKIP_WRITE_TRACKING
+            from app.database import engine as app_engine
+
+            self.engine = app_engine.execution_options(**{SKIP_WRITE_TRACKING: True})
+            self._owns_table = False
+        else:
+            self.engine = create_engine(uri.removeprefix("sqlalchemy+"), pool_pre_ping=True)
+            self._owns_table = True
+
+        dialect = self.engine.dialect.name
+        if dialect not in _UPSERT_DIALECTS:
+            raise ConfigurationError(f"DatabaseStorage 不支持的数据库类型: {dialect}")
+        self._insert = _UPSERT_DIALECTS[dialect]
+        self._table_ready = not self._owns_table
+        self._incr_calls = 0
+
+    @property
+    def base_exceptions(self) -> type[Exception]:
+        return SQLAlchemyError
+
+    def _ensure_table(self) -> None:
+        if not self._table_ready:
+            rate_limit_counters.create(self.engine, checkfirst=True)
+            self._table_ready = True
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        """原子地累加计数；计数行已过期时从 amount 重新开始并刷新过期时间。"""
+        self._ensure_table()
+        now = time.time()
+        table = rate_limit_counters
+        expired = table.c.expires_at <= now
+        stmt = self._insert(table).values(key=key, count=amount, expires_at=now + expiry)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.key],
+            set_={
+                "count": case((expired, amount), else_=table.c.count + amount),
+                "expires_at": case((expired, now + expiry), else_=table.c.expires_at),
+            },
+        ).returning(table.c.count)
+
+        with self.engine.begin() as conn:
+            count = conn.execute(stmt).scalar_one()
+            self._incr_calls += 1
+            if self._incr_calls % _PURGE_EVERY == 0:
+                conn.execute(delete(table).where(table.c.expires_at <= now))
+        return count
+
+    def decr(self, key: str, amount: int = 1) -> int:
+        self._ensure_table()
+        table = rate_limit_counters
+        with self.engine.begin() as conn:
+            conn.execute(
+                update(table)
+                .where(table.c.key == key)
+                .values(count=case((table.c.count > amount, table.c.count - amount), else_=0))
+            )
+        return self.get(key)
+
+    def get(self, key: str) -> int:
+        self._ensure_table()
+        table = rate_limit_counters
+        with self.engine.connect() as conn:
+            count = conn.execute(
+                select(table.c.count).where(table.c.key == key, table.c.expires_at > time.time())
+            ).scalar()
+        return count or 0
+
+    def get_expiry(self, key: str) -> float:
+        self._ensure_table()
+        table = rate_limit_counters
+        now = time.time()
+        with self.engine.connect() as conn:
+            expires_at = conn.execute(
+                select(table.c.expires_at).where(table.c.key == key, table.c.expires_at > now)
+            ).scalar()
+        return expires_at or now
+
+    def check(self) -> bool:
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return True
+        except SQLAlchemyError:
+            return False
+
+    def reset(self) -> int | None:
+        self._ensure_table()
+        with self.engine.begin() as conn:
+            return conn.execute(delete(rate_limit_counters)).rowcount
+
+    def clear(self, key: str) -> None:
+        self._ensure_table()
+        with self.engine.begin() as conn:
+            conn.execute(delete(rate_limit_counters).where(rate_limit_counters.c.key == key))
+
+    # ── sliding-window-counter ──────────────────────────────────────────
+
+    def acquire_sliding_window_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        if amount > limit:
+            return False
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        previous_count, previous_ttl, current_count, _ = self._get_sliding_window_info(
+            previous_key, current_key, expiry, now
+        )
+        weighted_count = previous_count * previous_ttl / expiry + current_count
+        if floor(weighted_count) + amount > limit:
+            return False
+
+        # 当前窗口计数保留两个窗口长度，下一窗口中作为 previous 参与加权
+        current_count = self.incr(current_key, 2 * expiry, amount=amount)
+        weighted_count = previous_count * previous_ttl / expiry + current_count
+        if floor(weighted_count) > limit:
+            # 并发请求抢先占满了配额：回滚本次计数并拒绝
+            self.decr(current_key, amount)
+            return False
+        return True
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple[int, float, int, float]:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        return self._get_sliding_window_info(previous_key, current_key, expiry, now)
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        self.clear(previous_key)
+        self.clear(current_key)
+
+    def _get_sliding_window_info(
+        self,
+        previous_key: str,
+        current_key: str,
+        expiry: int,
+        now: float,
+    ) -> tuple[int, float, int, float]:
+        self._ensure_table()
+        table = rate_limit_counters
+        with self.engine.connect() as conn:
+            rows = dict(
+                conn.execute(
+                    select(table.c.key, table.c.count).where(
+                        table.c.key.in_([previous_key, current_key]),
+                        table.c.expires_at > now,
+                    )
+                ).all()
+            )
+        previous_count = rows.get(previous_key, 0)
+        current_count = rows.get(current_key, 0)
+        if previous_count == 0:
+            previous_ttl = 0.0
+        else:
+            previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
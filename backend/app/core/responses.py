@@ -0,0 +1,43 @@
+"""
+JSON 响应快速路径
+
+- 应用默认响应类为 ORJSONResponse（main.py），未走快速路径的接口也由 orjson 渲染。
+- ``model_response(tp, content)``：按响应模型校验一次，直接由 pydantic-core 序列化为 JSON 字节。
+  路由函数返回 Response 时 FastAPI 不再执行 response_model 的二次校验与序列化，
+  适用于大列表接口。路由仍声明 ``response_model``，OpenAPI 文档不变。
+
+默认路径（handler 构造 Pydantic 模型 → FastAPI 转 dict 再按 response_model 校验 →
+转为 JSON 兼容对象 → json.dumps）与快速路径的输出一致，见 tests/test_responses.py。
+"""
+
+from functools import lru_cache
+from typing import Any
+
+from fastapi import Response
+from pydantic import TypeAdapter
+
+
+@lru_cache(maxsize=256)
+def _adapter(tp: Any) -> TypeAdapter:
+    return TypeAdapter(tp)
+
+
+def model_response(
+    tp: Any,
+    content: Any,
+    *,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """按类型 ``tp``（如 ``list[MeetingOut]``）校验 ``content`` 并直接输出 JSON 响应。
+
+    ``content`` 可以是 ORM 对象、dict 或已构造的模型（及其列表）；已是 ``tp`` 实例的部分不会重复校验。
+    """
+    adapter = _adapter(tp)
+    value = adapter.validate_python(content, from_attributes=True)
+    return Response(
+        adapter.dump_json(value, by_alias=True),
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
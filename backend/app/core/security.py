@@ -60,11 +60,13 @@ def decrypt_value(encrypted_text: str) -> str:
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
+    now = utc_now()
     if expires_delta:
-        expire = utc_now() + expires_delta
+        expire = now + expires_delta
     else:
-        expire = utc_now() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+        expire = now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    # iat 参与认证主体缓存的键（app/core/principal_cache.py）
+    to_encode.update({"exp": expire, "iat": now})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
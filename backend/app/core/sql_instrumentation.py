@@ -0,0 +1,212 @@
+"""
+请求级 SQL 观测
+
+通过 SQLAlchemy ``before_cursor_execute`` / ``after_cursor_execute`` 事件统计
+每个请求执行的语句数与数据库耗时，并按「语句形状」（参数化后的 SQL）计数，
+同一形状重复超过阈值即视为疑似 N+1。
+
+- 响应头：``Server-Timing: db;dur=..., app;dur=...`` 与 ``X-DB-Queries``
+- 超过 PERF_SQL_WARN_QUERIES / PERF_SQL_WARN_MS 或出现 N+1 时输出结构化告警日志
+- 按路由模板保留最近 PERF_ROUTE_WINDOW 个请求的样本，供 /api/admin/perf/routes 查询
+
+事件监听挂在 Engine 类上，同步 engine、async engine 的 sync_engine 都会被覆盖；
+只有在请求上下文中（ContextVar 已设置）执行的语句才会计数。
+"""
+
+import re
+import threading
+import time
+from collections import Counter, deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.config import settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# IN (?, ?, ?) / IN (%(p_1)s, %(p_2)s) 等展开后的参数列表归一为一个占位符
+_IN_LIST_RE = re.compile(r"\((?:\s*(?:\?|%\([^)]+\)s|\$\d+|:\w+)\s*,)+\s*(?:\?|%\([^)]+\)s|\$\d+|:\w+)\s*\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def statement_shape(statement: str) -> str:
+    """把参数化 SQL 归一为「形状」：合并空白、折叠 IN 列表。"""
+    shape = _WHITESPACE_RE.sub(" ", statement).strip()
+    return _IN_LIST_RE.sub("(?)", shape)
+
+
+@dataclass
+class RequestSqlStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+    shapes: Counter = field(default_factory=Counter)
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+_current_stats: ContextVar[RequestSqlStats | None] = ContextVar("request_sql_stats", default=None)
+
+
+def current_sql_stats() -> RequestSqlStats | None:
+    """当前请求的 SQL 统计（不在请求上下文中时为 None）。"""
+    return _current_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _current_stats.get() is not None:
+        conn.info.setdefault("_sql_instrumentation_start", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current_stats.get()
+    if stats is None:
+        return
+    starts = conn.info.get("_sql_instrumentation_start")
+    if not starts:
+        return
+    stats.queries += 1
+    stats.db_seconds += time.perf_counter() - starts.pop()
+    stats.shapes[statement_shape(statement)] += 1
+
+
+def route_template(scope: Scope) -> str:
+    """返回 "METHOD /path/{param}" 形式的路由标识，未匹配路由时返回 "METHOD <unmatched>"。"""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or "<unmatched>"
+    return f"{scope.get('method', '')} {path}"
+
+
+@dataclass(frozen=True)
+class _RouteSample:
+    queries: int
+    db_ms: float
+    total_ms: float
+    n_plus_one: bool
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class RouteSqlSummary:
+    """按路由保留最近 window 个请求样本的滚动汇总（进程内）。"""
+
+    def __init__(self, window: int):
+        self.window = window
+        self._samples: dict[str, deque[_RouteSample]] = {}
+        self._totals: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, route: str, sample: _RouteSample) -> None:
+        with self._lock:
+            samples = self._samples.get(route)
+            if samples is None:
+                samples = self._samples[route] = deque(maxlen=self.window)
+            samples.append(sample)
+            self._totals[route] += 1
+
+    def snapshot(self) -> list[dict]:
+        with self._lock:
+            items = [(route, list(samples), self._totals[route]) for route, samples in self._samples.items()]
+
+        result = []
+        for route, samples, total in items:
+            queries = [s.queries for s in samples]
+            db_ms = [s.db_ms for s in samples]
+            total_ms = [s.total_ms for s in samples]
+            result.append({
+                "route": route,
+                "requests": total,
+                "window": len(samples),
+                "avg_queries": round(sum(queries) / len(queries), 2),
+                "max_queries": max(queries),
+                "avg_db_ms": round(sum(db_ms) / len(db_ms), 2),
+                "p95_db_ms": round(_percentile(db_ms, 95), 2),
+                "avg_total_ms": round(sum(total_ms) / len(total_ms), 2),
+                "p95_total_ms": round(_percentile(total_ms, 95), 2),
+                "n_plus_one_requests": sum(1 for s in samples if s.n_plus_one),
+            })
+        result.sort(key=lambda item: item["avg_db_ms"] * item["window"], reverse=True)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+
+
+route_sql_summary = RouteSqlSummary(window=settings.PERF_ROUTE_WINDOW)
+
+
+class SqlInstrumentationMiddleware:
+    """统计每个 HTTP 请求的 SQL 语句数与耗时，写入响应头并按路由汇总。"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not settings.PERF_SQL_INSTRUMENTATION:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestSqlStats()
+        token = _current_stats.set(stats)
+        start = time.perf_counter()
+
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                total_ms = (time.perf_counter() - start) * 1000
+                db_ms = stats.db_seconds * 1000
+                headers = list(message.get("headers", []))
+                headers.append((
+                    b"server-timing",
+                    f'db;dur={db_ms:.1f};desc="{stats.queries} queries", app;dur={total_ms:.1f}'.encode(),
+                ))
+                headers.append((b"x-db-queries", str(stats.queries).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current_stats.reset(token)
+            self._finish(scope, stats, (time.perf_counter() - start) * 1000)
+
+    @staticmethod
+    def _finish(scope: Scope, stats: RequestSqlStats, total_ms: float) -> None:
+        route = route_template(scope)
+        db_ms = stats.db_seconds * 1000
+        repeated = stats.repeated_shapes(settings.PERF_SQL_N_PLUS_ONE_THRESHOLD)
+        route_sql_summary.record(
+            route,
+            _RouteSample(queries=stats.queries, db_ms=db_ms, total_ms=total_ms, n_plus_one=bool(repeated)),
+        )
+
+        if (
+            repeated
+            or stats.queries > settings.PERF_SQL_WARN_QUERIES
+            or db_ms > settings.PERF_SQL_WARN_MS
+        ):
+            logger.warning(
+                "请求 SQL 超出阈值",
+                extra={
+                    "route": route,
+                    "path": scope.get("path"),
+                    "queries": stats.queries,
+                    "db_ms": round(db_ms, 1),
+                    "total_ms": round(total_ms, 1),
+                    "repeated_statements": [
+                        {"count": count, "statement": shape[:300]} for shape, count in repeated[:5]
+                    ],
+                },
+            )
@@ -1,9 +1,19 @@
 import os
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
 from app.config import settings
+from app.core.db_routing import (
+    Replica,
+    ReplicaRouter,
+    primary_required,
+    replica_display_name,
+    track_primary_writes,
+)
+from app.core.metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, instrument_engine
 
 # Ensure SQLite parent directory exists (e.g., data/ in fresh CI checkout)
 if settings.DATABASE_URL.startswith("sqlite:///"):
@@ -12,19 +22,48 @@ if settings.DATABASE_URL.startswith("sqlite:///"):
     if _db_dir:
         os.makedirs(_db_dir, exist_ok=True)
 
+_IS_SQLITE = settings.DATABASE_URL.startswith("sqlite")
+# 内存库每个连接各自独立，无法拆出只读连接池
+_IS_SQLITE_FILE = _IS_SQLITE and make_url(settings.DATABASE_URL).database not in (None, "", ":memory:")
+
+
+def configure_sqlite_engine(engine: Engine, *, read_only: bool = False) -> None:
+    """为 SQLite engine 的每个新连接设置 WAL、busy_timeout 等 PRAGMA。
+
+    read_only=True 时额外开启 query_only，误写会直接报错而不会去争抢写锁。
+    异步 engine 传入其 sync_engine。
+    """
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, _connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+            cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+            cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+            cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE)}")
+            cursor.execute(f"PRAGMA cache_size={int(settings.SQLITE_CACHE_SIZE)}")
+            if read_only:
+                cursor.execute("PRAGMA query_only=ON")
+        finally:
+            cursor.close()
+
+
 # Database connection pool configuration
 # For SQLite, we need check_same_thread=False
 # For PostgreSQL/MySQL, use connection pooling settings
-if settings.DATABASE_URL.startswith("sqlite"):
+if _IS_SQLITE:
     engine = create_engine(
         settings.DATABASE_URL,
         connect_args={"check_same_thread": False},  # SQLite specific
         echo=settings.DB_ECHO or settings.DEBUG,
     )
+    configure_sqlite_engine(engine)
 else:
     # For PostgreSQL/MySQL with connection pooling
     engine = create_engine(
         settings.DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
         pool_size=settings.DB_POOL_SIZE,
         max_overflow=settings.DB_MAX_OVERFLOW,
         pool_timeout=settings.DB_POOL_TIMEOUT,
@@ -33,7 +72,119 @@ else:
         echo=settings.DB_ECHO or settings.DEBUG,
     )
 
+# 只读 engine：GET 接口使用。SQLite 下是独立的 query_only 连接池，
+# WAL 模式下读连接不会被写事务阻塞，也不会占用写连接
+if _IS_SQLITE_FILE:
+    read_engine = create_engine(
+        settings.DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        echo=settings.DB_ECHO or settings.DEBUG,
+    )
+    configure_sqlite_engine(read_engine, read_only=True)
+else:
+    read_engine = engine
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# ── Async engine ──────────────────────────────────────────────────────
+# 与同步 engine 指向同一数据库，供 async def 路由使用（aiosqlite / asyncpg / aiomysql），
+# 避免同步 Session 的 IO 阻塞 uvicorn 事件循环。
+_ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+
+def to_async_url(url: str) -> str:
+    """将同步数据库 URL 转换为对应的异步驱动 URL。"""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in _ASYNC_DRIVERS:
+        raise ValueError(f"不支持的异步数据库后端: {backend}")
+    return parsed.set(drivername=_ASYNC_DRIVERS[backend]).render_as_string(hide_password=False)
+
+
+if _IS_SQLITE:
+    async_engine = create_async_engine(
+        to_async_url(settings.DATABASE_URL),
+        echo=settings.DB_ECHO or settings.DEBUG,
+    )
+    configure_sqlite_engine(async_engine.sync_engine)
+else:
+    async_engine = create_async_engine(
+        to_async_url(settings.DATABASE_URL),
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT,
+        pool_recycle=settings.DB_POOL_RECYCLE,
+        pool_pre_ping=True,
+        echo=settings.DB_ECHO or settings.DEBUG,
+    )
+
+if _IS_SQLITE_FILE:
+    async_read_engine = create_async_engine(
+        to_async_url(settings.DATABASE_URL),
+        echo=settings.DB_ECHO or settings.DEBUG,
+    )
+    configure_sqlite_engine(async_read_engine.sync_engine, read_only=True)
+else:
+    async_read_engine = async_engine
+
+# 连接池借出/溢出指标（/api/metrics）
+instrument_engine(engine, "sync")
+instrument_engine(async_engine.sync_engine, "async")
+if read_engine is not engine:
+    instrument_engine(read_engine, "sync-read")
+if async_read_engine is not async_engine:
+    instrument_engine(async_read_engine.sync_engine, "async-read")
+
+# expire_on_commit=False：提交后继续读取属性不会触发隐式 IO（异步下会抛 MissingGreenlet）
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, autoflush=False, expire_on_commit=False)
+
+# ── 只读副本 ──────────────────────────────────────────────────────────
+# 配置 DATABASE_REPLICA_URLS 时，只读依赖按轮询分发到健康副本；
+# 请求在主库写入后的粘滞窗口内仍读主库（见 app/core/db_routing.py）
+
+
+def _create_replica(index: int, url: str) -> Replica:
+    if url.startswith("sqlite"):
+        sync_replica = create_engine(url, connect_args={"check_same_thread": False})
+        async_replica = create_async_engine(to_async_url(url))
+        configure_sqlite_engine(sync_replica, read_only=True)
+        configure_sqlite_engine(async_replica.sync_engine, read_only=True)
+    else:
+        pool_options = {
+            "pool_size": settings.DB_POOL_SIZE,
+            "max_overflow": settings.DB_MAX_OVERFLOW,
+            "pool_timeout": settings.DB_POOL_TIMEOUT,
+            "pool_recycle": settings.DB_POOL_RECYCLE,
+            "pool_pre_ping": True,
+        }
+        sync_replica = create_engine(url, poolclass=InstrumentedQueuePool, **pool_options)
+        async_replica = create_async_engine(to_async_url(url), poolclass=InstrumentedAsyncQueuePool, **pool_options)
+    instrument_engine(sync_replica, f"replica{index}")
+    instrument_engine(async_replica.sync_engine, f"replica{index}-async")
+    return Replica(name=replica_display_name(url), engine=sync_replica, async_engine=async_replica)
+
+
+replica_router: ReplicaRouter | None = (
+    ReplicaRouter([_create_replica(i, url) for i, url in enumerate(settings.replica_urls_list)])
+    if settings.replica_urls_list
+    else None
+)
+track_primary_writes(engine)
+track_primary_writes(async_engine.sync_engine)
+
+
+def choose_replica() -> Replica | None:
+    """为当前请求的只读查询选择副本；需要读主库或无可用副本时返回 None。"""
+    if replica_router is None or primary_required():
+        return None
+    return replica_router.choose()
 
 
 class Base(DeclarativeBase):
@@ -48,9 +199,33 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def get_read_db():
+    """只读 Session，供不修改数据的 GET 接口使用（配置副本时路由到副本）。"""
+    replica = choose_replica()
+    db = ReadSessionLocal(bind=replica.engine) if replica else ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db():
+    """只读 AsyncSession，供不修改数据的 async GET 接口使用（配置副本时路由到副本）。"""
+    replica = choose_replica()
+    session = AsyncReadSessionLocal(bind=replica.async_engine) if replica else AsyncReadSessionLocal()
+    async with session as db:
+        yield db
+
+
 def init_db():
     from app.models import (  # noqa: F401
         audit,
+        cache_version,
         campaign,
         channel,
         committee,
@@ -62,6 +237,8 @@ def init_db():
         password_reset,
         people,
         publish_record,
+        rate_limit,
+        scheduler,
         user,
         wechat_stats,
     )
@@ -3,15 +3,19 @@
 前缀：/api/insights（在 main.py 中条件注册于 ENABLE_INSIGHTS_MODULE 块）。
 所有端点均需认证（Depends(get_current_user)）。
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 
-from app.core.dependencies import get_current_user, get_db
+from app.config import settings
+from app.core.conditional import VersionSource, conditional_response, version_token
+from app.core.dependencies import get_current_user
+from app.core.responses import model_response
+from app.database import get_read_db
 from app.insights.analyzers import corporate as corporate_analyzer
 from app.insights.analyzers import influence as influence_analyzer
 from app.insights.analyzers import trend as trend_analyzer
 from app.insights.schemas import CorporateLandscape, KeyPerson, MomentumLevel, ProjectTrend
-from app.models.ecosystem import EcosystemProject
+from app.models.ecosystem import EcosystemProject, EcosystemSnapshot
 from app.models.user import User
 
 router = APIRouter()
@@ -22,14 +26,31 @@ router = APIRouter()
 
 @router.get("/trends", response_model=list[ProjectTrend], summary="所有项目趋势摘要")
 def list_trends(
+    request: Request,
+    response: Response,
     momentum: MomentumLevel | None = Query(None, description="按动量级别筛选"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: User = Depends(get_current_user),
 ) -> list[ProjectTrend]:
     """返回所有活跃项目的趋势动量，按 velocity_score 降序排列。
 
     若尚无快照数据，momentum 为 `insufficient_data`。
+    支持条件请求：采集任务未写入新快照时，携带 If-None-Match 返回 304。
     """
+    # 每次采集写入快照并更新 last_synced_at，二者即为趋势数据的版本
+    etag = version_token(
+        db,
+        VersionSource(
+            EcosystemProject,
+            EcosystemProject.is_active == True,  # noqa: E712
+            watch=[EcosystemProject.id, EcosystemProject.last_synced_at],
+        ),
+        VersionSource(EcosystemSnapshot),
+        scope=("trends", momentum),
+    )
+    cached = conditional_response(request, response, etag, max_age=settings.HTTP_CACHE_INSIGHTS_MAX_AGE)
+    if cached is not None:
+        return cached
     results = trend_analyzer.analyze_all(db)
     if momentum is not None:
         results = [r for r in results if r.momentum == momentum]
@@ -39,7 +60,7 @@ def list_trends(
 @router.get("/trends/{project_id}", response_model=ProjectTrend, summary="单项目趋势详情")
 def get_trend(
     project_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: User = Depends(get_current_user),
 ) -> ProjectTrend:
     project = db.get(EcosystemProject, project_id)
@@ -55,20 +76,20 @@ def get_trend(
 def list_key_people(
     type: str | None = Query(None, description="按影响力类型筛选（maintainer/bridge/rising_star/reviewer/contributor）"),
     limit: int = Query(50, ge=1, le=200, description="最多返回条数"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: User = Depends(get_current_user),
-) -> list[KeyPerson]:
+) -> Response:
     """返回贡献者影响力排行，跨项目聚合，按综合评分降序。
 
     未填充 company / review_count_90d 时相应字段为 null。
     """
-    return influence_analyzer.analyze_all(db, influence_type=type, limit=limit)
+    return model_response(list[KeyPerson], influence_analyzer.analyze_all(db, influence_type=type, limit=limit))
 
 
 @router.get("/people/{github_handle}", response_model=KeyPerson, summary="单人影响力画像")
 def get_person(
     github_handle: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: User = Depends(get_current_user),
 ) -> KeyPerson:
     result = influence_analyzer.analyze_person(db, github_handle)
@@ -84,7 +105,7 @@ def get_person(
 def list_corporate(
     min_projects: int = Query(1, ge=1, description="至少出现在 N 个项目中"),
     limit: int = Query(50, ge=1, le=200, description="最多返回条数"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: User = Depends(get_current_user),
 ) -> list[CorporateLandscape]:
     """按企业聚合贡献数据，识别战略性投入生态的企业。
@@ -97,7 +118,7 @@ def list_corporate(
 @router.get("/corporate/{company}", response_model=CorporateLandscape, summary="单企业详情")
 def get_corporate(
     company: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     _: User = Depends(get_current_user),
 ) -> CorporateLandscape:
     result = corporate_analyzer.analyze_company(db, company)
@@ -1,11 +1,11 @@
+import secrets
 from contextlib import asynccontextmanager
 
 from apscheduler.schedulers.background import BackgroundScheduler
-from fastapi import FastAPI, Request, status
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import JSONResponse, ORJSONResponse
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
@@ -27,6 +27,7 @@ from app.api import (
     ecosystem,
     event_templates,
     events,
+    jobs,
     meetings,
     notifications,
     people,
@@ -35,12 +36,26 @@ from app.api import (
     wechat_stats,
 )
 from app.config import settings
+from app.core.compression import CompressionMiddleware, PrecompressedStaticFiles
+from app.core.db_routing import ReadYourWritesMiddleware
 from app.core.logging import get_logger, setup_logging
+from app.core.metrics import MetricsMiddleware, render_metrics
 from app.core.rate_limit import limiter
-from app.database import init_db
+from app.core.sql_instrumentation import SqlInstrumentationMiddleware
+from app.core.timezone import utc_now
+from app.database import SessionLocal, async_engine, async_read_engine, init_db, replica_router
 from app.insights import router as insights_router
+from app.services.auto_publish import run_auto_publish
+from app.services.community_counters import run_counter_reconcile
+from app.services.community_metrics import run_metrics_snapshot
 from app.services.ecosystem.sync_worker import sync_projects_due
+from app.services.email import smtp_pool
 from app.services.issue_sync import run_issue_sync
+from app.services.jobs import JobWorker
+from app.services.meeting_reminders import run_reminder_dispatch
+from app.services.notification_outbox import OutboxDispatcher
+from app.services.scheduler_lease import SchedulerLeader
+from app.services.user_work_items import run_work_item_reconcile
 
 # 初始化日志系统
 setup_logging()
@@ -48,6 +63,10 @@ logger = get_logger(__name__)
 
 
 _scheduler = BackgroundScheduler()
+# 多 worker / 多节点部署时，仅持有数据库租约的进程实际执行定时任务
+_leader = SchedulerLeader(SessionLocal, ttl_seconds=settings.SCHEDULER_LEASE_TTL_SECONDS)
+_job_worker = JobWorker(SessionLocal)
+_outbox_dispatcher = OutboxDispatcher(SessionLocal)
 
 
 @asynccontextmanager
@@ -57,9 +76,76 @@ async def lifespan(app: FastAPI):
 
     # 定时任务
     try:
+        # 租约心跳：Leader 续期，其他进程在租约过期后接管
+        _scheduler.add_job(
+            _leader.heartbeat,
+            trigger="interval",
+            seconds=settings.SCHEDULER_HEARTBEAT_SECONDS,
+            next_run_time=utc_now(),
+            id="scheduler_heartbeat",
+            replace_existing=True,
+        )
+        # 只读副本健康检查：每个进程各自检查（非 Leader 任务）
+        if replica_router is not None:
+            _scheduler.add_job(
+                replica_router.check_health,
+                trigger="interval",
+                seconds=settings.DB_REPLICA_HEALTH_CHECK_SECONDS,
+                id="db_replica_health",
+                replace_existing=True,
+            )
+        # SMTP 连接池空闲回收：每个进程各自的连接池（非 Leader 任务）
+        _scheduler.add_job(
+            smtp_pool.evict_idle,
+            trigger="interval",
+            seconds=settings.SMTP_POOL_IDLE_TIMEOUT_SECONDS,
+            id="smtp_pool_evict",
+            replace_existing=True,
+        )
+        # 到期会议提醒：每个进程各自扫描，靠数据库领取互斥（非 Leader 任务，多进程分担发送）
+        _scheduler.add_job(
+            run_reminder_dispatch,
+            trigger="interval",
+            seconds=settings.MEETING_REMINDER_DISPATCH_SECONDS,
+            id="meeting_reminders",
+            replace_existing=True,
+        )
+        # 定时自动发布：同样按进程扫描、数据库领取互斥
+        _scheduler.add_job(
+            run_auto_publish,
+            trigger="interval",
+            seconds=settings.AUTO_PUBLISH_INTERVAL_SECONDS,
+            id="auto_publish",
+            replace_existing=True,
+        )
+        # 社区计数表校正：修复绕过 Session 写入造成的偏差
+        _scheduler.add_job(
+            _leader.leader_only("community_counter_reconcile", run_counter_reconcile),
+            trigger="interval",
+            seconds=settings.COMMUNITY_COUNTER_RECONCILE_SECONDS,
+            id="community_counter_reconcile",
+            replace_existing=True,
+        )
+        # 负责事项投影校正：修复绕过 Session 的写入造成的偏差
+        _scheduler.add_job(
+            _leader.leader_only("user_work_item_reconcile", run_work_item_reconcile),
+            trigger="interval",
+            seconds=settings.USER_WORK_ITEM_RECONCILE_SECONDS,
+            id="user_work_item_reconcile",
+            replace_existing=True,
+        )
+        # 每日 01:30 写入前一天的社区指标快照
+        _scheduler.add_job(
+            _leader.leader_only("community_metrics_snapshot", run_metrics_snapshot),
+            trigger="cron",
+            hour=1,
+            minute=30,
+            id="community_metrics_snapshot",
+            replace_existing=True,
+        )
         # 每日 02:00 同步 GitHub Issue 状态
         _scheduler.add_job(
-            run_issue_sync,
+            _leader.leader_only("issue_sync", run_issue_sync),
             trigger="cron",
             hour=2,
             minute=0,
@@ -68,11 +154,11 @@ async def lifespan(app: FastAPI):
         )
         # 生态采集器（嵌入模式）：每小时检查哪些项目到期
         if settings.COLLECTOR_EMBEDDED:
-            def _run_ecosystem_sync() -> None:
-                sync_projects_due(settings.GITHUB_TOKEN)
+            def _run_ecosystem_sync() -> dict:
+                return sync_projects_due(settings.GITHUB_TOKEN)
 
             _scheduler.add_job(
-                _run_ecosystem_sync,
+                _leader.leader_only("ecosystem_sync", _run_ecosystem_sync),
                 trigger="interval",
                 hours=1,
                 id="ecosystem_sync",
@@ -87,10 +173,29 @@ async def lifespan(app: FastAPI):
     except Exception as exc:
         logger.warning("APScheduler 未启动: %s", exc)
 
+    # 后台任务队列（嵌入模式）：每个进程一个领取线程
+    if settings.JOB_WORKER_EMBEDDED:
+        _job_worker.start()
+        _outbox_dispatcher.start()
+        logger.info("任务队列：嵌入模式（进程内 worker 线程与通知邮件分发线程）")
+    else:
+        logger.info("任务队列：独立模式（请单独运行 python run_worker.py）")
+
     yield
 
+    _job_worker.stop(timeout=5)
+    _outbox_dispatcher.stop(timeout=5)
+    smtp_pool.close_all()
     if _scheduler.running:
         _scheduler.shutdown(wait=False)
+    _leader.release()
+    await async_engine.dispose()
+    if async_read_engine is not async_engine:
+        await async_read_engine.dispose()
+    if replica_router is not None:
+        for replica in replica_router.replicas:
+            replica.engine.dispose()
+            await replica.async_engine.dispose()
     logger.info("openGecko 服务关闭")
 
 
@@ -98,13 +203,33 @@ app = FastAPI(
     title=settings.APP_NAME,
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # 挂载速率限制器状态和中间件
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+
+# 读己之写：限流计数器写入带 SKIP_WRITE_TRACKING 选项，不会触发主库粘滞
+app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=settings.DB_REPLICA_STICKY_SECONDS)
 app.add_middleware(SlowAPIMiddleware)
 
+# 请求级 SQL 统计（Server-Timing / X-DB-Queries 响应头 + 路由汇总）
+app.add_middleware(SqlInstrumentationMiddleware)
+
+# Prometheus 请求指标（/api/metrics）
+app.add_middleware(MetricsMiddleware)
+
+# 响应压缩（br / gzip），位于指标中间件外层，压缩耗时不计入接口延迟
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=settings.COMPRESSION_MIN_SIZE,
+        content_types=settings.compression_content_types_list,
+        gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+    )
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_origins_list,
@@ -183,7 +308,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 # Serve uploaded files — only in local storage mode.
 # When STORAGE_BACKEND=s3, nginx proxies /uploads/ directly to MinIO.
 if settings.STORAGE_BACKEND == "local":
-    app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+    app.mount("/uploads", PrecompressedStaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 
 # Register API routers
@@ -208,6 +333,7 @@ app.include_router(notifications.router, prefix="/api/notifications", tags=["Not
 app.include_router(event_templates.router, prefix="/api/event-templates", tags=["Event Templates"])
 app.include_router(campaigns.router, prefix="/api/campaigns", tags=["Campaigns"])
 app.include_router(admin.router, prefix="/api/admin", tags=["Admin"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["Jobs"])
 app.include_router(design_tasks.router, prefix="/api/design-tasks", tags=["Design Tasks"])
 app.include_router(assets.router, prefix="/api/assets", tags=["Assets"])
 
@@ -217,6 +343,19 @@ def health_check():
     return {"status": "ok", "app": settings.APP_NAME}
 
 
+@app.get("/api/metrics", include_in_schema=False)
+def metrics(request: Request):
+    """Prometheus 指标（多 worker 时为全部进程的汇总）"""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if settings.METRICS_TOKEN and not secrets.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {settings.METRICS_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+    body, content_type = render_metrics()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/api/config/features")
 def get_features():
     """返回各可选功能模块的开关状态（无需认证，前端启动时拉取）"""
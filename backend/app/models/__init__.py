@@ -1,8 +1,11 @@
 from app.models.audit import AuditLog
+from app.models.cache_version import CacheVersion
 from app.models.campaign import Campaign, CampaignActivity, CampaignContact
 from app.models.channel import ChannelConfig
 from app.models.committee import Committee, CommitteeMember
 from app.models.community import Community
+from app.models.community_counter import CommunityCounter
+from app.models.community_metrics import CommunityMetricsDaily
 from app.models.content import Content
 from app.models.design import Asset, DesignTask, content_assets
 from app.models.ecosystem import EcosystemContributor, EcosystemProject, EcosystemSnapshot
@@ -17,17 +20,24 @@ from app.models.event import (
     FeedbackItem,
     IssueLink,
 )
+from app.models.job import Job
 from app.models.meeting import Meeting, MeetingParticipant, MeetingReminder
-from app.models.notification import Notification, NotificationType
+from app.models.notification import Notification, NotificationOutbox, NotificationType
 from app.models.password_reset import PasswordResetToken
 from app.models.people import CommunityRole, PersonProfile
 from app.models.publish_record import PublishRecord
+from app.models.rate_limit import rate_limit_counters
+from app.models.scheduler import SchedulerJobRun, SchedulerLease
 from app.models.user import User, community_users
+from app.models.user_work_item import UserWorkItem
 from app.models.wechat_stats import WechatArticleStat, WechatStatsAggregate
 
 __all__ = [
     "User",
     "Community",
+    "CommunityCounter",
+    "CommunityMetricsDaily",
+    "UserWorkItem",
     "AuditLog",
     "Content",
     "ChannelConfig",
@@ -60,7 +70,13 @@ __all__ = [
     "EcosystemSnapshot",
     "Notification",
     "NotificationType",
+    "NotificationOutbox",
     "DesignTask",
     "Asset",
     "content_assets",
+    "SchedulerLease",
+    "SchedulerJobRun",
+    "rate_limit_counters",
+    "CacheVersion",
+    "Job",
 ]
@@ -0,0 +1,52 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, Table, UniqueConstraint, select
+from sqlalchemy.orm import Session
+
+from app.core.timezone import utc_now
+from app.database import Base
+from app.models.user import User
+
+
+def assignee_table(name: str, task_table: str) -> Table:
+    """任务责任人关联表：(task_id, user_id) 唯一，(user_id, task_id) 索引用于按人查询。"""
+    return Table(
+        name,
+        Base.metadata,
+        Column("id", Integer, primary_key=True),
+        Column("task_id", Integer, ForeignKey(f"{task_table}.id", ondelete="CASCADE"), nullable=False),
+        Column("user_id", Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False),
+        Column("assigned_at", DateTime(timezone=True), default=utc_now),
+        UniqueConstraint("task_id", "user_id", name=f"uq_{name}_task_user"),
+        Index(f"ix_{name}_user_task", "user_id", "task_id"),
+    )
+
+
+class AssigneeIdsMixin:
+    """责任人存于关联表（assignee_links）的任务模型。
+
+    assignee_ids 保持原 JSON 字段的读写接口：构造参数、setattr 与响应序列化均无需改动。
+    """
+
+    assignee_link_class: type
+
+    @property
+    def assignee_ids(self) -> list[int]:
+        return [link.user_id for link in self.assignee_links]
+
+    @assignee_ids.setter
+    def assignee_ids(self, user_ids: list[int] | None) -> None:
+        ids = list(dict.fromkeys(user_ids or []))
+        existing = {link.user_id: link for link in self.assignee_links}
+        if ids == list(existing):
+            return
+        # 保留仍在列表中的关联行，避免先插后删触发唯一约束
+        self.assignee_links = [existing.get(uid) or self.assignee_link_class(user_id=uid) for uid in ids]
+        # 只改关联表不会触发 onupdate，手动更新以刷新工作台 ETag
+        self.updated_at = utc_now()
+
+
+def known_assignees(db: Session, payload: dict) -> dict:
+    """请求数据中的 assignee_ids 去掉不存在的用户（关联表有外键约束），保持原顺序。"""
+    if payload.get("assignee_ids"):
+        known = set(db.scalars(select(User.id).where(User.id.in_(payload["assignee_ids"]))))
+        payload["assignee_ids"] = [uid for uid in payload["assignee_ids"] if uid in known]
+    return payload
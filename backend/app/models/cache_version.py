@@ -0,0 +1,13 @@
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.core.timezone import utc_now
+from app.database import Base
+
+
+class CacheVersion(Base):
+    """进程内缓存的全局版本号：数据变更时递增，各 worker 轮询发现变化后丢弃本地缓存"""
+    __tablename__ = "cache_versions"
+
+    name = Column(String(100), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
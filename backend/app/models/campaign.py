@@ -1,8 +1,16 @@
-from sqlalchemy import JSON, Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Column, Date, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.timezone import utc_now
 from app.database import Base
+from app.models.assignee import AssigneeIdsMixin, assignee_table
+
+# 运营任务 ↔ 责任人
+campaign_task_assignees = assignee_table("campaign_task_assignees", "campaign_tasks")
+
+
+class CampaignTaskAssignee(Base):
+    __table__ = campaign_task_assignees
 
 
 class Campaign(Base):
@@ -28,6 +36,11 @@ class Campaign(Base):
 
 class CampaignContact(Base):
     __tablename__ = "campaign_contacts"
+    __table_args__ = (
+        Index("ix_campaign_contacts_campaign_id_id", "campaign_id", "id"),
+        # 漏斗统计与按状态筛选联系人
+        Index("ix_campaign_contacts_campaign_status", "campaign_id", "status", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     campaign_id = Column(Integer, ForeignKey("campaigns.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -37,7 +50,8 @@ class CampaignContact(Base):
     added_by = Column(String(50), nullable=False, default="manual")  # manual/event_import/ecosystem_import/csv_import
     last_contacted_at = Column(DateTime(timezone=True), nullable=True)
     notes = Column(Text, nullable=True)
-    assigned_to_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    assigned_to_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
 
     campaign = relationship("Campaign", back_populates="contacts")
     person = relationship("PersonProfile")
@@ -59,7 +73,7 @@ class CampaignActivity(Base):
     person = relationship("PersonProfile")
 
 
-class CampaignTask(Base):
+class CampaignTask(AssigneeIdsMixin, Base):
     """运营活动任务（任务规划，联动个人工作台）"""
     __tablename__ = "campaign_tasks"
 
@@ -73,7 +87,6 @@ class CampaignTask(Base):
         String(50), nullable=False, default="not_started"
     )  # not_started / in_progress / completed / blocked
     priority = Column(String(20), nullable=False, default="medium")  # low / medium / high
-    assignee_ids = Column(JSON, default=list)   # list[int] user IDs
     deadline = Column(Date, nullable=True)
     created_by_id = Column(
         Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True
@@ -82,3 +95,8 @@ class CampaignTask(Base):
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
 
     campaign = relationship("Campaign", back_populates="tasks")
+    # 责任人，经 assignee_ids 读写
+    assignee_links = relationship(
+        CampaignTaskAssignee, cascade="all, delete-orphan", lazy="selectin", order_by=CampaignTaskAssignee.id
+    )
+    assignee_link_class = CampaignTaskAssignee
@@ -0,0 +1,32 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Integer
+
+from app.core.timezone import utc_now
+from app.database import Base
+
+# 计数列（与工作台指标卡片同名）
+COUNTER_FIELDS = (
+    "total_contents",
+    "published_contents",
+    "reviewing_contents",
+    "draft_contents",
+    "total_committees",
+    "total_members",
+    "active_channels",
+    "active_campaigns",
+)
+
+
+class CommunityCounter(Base):
+    """社区计数（每个社区一行），随写入在同一事务内增量维护，定时任务校正偏差"""
+    __tablename__ = "community_counters"
+
+    community_id = Column(Integer, ForeignKey("communities.id", ondelete="CASCADE"), primary_key=True)
+    total_contents = Column(Integer, nullable=False, default=0, server_default="0")
+    published_contents = Column(Integer, nullable=False, default=0, server_default="0")
+    reviewing_contents = Column(Integer, nullable=False, default=0, server_default="0")
+    draft_contents = Column(Integer, nullable=False, default=0, server_default="0")
+    total_committees = Column(Integer, nullable=False, default=0, server_default="0")
+    total_members = Column(Integer, nullable=False, default=0, server_default="0")
+    active_channels = Column(Integer, nullable=False, default=0, server_default="0")
+    active_campaigns = Column(Integer, nullable=False, default=0, server_default="0")
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
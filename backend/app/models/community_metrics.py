@@ -0,0 +1,51 @@
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, UniqueConstraint
+
+from app.core.timezone import utc_now
+from app.database import Base
+
+# 时点指标：快照时的数值，按周 / 月汇总时取区间内最后一天
+STATE_FIELDS = (
+    "total_contents",
+    "published_contents",
+    "reviewing_contents",
+    "draft_contents",
+    "total_members",
+    "active_campaigns",
+)
+# 当日发生量：按周 / 月汇总时求和
+FLOW_FIELDS = (
+    "wechat_publishes",
+    "hugo_publishes",
+    "csdn_publishes",
+    "zhihu_publishes",
+    "meetings_held",
+    "wechat_reads",
+)
+
+
+class CommunityMetricsDaily(Base):
+    """社区每日指标快照（每晚定时任务写入，供长周期趋势图读取）"""
+    __tablename__ = "community_metrics_daily"
+    __table_args__ = (
+        UniqueConstraint("community_id", "snapshot_date", name="uq_community_metrics_daily_community_date"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    community_id = Column(Integer, ForeignKey("communities.id", ondelete="CASCADE"), nullable=False)
+    snapshot_date = Column(Date, nullable=False, index=True)
+
+    total_contents = Column(Integer, nullable=False, default=0)
+    published_contents = Column(Integer, nullable=False, default=0)
+    reviewing_contents = Column(Integer, nullable=False, default=0)
+    draft_contents = Column(Integer, nullable=False, default=0)
+    total_members = Column(Integer, nullable=False, default=0)
+    active_campaigns = Column(Integer, nullable=False, default=0)
+
+    wechat_publishes = Column(Integer, nullable=False, default=0)
+    hugo_publishes = Column(Integer, nullable=False, default=0)
+    csdn_publishes = Column(Integer, nullable=False, default=0)
+    zhihu_publishes = Column(Integer, nullable=False, default=0)
+    meetings_held = Column(Integer, nullable=False, default=0)   # 当日召开（未取消）的会议
+    wechat_reads = Column(Integer, nullable=False, default=0)    # 当日公众号文章阅读数
+
+    created_at = Column(DateTime(timezone=True), default=utc_now)
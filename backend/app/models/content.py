@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Table, Text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
 
@@ -42,6 +42,10 @@ content_assignees = Table(
 
 class Content(Base):
     __tablename__ = "contents"
+    __table_args__ = (
+        Index("ix_contents_updated_at_id", "updated_at", "id"),
+        Index("ix_contents_status_scheduled_publish_at", "status", "scheduled_publish_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(500), nullable=False)
@@ -69,9 +73,13 @@ class Content(Base):
     owner_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
     # Calendar/scheduling field
     scheduled_publish_at = Column(DateTime, nullable=True, index=True)
+    # 定时自动发布状态：NULL 待发布 / publishing 已被发布器领取 / published / failed / skipped（无可用渠道）
+    auto_publish_status = Column(String(20), nullable=True)
+    auto_publish_locked_by = Column(String(200), nullable=True)
+    auto_publish_locked_until = Column(DateTime(timezone=True), nullable=True)
 
     created_at = Column(DateTime(timezone=True), default=utc_now)
-    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now, nullable=False)
 
     publish_records = relationship("PublishRecord", back_populates="content", cascade="all, delete-orphan")
     community = relationship("Community", back_populates="contents")
@@ -95,3 +103,11 @@ class Content(Base):
         back_populates="assigned_contents",
     )
     assets = relationship("Asset", secondary="content_assets", back_populates="contents")
+
+    @property
+    def assignee_ids(self) -> list[int]:
+        return [u.id for u in self.assignees]
+
+    @property
+    def assignee_names(self) -> list[str]:
+        return [u.full_name or u.username for u in self.assignees]
@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, Column, Date, DateTime, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import JSON, Column, Date, DateTime, ForeignKey, Index, Integer, String, Table, Text
 from sqlalchemy.orm import relationship
 
 from app.core.timezone import utc_now
@@ -17,6 +17,9 @@ class DesignTask(Base):
     """设计任务：独立的设计工作项，可选关联内容文章。"""
 
     __tablename__ = "design_tasks"
+    __table_args__ = (
+        Index("ix_design_tasks_community_created_at", "community_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(500), nullable=False)
@@ -36,7 +39,7 @@ class DesignTask(Base):
     # Optional link to a content article
     content_id = Column(Integer, ForeignKey("contents.id", ondelete="SET NULL"), nullable=True, index=True)
 
-    created_at = Column(DateTime(timezone=True), default=utc_now)
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
 
     assignee = relationship("User", foreign_keys=[assignee_id])
@@ -48,6 +51,9 @@ class Asset(Base):
     """素材库：存储设计产出物（图片、图标、品牌文件、模板等）。"""
 
     __tablename__ = "assets"
+    __table_args__ = (
+        Index("ix_assets_community_created_at", "community_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(500), nullable=False)
@@ -63,7 +69,7 @@ class Asset(Base):
     community_id = Column(Integer, ForeignKey("communities.id", ondelete="CASCADE"), nullable=False, index=True)
     uploaded_by_user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
 
-    created_at = Column(DateTime(timezone=True), default=utc_now)
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
     updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
 
     uploader = relationship("User", foreign_keys=[uploaded_by_user_id])
@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.timezone import utc_now
@@ -40,6 +40,9 @@ class EcosystemProject(Base):
 
 class EcosystemContributor(Base):
     __tablename__ = "ecosystem_contributors"
+    __table_args__ = (
+        Index("ix_ecosystem_contributors_project_commits", "project_id", "commit_count_90d", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(Integer, ForeignKey("ecosystem_projects.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -68,6 +71,10 @@ class EcosystemSnapshot(Base):
     """项目时序快照，每次采集写入一条，用于趋势动量分析。"""
 
     __tablename__ = "ecosystem_snapshots"
+    __table_args__ = (
+        # 趋势分析取项目最近的快照
+        Index("ix_ecosystem_snapshots_project_snapshot_at", "project_id", "snapshot_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     project_id = Column(
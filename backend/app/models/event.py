@@ -1,9 +1,10 @@
-from sqlalchemy import JSON, Boolean, Column, Date, DateTime, Float, ForeignKey, Integer, String, Table, Text
+from sqlalchemy import JSON, Boolean, Column, Date, DateTime, Float, ForeignKey, Index, Integer, String, Table, Text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
 
 from app.core.timezone import utc_now
 from app.database import Base
+from app.models.assignee import AssigneeIdsMixin, assignee_table
 
 # 活动 ↔ 社区 多对多关联表
 event_communities_table = Table(
@@ -13,6 +14,18 @@ event_communities_table = Table(
     Column("community_id", Integer, ForeignKey("communities.id", ondelete="CASCADE"), primary_key=True),
 )
 
+# 活动任务 / 检查项 ↔ 责任人
+event_task_assignees = assignee_table("event_task_assignees", "event_tasks")
+checklist_item_assignees = assignee_table("checklist_item_assignees", "checklist_items")
+
+
+class EventTaskAssignee(Base):
+    __table__ = event_task_assignees
+
+
+class ChecklistItemAssignee(Base):
+    __table__ = checklist_item_assignees
+
 
 class EventTemplate(Base):
     """活动 SOP 模板"""
@@ -64,6 +77,9 @@ class ChecklistTemplateItem(Base):
 class Event(Base):
     """活动"""
     __tablename__ = "events"
+    __table_args__ = (
+        Index("ix_events_planned_at_id", "planned_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True)
     community_id = Column(
@@ -120,7 +136,7 @@ class Event(Base):
     tasks = relationship("EventTask", back_populates="event", cascade="all, delete-orphan")
 
 
-class ChecklistItem(Base):
+class ChecklistItem(AssigneeIdsMixin, Base):
     """活动实例检查项"""
     __tablename__ = "checklist_items"
 
@@ -139,13 +155,18 @@ class ChecklistItem(Base):
     status = Column(
         SAEnum("pending", "done", "skipped", name="checklist_status_enum"), default="pending"
     )
-    assignee_ids = Column(JSON, default=list)  # list[int] user IDs（责任人，支持多人）
     due_date = Column(Date, nullable=True)
     notes = Column(Text, nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
     order = Column(Integer, default=0)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
 
     event = relationship("Event", back_populates="checklist_items")
+    # 责任人（支持多人），经 assignee_ids 读写
+    assignee_links = relationship(
+        ChecklistItemAssignee, cascade="all, delete-orphan", lazy="selectin", order_by=ChecklistItemAssignee.id
+    )
+    assignee_link_class = ChecklistItemAssignee
 
 
 class EventPersonnel(Base):
@@ -247,7 +268,7 @@ class IssueLink(Base):
     feedback = relationship("FeedbackItem", back_populates="issue_links")
 
 
-class EventTask(Base):
+class EventTask(AssigneeIdsMixin, Base):
     """活动任务/里程碑（甘特图数据）"""
     __tablename__ = "event_tasks"
 
@@ -270,10 +291,15 @@ class EventTask(Base):
         default="not_started",
     )
     depends_on = Column(JSON, default=list)   # list[int] task IDs
-    assignee_ids = Column(JSON, default=list)  # list[int] user IDs（责任人）
     parent_task_id = Column(
         Integer, ForeignKey("event_tasks.id", ondelete="SET NULL"), nullable=True
     )
     order = Column(Integer, default=0)
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
 
     event = relationship("Event", back_populates="tasks")
+    # 责任人，经 assignee_ids 读写
+    assignee_links = relationship(
+        EventTaskAssignee, cascade="all, delete-orphan", lazy="selectin", order_by=EventTaskAssignee.id
+    )
+    assignee_link_class = EventTaskAssignee
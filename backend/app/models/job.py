@@ -0,0 +1,35 @@
+from sqlalchemy import JSON, Column, DateTime, ForeignKey, Index, Integer, String, Text
+
+from app.core.timezone import utc_now
+from app.database import Base
+
+
+class Job(Base):
+    """后台任务（由 worker 进程或嵌入线程领取执行）"""
+    __tablename__ = "jobs"
+    __table_args__ = (
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(50), nullable=False, index=True)
+    status = Column(String(20), nullable=False, default="queued")
+    # 可选值: queued, running, succeeded, failed
+    payload = Column(JSON, nullable=False, default=dict)
+    result = Column(JSON, nullable=True)
+    error = Column(Text, nullable=True)
+    error_status = Column(Integer, nullable=True)  # 与同步接口一致的 HTTP 状态码（400/404/502 等）
+    # 同一 dedupe_key 的未完成任务只保留一个（如重复点击"同步"）
+    dedupe_key = Column(String(200), nullable=True, index=True)
+
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    run_after = Column(DateTime(timezone=True), default=utc_now, nullable=False)  # 重试退避：此时间前不领取
+    locked_by = Column(String(200), nullable=True)  # 执行中的 worker 标识
+    locked_until = Column(DateTime(timezone=True), nullable=True)  # 租约到期后视为 worker 失联，可被重新领取
+
+    community_id = Column(Integer, ForeignKey("communities.id", ondelete="SET NULL"), nullable=True, index=True)
+    created_by_user_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"), nullable=True, index=True)
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -31,6 +31,10 @@ meeting_assignees = Table(
 class Meeting(Base):
     """理事会会议"""
     __tablename__ = "meetings"
+    __table_args__ = (
+        # 社区看板即将召开的会议：按社区 + 状态过滤、按时间排序
+        Index("ix_meetings_community_status_scheduled_at", "community_id", "status", "scheduled_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     committee_id = Column(
@@ -95,6 +99,10 @@ class Meeting(Base):
         cascade="all, delete-orphan",
     )
 
+    @property
+    def assignee_ids(self) -> list[int]:
+        return [u.id for u in self.assignees]
+
 
 class MeetingReminder(Base):
     """会议提醒记录"""
@@ -116,16 +124,20 @@ class MeetingReminder(Base):
 
     notification_channels = Column(JSON, default=list)  # ['email', 'wechat']
 
-    status = Column(String(50), default="pending")  # pending, sent, failed
+    status = Column(String(50), default="pending")  # pending, sending, sent, failed
     error_message = Column(Text, nullable=True)
 
+    # 分发器领取租约（status=sending 期间有效，过期后可被其他进程重新领取）
+    locked_by = Column(String(200), nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+
     created_at = Column(DateTime(timezone=True), default=utc_now)
 
     # Relationships
     meeting = relationship("Meeting")
 
     __table_args__ = (
-        Index("idx_reminder_scheduled_status", "scheduled_at", "status"),
+        Index("ix_meeting_reminders_status_scheduled_at", "status", "scheduled_at"),
     )
 
 
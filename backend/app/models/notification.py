@@ -1,6 +1,6 @@
 from enum import Enum
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import relationship
 
 from app.core.timezone import utc_now
@@ -16,6 +16,11 @@ class Notification(Base):
     """站内通知记录。每条通知属于特定用户，可选关联资源（event_task / meeting）。"""
 
     __tablename__ = "notifications"
+    __table_args__ = (
+        Index("ix_notifications_user_created_at", "user_id", "created_at", "id"),
+        # 未读数轮询与仅未读列表
+        Index("ix_notifications_user_read_created_at", "user_id", "is_read", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(
@@ -39,3 +44,41 @@ class Notification(Base):
 
     # 关系
     user = relationship("User", back_populates="notifications")
+
+
+class NotificationOutbox(Base):
+    """通知邮件发件箱。
+
+    与站内通知在同一事务中写入，由后台分发器批量领取投递；
+    status: pending（待发送）/ sending（已被分发器领取）/ sent / failed（超过最大尝试次数）。
+    """
+
+    __tablename__ = "notification_outbox"
+    __table_args__ = (
+        Index("ix_notification_outbox_status_next_attempt_at", "status", "next_attempt_at"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    notification_id = Column(
+        Integer,
+        ForeignKey("notifications.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+
+    to_email = Column(String(200), nullable=False)
+    subject = Column(String(200), nullable=False)
+    text_body = Column(Text, nullable=False)
+    html_body = Column(Text, nullable=False)
+
+    status = Column(String(20), default="pending", nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_attempt_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    locked_by = Column(String(200), nullable=True)
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    sent_at = Column(DateTime(timezone=True), nullable=True)
+
+    notification = relationship("Notification")
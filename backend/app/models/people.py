@@ -1,4 +1,4 @@
-from sqlalchemy import JSON, Boolean, Column, Date, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import JSON, Boolean, Column, Date, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
 
@@ -9,6 +9,9 @@ from app.database import Base
 class PersonProfile(Base):
     """社区人脉档案（独立于系统 User，覆盖外部参与者）"""
     __tablename__ = "person_profiles"
+    __table_args__ = (
+        Index("ix_person_profiles_display_name_id", "display_name", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     display_name = Column(String(200), nullable=False, index=True)
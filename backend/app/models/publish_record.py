@@ -1,4 +1,4 @@
-from sqlalchemy import Column, DateTime, ForeignKey, Integer, String, Text
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy import Enum as SAEnum
 from sqlalchemy.orm import relationship
 
@@ -8,6 +8,12 @@ from app.database import Base
 
 class PublishRecord(Base):
     __tablename__ = "publish_records"
+    __table_args__ = (
+        # 社区看板发布趋势 / 日历、数据分析：按社区 + 状态过滤、按发布时间取范围
+        Index("ix_publish_records_community_status_published_at", "community_id", "status", "published_at"),
+        # 内容详情的发布记录、定时自动发布的渠道去重
+        Index("ix_publish_records_content_channel", "content_id", "channel"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     content_id = Column(Integer, ForeignKey("contents.id"), nullable=False)
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Float, Integer, String, Table
+
+from app.database import Base
+
+# 速率限制计数器（DatabaseStorage 使用，多 worker / 多节点共享）
+# key 由 limits 生成（含限流键与时间窗口编号），expires_at 为 Unix 时间戳（秒）
+rate_limit_counters = Table(
+    "rate_limit_counters",
+    Base.metadata,
+    Column("key", String(500), primary_key=True),
+    Column("count", Integer, nullable=False, default=0),
+    Column("expires_at", Float, nullable=False, index=True),
+)
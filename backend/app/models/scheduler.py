@@ -0,0 +1,31 @@
+from sqlalchemy import JSON, Column, DateTime, Integer, String, Text
+
+from app.core.timezone import utc_now
+from app.database import Base
+
+
+class SchedulerLease(Base):
+    """定时任务调度 Leader 租约（每个 name 同一时刻只有一个持有者）"""
+    __tablename__ = "scheduler_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder_id = Column(String(200), nullable=False)  # hostname:pid:随机后缀
+    acquired_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    heartbeat_at = Column(DateTime(timezone=True), default=utc_now, nullable=False)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
+
+
+class SchedulerJobRun(Base):
+    """定时任务执行历史"""
+    __tablename__ = "scheduler_job_runs"
+
+    id = Column(Integer, primary_key=True, index=True)
+    job_id = Column(String(100), nullable=False, index=True)
+    holder_id = Column(String(200), nullable=False)
+    status = Column(String(20), nullable=False, default="running", index=True)
+    # 可选值: running, success, failed
+    started_at = Column(DateTime(timezone=True), default=utc_now, nullable=False, index=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+    duration_ms = Column(Integer, nullable=True)
+    result = Column(JSON, nullable=True)  # 任务返回的统计字典
+    error = Column(Text, nullable=True)
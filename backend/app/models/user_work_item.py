@@ -0,0 +1,32 @@
+from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, UniqueConstraint
+
+from app.core.timezone import utc_now
+from app.database import Base
+
+# 事项类型（与前端「我的工作」中的 type 一致）
+WORK_ITEM_TYPES = ("content", "meeting", "event_task", "checklist_item", "campaign_task", "design_task")
+
+
+class UserWorkItem(Base):
+    """用户负责事项的投影（每个 (用户, 事项类型, 事项) 一行），随写入在同一事务内刷新，定时任务校正偏差"""
+    __tablename__ = "user_work_items"
+    __table_args__ = (
+        UniqueConstraint("user_id", "item_type", "item_id", name="uq_user_work_items_user_item"),
+        # 个人收件箱：按截止时间分页（全部类型 / 单一类型）
+        Index("ix_user_work_items_user_due", "user_id", "due_at", "id"),
+        Index("ix_user_work_items_user_type_due", "user_id", "item_type", "due_at", "id"),
+        # 事项变更时按事项刷新
+        Index("ix_user_work_items_item", "item_type", "item_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    item_type = Column(String(30), nullable=False)
+    item_id = Column(Integer, nullable=False)
+    # 所属活动 / 运营活动（活动任务、清单项、运营任务），用于跳转
+    parent_id = Column(Integer, nullable=True)
+    title = Column(String(500), nullable=False)
+    status = Column(String(50), nullable=True)        # 事项自身的状态
+    work_status = Column(String(20), nullable=True)   # planning / in_progress / completed
+    due_at = Column(DateTime, nullable=True)           # 截止时间（naive UTC，日期型截止日取当天 00:00）
+    updated_at = Column(DateTime(timezone=True), default=utc_now, onupdate=utc_now)
@@ -96,9 +96,11 @@ class ContactOut(BaseModel):
 
 class PaginatedContacts(BaseModel):
     items: list[ContactOut]
-    total: int
+    total: int | None = None  # 游标模式默认不计算总数
     page: int
     page_size: int
+    total_exact: bool = True  # false 表示 total 为规划器估算值
+    next_cursor: str | None = None
 
 
 # ─── Campaign Activity ─────────────────────────────────────────────────────────
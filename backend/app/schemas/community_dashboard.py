@@ -4,7 +4,7 @@
 用于 GET /communities/{id}/dashboard 聚合 API 的请求/响应数据结构。
 """
 
-from datetime import datetime
+from datetime import date, datetime
 
 from pydantic import BaseModel
 
@@ -126,6 +126,34 @@ class CommunityDashboardResponse(BaseModel):
     calendar_events: list[CalendarEvent] = []
 
 
+# ── 指标历史 ────────────────────────────────────────────────────────
+
+class MetricsHistoryPoint(BaseModel):
+    """指标历史数据点：时点指标取区间内最后一次快照，发生量为区间合计"""
+    period_start: date   # 区间起始日（当日 / 周一 / 月初）
+    total_contents: int = 0
+    published_contents: int = 0
+    reviewing_contents: int = 0
+    draft_contents: int = 0
+    total_members: int = 0
+    active_campaigns: int = 0
+    wechat_publishes: int = 0
+    hugo_publishes: int = 0
+    csdn_publishes: int = 0
+    zhihu_publishes: int = 0
+    meetings_held: int = 0
+    wechat_reads: int = 0
+
+
+class MetricsHistoryResponse(BaseModel):
+    """社区指标历史（来自每日快照）"""
+    community_id: int
+    granularity: str     # day / week / month
+    start_date: date
+    end_date: date
+    points: list[MetricsHistoryPoint] = []
+
+
 # ── 超管社区总览 ────────────────────────────────────────────────────
 
 class CommunityOverviewItem(BaseModel):
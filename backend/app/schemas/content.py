@@ -56,6 +56,8 @@ class ContentOut(BaseModel):
     created_by_user_id: int | None
     owner_id: int | None
     scheduled_publish_at: datetime | None
+    # 定时自动发布结果：None（未处理）/ publishing / published / failed / skipped
+    auto_publish_status: str | None = None
     created_at: datetime
     updated_at: datetime
     assignee_ids: list[int] = []
@@ -105,6 +107,8 @@ class ContentScheduleUpdate(BaseModel):
 
 class PaginatedContents(BaseModel):
     items: list[ContentListOut]
-    total: int
+    total: int | None = None  # 游标模式默认不计算总数
     page: int
     page_size: int
+    total_exact: bool = True  # false 表示 total 为规划器估算值
+    next_cursor: str | None = None
@@ -4,7 +4,7 @@ Dashboard (个人工作台) Schemas
 from datetime import date, datetime
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class AssignedItem(BaseModel):
@@ -98,6 +98,27 @@ class DashboardResponse(BaseModel):
     total_assigned_items: int
 
 
+class WorkItemOut(BaseModel):
+    """负责事项（投影行）"""
+    item_type: Literal["content", "meeting", "event_task", "checklist_item", "campaign_task", "design_task"]
+    item_id: int
+    parent_id: int | None = None   # 所属活动 / 运营活动
+    title: str
+    status: str | None = None      # 事项自身的状态
+    work_status: str | None = None  # planning / in_progress / completed
+    due_at: datetime | None = None  # 截止时间（UTC）
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WorkItemListOut(BaseModel):
+    """负责事项列表（按截止时间排序，无截止时间的排在最后）"""
+    items: list[WorkItemOut]
+    total: int | None = None  # 游标模式默认不计算总数
+    total_exact: bool = True
+    next_cursor: str | None = None
+
+
 class UpdateWorkStatusRequest(BaseModel):
     """更新工作状态请求"""
     work_status: Literal["planning", "in_progress", "completed"]
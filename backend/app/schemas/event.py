@@ -189,9 +189,11 @@ class EventListOut(BaseModel):
 
 class PaginatedEvents(BaseModel):
     items: list[EventListOut]
-    total: int
+    total: int | None = None  # 游标模式默认不计算总数
     page: int
     page_size: int
+    total_exact: bool = True  # false 表示 total 为规划器估算值
+    next_cursor: str | None = None
 
 
 # ─── Checklist Item ───────────────────────────────────────────────────────────
@@ -0,0 +1,20 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class JobOut(BaseModel):
+    id: int
+    kind: str
+    status: str  # queued / running / succeeded / failed
+    attempts: int
+    max_attempts: int
+    result: Any | None = None  # 成功时为原同步接口的响应体
+    error: str | None = None
+    error_status: int | None = None  # 失败时对应的 HTTP 状态码
+    created_at: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    model_config = {"from_attributes": True}
@@ -19,5 +19,7 @@ class NotificationOut(BaseModel):
 
 class NotificationListOut(BaseModel):
     items: list[NotificationOut]
-    total: int
+    total: int | None = None  # 游标模式默认不计算总数
     unread_count: int
+    total_exact: bool = True  # false 表示 total 为规划器估算值
+    next_cursor: str | None = None
@@ -0,0 +1,201 @@
+"""定时自动发布：已审核（approved）且 scheduled_publish_at 已到的内容自动发布到已启用的渠道。
+
+- 每个进程的 APScheduler 每 AUTO_PUBLISH_INTERVAL_SECONDS 扫描一次，经 (status, scheduled_publish_at)
+  索引按批领取；领取是原子的（见 app/services/lease_claim.py），多进程同时触发也只有一个进程发布同一内容；
+- 一批内容按渠道并发发布（公众号草稿 / Hugo 文章），每个渠道有独立的并发上限；
+- 发布记录在整批结束后一次性批量写入 publish_records；
+- 已有成功发布记录的渠道不再重复发布，租约过期被重新领取时只补发失败或未完成的渠道。
+
+发布结果记在 contents.auto_publish_status：published / failed / skipped（社区未启用可自动发布的渠道）。
+失败不会自动重试，编辑修改排期时间后会重新进入待发布状态。
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from sqlalchemy import and_, insert, or_, select, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.metrics import AUTO_PUBLISH_BATCH_DURATION, AUTO_PUBLISH_RESULTS
+from app.core.timezone import utc_now
+from app.database import SessionLocal
+from app.models.channel import ChannelConfig
+from app.models.content import Content
+from app.models.publish_record import PublishRecord
+from app.services.hugo import hugo_service
+from app.services.jobs.handlers import prepare_wechat_article
+from app.services.jobs.queue import JobError
+from app.services.lease_claim import claim_rows
+from app.services.scheduler_lease import HOLDER_ID
+from app.services.wechat import wechat_service
+
+logger = logging.getLogger(__name__)
+
+# 支持自动发布的渠道（csdn / zhihu 只提供复制内容，无发布接口）
+AUTO_PUBLISH_CHANNELS = ("wechat", "hugo")
+
+
+def _claimable(now):
+    # scheduled_publish_at 为 naive UTC；租约列带时区
+    return and_(
+        Content.status == "approved",
+        Content.scheduled_publish_at <= now.replace(tzinfo=None),
+        or_(
+            Content.auto_publish_status.is_(None),
+            and_(Content.auto_publish_status == "publishing", Content.auto_publish_locked_until < now),
+        ),
+    )
+
+
+def claim_due_contents(db: Session, worker_id: str, limit: int) -> list[Content]:
+    """领取一批到期内容并标记为 publishing，返回本进程实际抢到的内容。"""
+    now = utc_now()
+    claimed = claim_rows(
+        db,
+        Content,
+        _claimable(now),
+        order_by=(Content.scheduled_publish_at, Content.id),
+        values={
+            "auto_publish_status": "publishing",
+            "auto_publish_locked_until": now + timedelta(seconds=settings.AUTO_PUBLISH_LEASE_SECONDS),
+            # 领取不算内容修改，不影响 updated_at 排序与缓存
+            "updated_at": Content.updated_at,
+        },
+        worker_id=worker_id,
+        limit=limit,
+        locked_by=Content.auto_publish_locked_by,
+    )
+    return claimed or []
+
+
+def publish_due_contents(db: Session, worker_id: str = HOLDER_ID, limit: int | None = None) -> int:
+    """领取并发布一批到期内容，返回处理条数（0 表示没有到期内容）。"""
+    contents = claim_due_contents(db, worker_id, limit or settings.AUTO_PUBLISH_BATCH_SIZE)
+    if not contents:
+        return 0
+
+    start = time.perf_counter()
+    enabled = _enabled_channels(db, {c.community_id for c in contents if c.community_id is not None})
+    done = _published_channels(db, [c.id for c in contents])
+    targets = [
+        (content, channel)
+        for content in contents
+        for channel in AUTO_PUBLISH_CHANNELS
+        if channel in enabled.get(content.community_id, ()) and (content.id, channel) not in done
+    ]
+
+    records = asyncio.run(_fan_out(targets)) if targets else []
+    if records:
+        db.execute(insert(PublishRecord), records)
+
+    failed = {r["content_id"] for r in records if r["status"] == "failed"}
+    for content in contents:
+        if content.id in failed:
+            status = "failed"
+        elif enabled.get(content.community_id):
+            status = "published"
+        else:
+            status = "skipped"
+        db.execute(
+            update(Content)
+            .where(Content.id == content.id, Content.auto_publish_locked_by == worker_id)
+            .values(auto_publish_status=status, auto_publish_locked_by=None, auto_publish_locked_until=None)
+            .execution_options(synchronize_session=False)
+        )
+    db.commit()
+
+    AUTO_PUBLISH_BATCH_DURATION.observe(time.perf_counter() - start)
+    logger.info("定时发布: %d 篇内容，%d 个渠道发布，%d 篇失败", len(contents), len(records), len(failed))
+    return len(contents)
+
+
+def _enabled_channels(db: Session, community_ids: set[int]) -> dict[int, set[str]]:
+    if not community_ids:
+        return {}
+    rows = db.execute(
+        select(ChannelConfig.community_id, ChannelConfig.channel).where(
+            ChannelConfig.community_id.in_(community_ids),
+            ChannelConfig.channel.in_(AUTO_PUBLISH_CHANNELS),
+            ChannelConfig.enabled.is_(True),
+        )
+    )
+    enabled: dict[int, set[str]] = {}
+    for community_id, channel in rows:
+        enabled.setdefault(community_id, set()).add(channel)
+    return enabled
+
+
+def _published_channels(db: Session, content_ids: list[int]) -> set[tuple[int, str]]:
+    rows = db.execute(
+        select(PublishRecord.content_id, PublishRecord.channel).where(
+            PublishRecord.content_id.in_(content_ids),
+            PublishRecord.status.in_(("draft", "published")),
+        )
+    )
+    return {(content_id, channel) for content_id, channel in rows}
+
+
+async def _fan_out(targets: list[tuple[Content, str]]) -> list[dict]:
+    limits = {
+        "wechat": asyncio.Semaphore(settings.AUTO_PUBLISH_WECHAT_CONCURRENCY),
+        "hugo": asyncio.Semaphore(settings.AUTO_PUBLISH_HUGO_CONCURRENCY),
+    }
+    return await asyncio.gather(*(_publish_one(content, channel, limits[channel]) for content, channel in targets))
+
+
+async def _publish_one(content: Content, channel: str, limit: asyncio.Semaphore) -> dict:
+    """发布到单个渠道，返回待写入的发布记录（失败也记录，便于编辑排查）。"""
+    record = {
+        "content_id": content.id,
+        "channel": channel,
+        "community_id": content.community_id,
+        "status": "failed",
+        "platform_article_id": None,
+        "platform_url": None,
+        "published_at": None,
+        "error_message": None,
+        "created_at": utc_now(),
+    }
+    async with limit:
+        try:
+            if channel == "wechat":
+                wechat_html, thumb_media_id = await prepare_wechat_article(content)
+                result = await wechat_service.create_draft(
+                    title=content.title,
+                    content_html=wechat_html,
+                    author=content.author,
+                    thumb_media_id=thumb_media_id,
+                    community_id=content.community_id,
+                )
+                record.update(status="draft", platform_article_id=result.get("media_id", ""))
+            else:
+                file_path = await asyncio.to_thread(
+                    hugo_service.save_post,
+                    title=content.title,
+                    markdown_content=content.content_markdown,
+                    author=content.author,
+                    tags=content.tags,
+                    category=content.category,
+                    community_id=content.community_id,
+                )
+                record.update(status="published", platform_url=file_path, published_at=utc_now())
+        except JobError as exc:
+            record["error_message"] = exc.detail
+        except Exception as exc:
+            logger.warning("内容 %s 自动发布到 %s 失败: %s", content.id, channel, exc)
+            record["error_message"] = str(exc)
+    AUTO_PUBLISH_RESULTS.labels(channel=channel, status=record["status"]).inc()
+    return record
+
+
+def run_auto_publish(session_factory: Callable[[], Session] = SessionLocal) -> int:
+    """定时任务入口：处理完当前所有到期内容，返回处理条数。"""
+    total = 0
+    with session_factory() as db:
+        while count := publish_due_contents(db):
+            total += count
+    return total
@@ -0,0 +1,41 @@
+"""跨 worker 的缓存失效版本号。
+
+各进程内缓存（如认证主体缓存）记录读取时的版本号；写操作在同一事务内调用
+bump_cache_version 递增版本，其他 worker 定期比对版本号即可感知失效。
+"""
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.timezone import utc_now
+from app.models.cache_version import CacheVersion
+
+
+def get_cache_version(db: Session, name: str) -> int:
+    """读取缓存版本号，尚未创建时返回 0。"""
+    return db.execute(select(CacheVersion.version).where(CacheVersion.name == name)).scalar() or 0
+
+
+def bump_cache_version(db: Session, name: str) -> None:
+    """递增缓存版本号，不提交事务：由调用方随业务变更一起 commit。"""
+    result = db.execute(
+        update(CacheVersion)
+        .where(CacheVersion.name == name)
+        .values(version=CacheVersion.version + 1, updated_at=utc_now())
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(CacheVersion(name=name, version=1))
+    except IntegrityError:
+        # 并发请求抢先插入了版本行，改为递增
+        db.execute(
+            update(CacheVersion)
+            .where(CacheVersion.name == name)
+            .values(version=CacheVersion.version + 1, updated_at=utc_now())
+            .execution_options(synchronize_session=False)
+        )
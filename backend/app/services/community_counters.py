@@ -0,0 +1,339 @@
+"""社区计数表（community_counters）的维护与读取。
+
+工作台与超管总览的指标卡片直接读取每个社区一行的计数，不再逐次 COUNT 基础表：
+
+- 增量维护：Session ``after_flush`` 根据本次 flush 新增 / 修改 / 删除的内容（按状态）、委员会、
+  渠道（enabled）、运营活动（status）以及社区成员集合的变化计算各社区增量，
+  在同一事务内执行 ``UPDATE ... SET x = x + delta``；
+- 直接执行的 community_users 插入 / 删除语句（不经 ORM 关系集合）由 ``do_orm_execute``
+  拦截，执行后重算涉及社区的成员数；
+- 新建社区、或社区尚无计数行时，按基础表重算后插入；
+- 定时校正（Leader 任务）：比对所有社区的实际计数，修复绕过 Session 的写入（批量 SQL、
+  脚本导入、删除用户等）造成的偏差。
+
+即将召开的会议数随时间变化，不在计数表中，仍由工作台按索引实时统计。
+"""
+
+import logging
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import case, delete, event, func, inspect, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.timezone import utc_now
+from app.database import SessionLocal
+from app.models.campaign import Campaign
+from app.models.channel import ChannelConfig
+from app.models.committee import Committee
+from app.models.community import Community
+from app.models.community_counter import COUNTER_FIELDS, CommunityCounter
+from app.models.content import Content
+from app.models.user import User, community_users
+
+logger = logging.getLogger(__name__)
+
+_CONTENT_STATUS_FIELDS = {
+    "published": "published_contents",
+    "reviewing": "reviewing_contents",
+    "draft": "draft_contents",
+}
+
+
+def _content_fields(status: str | None) -> tuple[str, ...]:
+    if status in _CONTENT_STATUS_FIELDS:
+        return ("total_contents", _CONTENT_STATUS_FIELDS[status])
+    return ("total_contents",)
+
+
+# 计数涉及的模型 -> (决定计入哪些列的属性, 属性值 -> 计入的列)
+_TRACKED: dict[type, tuple[str, Callable[[Any], tuple[str, ...]]]] = {
+    Content: ("status", _content_fields),
+    Committee: ("community_id", lambda _: ("total_committees",)),
+    ChannelConfig: ("enabled", lambda enabled: ("active_channels",) if enabled else ()),
+    Campaign: ("status", lambda status: ("active_campaigns",) if status == "active" else ()),
+}
+
+
+def _load_old_value(target, value, oldvalue, initiator) -> None:
+    pass
+
+
+# 赋值时加载旧值（对象已过期时默认不加载），flush 后的属性历史才能给出修改前的计数归属
+for _model, (_attr, _) in _TRACKED.items():
+    for _name in {_attr, "community_id"}:
+        event.listen(getattr(_model, _name), "set", _load_old_value, active_history=True)
+
+
+# ── 基础表计数 ────────────────────────────────────────────────────────
+
+
+def _recount_columns(community_id: int) -> list:
+    """单个社区各计数列的标量子查询（列名与 COUNTER_FIELDS 一致）。"""
+
+    def count(model, *criteria):
+        return select(func.count()).select_from(model).where(*criteria).scalar_subquery()
+
+    def contents(*criteria):
+        return count(Content, Content.community_id == community_id, *criteria)
+
+    return [
+        contents().label("total_contents"),
+        *(contents(Content.status == status).label(field) for status, field in _CONTENT_STATUS_FIELDS.items()),
+        count(Committee, Committee.community_id == community_id).label("total_committees"),
+        count(community_users, community_users.c.community_id == community_id).label("total_members"),
+        count(
+            ChannelConfig,
+            ChannelConfig.community_id == community_id,
+            ChannelConfig.enabled == True,  # noqa: E712
+        ).label("active_channels"),
+        count(Campaign, Campaign.community_id == community_id, Campaign.status == "active").label("active_campaigns"),
+    ]
+
+
+def _recount(conn: Connection | Session, community_id: int) -> dict[str, int]:
+    return dict(conn.execute(select(*_recount_columns(community_id))).one()._mapping)
+
+
+def count_by_community(db: Session) -> dict[int, dict[str, int]]:
+    """全部社区按基础表的实际计数（每张基础表一条分组查询）。"""
+    actual: dict[int, dict[str, int]] = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+    content_rows = db.execute(
+        select(
+            Content.community_id,
+            func.count().label("total_contents"),
+            *(func.count(case((Content.status == status, 1))).label(field)
+              for status, field in _CONTENT_STATUS_FIELDS.items()),
+        )
+        .where(Content.community_id.isnot(None))
+        .group_by(Content.community_id)
+    )
+    for row in content_rows:
+        counts = dict(row._mapping)
+        actual[counts.pop("community_id")].update(counts)
+    grouped = (
+        ("total_committees", Committee.community_id, ()),
+        ("total_members", community_users.c.community_id, ()),
+        ("active_channels", ChannelConfig.community_id, (ChannelConfig.enabled == True,)),  # noqa: E712
+        ("active_campaigns", Campaign.community_id, (Campaign.status == "active",)),
+    )
+    for field, column, criteria in grouped:
+        for community_id, n in db.execute(
+            select(column, func.count()).where(column.isnot(None), *criteria).group_by(column)
+        ):
+            actual[community_id][field] = n
+    return actual
+
+
+def _insert_recounted(conn: Connection, community_id: int) -> None:
+    """插入按基础表重算的计数行；并发插入时以先写入者为准（偏差由定时校正修复）。"""
+    insert = postgresql.insert if conn.dialect.name == "postgresql" else sqlite.insert
+    conn.execute(
+        insert(CommunityCounter)
+        .values(community_id=community_id, updated_at=utc_now(), **_recount(conn, community_id))
+        .on_conflict_do_nothing(index_elements=["community_id"])
+    )
+
+
+# ── 读取 ──────────────────────────────────────────────────────────────
+
+
+def community_counts(db: Session, community_id: int) -> dict[str, int]:
+    """单个社区的计数；尚无计数行时按基础表现算（只读，不写入）。"""
+    row = db.execute(
+        select(*(getattr(CommunityCounter, field) for field in COUNTER_FIELDS))
+        .where(CommunityCounter.community_id == community_id)
+    ).one_or_none()
+    return dict(row._mapping) if row is not None else _recount(db, community_id)
+
+
+def all_community_counts(db: Session) -> dict[int, dict[str, int]]:
+    """所有已有计数行的社区计数。"""
+    rows = db.execute(
+        select(CommunityCounter.community_id, *(getattr(CommunityCounter, field) for field in COUNTER_FIELDS))
+    )
+    return {row.community_id: {field: row._mapping[field] for field in COUNTER_FIELDS} for row in rows}
+
+
+# ── 增量维护 ──────────────────────────────────────────────────────────
+
+
+def _before(state, attr: str):
+    history = state.attrs[attr].history
+    if history.deleted:
+        return history.deleted[0]
+    return history.unchanged[0] if history.unchanged else None
+
+
+def _after(state, attr: str):
+    history = state.attrs[attr].history
+    if history.added:
+        return history.added[0]
+    return history.unchanged[0] if history.unchanged else None
+
+
+def _collect_deltas(session: Session) -> dict[int, Counter]:
+    deltas: dict[int, Counter] = defaultdict(Counter)
+
+    def apply(state, read, sign: int) -> None:
+        attr, fields = _TRACKED[state.class_]
+        community_id = read(state, "community_id")
+        if community_id is not None:
+            for field in fields(read(state, attr)):
+                deltas[community_id][field] += sign
+
+    for obj in session.new:
+        if type(obj) in _TRACKED:
+            apply(inspect(obj), _after, 1)
+    for obj in session.dirty:
+        if type(obj) in _TRACKED:
+            state = inspect(obj)
+            apply(state, _before, -1)
+            apply(state, _after, 1)
+    for obj in session.deleted:
+        if type(obj) in _TRACKED:
+            apply(inspect(obj), _before, -1)
+
+    # 成员关系集合（两侧都可能有历史，按 (社区, 用户) 去重）
+    added: set[tuple[int, int]] = set()
+    removed: set[tuple[int, int]] = set()
+    for obj in chain(session.new, session.dirty):
+        if isinstance(obj, Community):
+            history = inspect(obj).attrs.members.history
+            added.update((obj.id, user.id) for user in history.added)
+            removed.update((obj.id, user.id) for user in history.deleted)
+        elif isinstance(obj, User):
+            history = inspect(obj).attrs.communities.history
+            added.update((community.id, obj.id) for community in history.added)
+            removed.update((community.id, obj.id) for community in history.deleted)
+    for community_id, _ in added:
+        deltas[community_id]["total_members"] += 1
+    for community_id, _ in removed:
+        deltas[community_id]["total_members"] -= 1
+    return deltas
+
+
+@event.listens_for(Session, "after_flush")
+def _apply_flushed_counts(session: Session, _flush_context) -> None:
+    # after_flush 时 new / dirty / deleted 与属性历史仍是 flush 前的状态，数据库中已是 flush 后的数据
+    created = {obj.id for obj in session.new if isinstance(obj, Community)}
+    dropped = {obj.id for obj in session.deleted if isinstance(obj, Community)}
+    deltas = _collect_deltas(session)
+    if not (created or dropped or deltas):
+        return
+
+    conn = session.connection()
+    if dropped:
+        conn.execute(delete(CommunityCounter).where(CommunityCounter.community_id.in_(dropped)))
+    for community_id in created:
+        _insert_recounted(conn, community_id)
+    for community_id, delta in deltas.items():
+        changes = {field: n for field, n in delta.items() if n}
+        if not changes or community_id in created or community_id in dropped:
+            continue
+        result = conn.execute(
+            update(CommunityCounter)
+            .where(CommunityCounter.community_id == community_id)
+            .values(
+                **{field: getattr(CommunityCounter, field) + n for field, n in changes.items()},
+                updated_at=utc_now(),
+            )
+        )
+        if result.rowcount == 0:
+            _insert_recounted(conn, community_id)
+
+
+def _inserted_community_ids(orm_execute_state) -> set[int]:
+    params = orm_execute_state.parameters
+    rows = params if isinstance(params, list) else [params or orm_execute_state.statement.compile().params]
+    return {
+        value for row in rows for key, value in row.items() if key.startswith("community_id") and value is not None
+    }
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _recount_members_after_statement(orm_execute_state):
+    """直接对 community_users 执行 INSERT / DELETE 后重算涉及社区的成员数。"""
+    if not (orm_execute_state.is_insert or orm_execute_state.is_delete):
+        return None
+    statement = orm_execute_state.statement
+    if statement.table is not community_users:
+        return None
+
+    session = orm_execute_state.session
+    if orm_execute_state.is_insert:
+        community_ids = _inserted_community_ids(orm_execute_state)
+    else:
+        affected = select(community_users.c.community_id).distinct()
+        if statement.whereclause is not None:
+            affected = affected.where(statement.whereclause)
+        params = orm_execute_state.parameters
+        community_ids = set(session.scalars(affected, params if isinstance(params, dict) else None))
+
+    result = orm_execute_state.invoke_statement()
+    conn = session.connection()
+    for community_id in community_ids:
+        members = select(func.count()).where(community_users.c.community_id == community_id).scalar_subquery()
+        updated = conn.execute(
+            update(CommunityCounter)
+            .where(CommunityCounter.community_id == community_id)
+            .values(total_members=members, updated_at=utc_now())
+        )
+        if updated.rowcount == 0:
+            _insert_recounted(conn, community_id)
+    return result
+
+
+# ── 定时校正 ──────────────────────────────────────────────────────────
+
+
+def reconcile_counters(db: Session) -> int:
+    """比对并修复计数表，返回修复的社区数。
+
+    先用分组查询找出有偏差的社区，再逐个锁定计数行（PostgreSQL ``FOR UPDATE``）后重算：
+    并发事务的增量要么已提交并被重算看到，要么等锁释放后叠加在重算结果上。
+    """
+    community_ids = set(db.scalars(select(Community.id)))
+    actual = count_by_community(db)
+    stored = all_community_counts(db)
+    db.commit()
+
+    stale = set(stored) - community_ids
+    if stale:
+        db.execute(delete(CommunityCounter).where(CommunityCounter.community_id.in_(stale)))
+        db.commit()
+
+    lock = db.get_bind().dialect.name == "postgresql"
+    repaired = 0
+    for community_id in sorted(community_ids):
+        expected = actual.get(community_id, dict.fromkeys(COUNTER_FIELDS, 0))
+        if stored.get(community_id) == expected:
+            continue
+        row = select(CommunityCounter.community_id).where(CommunityCounter.community_id == community_id)
+        if lock:
+            row = row.with_for_update()
+        if db.scalar(row) is None:
+            _insert_recounted(db.connection(), community_id)
+        else:
+            db.execute(
+                update(CommunityCounter)
+                .where(CommunityCounter.community_id == community_id)
+                .values(**_recount(db, community_id), updated_at=utc_now())
+            )
+        db.commit()
+        if community_id in stored:
+            drift = {f: (stored[community_id][f], expected[f]) for f in COUNTER_FIELDS
+                     if stored[community_id][f] != expected[f]}
+            logger.warning("社区 %s 计数偏差已修复: %s", community_id, drift)
+        repaired += 1
+    return repaired
+
+
+def run_counter_reconcile(session_factory: Callable[[], Session] = SessionLocal) -> dict:
+    """定时任务入口。"""
+    with session_factory() as db:
+        return {"repaired": reconcile_counters(db)}
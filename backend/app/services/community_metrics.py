@@ -0,0 +1,134 @@
+"""社区每日指标快照。
+
+每晚由 Leader 进程为每个社区写入一行 community_metrics_daily（前一天，按 APP_TIMEZONE 划分日期）：
+
+- 时点指标（内容按状态、成员数、进行中的运营活动）：快照时按基础表分组统计的数值；
+- 当日发生量：各渠道发布数、召开（未取消）的会议数、公众号文章阅读数。
+
+同一天重复执行会覆盖当天的快照。指标历史接口只读快照表，按日 / 周 / 月汇总：
+时点指标取区间内最后一次快照，发生量求和。
+"""
+
+import logging
+from collections.abc import Callable
+from datetime import UTC, date, datetime, time, timedelta
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.orm import Session
+
+from app.core.timezone import get_app_tz, utc_now
+from app.database import SessionLocal
+from app.models.community import Community
+from app.models.community_metrics import FLOW_FIELDS, STATE_FIELDS, CommunityMetricsDaily
+from app.models.meeting import Meeting
+from app.models.publish_record import PublishRecord
+from app.models.wechat_stats import WechatArticleStat
+from app.services.community_counters import count_by_community
+
+logger = logging.getLogger(__name__)
+
+GRANULARITIES = ("day", "week", "month")
+
+
+def _day_bounds(day: date) -> tuple[datetime, datetime]:
+    """应用时区下某天的起止时刻（UTC）。"""
+    start = datetime.combine(day, time.min, tzinfo=get_app_tz()).astimezone(UTC)
+    return start, start + timedelta(days=1)
+
+
+def snapshot_metrics(db: Session, day: date) -> int:
+    """写入所有社区某天的指标快照，返回写入行数。"""
+    start, end = _day_bounds(day)
+    rows = {
+        community_id: {"community_id": community_id, "snapshot_date": day, **dict.fromkeys(FLOW_FIELDS, 0)}
+        for community_id in db.scalars(select(Community.id))
+    }
+
+    for community_id, counts in count_by_community(db).items():
+        if community_id in rows:
+            rows[community_id].update({field: counts[field] for field in STATE_FIELDS})
+
+    publishes = db.execute(
+        select(PublishRecord.community_id, PublishRecord.channel, func.count())
+        .where(
+            PublishRecord.status == "published",
+            PublishRecord.published_at >= start,
+            PublishRecord.published_at < end,
+        )
+        .group_by(PublishRecord.community_id, PublishRecord.channel)
+    )
+    for community_id, channel, n in publishes:
+        field = f"{channel}_publishes"
+        if community_id in rows and field in FLOW_FIELDS:
+            rows[community_id][field] = n
+
+    # meetings.scheduled_at 为 naive UTC
+    meetings = db.execute(
+        select(Meeting.community_id, func.count())
+        .where(
+            Meeting.status != "cancelled",
+            Meeting.scheduled_at >= start.replace(tzinfo=None),
+            Meeting.scheduled_at < end.replace(tzinfo=None),
+        )
+        .group_by(Meeting.community_id)
+    )
+    for community_id, n in meetings:
+        if community_id in rows:
+            rows[community_id]["meetings_held"] = n
+
+    reads = db.execute(
+        select(WechatArticleStat.community_id, func.coalesce(func.sum(WechatArticleStat.read_count), 0))
+        .where(WechatArticleStat.stat_date == day)
+        .group_by(WechatArticleStat.community_id)
+    )
+    for community_id, n in reads:
+        if community_id in rows:
+            rows[community_id]["wechat_reads"] = n
+
+    db.execute(delete(CommunityMetricsDaily).where(CommunityMetricsDaily.snapshot_date == day))
+    if rows:
+        now = utc_now()
+        db.execute(insert(CommunityMetricsDaily), [{**row, "created_at": now} for row in rows.values()])
+    db.commit()
+    return len(rows)
+
+
+def run_metrics_snapshot(session_factory: Callable[[], Session] = SessionLocal) -> dict:
+    """定时任务入口：写入应用时区下前一天的快照。"""
+    day = utc_now().astimezone(get_app_tz()).date() - timedelta(days=1)
+    with session_factory() as db:
+        written = snapshot_metrics(db, day)
+    logger.info("社区指标快照: %s，%d 个社区", day.isoformat(), written)
+    return {"date": day.isoformat(), "communities": written}
+
+
+def _bucket_start(day: date, granularity: str) -> date:
+    if granularity == "week":
+        return day - timedelta(days=day.weekday())
+    if granularity == "month":
+        return day.replace(day=1)
+    return day
+
+
+def metrics_history(db: Session, community_id: int, start: date, end: date, granularity: str) -> list[dict]:
+    """按粒度汇总快照：时点指标取区间内最后一次快照，发生量求和。没有快照的区间不返回。"""
+    snapshots = db.execute(
+        select(
+            CommunityMetricsDaily.snapshot_date,
+            *(getattr(CommunityMetricsDaily, field) for field in STATE_FIELDS + FLOW_FIELDS),
+        )
+        .where(
+            CommunityMetricsDaily.community_id == community_id,
+            CommunityMetricsDaily.snapshot_date >= start,
+            CommunityMetricsDaily.snapshot_date <= end,
+        )
+        .order_by(CommunityMetricsDaily.snapshot_date)
+    )
+    buckets: dict[date, dict] = {}
+    for row in snapshots:
+        key = _bucket_start(row.snapshot_date, granularity)
+        point = buckets.setdefault(key, {"period_start": key, **dict.fromkeys(FLOW_FIELDS, 0)})
+        point.update({field: row._mapping[field] for field in STATE_FIELDS})
+        for field in FLOW_FIELDS:
+            point[field] += row._mapping[field]
+    return list(buckets.values())
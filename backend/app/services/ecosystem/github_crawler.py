@@ -11,6 +11,7 @@ from datetime import timedelta
 import httpx
 from sqlalchemy.orm import Session
 
+from app.core.metrics import github_event_hooks
 from app.core.timezone import utc_now
 from app.models.ecosystem import EcosystemContributor, EcosystemProject, EcosystemSnapshot
 
@@ -200,7 +201,7 @@ def sync_project(db: Session, project: EcosystemProject, token: str | None = Non
     new_handles: list[str] = []
 
     try:
-        with httpx.Client(timeout=30) as client:
+        with httpx.Client(timeout=30, event_hooks=github_event_hooks()) as client:
             # ── 1. 同步贡献者列表 ──────────────────────────────────────
             resp = client.get(url, headers=headers, params={"per_page": 100, "anon": "false"})
             if resp.status_code != 200:
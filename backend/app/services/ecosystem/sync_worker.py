@@ -17,6 +17,11 @@ from datetime import UTC, timedelta
 
 from sqlalchemy.orm import Session
 
+from app.core.metrics import (
+    COLLECTOR_PROJECTS_SYNCED,
+    COLLECTOR_RATE_LIMIT_WAIT_SECONDS,
+    COLLECTOR_RATE_LIMIT_WAITS,
+)
 from app.core.timezone import utc_now
 from app.models.ecosystem import EcosystemProject
 
@@ -41,6 +46,7 @@ class RateLimiter:
 
     def acquire(self) -> None:
         """消耗一个令牌；若令牌不足则阻塞直到补充。"""
+        wait_start: float | None = None
         while True:
             with self._lock:
                 now = time.monotonic()
@@ -52,7 +58,12 @@ class RateLimiter:
                 self._last_refill = now
                 if self._tokens >= 1.0:
                     self._tokens -= 1.0
+                    if wait_start is not None:
+                        COLLECTOR_RATE_LIMIT_WAITS.inc()
+                        COLLECTOR_RATE_LIMIT_WAIT_SECONDS.inc(now - wait_start)
                     return
+            if wait_start is None:
+                wait_start = now
             # 不持锁等待（避免死锁），稍后重试
             time.sleep(0.1)
 
@@ -121,9 +132,11 @@ def _sync_project_isolated(
                 return {"project_id": project_id, "created": 0, "updated": 0, "errors": 1}
             result = sync_project(db, project, token)
             result["project_id"] = project_id
+            COLLECTOR_PROJECTS_SYNCED.labels(result="error" if result.get("errors") else "success").inc()
             return result
     except Exception as exc:
         logger.error("项目 %d 同步异常: %s", project_id, exc)
+        COLLECTOR_PROJECTS_SYNCED.labels(result="error").inc()
         return {"project_id": project_id, "created": 0, "updated": 0, "errors": 1}
 
 
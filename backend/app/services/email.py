@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 import smtplib
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from dataclasses import dataclass
 from email import encoders
 from email.mime.base import MIMEBase
@@ -30,7 +34,7 @@ class EmailMessage:
     attachments: list[EmailAttachment] | None = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class SmtpConfig:
     host: str
     port: int
@@ -39,11 +43,152 @@ class SmtpConfig:
     use_tls: bool
 
 
+@dataclass
+class _IdleConnection:
+    server: smtplib.SMTP
+    last_used: float
+
+
+class SmtpConnectionPool:
+    """已登录 SMTP 连接的进程内复用池。
+
+    以 (SmtpConfig, 登录名) 为键，社区各自的 SMTP 配置互不混用。借出时：
+    - 空闲超过 SMTP_POOL_IDLE_TIMEOUT_SECONDS 的连接直接关闭（服务器多半已断开）；
+    - 空闲超过 SMTP_POOL_NOOP_AFTER_SECONDS 的连接先发 NOOP，非 250 响应则丢弃重连。
+    归还时每个键最多保留 SMTP_POOL_MAX_IDLE 个空闲连接，为 0 时不复用。
+    """
+
+    def __init__(
+        self,
+        max_idle: int | None = None,
+        idle_timeout: float | None = None,
+        noop_after: float | None = None,
+    ) -> None:
+        self.max_idle = max_idle if max_idle is not None else settings.SMTP_POOL_MAX_IDLE
+        self.idle_timeout = idle_timeout if idle_timeout is not None else settings.SMTP_POOL_IDLE_TIMEOUT_SECONDS
+        self.noop_after = noop_after if noop_after is not None else settings.SMTP_POOL_NOOP_AFTER_SECONDS
+        self._idle: dict[tuple[SmtpConfig, str], list[_IdleConnection]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def connection(
+        self, config: SmtpConfig, login: str, connect: Callable[[], smtplib.SMTP]
+    ) -> Iterator[smtplib.SMTP]:
+        """借出一个可用连接（池中没有时调用 connect 新建），正常退出后归还。"""
+        key = (config, login)
+        server = self._checkout(key) or connect()
+        try:
+            yield server
+        except BaseException:
+            self._close(server)
+            raise
+        self._release(key, server)
+
+    def _checkout(self, key: tuple[SmtpConfig, str]) -> smtplib.SMTP | None:
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                conn = idle.pop()  # 后进先出：优先使用最近用过的连接
+            age = time.monotonic() - conn.last_used
+            if age > self.idle_timeout:
+                self._close(conn.server)
+            elif age > self.noop_after and not self._healthy(conn.server):
+                self._close(conn.server)
+            else:
+                return conn.server
+
+    def _release(self, key: tuple[SmtpConfig, str], server: smtplib.SMTP) -> None:
+        # smtplib 在服务器断开时会先 close()，sock 为 None 的连接不能再用
+        if getattr(server, "sock", None) is None:
+            self._close(server)
+            return
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle:
+                idle.append(_IdleConnection(server, time.monotonic()))
+                return
+        self._close(server)
+
+    @staticmethod
+    def _healthy(server: smtplib.SMTP) -> bool:
+        try:
+            code, _ = server.noop()
+        except (smtplib.SMTPException, OSError):
+            return False
+        return code == 250
+
+    @staticmethod
+    def _close(server: smtplib.SMTP) -> None:
+        try:
+            server.quit()
+        except (smtplib.SMTPException, OSError):
+            server.close()
+
+    def evict_idle(self) -> int:
+        """关闭空闲超时的连接（由定时任务调用，避免长时间无邮件时连接一直占用），返回关闭数量。"""
+        now = time.monotonic()
+        expired: list[smtplib.SMTP] = []
+        with self._lock:
+            for key, idle in list(self._idle.items()):
+                keep = [conn for conn in idle if now - conn.last_used <= self.idle_timeout]
+                expired.extend(conn.server for conn in idle if now - conn.last_used > self.idle_timeout)
+                if keep:
+                    self._idle[key] = keep
+                else:
+                    del self._idle[key]
+        for server in expired:
+            self._close(server)
+        return len(expired)
+
+    def close_all(self) -> None:
+        with self._lock:
+            servers = [conn.server for idle in self._idle.values() for conn in idle]
+            self._idle.clear()
+        for server in servers:
+            self._close(server)
+
+
+smtp_pool = SmtpConnectionPool()
+
+
 class SmtpEmailProvider:
-    def __init__(self, config: SmtpConfig) -> None:
+    def __init__(self, config: SmtpConfig, pool: SmtpConnectionPool | None = None) -> None:
         self._config = config
+        self._pool = pool or smtp_pool
 
     def send(self, message: EmailMessage) -> None:
+        with self._session(message.from_email) as server:
+            server.sendmail(message.from_email, message.to_emails, self._build_mime(message).as_string())
+
+    def send_many(self, messages: list[EmailMessage]) -> list[Exception | None]:
+        """在同一个 SMTP 会话中依次发送多封邮件，返回与 messages 一一对应的结果（成功为 None）。
+
+        单封邮件被拒收不影响其余邮件；连接中途断开时剩余邮件均记为该异常。
+        建立连接或登录失败时直接抛出。
+        """
+        if not messages:
+            return []
+        results: list[Exception | None] = []
+        with self._session(messages[0].from_email) as server:
+            for index, message in enumerate(messages):
+                try:
+                    server.sendmail(message.from_email, message.to_emails, self._build_mime(message).as_string())
+                except smtplib.SMTPServerDisconnected as exc:
+                    results.extend([exc] * (len(messages) - index))
+                    break
+                except smtplib.SMTPException as exc:
+                    results.append(exc)
+                else:
+                    results.append(None)
+        return results
+
+    def _session(self, from_email: str) -> AbstractContextManager[smtplib.SMTP]:
+        login = self._login_name(from_email)
+        return self._pool.connection(self._config, login, lambda: self._connect(login))
+
+    def _build_mime(self, message: EmailMessage) -> MIMEMultipart:
         msg = MIMEMultipart("mixed")
         msg["Subject"] = message.subject
         msg["From"] = self._format_from(message.from_email, message.from_name)
@@ -62,28 +207,31 @@ class SmtpEmailProvider:
             encoders.encode_base64(part)
             part.add_header("Content-Disposition", f'attachment; filename="{attachment.filename}"')
             msg.attach(part)
+        return msg
+
+    def _login_name(self, from_email: str) -> str:
+        # Use username if provided, otherwise use from_email as username
+        return self._config.username.strip() if self._config.username else from_email
 
+    def _connect(self, username: str) -> smtplib.SMTP:
+        """建立已完成加密与登录的 SMTP 连接。"""
         # Auto-detect encryption method based on port
         # Port 465: SMTP_SSL (direct SSL/TLS connection)
         # Port 587/others: SMTP with STARTTLS (upgrade after connect)
         use_ssl = self._config.port == 465
-        # Use username if provided, otherwise use from_email as username
-        username = self._config.username.strip() if self._config.username else message.from_email
-
         if use_ssl:
-            # Use SMTP_SSL for port 465
-            with smtplib.SMTP_SSL(self._config.host, self._config.port, timeout=30) as server:
-                if username and self._config.password:
-                    server.login(username, self._config.password)
-                server.sendmail(message.from_email, message.to_emails, msg.as_string())
+            server = smtplib.SMTP_SSL(self._config.host, self._config.port, timeout=30)
         else:
-            # Use SMTP with STARTTLS for port 587 and others
-            with smtplib.SMTP(self._config.host, self._config.port, timeout=30) as server:
-                if self._config.use_tls:
-                    server.starttls()
-                if username and self._config.password:
-                    server.login(username, self._config.password)
-                server.sendmail(message.from_email, message.to_emails, msg.as_string())
+            server = smtplib.SMTP(self._config.host, self._config.port, timeout=30)
+        try:
+            if not use_ssl and self._config.use_tls:
+                server.starttls()
+            if username and self._config.password:
+                server.login(username, self._config.password)
+        except Exception:
+            server.close()
+            raise
+        return server
 
     @staticmethod
     def _format_from(email: str, name: str | None) -> str:
@@ -98,7 +246,8 @@ def _load_email_settings(community: Community) -> dict:
     return email_cfg or {}
 
 
-def _get_fallback_smtp_config() -> SmtpConfig | None:
+def get_global_smtp_config() -> SmtpConfig | None:
+    """全局 SMTP（环境变量 SMTP_*），用于站内通知邮件及社区未单独配置时的兜底。"""
     if not settings.SMTP_HOST:
         return None
     return SmtpConfig(
@@ -126,7 +275,7 @@ def get_smtp_config(community: Community) -> tuple[SmtpConfig | None, dict]:
         )
         return config, email_cfg
 
-    return _get_fallback_smtp_config(), email_cfg
+    return get_global_smtp_config(), email_cfg
 
 
 def get_sender_info(community: Community, email_cfg: dict) -> tuple[str, str | None, str | None]:
@@ -0,0 +1,25 @@
+"""后台任务队列。
+
+耗时操作（GitHub 同步、docx 转换、微信接口调用、聚合重建）不再占用请求处理进程：
+接口写入 jobs 表后立即返回 202 与任务 ID，由 worker 领取执行，客户端轮询
+``GET /api/jobs/{id}`` 获取结果。
+
+- worker 可嵌入 FastAPI 进程（JOB_WORKER_EMBEDDED，后台线程），也可 ``python run_worker.py`` 独立运行；
+- 领取：PostgreSQL 用 ``FOR UPDATE SKIP LOCKED``，SQLite 用条件 UPDATE（app/services/lease_claim.py）；
+- 执行中持有租约并定期续期，worker 崩溃后任务在租约到期时被其他 worker 重新领取；
+- 可重试的失败按指数退避重新入队，直至 max_attempts。
+"""
+
+from app.services.jobs import handlers  # noqa: F401  注册各任务处理函数
+from app.services.jobs.queue import HANDLERS, JobError, claim_next, enqueue, finish_job, job_handler
+from app.services.jobs.worker import JobWorker
+
+__all__ = [
+    "HANDLERS",
+    "JobError",
+    "JobWorker",
+    "claim_next",
+    "enqueue",
+    "finish_job",
+    "job_handler",
+]
@@ -0,0 +1,181 @@
+"""各类后台任务的处理函数（原先在请求处理中同步执行的逻辑）。
+
+处理函数返回值写入 jobs.result，结构与改造前同步接口的响应一致。
+"""
+
+import os
+import tempfile
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.models.content import Content
+from app.models.ecosystem import EcosystemProject
+from app.models.publish_record import PublishRecord
+from app.schemas.content import ContentOut
+from app.schemas.ecosystem import SyncResult
+from app.schemas.publish import PublishRecordOut
+from app.services.converter import convert_docx_to_markdown, convert_markdown_to_html
+from app.services.ecosystem.github_crawler import sync_project
+from app.services.jobs.queue import JobError, job_handler
+from app.services.storage import get_storage
+from app.services.wechat import wechat_service
+from app.services.wechat_stats import wechat_stats_service
+from app.services.wechat_sync import wechat_sync_service
+
+ECOSYSTEM_SYNC = "ecosystem.sync"
+CONTENT_UPLOAD = "content.upload"
+PUBLISH_WECHAT = "publish.wechat"
+WECHAT_SYNC_ARTICLES = "wechat.sync_articles"
+WECHAT_SYNC_STATS = "wechat.sync_stats"
+WECHAT_REBUILD_AGGREGATES = "wechat.rebuild_aggregates"
+
+
+@job_handler(ECOSYSTEM_SYNC)
+def sync_ecosystem_project(db: Session, payload: dict) -> dict:
+    project = db.get(EcosystemProject, payload["project_id"])
+    if project is None:
+        raise JobError("项目不存在", 404)
+    result = sync_project(db, project, settings.GITHUB_TOKEN)
+    return SyncResult.model_validate(result).model_dump(mode="json")
+
+
+@job_handler(CONTENT_UPLOAD)
+def convert_uploaded_file(db: Session, payload: dict) -> dict:
+    """把已存入存储的原始文件转换为 Markdown/HTML 并创建内容。"""
+    file_content = get_storage().read(payload["key"])
+
+    if payload["ext"] == ".docx":
+        # python-docx requires a real file path; write to a temp file, parse, then clean up
+        with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as tmp:
+            tmp.write(file_content)
+            tmp_path = tmp.name
+        try:
+            markdown_text, _image_paths = convert_docx_to_markdown(tmp_path)
+        except Exception as e:
+            raise JobError(f"文档解析失败: {e}", 400) from e
+        finally:
+            os.unlink(tmp_path)
+    else:
+        markdown_text = file_content.decode("utf-8", errors="replace").strip()
+
+    content = Content(
+        title=payload["title"],
+        content_markdown=markdown_text,
+        content_html=convert_markdown_to_html(markdown_text) if markdown_text else "",
+        source_type="contribution",
+        source_file=payload["key"],
+        status="draft",
+        community_id=None,
+        created_by_user_id=payload.get("user_id"),
+    )
+    db.add(content)
+    db.commit()
+    db.refresh(content)
+    return ContentOut.model_validate(content).model_dump(mode="json")
+
+
+def _record_publish(db: Session, content: Content, **fields) -> PublishRecord:
+    record = PublishRecord(content_id=content.id, channel="wechat", community_id=content.community_id, **fields)
+    db.add(record)
+    db.commit()
+    db.refresh(record)
+    return record
+
+
+async def prepare_wechat_article(content: Content, thumb_media_id: str = "") -> tuple[str, str]:
+    """生成公众号正文 HTML 并确定封面 thumb_media_id（必要时上传本地图片与封面）。"""
+    community_id = content.community_id
+
+    # 优先使用 content_html（如 135 编辑器导入的 HTML），否则从 Markdown 转换
+    if content.content_html and content.content_html.strip():
+        wechat_html = wechat_service.apply_wechat_styles(content.content_html)
+    else:
+        # Replace local images with WeChat URLs before conversion
+        markdown_with_wechat_images = await wechat_service._replace_local_images_with_wechat_urls(
+            content.content_markdown, community_id
+        )
+        wechat_html = wechat_service.convert_to_wechat_html(markdown_with_wechat_images)
+
+    # Resolve thumb_media_id: explicit param > auto-upload cover_image
+    if not thumb_media_id and content.cover_image:
+        cover_path = os.path.join(settings.UPLOAD_DIR, content.cover_image.removeprefix("/uploads/"))
+        if os.path.isfile(cover_path):
+            try:
+                thumb_media_id = await wechat_service.upload_thumb_media(cover_path, community_id)
+            except Exception as e:
+                raise JobError(f"封面图上传失败: {e}", 502) from e
+    if not thumb_media_id:
+        raise JobError(
+            "缺少封面图。请在内容编辑页设置封面图（cover_image），或在请求中提供 thumb_media_id",
+            400,
+        )
+    return wechat_html, thumb_media_id
+
+
+# 创建草稿不是幂等操作，失败后不自动重试，避免公众号后台出现重复草稿
+@job_handler(PUBLISH_WECHAT, max_attempts=1)
+async def publish_content_to_wechat(db: Session, payload: dict) -> dict:
+    content = db.get(Content, payload["content_id"])
+    if content is None:
+        raise JobError("Content not found", 404)
+
+    wechat_html, thumb_media_id = await prepare_wechat_article(content, payload.get("thumb_media_id") or "")
+    try:
+        result = await wechat_service.create_draft(
+            title=content.title,
+            content_html=wechat_html,
+            author=content.author,
+            thumb_media_id=thumb_media_id,
+            community_id=content.community_id,
+        )
+    except ValueError as e:
+        # Configuration errors (missing credentials)
+        raise JobError(str(e), 400) from e
+    except Exception as e:
+        _record_publish(db, content, status="failed", error_message=str(e))
+        raise JobError(f"WeChat API error: {e}", 502) from e
+
+    record = _record_publish(db, content, status="draft", platform_article_id=result.get("media_id", ""))
+    return PublishRecordOut.model_validate(record).model_dump(mode="json")
+
+
+@job_handler(WECHAT_SYNC_ARTICLES)
+async def sync_wechat_articles(db: Session, payload: dict) -> dict:
+    try:
+        return await wechat_sync_service.sync_articles(
+            db, community_id=payload["community_id"], user_id=payload["user_id"]
+        )
+    except ValueError as e:
+        raise JobError(str(e), 400) from None
+    except Exception as e:
+        raise JobError(str(e), 502, retryable=True) from e
+
+
+@job_handler(WECHAT_SYNC_STATS)
+async def sync_wechat_stats(db: Session, payload: dict) -> dict:
+    try:
+        return await wechat_sync_service.sync_stats(
+            db,
+            community_id=payload["community_id"],
+            start_date=date.fromisoformat(payload["start_date"]),
+            end_date=date.fromisoformat(payload["end_date"]),
+        )
+    except ValueError as e:
+        raise JobError(str(e), 400) from None
+    except Exception as e:
+        raise JobError(str(e), 502, retryable=True) from e
+
+
+@job_handler(WECHAT_REBUILD_AGGREGATES)
+def rebuild_wechat_aggregates(db: Session, payload: dict) -> dict:
+    period_type = payload["period_type"]
+    count = wechat_stats_service.rebuild_aggregates(
+        db,
+        community_id=payload["community_id"],
+        period_type=period_type,
+        start_date=date.fromisoformat(payload["start_date"]) if payload.get("start_date") else None,
+        end_date=date.fromisoformat(payload["end_date"]) if payload.get("end_date") else None,
+    )
+    return {"rebuilt_count": count, "period_type": period_type}
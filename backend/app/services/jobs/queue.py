@@ -0,0 +1,198 @@
+"""任务入队、领取与结束。"""
+
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.metrics import JOB_RETRIES
+from app.core.timezone import utc_now
+from app.models.job import Job
+from app.services.lease_claim import claim_rows
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+# SQLite 下多个 worker 可能选中同一行，条件 UPDATE 落空后换下一行重试的次数
+_CLAIM_RETRIES = 5
+
+
+class JobError(Exception):
+    """任务失败，附带返回给调用方的 HTTP 状态码。
+
+    retryable=False（默认）表示确定性失败（参数错误、配置缺失等），不再重试；
+    外部接口的临时故障应设为 True，按退避策略重新入队。
+    """
+
+    def __init__(self, detail: str, status_code: int = 500, *, retryable: bool = False):
+        super().__init__(detail)
+        self.detail = detail
+        self.status_code = status_code
+        self.retryable = retryable
+
+
+@dataclass(frozen=True)
+class JobHandler:
+    func: Callable[[Session, dict], Any]
+    max_attempts: int | None = None
+
+
+HANDLERS: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str, *, max_attempts: int | None = None) -> Callable:
+    """注册任务处理函数：``func(db, payload) -> dict | None``，可为 async 函数。
+
+    max_attempts 为空时使用 JOB_MAX_ATTEMPTS；有外部副作用、重试可能重复执行的任务应设为 1。
+    """
+
+    def decorator(func: Callable) -> Callable:
+        HANDLERS[kind] = JobHandler(func, max_attempts)
+        return func
+
+    return decorator
+
+
+def enqueue(
+    db: Session,
+    kind: str,
+    payload: dict | None = None,
+    *,
+    user_id: int | None = None,
+    community_id: int | None = None,
+    dedupe_key: str | None = None,
+) -> Job:
+    """写入一条 queued 任务并提交。
+
+    指定 dedupe_key 时，若已有同类未结束任务则直接返回该任务，不重复入队。
+    """
+    if kind not in HANDLERS:
+        raise ValueError(f"未注册的任务类型: {kind}")
+    if dedupe_key is not None:
+        existing = (
+            db.query(Job)
+            .filter(Job.kind == kind, Job.dedupe_key == dedupe_key, Job.status.in_(ACTIVE_STATUSES))
+            .order_by(Job.id)
+            .first()
+        )
+        if existing is not None:
+            return existing
+
+    job = Job(
+        kind=kind,
+        payload=payload or {},
+        dedupe_key=dedupe_key,
+        max_attempts=HANDLERS[kind].max_attempts or settings.JOB_MAX_ATTEMPTS,
+        community_id=community_id,
+        created_by_user_id=user_id,
+        run_after=utc_now(),
+    )
+    db.add(job)
+    db.commit()
+    db.refresh(job)
+    return job
+
+
+def _claimable(now):
+    # 排队中且已到重试时间；或执行中但租约已过期（worker 崩溃 / 被杀）
+    return or_(
+        and_(Job.status == "queued", Job.run_after <= now),
+        and_(Job.status == "running", Job.locked_until < now),
+    )
+
+
+def claim_next(db: Session, worker_id: str, lease_seconds: int) -> Job | None:
+    """领取一条可执行任务，返回已标记为 running 的任务；队列为空时返回 None。
+
+    并发领取见 :func:`app.services.lease_claim.claim_rows`；SQLite 下被其他 worker 抢先时换下一行重试。
+    """
+    for _ in range(_CLAIM_RETRIES):
+        now = utc_now()
+        claimed = claim_rows(
+            db,
+            Job,
+            _claimable(now),
+            order_by=(Job.run_after, Job.id),
+            values={
+                "status": "running",
+                "attempts": Job.attempts + 1,
+                "locked_until": now + timedelta(seconds=lease_seconds),
+                "started_at": now,
+            },
+            worker_id=worker_id,
+            limit=1,
+        )
+        if claimed is None:
+            return None
+        if not claimed:
+            continue
+
+        (job,) = claimed
+        if job.attempts > job.max_attempts:
+            # 租约过期被回收，但尝试次数已用尽
+            finish_job(db, job.id, worker_id, error="任务执行超时（worker 失联）", error_status=500)
+            continue
+        return job
+    return None
+
+
+def extend_lease(db: Session, job_id: int, worker_id: str, lease_seconds: int) -> bool:
+    """续期租约；返回 False 表示任务已被其他 worker 接管。"""
+    renewed = db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.status == "running", Job.locked_by == worker_id)
+        .values(locked_until=utc_now() + timedelta(seconds=lease_seconds))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return bool(renewed)
+
+
+def finish_job(
+    db: Session,
+    job_id: int,
+    worker_id: str,
+    *,
+    result: Any = None,
+    error: str | None = None,
+    error_status: int | None = None,
+    retry: bool = False,
+) -> str:
+    """记录执行结果，返回任务的新状态（succeeded / failed / queued）。
+
+    retry=True 且仍有剩余次数时按指数退避重新入队。仅当前租约持有者可以写入，
+    租约已被他人接管时不覆盖（返回 "running"）。
+    """
+    job = db.get(Job, job_id, populate_existing=True)
+    if job is None or job.status != "running" or job.locked_by != worker_id:
+        db.commit()
+        return job.status if job is not None else "failed"
+
+    now = utc_now()
+    if error is None:
+        values = {"status": "succeeded", "result": result, "error": None, "error_status": None}
+    elif retry and job.attempts < job.max_attempts:
+        backoff = settings.JOB_RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+        values = {"status": "queued", "error": error, "error_status": error_status,
+                  "run_after": now + timedelta(seconds=backoff)}
+        JOB_RETRIES.labels(kind=job.kind).inc()
+        logger.warning("任务 %s(%s) 第 %d 次执行失败，%ds 后重试: %s", job.id, job.kind, job.attempts, backoff, error)
+    else:
+        values = {"status": "failed", "error": error, "error_status": error_status}
+
+    if values["status"] != "queued":
+        values["finished_at"] = now
+    db.execute(
+        update(Job)
+        .where(Job.id == job_id, Job.locked_by == worker_id)
+        .values(locked_by=None, locked_until=None, **values)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return values["status"]
@@ -0,0 +1,142 @@
+"""任务 worker：循环领取并执行任务，执行期间定期续租。"""
+
+import asyncio
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.metrics import JOB_DURATION
+from app.services.jobs.queue import HANDLERS, JobError, claim_next, extend_lease, finish_job
+from app.services.scheduler_lease import HOLDER_ID
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """从 jobs 表领取任务执行。
+
+    session_factory 每次调用返回一个可作为上下文管理器的 Session（如 SessionLocal）。
+    同一实例可通过 start(threads=n) 启动多个线程，各线程使用独立的 worker 标识。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        worker_id: str = HOLDER_ID,
+        lease_seconds: int | None = None,
+        poll_interval: float | None = None,
+    ):
+        self.session_factory = session_factory
+        self.worker_id = worker_id
+        self.lease_seconds = lease_seconds or settings.JOB_LEASE_SECONDS
+        self.poll_interval = poll_interval if poll_interval is not None else settings.JOB_POLL_INTERVAL_SECONDS
+        self._stop = threading.Event()
+        self._threads: list[threading.Thread] = []
+
+    # ── 执行 ──
+
+    def run_once(self, worker_id: str | None = None) -> bool:
+        """领取并执行一条任务；队列为空时返回 False。"""
+        worker_id = worker_id or self.worker_id
+        with self.session_factory() as db:
+            job = claim_next(db, worker_id, self.lease_seconds)
+            if job is None:
+                return False
+            job_id, kind, payload = job.id, job.kind, dict(job.payload or {})
+
+        handler = HANDLERS.get(kind)
+        if handler is None:
+            self._finish(job_id, worker_id, kind, 0.0, error=f"未注册的任务类型: {kind}", error_status=500)
+            return True
+
+        start = time.perf_counter()
+        with self._keep_lease(job_id, worker_id):
+            try:
+                with self.session_factory() as db:
+                    result = handler.func(db, payload)
+                    if inspect.isawaitable(result):
+                        result = asyncio.run(result)
+            except JobError as exc:
+                self._finish(job_id, worker_id, kind, start, error=exc.detail,
+                             error_status=exc.status_code, retry=exc.retryable)
+            except Exception as exc:
+                logger.exception("任务 %s(%s) 执行异常", job_id, kind)
+                self._finish(job_id, worker_id, kind, start, error=f"{type(exc).__name__}: {exc}",
+                             error_status=500, retry=True)
+            else:
+                self._finish(job_id, worker_id, kind, start, result=result)
+        return True
+
+    def run_pending(self, limit: int | None = None) -> int:
+        """执行当前所有可领取的任务（--once 模式与测试使用），返回执行条数。"""
+        count = 0
+        while (limit is None or count < limit) and self.run_once():
+            count += 1
+        return count
+
+    def _finish(self, job_id: int, worker_id: str, kind: str, start: float, **outcome) -> None:
+        elapsed = time.perf_counter() - start if start else 0.0
+        with self.session_factory() as db:
+            status = finish_job(db, job_id, worker_id, **outcome)
+        JOB_DURATION.labels(kind=kind, status=status).observe(elapsed)
+        logger.info("任务 %s(%s) 执行结束: status=%s duration=%dms", job_id, kind, status, int(elapsed * 1000))
+
+    @contextmanager
+    def _keep_lease(self, job_id: int, worker_id: str) -> Iterator[None]:
+        """后台线程每 1/3 租约时长续期一次，长任务（如大仓库同步）不会被误判为失联。"""
+        done = threading.Event()
+
+        def renew() -> None:
+            while not done.wait(self.lease_seconds / 3):
+                try:
+                    with self.session_factory() as db:
+                        if not extend_lease(db, job_id, worker_id, self.lease_seconds):
+                            logger.warning("任务 %s 的租约已被其他 worker 接管", job_id)
+                            return
+                except Exception as exc:
+                    logger.warning("任务 %s 续租失败: %s", job_id, exc)
+
+        keeper = threading.Thread(target=renew, name=f"job-lease-{job_id}", daemon=True)
+        keeper.start()
+        try:
+            yield
+        finally:
+            done.set()
+
+    # ── 循环 ──
+
+    def run_forever(self, worker_id: str | None = None) -> None:
+        """持续领取任务直到 stop()；队列为空或数据库异常时等待 poll_interval。"""
+        while not self._stop.is_set():
+            try:
+                busy = self.run_once(worker_id)
+            except Exception as exc:
+                logger.error("领取任务失败: %s", exc)
+                busy = False
+            if not busy:
+                self._stop.wait(self.poll_interval)
+
+    def start(self, threads: int = 1) -> None:
+        self._stop.clear()
+        for n in range(threads):
+            thread = threading.Thread(
+                target=self.run_forever,
+                args=(f"{self.worker_id}/{n}",),
+                name=f"job-worker-{n}",
+                daemon=True,
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float | None = None) -> None:
+        """通知线程退出并等待当前任务结束（超时后放弃等待，未完成的任务在租约到期后由其他 worker 接管）。"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
@@ -0,0 +1,66 @@
+"""带租约的批量领取。
+
+后台任务、通知发件箱、会议提醒、定时发布都由多个进程并发扫描同一张表，
+每行只能被一个进程处理。这里统一实现领取：
+
+- PostgreSQL：``SELECT ... FOR UPDATE SKIP LOCKED`` 选出候选行，并发进程互不阻塞地各取各的；
+- 其他数据库（SQLite）没有行锁：用与 SELECT 相同条件的 UPDATE 判断是否抢到，
+  被其他进程抢先的行条件不再成立，不会被重复更新；
+- 用 ``UPDATE ... RETURNING`` 取得本次实际抢到的行并重新读取（``populate_existing`` 覆盖 Session 中的旧值）；
+  不支持 RETURNING 的数据库退化为按 ``locked_by`` 过滤，此时每个并发领取方需使用不同的 worker_id。
+
+可领取条件通常是「待处理且已到期」或「处理中但租约已过期」（进程崩溃后可被重新领取）。
+"""
+
+from collections.abc import Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import ColumnElement, select, update
+from sqlalchemy.orm import Session
+
+T = TypeVar("T")
+
+
+def claim_rows(
+    db: Session,
+    model: type[T],
+    claimable: ColumnElement[bool],
+    *,
+    order_by: Sequence[Any],
+    values: dict[str, Any],
+    worker_id: str,
+    limit: int,
+    locked_by: Any = None,
+    result_order: Sequence[Any] | None = None,
+) -> list[T] | None:
+    """领取至多 limit 行，写入 values 并把 locked_by 列设为 worker_id，提交后返回本进程抢到的行。
+
+    没有可领取的行时返回 None；有候选行但全部被其他进程抢先时返回空列表（调用方可决定是否重试）。
+    locked_by 默认为 ``model.locked_by``；返回顺序默认与 order_by 相同。
+    """
+    locked_by = locked_by if locked_by is not None else model.locked_by
+    stmt = select(model.id).where(claimable).order_by(*order_by).limit(limit)
+    if db.get_bind().dialect.name == "postgresql":
+        stmt = stmt.with_for_update(skip_locked=True)
+    ids = list(db.scalars(stmt))
+    if not ids:
+        db.commit()
+        return None
+
+    stmt = (
+        update(model)
+        .where(model.id.in_(ids), claimable)
+        .values({locked_by.key: worker_id, **values})
+        .execution_options(synchronize_session=False)
+    )
+    if db.get_bind().dialect.update_returning:
+        # 同一 worker_id 可能被多个线程共用，以 UPDATE 实际命中的行为准
+        ids = list(db.scalars(stmt.returning(model.id)))
+        claimed = model.id.in_(ids)
+    else:
+        db.execute(stmt)
+        claimed = model.id.in_(ids) & (locked_by == worker_id)
+    db.commit()
+    if not ids:
+        return []
+    return db.query(model).populate_existing().filter(claimed).order_by(*(result_order or order_by)).all()
@@ -0,0 +1,115 @@
+"""到期会议提醒分发器。
+
+create_reminder 写入的非立即提醒在 scheduled_at 到期后由这里发送：
+
+- 每个进程的 APScheduler 每 MEETING_REMINDER_DISPATCH_SECONDS 扫描一次，
+  经 (status, scheduled_at) 索引按批领取到期的 pending 提醒；
+- 领取是原子的（见 app/services/lease_claim.py），多进程不会重复发送；
+  领取后状态为 sending 并持有租约，进程崩溃后租约到期可被重新领取；
+- 同一批中按会议分组，参与人列表与 ICS 只构建一次；同一会议同时到期的多条提醒
+  （如停机后 one_day 与 two_hours 一起到期）合并为一封邮件，结果记到每条提醒上。
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.metrics import (
+    MEETING_REMINDER_BATCH_DURATION,
+    MEETING_REMINDER_LAG,
+    MEETING_REMINDERS_DISPATCHED,
+)
+from app.core.timezone import utc_now
+from app.database import SessionLocal
+from app.models.meeting import MeetingReminder
+from app.services.lease_claim import claim_rows
+from app.services.notification import prepare_meeting_reminder, send_meeting_reminder
+from app.services.scheduler_lease import HOLDER_ID
+
+logger = logging.getLogger(__name__)
+
+
+def _claimable(now):
+    # scheduled_at 为 naive UTC；租约列带时区
+    return or_(
+        and_(MeetingReminder.status == "pending", MeetingReminder.scheduled_at <= now.replace(tzinfo=None)),
+        and_(MeetingReminder.status == "sending", MeetingReminder.locked_until < now),
+    )
+
+
+def claim_due_reminders(db: Session, worker_id: str, limit: int) -> list[MeetingReminder]:
+    """领取一批到期提醒并标记为 sending，返回本进程实际抢到的提醒。"""
+    now = utc_now()
+    claimed = claim_rows(
+        db,
+        MeetingReminder,
+        _claimable(now),
+        order_by=(MeetingReminder.scheduled_at, MeetingReminder.id),
+        values={
+            "status": "sending",
+            "locked_until": now + timedelta(seconds=settings.MEETING_REMINDER_LEASE_SECONDS),
+        },
+        worker_id=worker_id,
+        limit=limit,
+        result_order=(MeetingReminder.meeting_id, MeetingReminder.scheduled_at.desc(), MeetingReminder.id),
+    )
+    return claimed or []
+
+
+def dispatch_due_reminders(db: Session, worker_id: str = HOLDER_ID, limit: int | None = None) -> int:
+    """领取并发送一批到期提醒，返回处理条数（0 表示没有到期提醒）。"""
+    reminders = claim_due_reminders(db, worker_id, limit or settings.MEETING_REMINDER_BATCH_SIZE)
+    if not reminders:
+        return 0
+
+    start = time.perf_counter()
+    by_meeting: dict[int, list[MeetingReminder]] = {}
+    for reminder in reminders:
+        by_meeting.setdefault(reminder.meeting_id, []).append(reminder)
+
+    for meeting_id, group in by_meeting.items():
+        try:
+            _send_group(db, meeting_id, group)
+        except Exception as exc:
+            # 未写回结果的提醒保持 sending，租约到期后重新领取
+            logger.exception("会议 %s 的提醒发送异常: %s", meeting_id, exc)
+
+    MEETING_REMINDER_BATCH_DURATION.observe(time.perf_counter() - start)
+    logger.info("会议提醒分发: %d 条，涉及 %d 场会议", len(reminders), len(by_meeting))
+    return len(reminders)
+
+
+def _send_group(db: Session, meeting_id: int, group: list[MeetingReminder]) -> None:
+    """同一会议的提醒：构建一次邮件，由计划时间最晚的一条实际发送，其余记为同样结果。"""
+    prepared = prepare_meeting_reminder(db, meeting_id)
+    if prepared.meeting is not None and prepared.meeting.scheduled_at <= utc_now().replace(tzinfo=None):
+        prepared.error = "Meeting already started"
+
+    primary = send_meeting_reminder(db, group[0].id, prepared)
+    for reminder in group[1:]:
+        reminder.status = primary.status
+        reminder.sent_at = primary.sent_at
+        reminder.error_message = primary.error_message
+        reminder.locked_by = None
+        reminder.locked_until = None
+    db.commit()
+
+    MEETING_REMINDERS_DISPATCHED.labels(status=primary.status).inc(len(group))
+    if primary.status == "sent":
+        now = utc_now().replace(tzinfo=None)
+        for reminder in group:
+            MEETING_REMINDER_LAG.observe(max((now - reminder.scheduled_at).total_seconds(), 0.0))
+
+
+def run_reminder_dispatch(session_factory: Callable[[], Session] = SessionLocal) -> int:
+    """定时任务入口：处理完当前所有到期提醒，返回处理条数。"""
+    total = 0
+    with session_factory() as db:
+        while count := dispatch_due_reminders(db):
+            total += count
+    return total
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import smtplib
+from dataclasses import dataclass, field
 from html import escape
 
 from sqlalchemy.orm import Session
@@ -13,32 +14,30 @@ from app.models.notification import NotificationType
 from app.models.user import User
 from app.services.email import EmailAttachment, EmailMessage, get_sender_info, get_smtp_config, send_email
 from app.services.ics import build_meeting_ics
-from app.services.notify import create_notification
+from app.services.notify import create_notifications
 
 logger = get_logger(__name__)
 
 
-def send_meeting_reminder(db: Session, reminder_id: int) -> MeetingReminder:
-    reminder = db.query(MeetingReminder).filter(MeetingReminder.id == reminder_id).first()
-    if not reminder:
-        raise ValueError("Reminder not found")
+@dataclass
+class PreparedReminder:
+    """一场会议的提醒邮件。参与人列表与 ICS 只构建一次，同一会议的多条提醒共用。"""
+
+    meeting: Meeting | None = None
+    community: Community | None = None
+    recipient_emails: list[str] = field(default_factory=list)
+    message: EmailMessage | None = None
+    error: str | None = None  # 无法发送的原因，记入提醒的 error_message
 
-    if reminder.status == "sent":
-        return reminder
 
-    meeting = db.query(Meeting).filter(Meeting.id == reminder.meeting_id).first()
+def prepare_meeting_reminder(db: Session, meeting_id: int) -> PreparedReminder:
+    meeting = db.query(Meeting).filter(Meeting.id == meeting_id).first()
     if not meeting:
-        reminder.status = "failed"
-        reminder.error_message = "Meeting not found"
-        db.commit()
-        return reminder
+        return PreparedReminder(error="Meeting not found")
 
     community = db.query(Community).filter(Community.id == meeting.community_id).first()
     if not community:
-        reminder.status = "failed"
-        reminder.error_message = "Community not found"
-        db.commit()
-        return reminder
+        return PreparedReminder(meeting=meeting, error="Community not found")
 
     participants = db.query(MeetingParticipant).filter(
         MeetingParticipant.meeting_id == meeting.id
@@ -46,17 +45,11 @@ def send_meeting_reminder(db: Session, reminder_id: int) -> MeetingReminder:
     recipient_emails = [p.email for p in participants if p.email]
 
     if not recipient_emails:
-        reminder.status = "failed"
-        reminder.error_message = "No recipients"
-        db.commit()
-        return reminder
+        return PreparedReminder(meeting=meeting, community=community, error="No recipients")
 
     smtp_config, email_cfg = get_smtp_config(community)
     if not smtp_config:
-        reminder.status = "failed"
-        reminder.error_message = "SMTP not configured"
-        db.commit()
-        return reminder
+        return PreparedReminder(meeting=meeting, community=community, error="SMTP not configured")
 
     from_email, from_name, reply_to = get_sender_info(community, email_cfg)
 
@@ -81,9 +74,32 @@ def send_meeting_reminder(db: Session, reminder_id: int) -> MeetingReminder:
             )
         ],
     )
+    return PreparedReminder(meeting, community, recipient_emails, message)
+
+
+def send_meeting_reminder(
+    db: Session, reminder_id: int, prepared: PreparedReminder | None = None
+) -> MeetingReminder:
+    """发送一条会议提醒。prepared 为空时现场构建邮件（批量分发时由调用方按会议预先构建）。"""
+    reminder = db.query(MeetingReminder).filter(MeetingReminder.id == reminder_id).first()
+    if not reminder:
+        raise ValueError("Reminder not found")
+
+    if reminder.status == "sent":
+        return reminder
+
+    if prepared is None:
+        prepared = prepare_meeting_reminder(db, reminder.meeting_id)
+    reminder.locked_by = None
+    reminder.locked_until = None
+    if prepared.error:
+        reminder.status = "failed"
+        reminder.error_message = prepared.error
+        db.commit()
+        return reminder
 
     try:
-        send_email(community, message)
+        send_email(prepared.community, prepared.message)
         reminder.status = "sent"
         reminder.sent_at = utc_now()
         reminder.error_message = None
@@ -96,31 +112,34 @@ def send_meeting_reminder(db: Session, reminder_id: int) -> MeetingReminder:
 
     db.commit()
 
-    # 站内通知：无论邮件是否成功，均为有账号的与会者创建站内提醒
-    _create_in_app_reminders(db, meeting, recipient_emails)
+    # 站内通知：无论邮件是否成功，均为有账号的与会者创建站内提醒；
+    # 提醒邮件已送达时不再经发件箱重复发送通知邮件
+    _create_in_app_reminders(db, prepared.meeting, prepared.recipient_emails, email=reminder.status != "sent")
 
     return reminder
 
 
-def _create_in_app_reminders(db: Session, meeting: Meeting, recipient_emails: list[str]) -> None:
-    """根据与会者邮件列表查找系统用户，并创建站内会议提醒通知。"""
+def _create_in_app_reminders(
+    db: Session, meeting: Meeting, recipient_emails: list[str], *, email: bool = True
+) -> None:
+    """根据与会者邮件列表查找系统用户，批量创建站内会议提醒通知（一次提交）。"""
     if not recipient_emails:
         return
     time_str = meeting.scheduled_at.strftime("%m-%d %H:%M")
-    users = db.query(User).filter(User.email.in_(recipient_emails)).all()
-    for user in users:
-        try:
-            create_notification(
-                db,
-                user_id=user.id,
-                ntype=NotificationType.MEETING_REMINDER,
-                title=f"会议即将开始：{meeting.title}",
-                body=f"开始时间：{time_str}，时长 {meeting.duration} 分钟",
-                resource_type="meeting",
-                resource_id=meeting.id,
-            )
-        except Exception as exc:  # noqa: BLE001
-            logger.warning("创建会议站内提醒失败", extra={"user_id": user.id, "error": str(exc)})
+    try:
+        user_ids = [uid for (uid,) in db.query(User.id).filter(User.email.in_(recipient_emails)).all()]
+        create_notifications(
+            db,
+            user_ids,
+            NotificationType.MEETING_REMINDER,
+            title=f"会议即将开始：{meeting.title}",
+            body=f"开始时间：{time_str}，时长 {meeting.duration} 分钟",
+            resource_type="meeting",
+            resource_id=meeting.id,
+            email=email,
+        )
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("创建会议站内提醒失败", extra={"meeting_id": meeting.id, "error": str(exc)})
 
 
 def _build_text_body(meeting: Meeting, community: Community) -> str:
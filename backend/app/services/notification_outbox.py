@@ -0,0 +1,191 @@
+"""通知邮件发件箱分发器。
+
+create_notification / create_notifications 只在事务中写入 notification_outbox，
+这里的分发器在后台批量投递：
+
+- 领取见 app/services/lease_claim.py，多个进程并发领取互不重复；
+- 每批最多 NOTIFY_OUTBOX_BATCH_SIZE 封，复用同一个 SMTP 连接逐封发送（每封只有一个收件人）；
+- 失败按指数退避重新排队，超过 NOTIFY_OUTBOX_MAX_ATTEMPTS 后标记为 failed，错误写入 last_error；
+- 分发器进程崩溃时，sending 状态的行在租约到期后被重新领取。
+
+与后台任务 worker 一起运行：嵌入模式（JOB_WORKER_EMBEDDED）随 FastAPI 进程启动，
+独立模式由 ``python run_worker.py`` 启动。
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.metrics import NOTIFY_OUTBOX_BATCH_DURATION, NOTIFY_OUTBOX_DELIVERIES
+from app.core.timezone import utc_now
+from app.models.notification import NotificationOutbox
+from app.services.email import EmailMessage, SmtpEmailProvider, get_global_smtp_config
+from app.services.lease_claim import claim_rows
+from app.services.scheduler_lease import HOLDER_ID
+
+logger = logging.getLogger(__name__)
+
+# 一批邮件的发送租约；逐封 SMTP 超时为 30 秒，正常情况下远小于此值
+_LEASE_SECONDS = 600
+
+
+def _claimable(now):
+    return or_(
+        and_(NotificationOutbox.status == "pending", NotificationOutbox.next_attempt_at <= now),
+        and_(NotificationOutbox.status == "sending", NotificationOutbox.locked_until < now),
+    )
+
+
+def claim_batch(db: Session, worker_id: str, limit: int) -> list[NotificationOutbox]:
+    """领取一批到期的待发送邮件并标记为 sending，返回本 worker 实际抢到的行。"""
+    now = utc_now()
+    claimed = claim_rows(
+        db,
+        NotificationOutbox,
+        _claimable(now),
+        order_by=(NotificationOutbox.next_attempt_at, NotificationOutbox.id),
+        values={
+            "status": "sending",
+            "attempts": NotificationOutbox.attempts + 1,
+            "locked_until": now + timedelta(seconds=_LEASE_SECONDS),
+        },
+        worker_id=worker_id,
+        limit=limit,
+        result_order=(NotificationOutbox.id,),
+    )
+    return claimed or []
+
+
+def dispatch_batch(db: Session, worker_id: str = HOLDER_ID, limit: int | None = None) -> int:
+    """领取并投递一批邮件，返回本批处理的条数（0 表示发件箱中没有到期邮件）。"""
+    rows = claim_batch(db, worker_id, limit or settings.NOTIFY_OUTBOX_BATCH_SIZE)
+    if not rows:
+        return 0
+
+    max_attempts = settings.NOTIFY_OUTBOX_MAX_ATTEMPTS
+    expired = [row for row in rows if row.attempts > max_attempts]
+    for row in expired:
+        # 租约过期被回收，但投递次数已用尽
+        _record_failure(db, row, worker_id, "投递超时（分发器失联）", retry=False)
+    rows = [row for row in rows if row.attempts <= max_attempts]
+
+    start = time.perf_counter()
+    errors = _send(rows)
+    NOTIFY_OUTBOX_BATCH_DURATION.observe(time.perf_counter() - start)
+
+    sent_ids = [row.id for row, error in zip(rows, errors, strict=True) if error is None]
+    if sent_ids:
+        db.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id.in_(sent_ids), NotificationOutbox.locked_by == worker_id)
+            .values(status="sent", sent_at=utc_now(), last_error=None, locked_by=None, locked_until=None)
+            .execution_options(synchronize_session=False)
+        )
+        NOTIFY_OUTBOX_DELIVERIES.labels(status="sent").inc(len(sent_ids))
+    for row, error in zip(rows, errors, strict=True):
+        if error is not None:
+            _record_failure(db, row, worker_id, f"{type(error).__name__}: {error}", retry=row.attempts < max_attempts)
+    db.commit()
+
+    logger.info("通知邮件批量投递: 成功 %d / 共 %d", len(sent_ids), len(rows) + len(expired))
+    return len(rows) + len(expired)
+
+
+def _send(rows: list[NotificationOutbox]) -> list[Exception | None]:
+    """通过一个 SMTP 连接发送整批邮件；连接或登录失败时整批记为同一异常。"""
+    if not rows:
+        return []
+    messages = [
+        EmailMessage(
+            subject=row.subject,
+            to_emails=[row.to_email],
+            html_body=row.html_body,
+            text_body=row.text_body,
+            from_email=settings.SMTP_FROM_EMAIL,
+        )
+        for row in rows
+    ]
+    try:
+        smtp_config = get_global_smtp_config()
+        if smtp_config is None or not settings.SMTP_FROM_EMAIL:
+            raise ValueError("SMTP 未配置")
+        return SmtpEmailProvider(smtp_config).send_many(messages)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("通知邮件批次发送失败（%d 封）: %s", len(rows), exc)
+        return [exc] * len(rows)
+
+
+def _record_failure(db: Session, row: NotificationOutbox, worker_id: str, error: str, *, retry: bool) -> None:
+    values: dict = {"last_error": error, "locked_by": None, "locked_until": None}
+    if retry:
+        backoff = settings.NOTIFY_OUTBOX_RETRY_BACKOFF_SECONDS * 2 ** (row.attempts - 1)
+        values.update(status="pending", next_attempt_at=utc_now() + timedelta(seconds=backoff))
+        NOTIFY_OUTBOX_DELIVERIES.labels(status="retry").inc()
+    else:
+        values["status"] = "failed"
+        NOTIFY_OUTBOX_DELIVERIES.labels(status="failed").inc()
+        logger.warning("通知邮件 %s 投递失败（已尝试 %d 次）: %s", row.id, row.attempts, error)
+    db.execute(
+        update(NotificationOutbox)
+        .where(NotificationOutbox.id == row.id, NotificationOutbox.locked_by == worker_id)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+
+
+class OutboxDispatcher:
+    """后台线程循环投递发件箱中的邮件。
+
+    session_factory 每次调用返回一个可作为上下文管理器的 Session（如 SessionLocal）。
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        worker_id: str = HOLDER_ID,
+        poll_interval: float | None = None,
+    ):
+        self.session_factory = session_factory
+        self.worker_id = worker_id
+        self.poll_interval = poll_interval if poll_interval is not None else settings.NOTIFY_OUTBOX_POLL_SECONDS
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def run_once(self) -> int:
+        with self.session_factory() as db:
+            return dispatch_batch(db, self.worker_id)
+
+    def run_pending(self) -> int:
+        """投递当前所有到期邮件（--once 模式与测试使用），返回处理条数。"""
+        total = 0
+        while count := self.run_once():
+            total += count
+        return total
+
+    def run_forever(self) -> None:
+        """持续投递直到 stop()；发件箱为空或数据库异常时等待 poll_interval。"""
+        while not self._stop.is_set():
+            try:
+                busy = self.run_once() > 0
+            except Exception as exc:
+                logger.error("通知邮件分发失败: %s", exc)
+                busy = False
+            if not busy:
+                self._stop.wait(self.poll_interval)
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run_forever, name="notify-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
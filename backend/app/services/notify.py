@@ -1,7 +1,7 @@
-"""通用通知工具 — 写入站内通知并（可选）发送邮件。
+"""通用通知工具 — 写入站内通知，并（可选）把邮件写入发件箱。
 
 使用方式：
-    from app.services.notify import create_notification
+    from app.services.notify import create_notification, create_notifications
     from app.models.notification import NotificationType
 
     create_notification(
@@ -13,18 +13,24 @@
         resource_type="event_task",
         resource_id=7,
     )
+
+    # 多个接收者：一次查询用户邮箱、一次提交
+    create_notifications(db, user_ids=[1, 2, 3], ntype=..., title=...)
+
+邮件不在请求中发送：全局 SMTP 已配置时，每条通知对应一行 notification_outbox，
+与通知在同一事务中提交，由 app.services.notification_outbox 的分发器批量投递。
 """
 from __future__ import annotations
 
+from collections.abc import Iterable
+from html import escape
+
 from sqlalchemy.orm import Session
 
 from app.config import settings
-from app.core.logging import get_logger
-from app.models.notification import Notification, NotificationType
+from app.models.notification import Notification, NotificationOutbox, NotificationType
 from app.models.user import User
 
-logger = get_logger(__name__)
-
 
 def create_notification(
     db: Session,
@@ -35,68 +41,77 @@ def create_notification(
     resource_type: str | None = None,
     resource_id: int | None = None,
 ) -> Notification:
-    """创建站内通知并持久化到数据库。
-
-    若全局 SMTP 已配置，同时异步尝试发送邮件；失败时仅记日志，不抛出异常。
-    """
-    notif = Notification(
-        user_id=user_id,
-        type=ntype.value,
-        title=title,
-        body=body,
-        resource_type=resource_type,
-        resource_id=resource_id,
+    """创建一条站内通知并提交；若全局 SMTP 已配置，同一事务内写入待发送邮件。"""
+    notifs = create_notifications(
+        db, [user_id], ntype, title, body, resource_type=resource_type, resource_id=resource_id
     )
-    db.add(notif)
-    db.commit()
-    db.refresh(notif)
+    return notifs[0]
+
 
-    # 可选：发送邮件通知
-    _try_send_email(db, notif)
+def create_notifications(
+    db: Session,
+    user_ids: Iterable[int],
+    ntype: NotificationType,
+    title: str,
+    body: str | None = None,
+    resource_type: str | None = None,
+    resource_id: int | None = None,
+    *,
+    email: bool = True,
+) -> list[Notification]:
+    """为多个用户创建同一内容的站内通知，并在同一事务中写入发件箱，只提交一次。
 
-    return notif
+    email=False 时只创建站内通知（如接收者已通过其他渠道收到邮件）。
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    if not user_ids:
+        return []
+
+    notifs = [
+        Notification(
+            user_id=uid,
+            type=ntype.value,
+            title=title,
+            body=body,
+            resource_type=resource_type,
+            resource_id=resource_id,
+        )
+        for uid in user_ids
+    ]
+    db.add_all(notifs)
+
+    if email and outbox_enabled():
+        emails = dict(
+            db.query(User.id, User.email)
+            .filter(User.id.in_(user_ids), User.email.isnot(None), User.email != "")
+            .all()
+        )
+        text_body, html_body = _render_bodies(title, body)
+        db.add_all(
+            NotificationOutbox(
+                notification=notif,
+                to_email=emails[notif.user_id],
+                subject=title,
+                text_body=text_body,
+                html_body=html_body,
+            )
+            for notif in notifs
+            if notif.user_id in emails
+        )
 
+    db.commit()
+    return notifs
 
-def _try_send_email(db: Session, notif: Notification) -> None:
-    """尝试向通知接收者发送邮件。失败时仅记录日志。"""
-    if not settings.SMTP_HOST or not settings.SMTP_FROM_EMAIL:
-        return
 
-    try:
-        user = db.get(User, notif.user_id)
-        if not user or not user.email:
-            return
+def outbox_enabled() -> bool:
+    """全局 SMTP 已配置时才写入发件箱。"""
+    return bool(settings.SMTP_HOST and settings.SMTP_FROM_EMAIL)
 
-        from app.services.email import EmailMessage, SmtpConfig, SmtpEmailProvider
 
-        smtp_cfg = SmtpConfig(
-            host=settings.SMTP_HOST,
-            port=settings.SMTP_PORT,
-            username=settings.SMTP_USER,
-            password=settings.SMTP_PASSWORD,
-            use_tls=settings.SMTP_USE_TLS,
-        )
-        provider = SmtpEmailProvider(smtp_cfg)
-
-        text_body = notif.title
-        if notif.body:
-            text_body += f"\n\n{notif.body}"
-
-        html_body = f"<p><strong>{notif.title}</strong></p>"
-        if notif.body:
-            html_body += f"<p>{notif.body}</p>"
-
-        message = EmailMessage(
-            subject=notif.title,
-            to_emails=[user.email],
-            html_body=html_body,
-            text_body=text_body,
-            from_email=settings.SMTP_FROM_EMAIL,
-        )
-        provider.send(message)
-        logger.info("通知邮件已发送", extra={"user_id": notif.user_id, "notif_id": notif.id})
-    except Exception as exc:  # noqa: BLE001
-        logger.warning(
-            "通知邮件发送失败（站内通知已创建）",
-            extra={"user_id": notif.user_id, "notif_id": notif.id, "error": str(exc)},
-        )
+def _render_bodies(title: str, body: str | None) -> tuple[str, str]:
+    text_body = title
+    html_body = f"<p><strong>{escape(title)}</strong></p>"
+    if body:
+        text_body += f"\n\n{body}"
+        html_body += f"<p>{escape(body)}</p>"
+    return text_body, html_body
@@ -0,0 +1,211 @@
+"""定时任务 Leader 租约与执行历史。
+
+生产环境 gunicorn 多 worker（乃至多节点）各自启动 APScheduler，若不加控制，
+每个定时任务会在每个进程里各执行一次。这里用数据库中的 scheduler_leases 表做
+Leader 选举：
+
+- 每个进程定期心跳（try_acquire_lease），租约未过期时只有持有者能续期；
+- Leader 进程退出或卡死后，租约在 TTL 到期后由其他进程接管（自动故障转移）；
+- 任务触发时再次校验租约，非 Leader 直接跳过；
+- Leader 执行的每次任务写入 scheduler_job_runs，便于排查。
+"""
+
+import logging
+import os
+import socket
+import time
+import uuid
+from collections.abc import Callable
+from datetime import timedelta
+from functools import wraps
+from typing import Any
+
+from sqlalchemy import case, delete, or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.metrics import SCHEDULER_JOB_DURATION, SCHEDULER_JOB_FAILURES
+from app.core.timezone import utc_now
+from app.models.scheduler import SchedulerJobRun, SchedulerLease
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEASE_NAME = "scheduler"
+
+# 当前进程的租约持有者标识（同一主机多 worker 通过 pid 区分，随机后缀防止 pid 复用）
+HOLDER_ID = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def try_acquire_lease(
+    db: Session,
+    holder_id: str,
+    ttl_seconds: int,
+    name: str = DEFAULT_LEASE_NAME,
+) -> bool:
+    """尝试获取或续期租约，返回当前进程是否为 Leader。
+
+    单条条件 UPDATE 保证原子性：只有租约持有者本人、或租约已过期时才能写入。
+    表中尚无该租约时插入新行，并发插入由主键冲突兜底。
+    """
+    now = utc_now()
+    expires_at = now + timedelta(seconds=ttl_seconds)
+
+    result = db.execute(
+        update(SchedulerLease)
+        .where(
+            SchedulerLease.name == name,
+            or_(SchedulerLease.holder_id == holder_id, SchedulerLease.expires_at < now),
+        )
+        .values(
+            acquired_at=case(
+                (SchedulerLease.holder_id == holder_id, SchedulerLease.acquired_at),
+                else_=now,
+            ),
+            holder_id=holder_id,
+            heartbeat_at=now,
+            expires_at=expires_at,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount:
+        db.commit()
+        return True
+
+    if db.get(SchedulerLease, name) is not None:
+        # 租约被其他进程持有且未过期（UPDATE 未命中，提交空事务即可释放锁）
+        db.commit()
+        return False
+
+    db.add(
+        SchedulerLease(
+            name=name,
+            holder_id=holder_id,
+            acquired_at=now,
+            heartbeat_at=now,
+            expires_at=expires_at,
+        )
+    )
+    try:
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        return False
+    return True
+
+
+def release_lease(db: Session, holder_id: str, name: str = DEFAULT_LEASE_NAME) -> bool:
+    """主动释放租约（进程正常退出时调用），让其他进程无需等待 TTL 即可接管。"""
+    result = db.execute(
+        delete(SchedulerLease).where(
+            SchedulerLease.name == name,
+            SchedulerLease.holder_id == holder_id,
+        )
+    )
+    db.commit()
+    return bool(result.rowcount)
+
+
+def record_job_run(
+    session_factory: Callable[[], Session],
+    job_id: str,
+    holder_id: str,
+    func: Callable[..., Any],
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    """执行任务并将开始/结束时间、耗时与结果写入 scheduler_job_runs。
+
+    任务异常会记录为 failed 后继续抛出，由 APScheduler 记录日志。
+    """
+    with session_factory() as db:
+        run = SchedulerJobRun(job_id=job_id, holder_id=holder_id, status="running", started_at=utc_now())
+        db.add(run)
+        db.commit()
+        run_id = run.id
+
+    start = time.perf_counter()
+    status, result, error = "success", None, None
+    try:
+        result = func(*args, **kwargs)
+        return result
+    except Exception as exc:
+        status, error = "failed", f"{type(exc).__name__}: {exc}"
+        raise
+    finally:
+        elapsed = time.perf_counter() - start
+        duration_ms = int(elapsed * 1000)
+        SCHEDULER_JOB_DURATION.labels(job_id=job_id).observe(elapsed)
+        if status == "failed":
+            SCHEDULER_JOB_FAILURES.labels(job_id=job_id).inc()
+        with session_factory() as db:
+            db.execute(
+                update(SchedulerJobRun)
+                .where(SchedulerJobRun.id == run_id)
+                .values(
+                    status=status,
+                    finished_at=utc_now(),
+                    duration_ms=duration_ms,
+                    result=result if isinstance(result, dict) else None,
+                    error=error,
+                )
+            )
+            db.commit()
+        logger.info("定时任务 %s 执行完成: status=%s duration=%dms", job_id, status, duration_ms)
+
+
+class SchedulerLeader:
+    """单进程内的租约状态：供心跳任务与 leader_only 包装的任务共用。"""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        ttl_seconds: int,
+        holder_id: str = HOLDER_ID,
+        name: str = DEFAULT_LEASE_NAME,
+    ):
+        self.session_factory = session_factory
+        self.ttl_seconds = ttl_seconds
+        self.holder_id = holder_id
+        self.name = name
+        self.is_leader = False
+
+    def heartbeat(self) -> bool:
+        """获取或续期租约；数据库异常时视为失去 Leader 身份。"""
+        try:
+            with self.session_factory() as db:
+                acquired = try_acquire_lease(db, self.holder_id, self.ttl_seconds, self.name)
+        except Exception as exc:
+            logger.warning("调度器租约心跳失败: %s", exc)
+            acquired = False
+
+        if acquired != self.is_leader:
+            logger.info(
+                "调度器 Leader 状态变更: %s → %s",
+                self.is_leader,
+                acquired,
+                extra={"holder_id": self.holder_id},
+            )
+        self.is_leader = acquired
+        return acquired
+
+    def release(self) -> None:
+        if not self.is_leader:
+            return
+        try:
+            with self.session_factory() as db:
+                release_lease(db, self.holder_id, self.name)
+        except Exception as exc:
+            logger.warning("释放调度器租约失败: %s", exc)
+        self.is_leader = False
+
+    def leader_only(self, job_id: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """包装定时任务：触发时续期租约，仅 Leader 执行并记录执行历史。"""
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not self.heartbeat():
+                logger.debug("非调度器 Leader，跳过任务 %s", job_id)
+                return None
+            return record_job_run(self.session_factory, job_id, self.holder_id, func, *args, **kwargs)
+
+        return wrapper
@@ -5,12 +5,18 @@ import uuid
 from abc import ABC, abstractmethod
 from pathlib import Path
 
+from app.core.compression import remove_precompressed, schedule_precompressed
+
 
 class StorageService(ABC):
     @abstractmethod
     def save(self, data: bytes, key: str) -> str:
         """Save file data under *key* and return the public URL path (e.g. /uploads/covers/abc.jpg)."""
 
+    @abstractmethod
+    def read(self, key: str) -> bytes:
+        """Return the raw bytes stored under *key*."""
+
     @abstractmethod
     def delete(self, key: str) -> None:
         """Delete the object identified by *key* (relative path, e.g. covers/abc.jpg)."""
@@ -32,12 +38,20 @@ class LocalStorage(StorageService):
         path = self.upload_dir / key
         path.parent.mkdir(parents=True, exist_ok=True)
         path.write_bytes(data)
+        # Text-like files also get .br / .gz siblings, served by PrecompressedStaticFiles.
+        # They are built on a background thread; the plain file is served until they exist.
+        remove_precompressed(path)
+        schedule_precompressed(path, data)
         return f"/uploads/{key}"
 
+    def read(self, key: str) -> bytes:
+        return (self.upload_dir / key).read_bytes()
+
     def delete(self, key: str) -> None:
         path = self.upload_dir / key
         if path.exists():
             path.unlink()
+        remove_precompressed(path)
 
 
 class S3Storage(StorageService):
@@ -73,6 +87,9 @@ class S3Storage(StorageService):
         # Return the same /uploads/<key> path — nginx proxies this to MinIO
         return f"/uploads/{key}"
 
+    def read(self, key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=key)["Body"].read()
+
     def delete(self, key: str) -> None:
         self.client.delete_object(Bucket=self.bucket, Key=key)
 
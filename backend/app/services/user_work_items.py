@@ -0,0 +1,256 @@
+"""个人负责事项投影（user_work_items）的维护与查询。
+
+内容、会议、活动任务、清单项、运营任务、设计任务的责任人分别存于关联表或 ``assignee_id`` 列，
+个人工作台与 /assigned/* 列表改为读取每个 (用户, 事项类型, 事项) 一行的投影，按截止时间走索引分页：
+
+- 同步维护：Session ``after_flush`` 收集本次 flush 中标题、状态、截止时间、所属活动或责任人有变化
+  （含新增 / 删除）的事项，按事项从基础表重算投影行，在同一事务内写入差异；
+  各路由经 ORM 的写入（含责任人关联行的增删）都会触发，无需在路由中逐一调用；
+- 定时校正（Leader 任务）：全量比对并修复绕过 Session 的写入（批量 SQL、数据库级联删除等）造成的偏差。
+
+工作状态映射与逾期口径见 app/services/work_status_stats.py。
+"""
+
+import logging
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from datetime import UTC, date, datetime, time
+from itertools import chain
+from typing import Any
+
+from sqlalchemy import Select, delete, event, inspect, null, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.timezone import utc_now
+from app.database import SessionLocal
+from app.models.campaign import CampaignTask, CampaignTaskAssignee
+from app.models.content import Content
+from app.models.design import DesignTask
+from app.models.event import ChecklistItem, ChecklistItemAssignee, EventTask, EventTaskAssignee
+from app.models.meeting import Meeting
+from app.models.user import User
+from app.models.user_work_item import WORK_ITEM_TYPES, UserWorkItem
+from app.services.work_status_stats import WORK_ITEM_KINDS
+
+logger = logging.getLogger(__name__)
+
+# 投影列（不含 user_id / item_type / item_id）
+_FIELDS = ("parent_id", "title", "status", "work_status", "due_at")
+
+# 事项类型 -> (投影的状态列, 所属活动列, 变化时需刷新投影的属性)
+_PROJECTED: dict[str, tuple[Any, Any, tuple[str, ...]]] = {
+    "content": (Content.status, None, ("title", "status", "work_status", "scheduled_publish_at", "assignees")),
+    "meeting": (Meeting.status, None, ("title", "status", "scheduled_at", "assignees")),
+    "event_task": (EventTask.status, EventTask.event_id, ("title", "status", "end_date", "event_id", "assignee_links")),
+    "checklist_item": (
+        ChecklistItem.status, ChecklistItem.event_id, ("title", "status", "due_date", "event_id", "assignee_links"),
+    ),
+    "campaign_task": (
+        CampaignTask.status, CampaignTask.campaign_id, ("title", "status", "deadline", "campaign_id", "assignee_links"),
+    ),
+    "design_task": (DesignTask.status, None, ("title", "status", "due_date", "assignee_id")),
+}
+_TYPE_OF_MODEL = {WORK_ITEM_KINDS[item_type].model: item_type for item_type in WORK_ITEM_TYPES}
+# 责任人关联行 -> 所属事项类型
+_TYPE_OF_LINK = {
+    EventTaskAssignee: "event_task",
+    ChecklistItemAssignee: "checklist_item",
+    CampaignTaskAssignee: "campaign_task",
+}
+
+
+def _due_at(value: date | datetime | None) -> datetime | None:
+    """统一为 naive UTC 时间；日期型截止日取当天 00:00。"""
+    if value is None:
+        return None
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time.min)
+    return value.astimezone(UTC).replace(tzinfo=None) if value.tzinfo else value
+
+
+# ── 基础表 ────────────────────────────────────────────────────────────
+
+
+def _source_query(item_type: str, item_ids: Iterable[int] | None = None) -> Select:
+    kind = WORK_ITEM_KINDS[item_type]
+    status, parent, _ = _PROJECTED[item_type]
+    stmt = select(
+        kind.user_id.label("user_id"),
+        kind.model.id.label("item_id"),
+        (parent if parent is not None else null()).label("parent_id"),
+        kind.model.title.label("title"),
+        status.label("status"),
+        kind.work_status().label("work_status"),
+        kind.deadline.label("due_at"),
+    ).select_from(kind.model)
+    stmt = stmt.join(*kind.link) if kind.link is not None else stmt.where(kind.user_id.is_not(None))
+    if item_ids is not None:
+        stmt = stmt.where(kind.model.id.in_(item_ids))
+    return stmt
+
+
+def _desired(conn: Connection | Session, item_type: str, item_ids: Iterable[int] | None = None) -> dict:
+    """基础表中的投影行：(user_id, item_id) -> 投影列。"""
+    rows = {}
+    for row in conn.execute(_source_query(item_type, item_ids)):
+        values = dict(row._mapping)
+        values["due_at"] = _due_at(values["due_at"])
+        rows[(values.pop("user_id"), values.pop("item_id"))] = values
+    return rows
+
+
+def _stored(conn: Connection | Session, item_type: str, item_ids: Iterable[int] | None = None) -> dict:
+    """投影表中的行：(user_id, item_id) -> (行 id, 投影列)。"""
+    stmt = select(
+        UserWorkItem.id, UserWorkItem.user_id, UserWorkItem.item_id, *(getattr(UserWorkItem, f) for f in _FIELDS)
+    ).where(UserWorkItem.item_type == item_type)
+    if item_ids is not None:
+        stmt = stmt.where(UserWorkItem.item_id.in_(item_ids))
+    return {
+        (row.user_id, row.item_id): (row.id, {field: row._mapping[field] for field in _FIELDS})
+        for row in conn.execute(stmt)
+    }
+
+
+def _write_diff(conn: Connection, item_type: str, desired: dict, stored: dict) -> int:
+    """写入差异，返回变更行数。插入与并发写入冲突时以后写入者为准。"""
+    stale = [row_id for key, (row_id, _) in stored.items() if key not in desired]
+    changed = [
+        {"user_id": user_id, "item_type": item_type, "item_id": item_id, **values}
+        for (user_id, item_id), values in desired.items()
+        if (user_id, item_id) not in stored or stored[(user_id, item_id)][1] != values
+    ]
+    if stale:
+        conn.execute(delete(UserWorkItem).where(UserWorkItem.id.in_(stale)))
+    if changed:
+        insert = postgresql.insert if conn.dialect.name == "postgresql" else sqlite.insert
+        stmt = insert(UserWorkItem).values([{**row, "updated_at": utc_now()} for row in changed])
+        conn.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["user_id", "item_type", "item_id"],
+                set_={field: stmt.excluded[field] for field in (*_FIELDS, "updated_at")},
+            )
+        )
+    return len(stale) + len(changed)
+
+
+def refresh_work_items(conn: Connection, item_type: str, item_ids: set[int]) -> int:
+    """按基础表重算指定事项的投影行。"""
+    return _write_diff(conn, item_type, _desired(conn, item_type, item_ids), _stored(conn, item_type, item_ids))
+
+
+# ── 同步维护 ──────────────────────────────────────────────────────────
+
+
+def _changed(obj, attrs: tuple[str, ...]) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[attr].history.has_changes() for attr in attrs)
+
+
+def _collect_touched(session: Session) -> tuple[dict[str, set[int]], set[int]]:
+    touched: dict[str, set[int]] = defaultdict(set)
+    for obj in chain(session.new, session.deleted):
+        item_type = _TYPE_OF_MODEL.get(type(obj))
+        if item_type is not None:
+            touched[item_type].add(obj.id)
+    for obj in session.dirty:
+        item_type = _TYPE_OF_MODEL.get(type(obj))
+        if item_type is not None and _changed(obj, _PROJECTED[item_type][2]):
+            touched[item_type].add(obj.id)
+
+    for obj in chain(session.new, session.dirty, session.deleted):
+        item_type = _TYPE_OF_LINK.get(type(obj))
+        if item_type is not None and obj.task_id is not None:
+            touched[item_type].add(obj.task_id)
+
+    # 从用户一侧修改内容 / 会议责任人
+    dropped_users: set[int] = set()
+    for obj in session.dirty:
+        if isinstance(obj, User):
+            for attr, item_type in (("assigned_contents", "content"), ("assigned_meetings", "meeting")):
+                history = inspect(obj).attrs[attr].history
+                touched[item_type].update(item.id for item in (*history.added, *history.deleted))
+    for obj in session.deleted:
+        if isinstance(obj, User):
+            dropped_users.add(obj.id)
+    return touched, dropped_users
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_flushed_items(session: Session, _flush_context) -> None:
+    # after_flush 时数据库中已是 flush 后的数据，按事项重算即可
+    touched, dropped_users = _collect_touched(session)
+    if not (touched or dropped_users):
+        return
+
+    conn = session.connection()
+    if dropped_users:
+        conn.execute(delete(UserWorkItem).where(UserWorkItem.user_id.in_(dropped_users)))
+    for item_type, item_ids in touched.items():
+        refresh_work_items(conn, item_type, item_ids)
+
+
+# ── 查询 ──────────────────────────────────────────────────────────────
+
+
+def work_items_query(user_id: int, item_type: str | None = None, work_status: str | None = None) -> Select:
+    """某用户的负责事项（未排序；排序与分页由调用方按截止时间处理）。"""
+    stmt = select(UserWorkItem).where(UserWorkItem.user_id == user_id)
+    if item_type is not None:
+        stmt = stmt.where(UserWorkItem.item_type == item_type)
+    if work_status is not None:
+        stmt = stmt.where(UserWorkItem.work_status == work_status)
+    return stmt
+
+
+def assigned_query(model, user_id: int, *columns: Any) -> Select:
+    """从投影按截止时间取某用户负责的事项对象（以投影为驱动表，事项按主键回表）。"""
+    item_type = _TYPE_OF_MODEL[model]
+    return (
+        select(model, *columns)
+        .join(
+            UserWorkItem,
+            (UserWorkItem.item_id == model.id)
+            & (UserWorkItem.item_type == item_type)
+            & (UserWorkItem.user_id == user_id),
+        )
+        .order_by(UserWorkItem.due_at.asc().nullslast(), UserWorkItem.id)
+    )
+
+
+# ── 定时校正 ──────────────────────────────────────────────────────────
+
+
+def reconcile_work_items(db: Session) -> int:
+    """全量比对并修复投影，返回修复的行数。
+
+    每类事项先比对找出有偏差的事项，再在新事务中按事项重算（与写入路径相同），
+    避免用比对时的旧数据覆盖期间提交的修改。
+    """
+    repaired = 0
+    for item_type in WORK_ITEM_TYPES:
+        desired = _desired(db, item_type)
+        stored = _stored(db, item_type)
+        db.commit()
+        drifted = {item_id for (user_id, item_id), (_, values) in stored.items()
+                   if desired.get((user_id, item_id)) != values}
+        drifted |= {item_id for (user_id, item_id) in desired if (user_id, item_id) not in stored}
+        if not drifted:
+            continue
+        repaired += refresh_work_items(db.connection(), item_type, drifted)
+        db.commit()
+        logger.warning("负责事项投影偏差已修复: %s %d 项", item_type, len(drifted))
+
+    stale = db.execute(
+        delete(UserWorkItem).where(UserWorkItem.user_id.not_in(select(User.id)))
+    ).rowcount
+    db.commit()
+    return repaired + stale
+
+
+def run_work_item_reconcile(session_factory: Callable[[], Session] = SessionLocal) -> dict:
+    """定时任务入口。"""
+    with session_factory() as db:
+        return {"repaired": reconcile_work_items(db)}
@@ -8,6 +8,7 @@ import markdown
 from bs4 import BeautifulSoup
 
 from app.core.logging import get_logger
+from app.core.metrics import wechat_event_hooks
 
 # WeChat-compatible inline styles
 WECHAT_STYLES = {
@@ -91,7 +92,7 @@ class WechatService:
             cached = None
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, event_hooks=wechat_event_hooks()) as client:
                 resp = await client.get(
                     f"{WECHAT_API_BASE}/cgi-bin/token",
                     params={
@@ -211,7 +212,7 @@ class WechatService:
         token = await self._get_access_token(community_id)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, event_hooks=wechat_event_hooks()) as client:
                 with open(image_path, "rb") as f:
                     resp = await client.post(
                         f"{WECHAT_API_BASE}/cgi-bin/media/uploadimg",
@@ -238,7 +239,7 @@ class WechatService:
         filename = os.path.basename(image_path)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, event_hooks=wechat_event_hooks()) as client:
                 with open(image_path, "rb") as f:
                     resp = await client.post(
                         f"{WECHAT_API_BASE}/cgi-bin/material/add_material",
@@ -274,7 +275,7 @@ class WechatService:
         }
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, event_hooks=wechat_event_hooks()) as client:
                 resp = await client.post(
                     f"{WECHAT_API_BASE}/cgi-bin/draft/add",
                     params={"access_token": token},
@@ -297,7 +298,7 @@ class WechatService:
     async def get_article_stats(self, publish_id: str, community_id: int = 0) -> dict:
         """Get article statistics (limited for subscription accounts)."""
         token = await self._get_access_token(community_id)
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(event_hooks=wechat_event_hooks()) as client:
             resp = await client.post(
                 f"{WECHAT_API_BASE}/cgi-bin/datacube/getarticlesummary",
                 params={"access_token": token},
@@ -318,7 +319,7 @@ class WechatService:
         """
         token = await self._get_access_token(community_id)
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, event_hooks=wechat_event_hooks()) as client:
                 resp = await client.post(
                     f"{WECHAT_API_BASE}/cgi-bin/freepublish/batchget",
                     params={"access_token": token},
@@ -353,7 +354,7 @@ class WechatService:
         """
         token = await self._get_access_token(community_id)
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with httpx.AsyncClient(timeout=30.0, event_hooks=wechat_event_hooks()) as client:
                 resp = await client.post(
                     f"{WECHAT_API_BASE}/cgi-bin/datacube/getarticletotal",
                     params={"access_token": token},
@@ -0,0 +1,187 @@
+"""工作状态统计：按（责任人，事项类型）在数据库中分组计数。
+
+每类事项一条语句：CASE 把各自的业务状态映射为 planning / in_progress / completed，
+逾期为「未完成、有截止时间且已过期」，按责任人 GROUP BY。个人工作台与工作量总览共用，
+统计本身不加载 ORM 对象。
+"""
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Date, Select, and_, case, func, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.timezone import utc_now
+from app.models.campaign import CampaignContact, CampaignTask, campaign_task_assignees
+from app.models.content import Content, content_assignees
+from app.models.design import DesignTask
+from app.models.event import ChecklistItem, EventTask, checklist_item_assignees, event_task_assignees
+from app.models.meeting import Meeting, meeting_assignees
+from app.schemas.dashboard import ContentByTypeStats, WorkStatusStats
+
+WORK_STATUSES = ("planning", "in_progress", "completed")
+
+_TASK_STATUS_MAP = {
+    "not_started": "planning",
+    "in_progress": "in_progress",
+    "completed": "completed",
+    "blocked": "in_progress",
+}
+
+
+@dataclass(frozen=True)
+class WorkItemKind:
+    """一类事项的统计口径。
+
+    ``mapping`` 为业务状态 → 工作状态，未列出的状态归为 ``default``（None 表示不计入任何状态）；
+    ``link`` 为 (责任人关联表, 连接条件)，事项表自带责任人列时为 None。
+    """
+
+    model: Any
+    user_id: Any
+    status: Any
+    mapping: dict[str, str]
+    default: str | None = "planning"
+    deadline: Any = None
+    link: tuple[Any, Any] | None = None
+
+    def work_status(self):
+        return case(self.mapping, value=self.status, else_=self.default)
+
+    def overdue_before(self, now) -> Any:
+        """截止时间的比较基准：日期列按今天（UTC），时间列按当前 naive UTC 时间。"""
+        if isinstance(self.deadline.type, Date):
+            return now.date()
+        return now.replace(tzinfo=None)
+
+
+WORK_ITEM_KINDS: dict[str, WorkItemKind] = {
+    "content": WorkItemKind(
+        Content,
+        content_assignees.c.user_id,
+        Content.work_status,
+        {status: status for status in WORK_STATUSES},
+        default=None,
+        deadline=Content.scheduled_publish_at,
+        link=(content_assignees, content_assignees.c.content_id == Content.id),
+    ),
+    "meeting": WorkItemKind(
+        Meeting,
+        meeting_assignees.c.user_id,
+        Meeting.status,
+        # 已取消的会议也算作已完成
+        {"scheduled": "planning", "in_progress": "in_progress", "completed": "completed", "cancelled": "completed"},
+        deadline=Meeting.scheduled_at,
+        link=(meeting_assignees, meeting_assignees.c.meeting_id == Meeting.id),
+    ),
+    "event_task": WorkItemKind(
+        EventTask,
+        event_task_assignees.c.user_id,
+        EventTask.status,
+        _TASK_STATUS_MAP,
+        deadline=EventTask.end_date,
+        link=(event_task_assignees, event_task_assignees.c.task_id == EventTask.id),
+    ),
+    "checklist_item": WorkItemKind(
+        ChecklistItem,
+        checklist_item_assignees.c.user_id,
+        ChecklistItem.status,
+        {"done": "completed", "skipped": "completed"},
+        deadline=ChecklistItem.due_date,
+        link=(checklist_item_assignees, checklist_item_assignees.c.task_id == ChecklistItem.id),
+    ),
+    "campaign_task": WorkItemKind(
+        CampaignTask,
+        campaign_task_assignees.c.user_id,
+        CampaignTask.status,
+        _TASK_STATUS_MAP,
+        deadline=CampaignTask.deadline,
+        link=(campaign_task_assignees, campaign_task_assignees.c.task_id == CampaignTask.id),
+    ),
+    "design_task": WorkItemKind(
+        DesignTask,
+        DesignTask.assignee_id,
+        DesignTask.status,
+        {"not_started": "planning", "in_progress": "in_progress", "review": "in_progress", "completed": "completed"},
+        deadline=DesignTask.due_date,
+    ),
+    # 关怀联系人：pending 待联系；contacted / blocked 进行中；其余状态不计入，无截止时间
+    "care_contact": WorkItemKind(
+        CampaignContact,
+        CampaignContact.assigned_to_id,
+        CampaignContact.status,
+        {"pending": "planning", "contacted": "in_progress", "blocked": "in_progress"},
+        default=None,
+    ),
+}
+
+
+@dataclass(frozen=True)
+class WorkStatusCount:
+    """某用户某类事项的统计；total 含未映射到工作状态的事项。"""
+
+    stats: WorkStatusStats
+    total: int
+
+
+def work_status_query(kind: WorkItemKind, user_ids: Sequence[int], now) -> Select:
+    """构造一类事项按责任人分组的统计语句。"""
+    work_status = kind.work_status()
+    columns = [func.count(case((work_status == status, 1))).label(status) for status in WORK_STATUSES]
+    if kind.deadline is None:
+        columns.append(literal(0).label("overdue"))
+    else:
+        overdue = and_(
+            work_status.is_distinct_from("completed"),
+            kind.deadline.is_not(None),
+            kind.deadline < kind.overdue_before(now),
+        )
+        columns.append(func.count(case((overdue, 1))).label("overdue"))
+
+    stmt = select(kind.user_id.label("user_id"), *columns, func.count().label("total")).select_from(kind.model)
+    if kind.link is not None:
+        stmt = stmt.join(*kind.link)
+    return stmt.where(kind.user_id.in_(user_ids)).group_by(kind.user_id)
+
+
+async def work_status_counts(
+    db: AsyncSession, kind: str, user_ids: Sequence[int]
+) -> dict[int, WorkStatusCount]:
+    """按用户统计某类事项的工作状态；没有事项的用户不在结果中。"""
+    if not user_ids:
+        return {}
+    rows = await db.execute(work_status_query(WORK_ITEM_KINDS[kind], user_ids, utc_now()))
+    return {
+        row.user_id: WorkStatusCount(
+            WorkStatusStats(planning=row.planning, in_progress=row.in_progress,
+                            completed=row.completed, overdue=row.overdue),
+            row.total,
+        )
+        for row in rows
+    }
+
+
+async def all_work_status_counts(
+    db: AsyncSession, user_ids: Sequence[int]
+) -> dict[str, dict[int, WorkStatusCount]]:
+    """所有事项类型的统计，按类型名索引。"""
+    return {kind: await work_status_counts(db, kind, user_ids) for kind in WORK_ITEM_KINDS}
+
+
+async def content_type_counts(db: AsyncSession, user_ids: Sequence[int]) -> dict[int, ContentByTypeStats]:
+    """按用户统计负责内容的来源类型（未设置时按 contribution 计）。"""
+    if not user_ids:
+        return {}
+    source_type = func.coalesce(Content.source_type, "contribution")
+    rows = await db.execute(
+        select(content_assignees.c.user_id, source_type, func.count())
+        .join(Content, content_assignees.c.content_id == Content.id)
+        .where(content_assignees.c.user_id.in_(user_ids))
+        .group_by(content_assignees.c.user_id, source_type)
+    )
+    grouped: dict[int, dict[str, int]] = {}
+    for user_id, st, n in rows:
+        if st in ContentByTypeStats.model_fields:
+            grouped.setdefault(user_id, {})[st] = n
+    return {user_id: ContentByTypeStats(**counts) for user_id, counts in grouped.items()}
@@ -0,0 +1,23 @@
+"""gunicorn 配置（生产环境，由 gunicorn 在工作目录下自动加载）
+
+启动参数仍在 docker-compose.prod.yml 中指定；这里只处理 Prometheus 多进程模式：
+- 启动时清空 PROMETHEUS_MULTIPROC_DIR，避免上次运行遗留的指标文件被计入；
+- worker 退出时标记其进程已结束，livesum 类 Gauge（进行中请求数、连接池）不再计入该进程。
+"""
+
+import os
+import shutil
+
+
+def on_starting(server):
+    path = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if path:
+        shutil.rmtree(path, ignore_errors=True)
+        os.makedirs(path, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
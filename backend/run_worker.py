@@ -0,0 +1,81 @@
+#!/usr/bin/env python
+"""独立后台任务 worker 进程。
+
+从 jobs 表领取并执行慢任务（GitHub 同步、docx 转换、微信接口调用、聚合重建），
+同时运行通知邮件发件箱分发器（notification_outbox）。可与 FastAPI 分开部署、按需横向扩展（多进程 / 多节点可同时运行）。
+使用方式：
+  python run_worker.py                  # 持续运行（队列为空时按 JOB_POLL_INTERVAL_SECONDS 轮询）
+  python run_worker.py --once           # 执行完当前队列中的任务与待发邮件后退出（适合 CI / k8s Job / cron）
+  python run_worker.py --concurrency 4  # 并发线程数（默认 JOB_WORKER_CONCURRENCY）
+
+环境变量：
+  JOB_WORKER_EMBEDDED       设为 false 表示采用独立模式（FastAPI 侧不启动 worker 线程）
+  JOB_WORKER_CONCURRENCY    并发线程数（默认 2）
+  JOB_LEASE_SECONDS         任务租约时长（默认 300 秒）
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+import threading
+
+# 确保从 backend/ 目录运行时 app 包可被找到
+sys.path.insert(0, os.path.dirname(__file__))
+
+from app.config import settings
+from app.core.logging import setup_logging
+from app.database import SessionLocal, init_db
+from app.services.jobs import JobWorker
+from app.services.notification_outbox import OutboxDispatcher
+
+setup_logging()
+logger = logging.getLogger("worker")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="openGecko 后台任务 worker")
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="执行完当前队列中的任务后退出（默认：持续运行）",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=settings.JOB_WORKER_CONCURRENCY,
+        help="并发线程数",
+    )
+    args = parser.parse_args()
+
+    logger.info("任务 worker 启动 — once=%s concurrency=%d", args.once, args.concurrency)
+    init_db()
+    worker = JobWorker(SessionLocal)
+    dispatcher = OutboxDispatcher(SessionLocal)
+
+    if args.once:
+        count = worker.run_pending()
+        emails = dispatcher.run_pending()
+        logger.info("执行完成: %d 个任务, %d 封通知邮件", count, emails)
+        return
+
+    stopped = threading.Event()
+
+    def _shutdown(signum, _frame) -> None:
+        logger.info("收到信号 %s，等待进行中的任务结束后退出", signum)
+        stopped.set()
+
+    signal.signal(signal.SIGTERM, _shutdown)
+    signal.signal(signal.SIGINT, _shutdown)
+
+    worker.start(threads=args.concurrency)
+    dispatcher.start()
+    stopped.wait()
+    worker.stop()
+    dispatcher.stop()
+    logger.info("任务 worker 已退出")
+
+
+if __name__ == "__main__":
+    main()
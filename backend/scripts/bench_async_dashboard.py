@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+并发基准：压测个人工作台时 /api/health 的尾延迟
+用法：先启动后端（建议与生产一致的 gunicorn 单 worker，并调高 RATE_LIMIT_DEFAULT
+以免压测被限流），再从 backend/ 目录执行:
+    python scripts/bench_async_dashboard.py --token <JWT> --concurrency 32 --duration 20
+
+脚本分两轮运行：
+  1. 空载：只探测 /api/health，得到基线延迟
+  2. 压测：N 个并发协程持续请求 /api/users/me/dashboard，同时探测 /api/health
+
+若工作台路由阻塞事件循环，第二轮 /api/health 的 p99 会被拉高到与工作台
+单次耗时同一量级；使用 AsyncSession 后二者应基本一致。
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+import httpx
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="压测工作台时测量 /api/health 延迟")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000", help="后端地址")
+    parser.add_argument("--token", required=True, help="JWT access token")
+    parser.add_argument("--path", default="/api/users/me/dashboard", help="被压测的路由")
+    parser.add_argument("--concurrency", type=int, default=32, help="压测并发数")
+    parser.add_argument("--duration", type=float, default=20.0, help="每轮持续秒数")
+    parser.add_argument("--probe-interval", type=float, default=0.05, help="健康检查探测间隔（秒）")
+    return parser.parse_args()
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(label: str, samples: list[float]) -> None:
+    if not samples:
+        print(f"{label:<22} 无样本")
+        return
+    print(
+        f"{label:<22} n={len(samples):<6} "
+        f"p50={percentile(samples, 50):7.1f}ms  "
+        f"p95={percentile(samples, 95):7.1f}ms  "
+        f"p99={percentile(samples, 99):7.1f}ms  "
+        f"max={max(samples):7.1f}ms  "
+        f"mean={statistics.fmean(samples):7.1f}ms"
+    )
+
+
+async def probe_health(client: httpx.AsyncClient, stop_at: float, interval: float) -> list[float]:
+    samples: list[float] = []
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        resp = await client.get("/api/health")
+        resp.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def hammer(client: httpx.AsyncClient, path: str, headers: dict, stop_at: float) -> list[float]:
+    samples: list[float] = []
+    while time.perf_counter() < stop_at:
+        start = time.perf_counter()
+        resp = await client.get(path, headers=headers)
+        resp.raise_for_status()
+        samples.append((time.perf_counter() - start) * 1000)
+    return samples
+
+
+async def run(args: argparse.Namespace) -> None:
+    headers = {"Authorization": f"Bearer {args.token}"}
+    limits = httpx.Limits(max_connections=args.concurrency + 8)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=60, limits=limits) as client:
+        stop_at = time.perf_counter() + args.duration
+        idle = await probe_health(client, stop_at, args.probe_interval)
+        summarize("health (idle)", idle)
+
+        stop_at = time.perf_counter() + args.duration
+        workers = [hammer(client, args.path, headers, stop_at) for _ in range(args.concurrency)]
+        results = await asyncio.gather(probe_health(client, stop_at, args.probe_interval), *workers)
+        summarize("health (under load)", results[0])
+        loaded = [s for batch in results[1:] for s in batch]
+        summarize(args.path, loaded)
+        print(f"{'throughput':<22} {len(loaded) / args.duration:.1f} req/s")
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        asyncio.run(run(args))
+    except httpx.HTTPError as exc:
+        print(f"请求失败: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
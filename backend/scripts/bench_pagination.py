@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+基准：深翻页时偏移分页与游标分页的查询耗时
+用法（从 backend/ 目录执行）:
+    python scripts/bench_pagination.py
+    python scripts/bench_pagination.py --rows 50000 --page-size 20 --rounds 20
+
+在临时 SQLite 库中写入 --rows 条内容，按 list_contents 的排序（updated_at desc, id desc）
+比较第 1 页与第 500 页的耗时（毫秒，取中位数）：
+  - offset  ORDER BY ... OFFSET (page-1)*page_size LIMIT page_size + 1
+  - cursor  ORDER BY ... WHERE (updated_at, id) 在游标之后 LIMIT page_size + 1
+另输出 COUNT(*) 的耗时——游标模式默认省略 total，即省下这部分。
+"""
+
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.api.contents import LIST_KEYSET  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.models import Content  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="偏移分页 vs 游标分页基准")
+    parser.add_argument("--rows", type=int, default=30000, help="内容行数")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--deep-page", type=int, default=500, help="深翻页页码")
+    parser.add_argument("--rounds", type=int, default=20, help="每种查询重复次数（取中位数）")
+    return parser.parse_args()
+
+
+def seed(db: Session, rows: int) -> None:
+    start = datetime(2024, 1, 1)
+    batch = [
+        {
+            "title": f"内容 {i}",
+            "content_markdown": "正文" * 200,
+            "status": "draft",
+            # 每 3 行共享一个 updated_at，覆盖平局
+            "updated_at": start + timedelta(minutes=i // 3),
+        }
+        for i in range(rows)
+    ]
+    db.execute(insert(Content), batch)
+    db.commit()
+
+
+def median_ms(fn: Callable[[], object], rounds: int) -> float:
+    fn()  # 预热
+    samples = []
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(samples)
+
+
+def main() -> None:
+    args = parse_args()
+    size = args.page_size
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            seed(db, args.rows)
+
+            def offset_page(page: int) -> list:
+                return LIST_KEYSET.apply(db.query(Content), cursor=None, offset=(page - 1) * size, limit=size).all()
+
+            # 游标：先取第 deep_page - 1 页最后一行作为游标
+            prev = LIST_KEYSET.page(offset_page(args.deep_page - 1), size)[1]
+            first_cursor = LIST_KEYSET.page(offset_page(1), size)[1]
+            assert prev and first_cursor, "--rows 不足以翻到深页"
+            deep_expected = [c.id for c in offset_page(args.deep_page)]
+
+            def cursor_page(cursor: str) -> list:
+                return LIST_KEYSET.apply(db.query(Content), cursor=cursor, offset=0, limit=size).all()
+
+            assert [c.id for c in cursor_page(prev)] == deep_expected
+
+            results = {
+                "offset p1": median_ms(lambda: offset_page(1), args.rounds),
+                f"offset p{args.deep_page}": median_ms(lambda: offset_page(args.deep_page), args.rounds),
+                "cursor p2": median_ms(lambda: cursor_page(first_cursor), args.rounds),
+                f"cursor p{args.deep_page}": median_ms(lambda: cursor_page(prev), args.rounds),
+                "count(*)": median_ms(lambda: db.query(Content).count(), args.rounds),
+            }
+        engine.dispose()
+
+    print(f"rows={args.rows} page_size={size} rounds={args.rounds}")
+    for name, ms in results.items():
+        print(f"  {name:<14} {ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+基准：大列表接口的响应序列化开销（不含数据库查询）
+用法（从 backend/ 目录执行）:
+    python scripts/bench_serialization.py
+    python scripts/bench_serialization.py --rounds 50
+
+对每个接口用合成数据比较三种路径，输出单次序列化耗时（毫秒）：
+  - stdlib    FastAPI 默认：按 response_model 校验 → 转为 JSON 兼容对象 → json.dumps（JSONResponse）
+  - orjson    同上，但由 ORJSONResponse 渲染（应用默认响应类）
+  - fast      app.core.responses.model_response：校验一次，pydantic-core 直接输出 JSON 字节
+stdlib / orjson 使用各接口改造前的返回值形态（dict 或已构造的模型），fast 使用改造后的形态（ORM 对象）。
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import APIRoute, serialize_response  # noqa: E402
+
+from app.core.responses import model_response  # noqa: E402
+from app.insights.schemas import KeyPerson  # noqa: E402
+from app.main import app  # noqa: E402
+from app.schemas.content import ContentListOut  # noqa: E402
+
+NOW = datetime(2026, 1, 1, 8, 0, 0)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="响应序列化基准")
+    parser.add_argument("--rounds", type=int, default=30, help="每种路径重复次数（取中位数）")
+    return parser.parse_args()
+
+
+def _content(i: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=i,
+        title=f"内容标题 {i}",
+        source_type="contribution",
+        author="作者",
+        tags=["release", "community"],
+        category="news",
+        status="draft",
+        work_status="planning",
+        community_id=1,
+        owner_id=1,
+        scheduled_publish_at=NOW + timedelta(hours=i),
+        created_at=NOW,
+        updated_at=NOW,
+        assignee_names=["张三", "李四"],
+    )
+
+
+def _meeting(i: int) -> dict:
+    return {
+        "id": i,
+        "committee_id": 1,
+        "community_id": 1,
+        "title": f"例会 {i}",
+        "description": "议题讨论" * 10,
+        "scheduled_at": NOW + timedelta(days=i),
+        "duration": 60,
+        "location_type": "online",
+        "location": None,
+        "online_url": "https://meeting.example.com/123",
+        "status": "scheduled",
+        "reminder_sent": False,
+        "created_by_user_id": 1,
+        "created_at": NOW,
+        "updated_at": NOW,
+        "assignee_ids": [1, 2, 3],
+    }
+
+
+def _rank_item(i: int) -> dict:
+    return {
+        "publish_record_id": i,
+        "content_id": i,
+        "title": f"文章 {i}",
+        "article_category": "technical",
+        "read_count": 1000 - i,
+        "like_count": 10,
+        "share_count": 5,
+        "comment_count": 2,
+        "published_at": NOW.isoformat(),
+    }
+
+
+def _person(i: int) -> KeyPerson:
+    return KeyPerson(
+        github_handle=f"user{i}",
+        display_name=f"User {i}",
+        avatar_url=f"https://avatars.example.com/{i}",
+        influence_types=["maintainer", "reviewer"],
+        influence_score=87.5,
+        cross_project_count=3,
+        commit_count_90d=120,
+        pr_count_90d=30,
+        review_count_90d=45,
+        company="Example Inc.",
+        person_profile_id=None,
+        project_ids=[1, 2, 3],
+    )
+
+
+def cases() -> list[tuple[str, int, Callable[[], object], object]]:
+    """(接口, 条数, 改造前返回值的构造函数, 改造后返回值)
+
+    改造前 list_contents 在 handler 中逐条构造 ContentListOut，构造开销计入 stdlib / orjson。
+    """
+    calendar = [_content(i) for i in range(500)]
+    contents = [_content(i) for i in range(100)]
+    meetings = [_meeting(i) for i in range(500)]
+    ranking = [_rank_item(i) for i in range(200)]
+    people = [_person(i) for i in range(200)]
+    return [
+        ("/api/contents/calendar/events", 500, lambda: calendar, calendar),
+        (
+            "/api/contents",
+            100,
+            lambda: {
+                "items": [ContentListOut(**vars(c)) for c in contents],
+                "total": 100,
+                "page": 1,
+                "page_size": 100,
+            },
+            {"items": contents, "total": 100, "page": 1, "page_size": 100},
+        ),
+        ("/api/meetings", 500, lambda: meetings, [SimpleNamespace(**m) for m in meetings]),
+        ("/api/wechat-stats/ranking", 200, lambda: ranking, ranking),
+        ("/api/insights/people", 200, lambda: people, people),
+    ]
+
+
+def _route(path: str) -> APIRoute:
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path and "GET" in route.methods:
+            return route
+    raise SystemExit(f"未找到路由 {path}")
+
+
+def _median_ms(fn, rounds: int) -> float:
+    fn()  # 预热（构建 TypeAdapter 等）
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return samples[len(samples) // 2] * 1000
+
+
+def main() -> None:
+    args = parse_args()
+    loop = asyncio.new_event_loop()
+    print(f"{'endpoint':<32} {'rows':>5} {'stdlib':>9} {'orjson':>9} {'fast':>9} {'speedup':>8}")
+    for path, rows, legacy, current in cases():
+        route = _route(path)
+
+        def default_path(response_class, legacy=legacy, route=route):
+            data = loop.run_until_complete(
+                serialize_response(field=route.response_field, response_content=legacy(), is_coroutine=True)
+            )
+            return response_class(data).body
+
+        stdlib = _median_ms(lambda: default_path(JSONResponse), args.rounds)
+        orjson = _median_ms(lambda: default_path(ORJSONResponse), args.rounds)
+        fast = _median_ms(
+            lambda route=route, current=current: model_response(route.response_model, current).body, args.rounds
+        )
+        print(f"{path:<32} {rows:>5} {stdlib:>8.2f}ms {orjson:>8.2f}ms {fast:>8.2f}ms {stdlib / fast:>7.1f}x")
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
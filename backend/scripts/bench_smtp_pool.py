@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+基准：SMTP 连接复用前后的邮件发送吞吐
+用法（从 backend/ 目录执行，需要 pip install aiosmtpd）:
+    python scripts/bench_smtp_pool.py
+    python scripts/bench_smtp_pool.py --count 1000 --handshake-ms 30 --batch-size 50
+
+在本机启动 aiosmtpd 作为 SMTP 服务器替身，发送 --count 封会议提醒邮件（含 ICS 附件），
+比较三种方式的 messages/sec：
+  - per-message   每封邮件新建连接（SMTP_POOL_MAX_IDLE=0，等同改造前的 SmtpEmailProvider.send）
+  - pooled send   逐封 send()，连接由 SmtpConnectionPool 复用
+  - send_many     每批 --batch-size 封在同一会话中发送（通知邮件发件箱分发器的方式）
+本机回环没有网络延迟，--handshake-ms 在每次 EHLO 时额外等待，模拟真实服务器上 TCP/TLS 握手与登录的往返耗时。
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from aiosmtpd.controller import Controller  # noqa: E402
+
+from app.services.email import (  # noqa: E402
+    EmailAttachment,
+    EmailMessage,
+    SmtpConfig,
+    SmtpConnectionPool,
+    SmtpEmailProvider,
+)
+from app.services.ics import build_meeting_ics  # noqa: E402
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SMTP 连接复用吞吐基准")
+    parser.add_argument("--count", type=int, default=1000, help="每种方式发送的邮件数")
+    parser.add_argument("--batch-size", type=int, default=50, help="send_many 每批邮件数")
+    parser.add_argument("--handshake-ms", type=float, default=20.0, help="每次建立会话（EHLO）的模拟延迟（毫秒）")
+    parser.add_argument("--port", type=int, default=8025, help="aiosmtpd 监听端口")
+    return parser.parse_args()
+
+
+class CountingHandler:
+    """只计数、不投递的 SMTP 服务器替身。"""
+
+    def __init__(self, handshake_seconds: float):
+        self.handshake_seconds = handshake_seconds
+        self.sessions = 0
+        self.messages = 0
+
+    async def handle_EHLO(self, server, session, envelope, hostname, responses):
+        self.sessions += 1
+        if self.handshake_seconds:
+            await asyncio.sleep(self.handshake_seconds)
+        session.host_name = hostname
+        return responses
+
+    async def handle_DATA(self, server, session, envelope):
+        self.messages += 1
+        return "250 OK"
+
+
+def make_reminders(count: int) -> list[EmailMessage]:
+    community = SimpleNamespace(name="openGecko", slug="opengecko")
+    meeting = SimpleNamespace(
+        id=1,
+        title="社区双周例会",
+        description="议题同步与版本规划",
+        agenda="1. 上期遗留\n2. 版本计划\n3. 自由讨论",
+        location="线上会议",
+        scheduled_at=datetime(2026, 11, 3, 6, 0, 0),
+        duration=60,
+    )
+    ics = build_meeting_ics(meeting, community, organizer_email="noreply@example.com")
+    return [
+        EmailMessage(
+            subject=f"[{meeting.title}] Meeting reminder",
+            to_emails=[f"member{i}@example.com"],
+            html_body=f"<p>{meeting.title}</p><p>Time: 2026-11-03 14:00</p>",
+            text_body=f"{meeting.title}\nTime: 2026-11-03 14:00",
+            from_email="noreply@example.com",
+            from_name=community.name,
+            attachments=[EmailAttachment("meeting.ics", ics, "text/calendar")],
+        )
+        for i in range(count)
+    ]
+
+
+def run(label: str, handler: CountingHandler, fn: Callable[[], int], count: int) -> None:
+    handler.sessions = handler.messages = 0
+    start = time.perf_counter()
+    sent = fn()
+    elapsed = time.perf_counter() - start
+    assert sent == count and handler.messages == count, (sent, handler.messages)
+    print(f"{label:<14} {count / elapsed:9.1f} msg/s  {elapsed:7.2f}s  sessions={handler.sessions}")
+
+
+def main() -> None:
+    args = parse_args()
+    handler = CountingHandler(args.handshake_ms / 1000)
+    controller = Controller(handler, hostname="127.0.0.1", port=args.port)
+    controller.start()
+
+    config = SmtpConfig(host="127.0.0.1", port=args.port, username="", password="", use_tls=False)
+    messages = make_reminders(args.count)
+
+    def send_each(pool: SmtpConnectionPool) -> Callable[[], int]:
+        def fn() -> int:
+            provider = SmtpEmailProvider(config, pool=pool)
+            for message in messages:
+                provider.send(message)
+            pool.close_all()
+            return len(messages)
+
+        return fn
+
+    def send_batches() -> int:
+        pool = SmtpConnectionPool(max_idle=1)
+        provider = SmtpEmailProvider(config, pool=pool)
+        sent = 0
+        for i in range(0, len(messages), args.batch_size):
+            results = provider.send_many(messages[i:i + args.batch_size])
+            sent += sum(1 for error in results if error is None)
+        pool.close_all()
+        return sent
+
+    print(f"{args.count} 封会议提醒邮件，模拟握手延迟 {args.handshake_ms:.0f}ms，send_many 批大小 {args.batch_size}")
+    try:
+        run("per-message", handler, send_each(SmtpConnectionPool(max_idle=0)), args.count)
+        run("pooled send", handler, send_each(SmtpConnectionPool(max_idle=1)), args.count)
+        run("send_many", handler, send_batches, args.count)
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+基准：SQLite 多进程混合读写吞吐（默认配置 vs 调优配置）
+用法（从 backend/ 目录执行）:
+    python scripts/bench_sqlite_concurrency.py
+    python scripts/bench_sqlite_concurrency.py --workers 4 --threads 4 --seconds 10 --write-ratio 0.2
+
+模拟 gunicorn 多 worker（进程）+ 每个 worker 内的并发请求（线程）：
+  - default  只设置 check_same_thread=False，读写共用一个连接池（rollback 日志模式）
+  - tuned    configure_sqlite_engine()：WAL、busy_timeout、synchronous=NORMAL、mmap、cache_size，
+             读请求走独立的 query_only 连接池
+每个操作是一次短事务：读 = 按社区聚合 + 取最新 20 行；写 = 插入一行并提交。
+输出每种配置的读/写吞吐、p99 延迟与 "database is locked" 错误数。
+"""
+
+import argparse
+import multiprocessing as mp
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import (  # noqa: E402
+    Column,
+    Float,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    create_engine,
+    func,
+    insert,
+    select,
+)
+from sqlalchemy.exc import OperationalError  # noqa: E402
+
+from app.database import configure_sqlite_engine  # noqa: E402
+
+metadata = MetaData()
+items = Table(
+    "bench_items",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("community_id", Integer, index=True),
+    Column("payload", String(200)),
+    Column("created_at", Float),
+)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="SQLite 多进程混合读写基准")
+    parser.add_argument("--workers", type=int, default=4, help="进程数（对应 gunicorn workers）")
+    parser.add_argument("--threads", type=int, default=4, help="每个进程的并发线程数")
+    parser.add_argument("--seconds", type=float, default=10.0, help="每种配置的运行时长")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="写操作占比")
+    parser.add_argument("--rows", type=int, default=20000, help="预置行数")
+    return parser.parse_args()
+
+
+def make_engines(url: str, profile: str):
+    write_engine = create_engine(url, connect_args={"check_same_thread": False})
+    if profile == "default":
+        return write_engine, write_engine
+    configure_sqlite_engine(write_engine)
+    read_engine = create_engine(url, connect_args={"check_same_thread": False})
+    configure_sqlite_engine(read_engine, read_only=True)
+    return write_engine, read_engine
+
+
+def prepare(url: str, profile: str, rows: int) -> None:
+    write_engine, _ = make_engines(url, profile)
+    metadata.create_all(write_engine)
+    with write_engine.begin() as conn:
+        conn.execute(
+            insert(items),
+            [
+                {"community_id": i % 10, "payload": "x" * 100, "created_at": time.time()}
+                for i in range(rows)
+            ],
+        )
+    write_engine.dispose()
+
+
+def run_worker(url: str, profile: str, threads: int, seconds: float, write_ratio: float, queue) -> None:
+    write_engine, read_engine = make_engines(url, profile)
+    lock = threading.Lock()
+    result = {"reads": 0, "writes": 0, "locked": 0, "latencies": []}
+    deadline = time.monotonic() + seconds
+
+    def loop(seed: int) -> None:
+        rng = random.Random(seed)
+        latencies = []
+        reads = writes = locked = 0
+        while time.monotonic() < deadline:
+            community_id = rng.randrange(10)
+            start = time.perf_counter()
+            try:
+                if rng.random() < write_ratio:
+                    with write_engine.begin() as conn:
+                        conn.execute(
+                            insert(items).values(
+                                community_id=community_id, payload="y" * 100, created_at=time.time()
+                            )
+                        )
+                    writes += 1
+                else:
+                    with read_engine.connect() as conn:
+                        conn.execute(
+                            select(items.c.community_id, func.count()).group_by(items.c.community_id)
+                        ).all()
+                        conn.execute(
+                            select(items)
+                            .where(items.c.community_id == community_id)
+                            .order_by(items.c.id.desc())
+                            .limit(20)
+                        ).all()
+                    reads += 1
+                latencies.append(time.perf_counter() - start)
+            except OperationalError as exc:
+                if "locked" not in str(exc):
+                    raise
+                locked += 1
+        with lock:
+            result["reads"] += reads
+            result["writes"] += writes
+            result["locked"] += locked
+            result["latencies"].extend(latencies)
+
+    pool = [threading.Thread(target=loop, args=(os.getpid() * 100 + i,)) for i in range(threads)]
+    for t in pool:
+        t.start()
+    for t in pool:
+        t.join()
+    queue.put(result)
+
+
+def bench(profile: str, args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        url = f"sqlite:///{Path(tmpdir) / 'bench.db'}"
+        prepare(url, profile, args.rows)
+
+        queue = mp.Queue()
+        procs = [
+            mp.Process(
+                target=run_worker,
+                args=(url, profile, args.threads, args.seconds, args.write_ratio, queue),
+            )
+            for _ in range(args.workers)
+        ]
+        for p in procs:
+            p.start()
+        results = [queue.get() for _ in procs]
+        for p in procs:
+            p.join()
+
+    reads = sum(r["reads"] for r in results)
+    writes = sum(r["writes"] for r in results)
+    locked = sum(r["locked"] for r in results)
+    latencies = sorted(lat for r in results for lat in r["latencies"])
+    p99 = latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0
+    print(
+        f"{profile:<8} reads={reads / args.seconds:9.1f}/s  writes={writes / args.seconds:8.1f}/s  "
+        f"p99={p99:8.1f}ms  locked_errors={locked}"
+    )
+
+
+def main() -> None:
+    args = parse_args()
+    print(
+        f"workers={args.workers} threads={args.threads} seconds={args.seconds} "
+        f"write_ratio={args.write_ratio} rows={args.rows}"
+    )
+    for profile in ("default", "tuned"):
+        bench(profile, args)
+
+
+if __name__ == "__main__":
+    main()
@@ -34,10 +34,11 @@ from app.config import Settings  # noqa: E402
 
 # ── 分节映射：字段名前缀 → 节标题（顺序即生成顺序）─────────────────────
 SECTION_MAP: list[tuple[str, str]] = [
-    ("DATABASE_URL|DB_",            "数据库"),
+    ("DATABASE_|DB_|SQLITE_",       "数据库"),
     ("JWT_|ACCESS_TOKEN_",          "安全 / JWT"),
     ("CORS_",                       "CORS 跨域"),
     ("RATE_LIMIT_",                 "速率限制"),
+    ("PRINCIPAL_CACHE_",            "认证主体缓存"),
     ("DEFAULT_ADMIN_",              "初始管理员（仅首次启动时创建）"),
     ("SMTP_",                       "SMTP 邮件（可选，用于密码重置和通知）"),
     ("FRONTEND_URL",                "前端地址（密码重置邮件跳转链接）"),
@@ -45,7 +46,18 @@ SECTION_MAP: list[tuple[str, str]] = [
     ("S3_",                         "S3 / MinIO 对象存储（STORAGE_BACKEND=s3 时填写）"),
     ("APP_TIMEZONE",                "时区"),
     ("GITHUB_TOKEN|GITEE_TOKEN|COLLECTOR_", "生态洞察采集服务"),
+    ("SCHEDULER_",                  "定时任务调度（多 worker Leader 选举）"),
+    ("JOB_",                        "后台任务队列"),
+    ("NOTIFY_OUTBOX_",              "通知邮件发件箱"),
+    ("MEETING_REMINDER_",           "会议提醒分发"),
+    ("AUTO_PUBLISH_",               "定时自动发布"),
+    ("COMMUNITY_COUNTER_",          "社区计数校正"),
+    ("USER_WORK_ITEM_",             "个人负责事项投影"),
     ("ENABLE_",                     "可选功能模块"),
+    ("PERF_|METRICS_",              "性能观测"),
+    ("COMPRESSION_",                "响应压缩"),
+    ("HTTP_CACHE_",                 "HTTP 条件请求缓存"),
+    ("COUNT_",                      "列表总数缓存"),
     ("HOST|PORT|DEBUG|LOG_",        "服务器"),
     ("APP_NAME",                    "应用"),
 ]
@@ -58,15 +70,37 @@ SKIP_FIELDS: set[str] = {
 # 在开发模板中对这些字段使用注释掉的形式（可选项）
 DEV_COMMENTED: set[str] = {
     "DB_POOL_SIZE", "DB_MAX_OVERFLOW", "DB_POOL_TIMEOUT", "DB_POOL_RECYCLE", "DB_ECHO",
+    "DATABASE_REPLICA_URLS", "DB_REPLICA_STICKY_SECONDS", "DB_REPLICA_HEALTH_CHECK_SECONDS",
+    "SQLITE_JOURNAL_MODE", "SQLITE_SYNCHRONOUS", "SQLITE_BUSY_TIMEOUT_MS", "SQLITE_MMAP_SIZE", "SQLITE_CACHE_SIZE",
     "CORS_ORIGINS",
     "RATE_LIMIT_LOGIN", "RATE_LIMIT_DEFAULT",
+    "RATE_LIMIT_COMMUNITY", "RATE_LIMIT_STRATEGY", "RATE_LIMIT_STORAGE_URI",
     "STORAGE_BACKEND", "UPLOAD_DIR", "MAX_UPLOAD_SIZE",
     "S3_ENDPOINT_URL", "S3_ACCESS_KEY", "S3_SECRET_KEY", "S3_BUCKET", "S3_PUBLIC_URL",
     "GITHUB_TOKEN", "GITEE_TOKEN",
     "COLLECTOR_SYNC_INTERVAL_HOURS", "COLLECTOR_MAX_WORKERS",
     "COLLECTOR_CHECK_INTERVAL_SECONDS", "COLLECTOR_EMBEDDED",
+    "SCHEDULER_LEASE_TTL_SECONDS", "SCHEDULER_HEARTBEAT_SECONDS",
+    "JOB_WORKER_EMBEDDED", "JOB_WORKER_CONCURRENCY", "JOB_POLL_INTERVAL_SECONDS",
+    "JOB_LEASE_SECONDS", "JOB_MAX_ATTEMPTS", "JOB_RETRY_BACKOFF_SECONDS",
+    "NOTIFY_OUTBOX_BATCH_SIZE", "NOTIFY_OUTBOX_POLL_SECONDS",
+    "NOTIFY_OUTBOX_MAX_ATTEMPTS", "NOTIFY_OUTBOX_RETRY_BACKOFF_SECONDS",
+    "MEETING_REMINDER_DISPATCH_SECONDS", "MEETING_REMINDER_BATCH_SIZE", "MEETING_REMINDER_LEASE_SECONDS",
+    "AUTO_PUBLISH_INTERVAL_SECONDS", "AUTO_PUBLISH_BATCH_SIZE", "AUTO_PUBLISH_LEASE_SECONDS",
+    "AUTO_PUBLISH_WECHAT_CONCURRENCY", "AUTO_PUBLISH_HUGO_CONCURRENCY",
+    "COMMUNITY_COUNTER_RECONCILE_SECONDS",
+    "USER_WORK_ITEM_RECONCILE_SECONDS",
+    "PRINCIPAL_CACHE_SIZE", "PRINCIPAL_CACHE_TTL_SECONDS", "PRINCIPAL_CACHE_VERSION_CHECK_SECONDS",
     "ENABLE_INSIGHTS_MODULE",
+    "PERF_SQL_INSTRUMENTATION", "PERF_SQL_WARN_QUERIES", "PERF_SQL_WARN_MS",
+    "PERF_SQL_N_PLUS_ONE_THRESHOLD", "PERF_ROUTE_WINDOW",
+    "METRICS_ENABLED", "METRICS_TOKEN",
+    "COMPRESSION_ENABLED", "COMPRESSION_MIN_SIZE", "COMPRESSION_CONTENT_TYPES",
+    "COMPRESSION_GZIP_LEVEL", "COMPRESSION_BROTLI_QUALITY",
+    "HTTP_CACHE_BUCKET_SECONDS", "HTTP_CACHE_DASHBOARD_MAX_AGE", "HTTP_CACHE_INSIGHTS_MAX_AGE",
+    "COUNT_CACHE_SIZE", "COUNT_CACHE_TTL_SECONDS", "COUNT_ESTIMATE_THRESHOLD",
     "SMTP_HOST", "SMTP_PORT", "SMTP_USER", "SMTP_PASSWORD", "SMTP_FROM_EMAIL", "SMTP_USE_TLS",
+    "SMTP_POOL_MAX_IDLE", "SMTP_POOL_IDLE_TIMEOUT_SECONDS", "SMTP_POOL_NOOP_AFTER_SECONDS",
     "FRONTEND_URL",
     "APP_NAME", "JWT_ALGORITHM",
     "LOG_LEVEL", "HOST", "PORT",
@@ -79,6 +113,7 @@ PROD_MUST_REPLACE: dict[str, str] = {
     "DEFAULT_ADMIN_EMAIL":     "admin@your-domain.com",
     "DATABASE_URL":            "postgresql://opengecko:YOUR_DB_PASSWORD@db:5432/opengecko",
     "CORS_ORIGINS":            "https://your-domain.com",
+    "RATE_LIMIT_STORAGE_URI":  "database://",
     "S3_ACCESS_KEY":           "REPLACE_WITH_MINIO_ACCESS_KEY",
     "S3_SECRET_KEY":           "REPLACE_WITH_MINIO_SECRET_KEY",
 }
@@ -4,26 +4,54 @@ Pytest configuration and shared fixtures for API tests.
 
 import os
 import tempfile
-from typing import Generator
+from collections.abc import Callable, Generator
+from contextlib import nullcontext
 
 # Set shorter JWT_SECRET_KEY for testing (to avoid bcrypt 72 byte limit)
 os.environ["JWT_SECRET_KEY"] = "test-secret-key"
+# 测试用例共用同一社区 ID，放宽社区总配额以免跨用例累计触发 429
+os.environ["RATE_LIMIT_COMMUNITY"] = "100000/minute"
+# 后台任务由用例通过 run_jobs 在测试 Session 内同步执行，不启动嵌入 worker 线程
+os.environ["JOB_WORKER_EMBEDDED"] = "false"
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 
-from app.database import Base, get_db
+from app.core.count_cache import count_cache
+from app.core.principal_cache import principal_cache
+from app.core.security import create_access_token, get_password_hash
+from app.database import Base, get_async_db, get_async_read_db, get_db, get_read_db
 from app.main import app
-from app.models.user import User, community_users
 from app.models.community import Community
-from app.models.channel import ChannelConfig
-from app.models.content import Content
-from app.models.publish_record import PublishRecord, ContentAnalytics
-from app.models.audit import AuditLog
-from app.models.password_reset import PasswordResetToken
-from app.core.security import get_password_hash, create_access_token
+from app.models.user import User, community_users
+from app.services.email import smtp_pool
+from app.services.jobs import JobWorker
+
+
+@pytest.fixture(autouse=True)
+def _reset_principal_cache():
+    """每个用例之间清空认证主体缓存：各用例事务回滚后用户 ID 会被复用。"""
+    principal_cache.invalidate()
+    yield
+    principal_cache.invalidate()
+
+
+@pytest.fixture(autouse=True)
+def _reset_count_cache():
+    """每个用例之间清空 COUNT 缓存：用例数据随事务回滚消失，不经过 after_commit 失效。"""
+    count_cache.clear()
+    yield
+    count_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def _reset_smtp_pool():
+    """用例结束后关闭池中的 SMTP 连接：各用例 patch 的 smtplib 替身不能被下一个用例复用。"""
+    yield
+    smtp_pool.close_all()
 
 
 # Test database setup
@@ -77,12 +105,41 @@ def client(db_session: Session) -> Generator[TestClient, None, None]:
         finally:
             pass
 
+    async def override_get_async_db():
+        # 复用同一个同步测试 Session：AsyncSession 通过 greenlet 代理到 db_session，
+        # 测试数据在同一事务内可见，且随测试结束一并回滚
+        yield AsyncSession(sync_session_class=lambda **_: db_session)
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="function")
+def run_jobs(db_session: Session) -> Callable[[], int]:
+    """返回一个函数：在测试 Session 内执行完所有已入队的后台任务，返回执行条数。"""
+    worker = JobWorker(lambda: nullcontext(db_session), worker_id="test-worker")
+    return worker.run_pending
+
+
+@pytest.fixture(scope="function")
+def complete_job(client: TestClient, auth_headers: dict, run_jobs: Callable[[], int]) -> Callable:
+    """断言接口返回 202 后执行队列，返回 GET /api/jobs/{id} 的任务详情。"""
+
+    def _complete(response) -> dict:
+        assert response.status_code == 202, response.text
+        run_jobs()
+        job = client.get(f"/api/jobs/{response.json()['id']}", headers=auth_headers)
+        assert job.status_code == 200, job.text
+        return job.json()
+
+    return _complete
+
+
 # Test data fixtures
 @pytest.fixture(scope="function")
 def test_community(db_session: Session) -> Community:
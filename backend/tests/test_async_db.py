@@ -0,0 +1,266 @@
+"""
+Tests for the async database path (get_async_db / AsyncSession).
+
+conftest.py 中的 client 会把 get_async_db 代理到同步测试 Session，
+这里改用真实的 aiosqlite 引擎，确保迁移到 AsyncSession 的路由
+不存在隐式懒加载（MissingGreenlet）等问题。
+
+Endpoints covered:
+- /api/design-tasks/*
+- /api/assets/*
+- /api/contents/{id}/assets/*
+- /api/users/me/dashboard
+"""
+import os
+import tempfile
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.security import create_access_token, get_password_hash
+from app.database import Base, get_async_db, get_async_read_db, get_db, get_read_db, to_async_url
+from app.main import app
+from app.models.community import Community
+from app.models.content import Content
+from app.models.design import Asset
+from app.models.user import User, community_users
+from app.services.storage import LocalStorage
+
+
+@pytest.fixture
+def async_env():
+    """独立的 SQLite 文件库：同步 Session 写入并提交，异步 Session 读取。"""
+    fd, path = tempfile.mkstemp(suffix=".db")
+    os.close(fd)
+    url = f"sqlite:///{path}"
+    sync_engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=sync_engine)
+    SyncSession = sessionmaker(bind=sync_engine, autoflush=False)
+    async_engine = create_async_engine(to_async_url(url))
+    AsyncTestSession = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+    db = SyncSession()
+    community = Community(name="Async Community", slug="async-community", is_active=True)
+    db.add(community)
+    db.flush()
+    user = User(
+        username="asyncuser",
+        email="async@example.com",
+        hashed_password=get_password_hash("password"),
+        full_name="Async User",
+        is_active=True,
+    )
+    db.add(user)
+    db.flush()
+    db.execute(insert(community_users).values(user_id=user.id, community_id=community.id, role="user"))
+    db.commit()
+
+    def override_get_db():
+        session = SyncSession()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    async def override_get_async_db():
+        async with AsyncTestSession() as session:
+            yield session
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_async_read_db] = override_get_async_db
+    headers = {
+        "Authorization": f"Bearer {create_access_token(data={'sub': user.username})}",
+        "X-Community-Id": str(community.id),
+    }
+    try:
+        with TestClient(app) as client:
+            yield {"client": client, "db": db, "user": user, "community": community, "headers": headers}
+    finally:
+        app.dependency_overrides.clear()
+        db.close()
+        sync_engine.dispose()
+        os.unlink(path)
+
+
+class TestAsyncUrl:
+    def test_sqlite_url(self):
+        assert to_async_url("sqlite:///./data/opengecko.db") == "sqlite+aiosqlite:///./data/opengecko.db"
+
+    def test_postgres_url_keeps_credentials(self):
+        assert (
+            to_async_url("postgresql+psycopg2://u:secret@db:5432/gecko")
+            == "postgresql+asyncpg://u:secret@db:5432/gecko"
+        )
+
+    def test_unsupported_backend(self):
+        with pytest.raises(ValueError):
+            to_async_url("oracle://u:p@host/db")
+
+
+class TestDesignTasksAsync:
+    def test_crud_roundtrip(self, async_env):
+        client, headers = async_env["client"], async_env["headers"]
+        user = async_env["user"]
+
+        resp = client.post(
+            "/api/design-tasks/",
+            json={"title": "海报设计", "task_type": "poster", "assignee_id": user.id},
+            headers=headers,
+        )
+        assert resp.status_code == 201
+        task = resp.json()
+        assert task["assignee_name"] == "Async User"
+
+        resp = client.get("/api/design-tasks/", headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["total"] == 1
+        assert resp.json()["items"][0]["assignee_name"] == "Async User"
+
+        resp = client.patch(f"/api/design-tasks/{task['id']}/status", json={"status": "review"}, headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["status"] == "review"
+
+        resp = client.put(f"/api/design-tasks/{task['id']}", json={"title": "新海报"}, headers=headers)
+        assert resp.status_code == 200
+        assert resp.json()["title"] == "新海报"
+
+        assert client.delete(f"/api/design-tasks/{task['id']}", headers=headers).status_code == 204
+        assert client.get(f"/api/design-tasks/{task['id']}", headers=headers).status_code == 404
+
+
+class TestAssetsAsync:
+    def test_upload_list_update_delete(self, async_env, tmp_path):
+        client, headers = async_env["client"], async_env["headers"]
+
+        with patch("app.api.assets.get_storage", return_value=LocalStorage(str(tmp_path))):
+            resp = client.post(
+                "/api/assets/upload",
+                files={"file": ("logo.png", b"\x89PNG fake", "image/png")},
+                data={"name": "Logo", "asset_type": "image", "tags": "brand, logo"},
+                headers=headers,
+            )
+            assert resp.status_code == 201
+            asset = resp.json()
+            assert asset["uploader_name"] == "Async User"
+            assert asset["tags"] == ["brand", "logo"]
+
+            resp = client.get("/api/assets/", params={"tags": "brand"}, headers=headers)
+            assert resp.status_code == 200
+            assert resp.json()["total"] == 1
+
+            resp = client.put(f"/api/assets/{asset['id']}", json={"name": "New Logo"}, headers=headers)
+            assert resp.status_code == 200
+            assert resp.json()["name"] == "New Logo"
+
+            assert client.delete(f"/api/assets/{asset['id']}", headers=headers).status_code == 204
+            assert client.get(f"/api/assets/{asset['id']}", headers=headers).status_code == 404
+
+    def test_non_owner_cannot_update(self, async_env):
+        client, headers, db = async_env["client"], async_env["headers"], async_env["db"]
+        asset = Asset(
+            name="Other",
+            asset_type="image",
+            file_url="/uploads/x.png",
+            file_key="x.png",
+            community_id=async_env["community"].id,
+            uploaded_by_user_id=None,
+        )
+        db.add(asset)
+        db.commit()
+
+        resp = client.put(f"/api/assets/{asset.id}", json={"name": "Hacked"}, headers=headers)
+        assert resp.status_code == 403
+
+
+class TestContentAssetLinksAsync:
+    def test_link_and_unlink(self, async_env):
+        client, headers, db = async_env["client"], async_env["headers"], async_env["db"]
+        user = async_env["user"]
+        content = Content(
+            title="Linked",
+            content_markdown="body",
+            community_id=async_env["community"].id,
+            owner_id=user.id,
+            created_by_user_id=user.id,
+        )
+        asset = Asset(
+            name="Banner",
+            asset_type="image",
+            file_url="/uploads/banner.png",
+            file_key="banner.png",
+            community_id=async_env["community"].id,
+            uploaded_by_user_id=user.id,
+        )
+        db.add_all([content, asset])
+        db.commit()
+
+        resp = client.post(f"/api/contents/{content.id}/assets/{asset.id}", headers=headers)
+        assert resp.status_code == 201
+        assert resp.json()["uploader_name"] == "Async User"
+
+        resp = client.get(f"/api/contents/{content.id}/assets", headers=headers)
+        assert [a["id"] for a in resp.json()] == [asset.id]
+
+        resp = client.delete(f"/api/contents/{content.id}/assets/{asset.id}", headers=headers)
+        assert resp.status_code == 204
+        assert client.get(f"/api/contents/{content.id}/assets", headers=headers).json() == []
+
+    def test_collaborator_can_link(self, async_env):
+        client, headers, db = async_env["client"], async_env["headers"], async_env["db"]
+        owner = User(username="owner", email="owner@example.com", hashed_password="x", is_active=True)
+        db.add(owner)
+        db.flush()
+        content = Content(
+            title="Shared",
+            content_markdown="body",
+            community_id=async_env["community"].id,
+            owner_id=owner.id,
+        )
+        content.collaborators.append(db.get(User, async_env["user"].id))
+        asset = Asset(
+            name="Icon",
+            asset_type="icon",
+            file_url="/uploads/icon.svg",
+            file_key="icon.svg",
+            community_id=async_env["community"].id,
+        )
+        db.add_all([content, asset])
+        db.commit()
+
+        resp = client.post(f"/api/contents/{content.id}/assets/{asset.id}", headers=headers)
+        assert resp.status_code == 201
+
+
+class TestDashboardAsync:
+    def test_dashboard_loads_relations_eagerly(self, async_env):
+        client, headers, db = async_env["client"], async_env["headers"], async_env["db"]
+        user = db.get(User, async_env["user"].id)
+        content = Content(
+            title="Mine",
+            content_markdown="body",
+            community_id=async_env["community"].id,
+            created_by_user_id=user.id,
+        )
+        content.assignees.append(user)
+        db.add(content)
+        db.commit()
+
+        resp = client.get("/api/users/me/dashboard", headers=headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["contents"][0]["creator_name"] == "asyncuser"
+        assert data["contents"][0]["assignee_count"] == 1
+
+        resp = client.patch(
+            f"/api/users/me/contents/{content.id}/work-status",
+            json={"work_status": "in_progress"},
+            headers=headers,
+        )
+        assert resp.status_code == 200
+        assert resp.json()["old_status"] == "planning"
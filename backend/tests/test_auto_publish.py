@@ -0,0 +1,196 @@
+"""定时自动发布测试。"""
+import os
+import sqlite3
+import subprocess
+import sys
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.timezone import utc_now
+from app.models.channel import ChannelConfig
+from app.models.community import Community
+from app.models.content import Content
+from app.models.publish_record import PublishRecord
+from app.services.auto_publish import claim_due_contents, publish_due_contents, run_auto_publish
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _now() -> datetime:
+    return utc_now().replace(tzinfo=None)
+
+
+@pytest.fixture
+def channels(db_session: Session, test_community: Community) -> None:
+    db_session.add_all([
+        ChannelConfig(community_id=test_community.id, channel="wechat", config={}, enabled=True),
+        ChannelConfig(community_id=test_community.id, channel="hugo", config={}, enabled=True),
+        ChannelConfig(community_id=test_community.id, channel="csdn", config={}, enabled=True),
+    ])
+    db_session.commit()
+
+
+@pytest.fixture
+def publishers():
+    """拦截公众号与 Hugo 的实际发布。"""
+    with patch(
+        "app.services.auto_publish.prepare_wechat_article", new=AsyncMock(return_value=("<p>html</p>", "thumb"))
+    ), patch(
+        "app.services.auto_publish.wechat_service.create_draft", new=AsyncMock(return_value={"media_id": "m1"})
+    ) as create_draft, patch(
+        "app.services.auto_publish.hugo_service.save_post", return_value="/site/content/posts/a.md"
+    ) as save_post:
+        yield create_draft, save_post
+
+
+@pytest.fixture
+def make_content(db_session: Session, test_community: Community):
+    def factory(title: str, due_in: timedelta = -timedelta(minutes=1), status: str = "approved") -> Content:
+        content = Content(
+            title=title,
+            content_markdown=f"# {title}",
+            content_html=f"<h1>{title}</h1>",
+            community_id=test_community.id,
+            source_type="contribution",
+            status=status,
+            scheduled_publish_at=_now() + due_in,
+        )
+        db_session.add(content)
+        db_session.commit()
+        return content
+
+    return factory
+
+
+def _records(db: Session, content: Content) -> list[tuple[str, str]]:
+    rows = db.query(PublishRecord).filter(PublishRecord.content_id == content.id).order_by(PublishRecord.channel)
+    return [(r.channel, r.status) for r in rows]
+
+
+class TestAutoPublish:
+    def test_publishes_due_approved_contents(self, db_session: Session, make_content, channels, publishers):
+        create_draft, save_post = publishers
+        due = make_content("到期")
+        future = make_content("未到期", due_in=timedelta(hours=1))
+        draft = make_content("未审核", status="draft")
+
+        assert publish_due_contents(db_session, "w1") == 1
+        assert _records(db_session, due) == [("hugo", "published"), ("wechat", "draft")]
+        assert create_draft.await_count == 1 and save_post.call_count == 1
+
+        db_session.refresh(due)
+        assert (due.auto_publish_status, due.auto_publish_locked_by, due.status) == ("published", None, "approved")
+        for content in (future, draft):
+            db_session.refresh(content)
+            assert content.auto_publish_status is None
+        assert publish_due_contents(db_session, "w1") == 0
+
+    def test_failure_recorded_per_channel(self, db_session: Session, make_content, channels, publishers):
+        create_draft, _ = publishers
+        create_draft.side_effect = ValueError("WeChat not configured")
+        content = make_content("到期")
+
+        publish_due_contents(db_session, "w1")
+        assert _records(db_session, content) == [("hugo", "published"), ("wechat", "failed")]
+        record = db_session.query(PublishRecord).filter_by(content_id=content.id, channel="wechat").one()
+        assert record.error_message == "WeChat not configured"
+        db_session.refresh(content)
+        assert content.auto_publish_status == "failed"
+
+    def test_skipped_without_enabled_channels(self, db_session: Session, make_content, publishers):
+        content = make_content("到期")
+        assert publish_due_contents(db_session, "w1") == 1
+        db_session.refresh(content)
+        assert content.auto_publish_status == "skipped"
+        assert _records(db_session, content) == []
+
+    def test_claim_is_exclusive(self, db_session: Session, make_content):
+        make_content("A")
+        make_content("B")
+        assert len(claim_due_contents(db_session, "w1", 1)) == 1
+        assert len(claim_due_contents(db_session, "w2", 10)) == 1
+        assert claim_due_contents(db_session, "w3", 10) == []
+
+    def test_expired_lease_only_retries_missing_channels(
+        self, db_session: Session, make_content, test_community: Community, channels, publishers
+    ):
+        create_draft, save_post = publishers
+        content = make_content("到期")
+        (claimed,) = claim_due_contents(db_session, "crashed", 10)
+        # 崩溃前公众号草稿已创建成功
+        db_session.add(PublishRecord(
+            content_id=content.id, channel="wechat", status="draft", community_id=test_community.id
+        ))
+        db_session.commit()
+        assert publish_due_contents(db_session, "w2") == 0
+
+        db_session.execute(
+            update(Content)
+            .where(Content.id == content.id)
+            .values(auto_publish_locked_until=utc_now() - timedelta(seconds=1))
+        )
+        db_session.commit()
+        assert publish_due_contents(db_session, "w2") == 1
+        create_draft.assert_not_awaited()
+        assert save_post.call_count == 1
+        assert _records(db_session, content) == [("hugo", "published"), ("wechat", "draft")]
+
+    def test_run_drains_all_batches(
+        self, db_session: Session, make_content, channels, publishers, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "AUTO_PUBLISH_BATCH_SIZE", 2)
+        for n in range(5):
+            make_content(f"内容 {n}")
+        assert run_auto_publish(lambda: nullcontext(db_session)) == 5
+        assert db_session.query(PublishRecord).count() == 10
+
+
+class TestReschedule:
+    def test_schedule_change_resets_status(
+        self, client: TestClient, auth_headers: dict, db_session: Session, make_content, publishers
+    ):
+        content = make_content("到期")
+        publish_due_contents(db_session, "w1")
+        db_session.refresh(content)
+        assert content.auto_publish_status == "skipped"
+
+        r = client.patch(
+            f"/api/contents/{content.id}/schedule",
+            json={"scheduled_publish_at": (_now() + timedelta(days=1)).isoformat()},
+            headers=auth_headers,
+        )
+        assert r.status_code == 200
+        assert r.json()["auto_publish_status"] is None
+
+
+class TestMigration:
+    def test_existing_past_schedules_not_auto_published(self, tmp_path):
+        """升级前已存在、排期已过的内容标记为 skipped，不会在首次扫描时被推送。"""
+        db_file = tmp_path / "upgrade.db"
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_file}"}
+
+        def alembic(*args: str) -> None:
+            subprocess.run([sys.executable, "-m", "alembic", *args], cwd=BACKEND_DIR, env=env,
+                           check=True, capture_output=True)
+
+        alembic("upgrade", "009_meeting_reminder_dispatch")
+        past = (_now() - timedelta(days=30)).isoformat(sep=" ")
+        future = (_now() + timedelta(days=1)).isoformat(sep=" ")
+        with sqlite3.connect(db_file) as conn:
+            conn.executemany(
+                "INSERT INTO contents (id, title, status, scheduled_publish_at) VALUES (?, ?, ?, ?)",
+                [(1, "历史", "approved", past), (2, "排期", "approved", future), (3, "未排期", "approved", None)],
+            )
+        alembic("upgrade", "010_content_auto_publish")
+
+        with sqlite3.connect(db_file) as conn:
+            rows = dict(conn.execute("SELECT id, auto_publish_status FROM contents"))
+        assert rows == {1: "skipped", 2: None, 3: None}
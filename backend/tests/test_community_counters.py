@@ -0,0 +1,184 @@
+"""社区计数表增量维护与定时校正测试。"""
+from contextlib import nullcontext
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign
+from app.models.channel import ChannelConfig
+from app.models.committee import Committee
+from app.models.community import Community
+from app.models.community_counter import CommunityCounter
+from app.models.content import Content
+from app.models.user import User, community_users
+from app.services.community_counters import _recount, community_counts, reconcile_counters, run_counter_reconcile
+
+
+def _stored(db: Session, community_id: int) -> dict[str, int] | None:
+    exists = db.scalar(select(CommunityCounter.community_id).where(CommunityCounter.community_id == community_id))
+    return community_counts(db, community_id) if exists else None
+
+
+@pytest.fixture
+def assert_in_sync(db_session: Session, test_community: Community):
+    def check(**expected: int) -> None:
+        stored = _stored(db_session, test_community.id)
+        assert stored == _recount(db_session, test_community.id)
+        for field, value in expected.items():
+            assert stored[field] == value, field
+
+    return check
+
+
+class TestIncremental:
+    def test_new_community_gets_row(self, db_session: Session, test_community: Community, assert_in_sync):
+        assert_in_sync(total_contents=0, total_members=0)
+
+    def test_content_status_changes(self, db_session: Session, test_community: Community, assert_in_sync):
+        draft = Content(title="草稿", community_id=test_community.id)
+        reviewing = Content(title="待审", community_id=test_community.id, status="reviewing")
+        db_session.add_all([draft, reviewing])
+        db_session.commit()
+        assert_in_sync(total_contents=2, draft_contents=1, reviewing_contents=1)
+
+        # 提交后对象已过期，赋值时仍能取到旧状态
+        reviewing.status = "published"
+        draft.status = "approved"
+        db_session.commit()
+        assert_in_sync(total_contents=2, draft_contents=0, reviewing_contents=0, published_contents=1)
+
+        db_session.delete(reviewing)
+        db_session.commit()
+        assert_in_sync(total_contents=1, published_contents=0)
+
+    def test_content_moved_between_communities(
+        self, db_session: Session, test_community: Community, test_another_community: Community, assert_in_sync
+    ):
+        content = Content(title="迁移", community_id=test_community.id, status="published")
+        db_session.add(content)
+        db_session.commit()
+
+        content.community_id = test_another_community.id
+        db_session.commit()
+        assert_in_sync(total_contents=0, published_contents=0)
+        assert community_counts(db_session, test_another_community.id)["published_contents"] == 1
+
+    def test_governance_and_campaigns(self, db_session: Session, test_community: Community, assert_in_sync):
+        committee = Committee(community_id=test_community.id, name="技术委员会", slug="tech")
+        channel = ChannelConfig(community_id=test_community.id, channel="wechat", config={}, enabled=False)
+        campaign = Campaign(community_id=test_community.id, name="推广", type="promotion", status="active")
+        db_session.add_all([committee, channel, campaign])
+        db_session.commit()
+        assert_in_sync(total_committees=1, active_channels=0, active_campaigns=1)
+
+        channel.enabled = True
+        campaign.status = "completed"
+        db_session.commit()
+        assert_in_sync(active_channels=1, active_campaigns=0)
+
+        db_session.delete(committee)
+        db_session.commit()
+        assert_in_sync(total_committees=0)
+
+    def test_members_via_relationship_and_statements(
+        self, db_session: Session, test_community: Community, test_user: User, test_superuser: User, assert_in_sync
+    ):
+        # conftest 直接 INSERT community_users
+        assert_in_sync(total_members=2)
+
+        db_session.execute(
+            delete(community_users).where(
+                community_users.c.user_id == test_user.id, community_users.c.community_id == test_community.id
+            )
+        )
+        db_session.commit()
+        assert_in_sync(total_members=1)
+
+        db_session.refresh(test_community)
+        test_community.members.append(test_user)
+        db_session.commit()
+        assert_in_sync(total_members=2)
+
+        test_user.communities.remove(test_community)
+        db_session.commit()
+        assert_in_sync(total_members=1)
+
+    def test_community_delete_removes_row(self, db_session: Session, test_community: Community):
+        db_session.add(Content(title="随社区删除", community_id=test_community.id))
+        db_session.commit()
+        community_id = test_community.id
+
+        db_session.delete(test_community)
+        db_session.commit()
+        assert _stored(db_session, community_id) is None
+
+    def test_rollback_discards_increment(self, db_session: Session, test_community: Community, assert_in_sync):
+        nested = db_session.begin_nested()
+        db_session.add(Content(title="回滚", community_id=test_community.id))
+        db_session.flush()
+        nested.rollback()
+        assert_in_sync(total_contents=0)
+
+
+class TestReconcile:
+    def test_repairs_drift_and_missing_rows(
+        self, db_session: Session, test_community: Community, test_another_community: Community, assert_in_sync
+    ):
+        db_session.add(Content(title="A", community_id=test_community.id, status="published"))
+        db_session.commit()
+        # 绕过 Session 的写入
+        db_session.connection().execute(
+            update(CommunityCounter)
+            .where(CommunityCounter.community_id == test_community.id)
+            .values(total_contents=7, published_contents=0)
+        )
+        db_session.connection().execute(
+            delete(CommunityCounter).where(CommunityCounter.community_id == test_another_community.id)
+        )
+
+        assert reconcile_counters(db_session) == 2
+        assert_in_sync(total_contents=1, published_contents=1)
+        assert _stored(db_session, test_another_community.id) is not None
+        assert run_counter_reconcile(lambda: nullcontext(db_session)) == {"repaired": 0}
+
+    def test_drops_rows_of_missing_communities(self, db_session: Session, test_community: Community):
+        db_session.connection().execute(insert(CommunityCounter).values(community_id=99999, total_contents=3))
+        reconcile_counters(db_session)
+        assert _stored(db_session, 99999) is None
+
+
+class TestDashboardReadsCounters:
+    def test_metrics_come_from_counter_row(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community,
+        superuser_auth_headers: dict,
+    ):
+        db_session.connection().execute(
+            update(CommunityCounter)
+            .where(CommunityCounter.community_id == test_community.id)
+            .values(total_contents=42, total_members=5)
+        )
+
+        metrics = client.get(f"/api/communities/{test_community.id}/dashboard", headers=auth_headers).json()["metrics"]
+        assert (metrics["total_contents"], metrics["total_members"]) == (42, 5)
+
+        overview = client.get("/api/communities/overview/stats", headers=superuser_auth_headers).json()
+        item = next(c for c in overview["communities"] if c["id"] == test_community.id)
+        assert (item["contents_count"], item["members_count"]) == (42, 5)
+
+    def test_missing_row_falls_back_to_live_counts(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+    ):
+        db_session.connection().execute(
+            delete(CommunityCounter).where(CommunityCounter.community_id == test_community.id)
+        )
+        metrics = client.get(f"/api/communities/{test_community.id}/dashboard", headers=auth_headers).json()["metrics"]
+        assert metrics["total_members"] == 1
+
+    def test_api_writes_update_counters(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+    ):
+        r = client.post("/api/contents", json={"title": "经接口创建", "content_markdown": "x", "community_ids": [test_community.id]}, headers=auth_headers)
+        assert r.status_code == 201, r.text
+        assert community_counts(db_session, test_community.id)["total_contents"] == 1
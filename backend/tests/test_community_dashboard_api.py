@@ -544,3 +544,63 @@ class TestCommunityDashboardCoverage:
         ]
         # 48 小时活动应产生 2 个日历条目
         assert len(event_entries) >= 2
+
+
+class TestCommunityDashboardQueryCount:
+    """工作台的 SQL 语句数固定，不随内容 / 活动 / 发布记录数量增长。"""
+
+    def _seed(self, db_session: Session, community: Community, owners: list[User], n: int) -> None:
+        for i in range(n):
+            owner = owners[i % len(owners)]
+            content = _create_content(db_session, community.id, owner.id, f"文章 {n}-{i}", status="published")
+            db_session.add(PublishRecord(
+                content_id=content.id,
+                community_id=community.id,
+                channel="wechat",
+                status="published",
+                published_at=datetime.utcnow() - timedelta(days=i),
+            ))
+            db_session.add(Campaign(
+                community_id=community.id,
+                owner_ids=[u.id for u in owners],
+                name=f"活动 {n}-{i}",
+                type="promotion",
+                status="active",
+            ))
+        db_session.commit()
+
+    def _get(self, client: TestClient, community: Community, headers: dict):
+        response = client.get(f"/api/communities/{community.id}/dashboard", headers=headers)
+        assert response.status_code == 200
+        return int(response.headers["x-db-queries"]), response.json()
+
+    def test_constant_query_count(
+        self,
+        client: TestClient,
+        auth_headers: dict,
+        test_community: Community,
+        test_user: User,
+        test_superuser: User,
+        db_session: Session,
+    ):
+        owners = [test_user, test_superuser]
+        self._seed(db_session, test_community, owners, 1)
+        self._get(client, test_community, auth_headers)  # 预热认证缓存
+        baseline, _ = self._get(client, test_community, auth_headers)
+
+        self._seed(db_session, test_community, owners, 8)
+        queries, data = self._get(client, test_community, auth_headers)
+        assert queries == baseline
+
+        assert data["metrics"]["total_contents"] == 9
+        assert data["metrics"]["published_contents"] == 9
+        assert data["metrics"]["active_campaigns"] == 9
+        assert sum(m["count"] for m in data["monthly_trend"]) == 9
+        assert data["monthly_trend"][-1]["month"] == datetime.utcnow().strftime("%Y-%m")
+        assert all(c["owner_name"] for c in data["recent_contents"])
+        assert data["recent_campaigns"][0]["owner_name"] == ", ".join(
+            u.full_name or u.username for u in owners
+        )
+        publish_events = [e for e in data["calendar_events"] if e["type"] == "publish"]
+        assert len(publish_events) == 9
+        assert all(e["title"].startswith("文章") for e in publish_events)
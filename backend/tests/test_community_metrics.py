@@ -0,0 +1,229 @@
+"""社区每日指标快照与指标历史接口测试。"""
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign
+from app.models.committee import Committee
+from app.models.community import Community
+from app.models.community_metrics import FLOW_FIELDS, STATE_FIELDS, CommunityMetricsDaily
+from app.models.content import Content
+from app.models.meeting import Meeting
+from app.models.publish_record import PublishRecord
+from app.models.user import User
+from app.models.wechat_stats import WechatArticleStat
+from app.services.community_metrics import metrics_history, run_metrics_snapshot, snapshot_metrics
+
+# APP_TIMEZONE 默认 Asia/Shanghai：2026-10-10 对应 UTC 10-09 16:00 ~ 10-10 16:00
+DAY = date(2026, 10, 10)
+
+
+def _utc(*args: int) -> datetime:
+    return datetime(*args, tzinfo=UTC)
+
+
+def _snapshot_row(db: Session, community_id: int, day: date) -> CommunityMetricsDaily:
+    return db.scalars(
+        select(CommunityMetricsDaily).where(
+            CommunityMetricsDaily.community_id == community_id,
+            CommunityMetricsDaily.snapshot_date == day,
+        )
+    ).one()
+
+
+def _seed_snapshots(db: Session, community_id: int, days: dict[date, dict[str, int]]) -> None:
+    db.execute(
+        insert(CommunityMetricsDaily),
+        [
+            {
+                "community_id": community_id,
+                "snapshot_date": day,
+                **dict.fromkeys(STATE_FIELDS + FLOW_FIELDS, 0),
+                **values,
+            }
+            for day, values in days.items()
+        ],
+    )
+    db.commit()
+
+
+@contextmanager
+def table_reads(db: Session, *tables: str) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if any(f"FROM {table}" in statement or f"JOIN {table}" in statement for table in tables):
+            statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+
+
+class TestSnapshot:
+    @pytest.fixture
+    def activity(self, db_session: Session, test_community: Community, test_user: User):
+        """前一天的发布、会议与阅读数据，以及边界外的干扰数据。"""
+        content = Content(title="已发布", community_id=test_community.id, status="published")
+        draft = Content(title="草稿", community_id=test_community.id)
+        committee = Committee(community_id=test_community.id, name="技术委员会", slug="tech")
+        db_session.add_all([
+            content,
+            draft,
+            committee,
+            Campaign(community_id=test_community.id, name="推广", type="promotion", status="active"),
+        ])
+        db_session.flush()
+
+        def publish(channel: str, published_at: datetime, status: str = "published") -> PublishRecord:
+            record = PublishRecord(
+                content_id=content.id, community_id=test_community.id,
+                channel=channel, status=status, published_at=published_at,
+            )
+            db_session.add(record)
+            return record
+
+        wechat = publish("wechat", _utc(2026, 10, 9, 16, 0))      # 当天 00:00（本地）
+        late = publish("wechat", _utc(2026, 10, 10, 15, 59))       # 当天 23:59（本地）
+        publish("hugo", _utc(2026, 10, 10, 8, 0))
+        publish("csdn", _utc(2026, 10, 10, 8, 0), status="failed")
+        publish("zhihu", _utc(2026, 10, 10, 16, 0))                # 次日（本地）
+
+        def meeting(scheduled_at: datetime, status: str = "scheduled") -> None:
+            db_session.add(Meeting(
+                committee_id=committee.id, community_id=test_community.id,
+                title="例会", scheduled_at=scheduled_at, status=status,
+            ))
+
+        meeting(datetime(2026, 10, 10, 2, 0), status="completed")
+        meeting(datetime(2026, 10, 10, 3, 0), status="cancelled")
+        meeting(datetime(2026, 10, 9, 15, 0))                      # 前一天（本地）
+        db_session.flush()
+
+        for record, stat_date, reads in ((wechat, DAY, 120), (late, DAY, 30), (wechat, DAY - timedelta(days=1), 999)):
+            db_session.add(WechatArticleStat(
+                publish_record_id=record.id, community_id=test_community.id,
+                stat_date=stat_date, read_count=reads,
+            ))
+        db_session.commit()
+
+    def test_writes_state_and_flow_metrics(
+        self, db_session: Session, test_community: Community, test_another_community: Community, activity
+    ):
+        assert snapshot_metrics(db_session, DAY) == 2
+
+        row = _snapshot_row(db_session, test_community.id, DAY)
+        assert (row.total_contents, row.published_contents, row.draft_contents) == (2, 1, 1)
+        assert (row.total_members, row.active_campaigns) == (1, 1)
+        assert (row.wechat_publishes, row.hugo_publishes, row.csdn_publishes, row.zhihu_publishes) == (2, 1, 0, 0)
+        assert row.meetings_held == 1
+        assert row.wechat_reads == 150
+
+        # 没有任何数据的社区也有一行，便于图表连续
+        empty = _snapshot_row(db_session, test_another_community.id, DAY)
+        assert all(getattr(empty, field) == 0 for field in STATE_FIELDS + FLOW_FIELDS)
+
+    def test_rerun_overwrites_same_day(self, db_session: Session, test_community: Community, activity):
+        snapshot_metrics(db_session, DAY)
+        db_session.add(Content(title="新增", community_id=test_community.id))
+        db_session.commit()
+
+        snapshot_metrics(db_session, DAY)
+        assert _snapshot_row(db_session, test_community.id, DAY).total_contents == 3
+
+    def test_job_snapshots_previous_local_day(self, db_session: Session, test_community: Community, monkeypatch):
+        # UTC 10-10 17:00 即本地 10-11 01:00，快照本地前一天 10-10
+        monkeypatch.setattr("app.services.community_metrics.utc_now", lambda: _utc(2026, 10, 10, 17, 0))
+        assert run_metrics_snapshot(lambda: nullcontext(db_session)) == {"date": "2026-10-10", "communities": 1}
+        assert _snapshot_row(db_session, test_community.id, DAY).total_contents == 0
+
+
+class TestHistory:
+    @pytest.fixture
+    def snapshots(self, db_session: Session, test_community: Community):
+        # 2026-09-28 为周一
+        _seed_snapshots(db_session, test_community.id, {
+            date(2026, 9, 28): {"total_contents": 10, "wechat_publishes": 1, "wechat_reads": 100},
+            date(2026, 9, 30): {"total_contents": 12, "wechat_publishes": 2, "wechat_reads": 50},
+            date(2026, 10, 1): {"total_contents": 13, "hugo_publishes": 1, "meetings_held": 1},
+            date(2026, 10, 6): {"total_contents": 15, "wechat_publishes": 4},
+        })
+
+    def test_day_granularity_returns_each_snapshot(self, db_session: Session, test_community: Community, snapshots):
+        points = metrics_history(db_session, test_community.id, date(2026, 9, 29), date(2026, 10, 6), "day")
+        assert [p["period_start"] for p in points] == [date(2026, 9, 30), date(2026, 10, 1), date(2026, 10, 6)]
+        assert points[0]["wechat_reads"] == 50
+
+    def test_week_takes_last_state_and_sums_flows(
+        self, db_session: Session, test_community: Community, snapshots
+    ):
+        points = metrics_history(db_session, test_community.id, date(2026, 9, 1), date(2026, 10, 31), "week")
+        assert [p["period_start"] for p in points] == [date(2026, 9, 28), date(2026, 10, 5)]
+        first = points[0]
+        assert first["total_contents"] == 13
+        assert (first["wechat_publishes"], first["hugo_publishes"], first["meetings_held"]) == (3, 1, 1)
+        assert first["wechat_reads"] == 150
+
+    def test_month_buckets(self, db_session: Session, test_community: Community, snapshots):
+        points = metrics_history(db_session, test_community.id, date(2026, 9, 1), date(2026, 10, 31), "month")
+        assert [(p["period_start"], p["total_contents"], p["wechat_publishes"]) for p in points] == [
+            (date(2026, 9, 1), 12, 3),
+            (date(2026, 10, 1), 15, 4),
+        ]
+
+
+class TestHistoryEndpoint:
+    def _url(self, community_id: int) -> str:
+        return f"/api/communities/{community_id}/metrics/history"
+
+    def test_reads_only_snapshot_table(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community
+    ):
+        _seed_snapshots(db_session, test_community.id, {
+            date(2026, 10, 1): {"total_contents": 5, "zhihu_publishes": 2},
+            date(2026, 10, 2): {"total_contents": 6, "zhihu_publishes": 1},
+        })
+
+        with table_reads(db_session, "contents", "publish_records", "meetings", "wechat_article_stats") as reads:
+            r = client.get(
+                self._url(test_community.id),
+                params={"from": "2026-10-01", "to": "2026-10-31", "granularity": "month"},
+                headers=auth_headers,
+            )
+        assert r.status_code == 200, r.text
+        assert reads == []
+
+        body = r.json()
+        assert (body["granularity"], body["start_date"], body["end_date"]) == ("month", "2026-10-01", "2026-10-31")
+        assert body["points"] == [{
+            "period_start": "2026-10-01",
+            **dict.fromkeys(STATE_FIELDS + FLOW_FIELDS, 0),
+            "total_contents": 6,
+            "zhihu_publishes": 3,
+        }]
+
+    def test_defaults_to_last_90_days(self, client: TestClient, auth_headers: dict, test_community: Community):
+        body = client.get(self._url(test_community.id), headers=auth_headers).json()
+        start, end = date.fromisoformat(body["start_date"]), date.fromisoformat(body["end_date"])
+        assert (body["granularity"], (end - start).days, body["points"]) == ("day", 90, [])
+
+    @pytest.mark.parametrize("params", [{"granularity": "year"}, {"from": "2026-10-02", "to": "2026-10-01"}])
+    def test_rejects_invalid_params(
+        self, client: TestClient, auth_headers: dict, test_community: Community, params: dict
+    ):
+        assert client.get(self._url(test_community.id), params=params, headers=auth_headers).status_code == 400
+
+    def test_requires_membership(
+        self, client: TestClient, auth_headers: dict, superuser_auth_headers: dict, test_another_community: Community
+    ):
+        assert client.get(self._url(test_another_community.id), headers=auth_headers).status_code == 403
+        assert client.get(self._url(test_another_community.id), headers=superuser_auth_headers).status_code == 200
+        assert client.get(self._url(99999), headers=superuser_auth_headers).status_code == 404
@@ -0,0 +1,179 @@
+"""响应压缩与上传文件预压缩测试"""
+import threading
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core import compression
+from app.core.compression import CompressionMiddleware, PrecompressedStaticFiles, negotiate_encoding
+from app.services.storage import LocalStorage
+
+BIG = {"items": [{"id": i, "title": f"内容 {i}"} for i in range(200)]}
+
+
+@pytest.fixture
+def app_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=500,
+        content_types=["application/json", "text/"],
+        gzip_level=6,
+        brotli_quality=4,
+    )
+
+    @app.get("/big")
+    def big():
+        return BIG
+
+    @app.get("/small")
+    def small():
+        return {"ok": True}
+
+    @app.get("/image")
+    def image():
+        return Response(b"\x89PNG" + b"\0" * 4096, media_type="image/png")
+
+    @app.get("/encoded")
+    def encoded():
+        return PlainTextResponse("x" * 4096, headers={"Content-Encoding": "identity"})
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse((f"line {i}\n" * 50 for i in range(20)), media_type="text/plain")
+
+    return TestClient(app)
+
+
+class TestNegotiation:
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip, deflate, br", "br"),
+            ("gzip", "gzip"),
+            ("br;q=0.5, gzip", "gzip"),
+            ("gzip;q=0, br;q=0", None),
+            ("*", "br"),
+            ("identity", None),
+            ("", None),
+        ],
+    )
+    def test_negotiate(self, header: str, expected: str | None):
+        assert negotiate_encoding(header, ("br", "gzip")) == expected
+
+
+class TestCompressionMiddleware:
+    def test_large_json_gzip(self, app_client: TestClient):
+        resp = app_client.get("/big", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in resp.headers["vary"]
+        assert int(resp.headers["content-length"]) < len(resp.content)
+        assert resp.json() == BIG
+
+    def test_brotli_preferred(self, app_client: TestClient):
+        pytest.importorskip("brotli")
+        resp = app_client.get("/big", headers={"Accept-Encoding": "gzip, br"})
+        assert resp.headers["content-encoding"] == "br"
+        assert resp.json() == BIG
+
+    def test_below_threshold_not_compressed(self, app_client: TestClient):
+        resp = app_client.get("/small", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+        assert resp.json() == {"ok": True}
+
+    def test_identity_not_compressed(self, app_client: TestClient):
+        resp = app_client.get("/big", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in resp.headers
+
+    def test_image_not_compressed(self, app_client: TestClient):
+        resp = app_client.get("/image", headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in resp.headers
+        assert len(resp.content) == 4100
+
+    def test_already_encoded_passthrough(self, app_client: TestClient):
+        resp = app_client.get("/encoded", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "identity"
+
+    def test_streaming_response(self, app_client: TestClient):
+        resp = app_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+        assert "content-length" not in resp.headers
+        assert resp.text == "".join(f"line {i}\n" * 50 for i in range(20))
+
+    def test_api_responses_compressed(self, client: TestClient):
+        resp = client.get("/openapi.json", headers={"Accept-Encoding": "gzip"})
+        assert resp.headers["content-encoding"] == "gzip"
+
+
+def _wait_precompressed() -> None:
+    """等待后台线程处理完已排队的预压缩任务（单线程按提交顺序执行）。"""
+    compression._precompress_executor.submit(lambda: None).result(timeout=10)
+
+
+class TestPrecompressedUploads:
+    @pytest.fixture
+    def storage(self, tmp_path) -> LocalStorage:
+        return LocalStorage(str(tmp_path))
+
+    def test_text_upload_precompressed(self, storage: LocalStorage, tmp_path):
+        storage.save(b"# title\n" * 500, "docs/readme.md")
+        _wait_precompressed()
+        assert (tmp_path / "docs/readme.md.gz").is_file()
+        if compression.brotli is not None:
+            assert (tmp_path / "docs/readme.md.br").is_file()
+
+        storage.delete("docs/readme.md")
+        assert list((tmp_path / "docs").iterdir()) == []
+
+    def test_images_and_small_files_skipped(self, storage: LocalStorage, tmp_path):
+        storage.save(b"\0" * 4096, "covers/a.png")
+        storage.save(b"tiny", "docs/tiny.txt")
+        _wait_precompressed()
+        assert sorted(p.name for p in tmp_path.rglob("*") if p.is_file()) == ["a.png", "tiny.txt"]
+
+    def test_save_does_not_wait_for_precompression(self, storage: LocalStorage, tmp_path):
+        release = threading.Event()
+        compression._precompress_executor.submit(release.wait, 10)
+        try:
+            assert storage.save(b"# title\n" * 500, "docs/readme.md") == "/uploads/docs/readme.md"
+            assert not (tmp_path / "docs/readme.md.gz").exists()
+        finally:
+            release.set()
+        _wait_precompressed()
+        assert (tmp_path / "docs/readme.md.gz").is_file()
+
+    def test_deleted_before_precompression_leaves_no_siblings(self, storage: LocalStorage, tmp_path):
+        release = threading.Event()
+        compression._precompress_executor.submit(release.wait, 10)
+        try:
+            storage.save(b"# title\n" * 500, "docs/readme.md")
+            storage.delete("docs/readme.md")
+        finally:
+            release.set()
+        _wait_precompressed()
+        assert list((tmp_path / "docs").iterdir()) == []
+
+    def test_static_serves_precompressed_sibling(self, storage: LocalStorage, tmp_path, monkeypatch):
+        # 只生成 .gz，确保无论是否安装 brotli 都走同一路径
+        monkeypatch.setattr(compression, "available_encodings", lambda: ("gzip",))
+        body = b"<svg xmlns='http://www.w3.org/2000/svg'>" + b"<rect/>" * 500 + b"</svg>"
+        storage.save(body, "icons/logo.svg")
+        _wait_precompressed()
+
+        app = FastAPI()
+        app.mount("/uploads", PrecompressedStaticFiles(directory=str(tmp_path)), name="uploads")
+        static = TestClient(app)
+
+        resp = static.get("/uploads/icons/logo.svg", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+        assert resp.headers["content-type"].startswith("image/svg+xml")
+        assert int(resp.headers["content-length"]) < len(body)
+        assert resp.content == body
+
+        plain = static.get("/uploads/icons/logo.svg", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in plain.headers
+        assert plain.headers["vary"] == "Accept-Encoding"
+        assert plain.content == body
@@ -0,0 +1,163 @@
+"""条件请求（ETag / If-None-Match）测试"""
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.conditional import VersionSource, _etag_matches, version_token
+from app.insights.analyzers import trend as trend_analyzer
+from app.models.community import Community
+from app.models.content import Content
+from app.models.design import DesignTask
+from app.models.ecosystem import EcosystemProject, EcosystemSnapshot
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def _no_time_bucket(monkeypatch):
+    # 避免两次请求跨越分桶边界导致 ETag 变化
+    monkeypatch.setattr(settings, "HTTP_CACHE_BUCKET_SECONDS", 0)
+
+
+def _dashboard_url(community: Community) -> str:
+    return f"/api/communities/{community.id}/dashboard"
+
+
+class TestEtagMatching:
+    @pytest.mark.parametrize(
+        "header",
+        ['W/"abc"', '"abc"', '"x", W/"abc"', "*"],
+    )
+    def test_matches(self, header: str):
+        assert _etag_matches(header, 'W/"abc"')
+
+    def test_mismatch(self):
+        assert not _etag_matches('W/"abd", "xyz"', 'W/"abc"')
+
+
+class TestVersionToken:
+    def test_changes_with_rows(self, db_session: Session, test_community: Community, test_user: User):
+        source = VersionSource(Content, Content.community_id == test_community.id, watch=[Content.updated_at])
+        before = version_token(db_session, source, scope=(test_community.id,))
+        assert version_token(db_session, source, scope=(test_community.id,)) == before
+
+        content = Content(
+            title="版本令牌", community_id=test_community.id, owner_id=test_user.id, created_by_user_id=test_user.id
+        )
+        db_session.add(content)
+        db_session.commit()
+        after_insert = version_token(db_session, source, scope=(test_community.id,))
+        assert after_insert != before
+
+        content.title = "版本令牌（修改）"
+        db_session.commit()
+        assert version_token(db_session, source, scope=(test_community.id,)) != after_insert
+
+    def test_scope_is_part_of_token(self, db_session: Session):
+        source = VersionSource(Content)
+        assert version_token(db_session, source, scope=(1,)) != version_token(db_session, source, scope=(2,))
+
+    def test_time_bucket(self, db_session: Session, monkeypatch):
+        source = VersionSource(Content)
+        monkeypatch.setattr(settings, "HTTP_CACHE_BUCKET_SECONDS", 60)
+        monkeypatch.setattr("app.core.conditional.time.time", lambda: 960.0)
+        first = version_token(db_session, source)
+        monkeypatch.setattr("app.core.conditional.time.time", lambda: 1019.0)
+        assert version_token(db_session, source) == first
+        monkeypatch.setattr("app.core.conditional.time.time", lambda: 1020.0)
+        assert version_token(db_session, source) != first
+
+
+class TestCommunityDashboard:
+    def test_headers_and_not_modified(self, client: TestClient, auth_headers: dict, test_community: Community):
+        resp = client.get(_dashboard_url(test_community), headers=auth_headers)
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+        assert etag.startswith('W/"')
+        assert resp.headers["cache-control"] == f"private, max-age={settings.HTTP_CACHE_DASHBOARD_MAX_AGE}"
+
+        cached = client.get(_dashboard_url(test_community), headers={**auth_headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["etag"] == etag
+        # 304 只执行版本令牌查询，跳过聚合
+        assert int(cached.headers["x-db-queries"]) < int(resp.headers["x-db-queries"])
+
+    def test_etag_changes_after_write(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+    ):
+        etag = client.get(_dashboard_url(test_community), headers=auth_headers).headers["etag"]
+
+        db_session.add(
+            Content(
+                title="新内容", community_id=test_community.id, owner_id=test_user.id, created_by_user_id=test_user.id
+            )
+        )
+        db_session.commit()
+
+        resp = client.get(_dashboard_url(test_community), headers={**auth_headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+        assert resp.json()["metrics"]["total_contents"] == 1
+
+    def test_forbidden_before_etag(
+        self, client: TestClient, another_user_auth_headers: dict, test_community: Community
+    ):
+        resp = client.get(_dashboard_url(test_community), headers={**another_user_auth_headers, "If-None-Match": "*"})
+        assert resp.status_code == 403
+
+
+class TestUserDashboard:
+    def test_not_modified_until_assignment_changes(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+    ):
+        resp = client.get("/api/users/me/dashboard", headers=auth_headers)
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+
+        cached = client.get("/api/users/me/dashboard", headers={**auth_headers, "If-None-Match": etag})
+        assert cached.status_code == 304
+
+        db_session.add(
+            DesignTask(title="海报", community_id=test_community.id, assignee_id=test_user.id)
+        )
+        db_session.commit()
+        resp = client.get("/api/users/me/dashboard", headers={**auth_headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert len(resp.json()["design_tasks"]) == 1
+
+
+class TestInsightsTrends:
+    def test_not_modified_skips_analysis(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, monkeypatch
+    ):
+        project = EcosystemProject(
+            community_id=test_community.id, name="repo", platform="github", org_name="org", is_active=True
+        )
+        db_session.add(project)
+        db_session.commit()
+
+        resp = client.get("/api/insights/trends", headers=auth_headers)
+        assert resp.status_code == 200
+        etag = resp.headers["etag"]
+        assert resp.headers["cache-control"] == f"private, max-age={settings.HTTP_CACHE_INSIGHTS_MAX_AGE}"
+
+        def fail(db):
+            raise AssertionError("304 不应执行趋势分析")
+
+        analyze_all = trend_analyzer.analyze_all
+        monkeypatch.setattr(trend_analyzer, "analyze_all", fail)
+        assert client.get("/api/insights/trends", headers={**auth_headers, "If-None-Match": etag}).status_code == 304
+
+        # 新快照（一次采集）使 ETag 失效
+        monkeypatch.setattr(trend_analyzer, "analyze_all", analyze_all)
+        db_session.add(EcosystemSnapshot(project_id=project.id, stars=1))
+        db_session.commit()
+        resp = client.get("/api/insights/trends", headers={**auth_headers, "If-None-Match": etag})
+        assert resp.status_code == 200
+        assert resp.json()[0]["snapshot_count"] == 1
+
+    def test_momentum_filter_has_own_etag(self, client: TestClient, auth_headers: dict):
+        all_trends = client.get("/api/insights/trends", headers=auth_headers).headers["etag"]
+        filtered = client.get("/api/insights/trends?momentum=stable", headers=auth_headers).headers["etag"]
+        assert all_trends != filtered
@@ -0,0 +1,166 @@
+"""列表总数（COUNT）缓存测试"""
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, insert, select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.core import count_cache as cc
+from app.core import pagination
+from app.core.count_cache import CountResult, count_cache, count_rows
+from app.database import Base
+from app.models import Content, User
+from app.models.community import Community
+from app.models.notification import Notification
+
+
+@contextmanager
+def count_queries(db: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        if "count(" in statement.lower():
+            statements.append(statement)
+
+    bind = db.get_bind()
+    event.listen(bind, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(bind, "before_cursor_execute", _record)
+
+
+def _contents(db: Session, community: Community):
+    return db.query(Content).filter(Content.community_id == community.id)
+
+
+class TestCountCache:
+    def test_hit_until_commit(self, db_session: Session, test_community: Community):
+        db_session.add(Content(title="a", community_id=test_community.id))
+        db_session.commit()
+
+        with count_queries(db_session) as issued:
+            assert count_rows(db_session, _contents(db_session, test_community)) == CountResult(1)
+            assert count_rows(db_session, _contents(db_session, test_community)).value == 1
+            assert len(issued) == 1
+
+            db_session.add(Content(title="b", community_id=test_community.id))
+            db_session.commit()
+            assert count_rows(db_session, _contents(db_session, test_community)).value == 2
+            assert len(issued) == 2
+
+    def test_filters_cached_separately(self, db_session: Session, test_community: Community):
+        db_session.add_all([Content(title="a", status="draft"), Content(title="b", status="published")])
+        db_session.commit()
+        draft = db_session.query(Content).filter(Content.status == "draft")
+        published = db_session.query(Content).filter(Content.status == "published")
+        assert count_rows(db_session, draft).value == 1
+        assert count_rows(db_session, db_session.query(Content)).value == 2
+        assert count_rows(db_session, published).value == 1
+
+    def test_bulk_statements_invalidate(self, db_session: Session, test_community: Community):
+        query = _contents(db_session, test_community)
+        assert count_rows(db_session, query).value == 0
+
+        db_session.execute(insert(Content), [{"title": "x", "community_id": test_community.id}])
+        db_session.commit()
+        assert count_rows(db_session, query).value == 1
+
+        db_session.execute(update(Content).values(community_id=None))
+        db_session.commit()
+        assert count_rows(db_session, query).value == 0
+
+    def test_secondary_table_invalidated(self, db_session: Session, test_user: User):
+        content = Content(title="a")
+        db_session.add(content)
+        db_session.commit()
+        assigned = db_session.query(Content).filter(Content.assignees.any(User.id == test_user.id))
+        assert count_rows(db_session, assigned).value == 0
+
+        content.assignees.append(test_user)
+        db_session.commit()
+        assert count_rows(db_session, assigned).value == 1
+
+    def test_rollback_does_not_invalidate(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            assert count_rows(db, db.query(Content)).value == 0
+            before = count_cache.generations(("contents",))
+            db.add(Content(title="a"))
+            db.flush()
+            db.rollback()
+            assert count_cache.generations(("contents",)) == before
+            assert "count_cache_tables" not in db.info
+        engine.dispose()
+
+    def test_ttl_expiry(self, db_session: Session, monkeypatch: pytest.MonkeyPatch):
+        assert count_rows(db_session, db_session.query(Content)).value == 0
+        # 绕过失效事件直接写入
+        db_session.connection().execute(insert(Content.__table__).values(title="raw"))
+        assert count_rows(db_session, db_session.query(Content)).value == 0
+
+        monkeypatch.setattr(count_cache, "ttl_seconds", 0.0)
+        count_cache.clear()
+        assert count_rows(db_session, db_session.query(Content)).value == 1
+
+    def test_lru_bound(self, db_session: Session, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(count_cache, "maxsize", 2)
+        for status in ("draft", "reviewing", "approved"):
+            count_rows(db_session, db_session.query(Content).filter(Content.status == status))
+        assert len(count_cache) == 2
+
+
+class TestEstimates:
+    def test_explain_compiles_for_postgres(self):
+        stmt = cc._Explain(select(Content.id).where(Content.status == "draft"))
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("EXPLAIN (FORMAT JSON) SELECT contents.id")
+        assert "%(status_1)s" in sql
+
+    @pytest.mark.parametrize(
+        ("output", "rows"),
+        [
+            ([{"Plan": {"Node Type": "Seq Scan", "Plan Rows": 250000}}], 250000.0),
+            ('[{"Plan": {"Plan Rows": 12}}]', 12.0),
+            ([], None),
+        ],
+    )
+    def test_plan_rows(self, output, rows):
+        assert cc._plan_rows(output) == rows
+
+    def test_threshold(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(cc.settings, "COUNT_ESTIMATE_THRESHOLD", 1000)
+        assert cc._estimated(999) is None
+        assert cc._estimated(5000.7) == CountResult(5000, exact=False)
+
+    def test_sqlite_always_exact(self, db_session: Session, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(cc.settings, "COUNT_ESTIMATE_THRESHOLD", 1)
+        db_session.add(Content(title="a"))
+        db_session.commit()
+        assert count_rows(db_session, db_session.query(Content)) == CountResult(1, exact=True)
+
+
+class TestEndpoints:
+    def test_total_exact_flag(self, client: TestClient, auth_headers: dict, monkeypatch: pytest.MonkeyPatch):
+        assert client.get("/api/events", headers=auth_headers).json()["total_exact"] is True
+
+        monkeypatch.setattr(pagination, "count_rows", lambda db, query: CountResult(250000, exact=False))
+        data = client.get("/api/events", headers=auth_headers).json()
+        assert data["total"] == 250000
+        assert data["total_exact"] is False
+
+    def test_unread_count_invalidated_by_mark_read(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_user: User
+    ):
+        notif = Notification(user_id=test_user.id, type="system", title="n")
+        db_session.add(notif)
+        db_session.commit()
+        assert client.get("/api/notifications/unread-count", headers=auth_headers).json() == {"count": 1}
+
+        assert client.patch(f"/api/notifications/{notif.id}/read", headers=auth_headers).status_code == 200
+        assert client.get("/api/notifications/unread-count", headers=auth_headers).json() == {"count": 0}
+        assert client.get("/api/notifications", headers=auth_headers).json()["unread_count"] == 0
@@ -0,0 +1,160 @@
+"""读写分离与只读副本路由测试（主库与副本均为本地 SQLite 文件）"""
+import time
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine, func, insert, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from app import database
+from app.core.db_routing import (
+    PRIMARY_COOKIE,
+    ReadYourWritesMiddleware,
+    Replica,
+    ReplicaRouter,
+    track_primary_writes,
+)
+from app.core.rate_limit import CommunityLimiter, client_key
+from app.database import configure_sqlite_engine, get_async_read_db, get_read_db, to_async_url
+from app.models.rate_limit import rate_limit_counters
+
+metadata = MetaData()
+items = Table("routing_items", metadata, Column("id", Integer, primary_key=True))
+
+
+def _replica(url: str) -> Replica:
+    sync_engine = create_engine(url, connect_args={"check_same_thread": False})
+    async_engine = create_async_engine(to_async_url(url))
+    configure_sqlite_engine(sync_engine, read_only=True)
+    configure_sqlite_engine(async_engine.sync_engine, read_only=True)
+    return Replica(name=url, engine=sync_engine, async_engine=async_engine)
+
+
+@pytest.fixture
+def replica_urls(tmp_path) -> list[str]:
+    urls = []
+    for name in ("replica_a", "replica_b"):
+        url = f"sqlite:///{tmp_path / name}.db"
+        engine = create_engine(url)
+        metadata.create_all(engine)
+        engine.dispose()
+        urls.append(url)
+    return urls
+
+
+class TestReplicaRouter:
+    def test_round_robin(self, replica_urls):
+        router = ReplicaRouter([_replica(url) for url in replica_urls])
+        names = [router.choose().name for _ in range(4)]
+        assert names == [replica_urls[0], replica_urls[1], replica_urls[0], replica_urls[1]]
+
+    def test_health_check_skips_unreachable_replica(self, replica_urls, tmp_path):
+        broken = _replica(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        router = ReplicaRouter([broken, _replica(replica_urls[0])])
+
+        router.check_health()
+        assert broken.healthy is False
+        assert broken.last_error
+        assert {router.choose().name for _ in range(3)} == {replica_urls[0]}
+
+    def test_connection_error_marks_down_immediately(self, tmp_path):
+        broken = _replica(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        router = ReplicaRouter([broken])
+        assert router.choose() is broken
+
+        with pytest.raises(OperationalError, match="unable to open database file"):
+            broken.engine.connect()
+        assert broken.healthy is False
+        assert router.choose() is None
+
+    def test_recovers_after_health_check(self, replica_urls):
+        replica = _replica(replica_urls[0])
+        router = ReplicaRouter([replica])
+        router.mark_down(replica, "simulated")
+        assert router.choose() is None
+
+        router.check_health()
+        assert replica.healthy is True
+        assert router.choose() is replica
+
+
+class TestReadYourWrites:
+    @pytest.fixture
+    def routed_client(self, tmp_path, replica_urls, monkeypatch) -> TestClient:
+        primary = create_engine(f"sqlite:///{tmp_path / 'primary.db'}", connect_args={"check_same_thread": False})
+        metadata.create_all(primary)
+        rate_limit_counters.create(primary)
+        track_primary_writes(primary)
+        # 副本尚未复制到主库的写入：副本为空表
+        monkeypatch.setattr(database, "replica_router", ReplicaRouter([_replica(replica_urls[0])]))
+        async_primary = create_async_engine(to_async_url(str(primary.url)))
+        monkeypatch.setattr(database, "ReadSessionLocal", sessionmaker(bind=primary))
+        monkeypatch.setattr(database, "AsyncReadSessionLocal", async_sessionmaker(async_primary))
+
+        # database:// 限流存储复用主库 engine
+        monkeypatch.setattr(database, "engine", primary)
+        quota = CommunityLimiter(key_func=client_key, community_limits=["5/minute"], storage_uri="database://")
+
+        app = FastAPI()
+        app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=30)
+
+        @app.get("/communities/{community_id}/items")
+        def community_items(request: Request, community_id: int):
+            quota.hit_community(request, community_id)
+            return {"ok": True}
+
+        @app.post("/items")
+        def create_item():
+            with primary.begin() as conn:
+                conn.execute(insert(items).values())
+            return {"ok": True}
+
+        @app.get("/items/count")
+        def count_items(db: Session = Depends(get_read_db)):
+            return {"count": db.execute(select(func.count()).select_from(items)).scalar()}
+
+        @app.get("/items/async-count")
+        async def async_count_items(db: AsyncSession = Depends(get_async_read_db)):
+            return {"count": (await db.execute(select(func.count()).select_from(items))).scalar()}
+
+        yield TestClient(app)
+        primary.dispose()
+
+    def test_reads_go_to_replica_without_writes(self, routed_client: TestClient):
+        routed_client.post("/items").raise_for_status()
+        routed_client.cookies.clear()
+        assert routed_client.get("/items/count").json() == {"count": 0}
+        assert routed_client.get("/items/async-count").json() == {"count": 0}
+
+    def test_sticks_to_primary_after_write(self, routed_client: TestClient):
+        resp = routed_client.post("/items")
+        assert PRIMARY_COOKIE in resp.headers["set-cookie"]
+
+        assert routed_client.get("/items/count").json() == {"count": 1}
+        assert routed_client.get("/items/async-count").json() == {"count": 1}
+
+    def test_read_only_request_sets_no_cookie(self, routed_client: TestClient):
+        resp = routed_client.get("/items/count")
+        assert "set-cookie" not in resp.headers
+
+    def test_rate_limit_counter_write_sets_no_cookie(self, routed_client: TestClient):
+        for _ in range(2):
+            resp = routed_client.get("/communities/1/items")
+            assert resp.status_code == 200
+            assert "set-cookie" not in resp.headers
+        with database.engine.connect() as conn:
+            assert conn.execute(select(rate_limit_counters.c.count)).scalar() == 2
+
+    def test_expired_cookie_routes_to_replica(self, routed_client: TestClient):
+        routed_client.post("/items")
+        routed_client.cookies.set(PRIMARY_COOKIE, f"{time.time() - 1:.3f}")
+        assert routed_client.get("/items/count").json() == {"count": 0}
+
+
+def test_admin_replica_status(client: TestClient, superuser_auth_headers: dict):
+    resp = client.get("/api/admin/db/replicas", headers=superuser_auth_headers)
+    assert resp.status_code == 200
+    assert resp.json()["replicas"] == []
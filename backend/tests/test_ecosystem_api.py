@@ -135,15 +135,22 @@ class TestUpdateProject:
 # ─── Sync ─────────────────────────────────────────────────────────────────────
 
 class TestSyncProject:
-    def test_sync_project_success(self, client: TestClient, auth_headers, test_project):
+    def test_sync_project_success(self, client: TestClient, auth_headers, test_project, complete_job):
         mock_result = {"created": 5, "updated": 2, "errors": 0}
-        with mock.patch("app.api.ecosystem.sync_project", return_value=mock_result):
+        with mock.patch("app.services.jobs.handlers.sync_project", return_value=mock_result):
             resp = client.post(f"/api/ecosystem/{test_project.id}/sync", headers=auth_headers)
-        assert resp.status_code == 200
-        data = resp.json()
+            job = complete_job(resp)
+        assert job["status"] == "succeeded"
+        data = job["result"]
         assert data["created"] == 5
         assert data["updated"] == 2
 
+    def test_sync_project_deduplicated(self, client: TestClient, auth_headers, test_project):
+        first = client.post(f"/api/ecosystem/{test_project.id}/sync", headers=auth_headers)
+        second = client.post(f"/api/ecosystem/{test_project.id}/sync", headers=auth_headers)
+        assert first.status_code == second.status_code == 202
+        assert first.json()["id"] == second.json()["id"]
+
     def test_sync_project_not_found(self, client: TestClient, auth_headers):
         resp = client.post("/api/ecosystem/99999/sync", headers=auth_headers)
         assert resp.status_code == 404
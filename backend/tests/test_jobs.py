@@ -0,0 +1,183 @@
+"""后台任务队列测试"""
+import threading
+from contextlib import nullcontext
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, update
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.timezone import utc_now
+from app.database import Base
+from app.models.job import Job
+from app.models.user import User
+from app.services.jobs import HANDLERS, JobError, JobWorker, claim_next, enqueue, finish_job
+from app.services.jobs.queue import JobHandler
+from app.services.lease_claim import claim_rows
+
+
+@pytest.fixture
+def handlers(monkeypatch: pytest.MonkeyPatch) -> dict[str, list]:
+    """注册测试用任务类型，返回各类型收到的 payload。"""
+    calls: dict[str, list] = {"ok": [], "flaky": [], "bad": []}
+
+    def ok(db, payload):
+        calls["ok"].append(payload)
+        return {"echo": payload["n"]}
+
+    async def flaky(db, payload):
+        calls["flaky"].append(payload)
+        raise RuntimeError("upstream timeout")
+
+    def bad(db, payload):
+        calls["bad"].append(payload)
+        raise JobError("参数错误", 400)
+
+    monkeypatch.setitem(HANDLERS, "test.ok", JobHandler(ok))
+    monkeypatch.setitem(HANDLERS, "test.flaky", JobHandler(flaky, max_attempts=2))
+    monkeypatch.setitem(HANDLERS, "test.bad", JobHandler(bad))
+    return calls
+
+
+def _worker(db: Session, worker_id: str = "w1") -> JobWorker:
+    return JobWorker(lambda: nullcontext(db), worker_id=worker_id, lease_seconds=60)
+
+
+class TestQueue:
+    def test_enqueue_unknown_kind(self, db_session: Session):
+        with pytest.raises(ValueError):
+            enqueue(db_session, "test.missing")
+
+    def test_success(self, db_session: Session, handlers):
+        job = enqueue(db_session, "test.ok", {"n": 1})
+        assert job.status == "queued" and job.attempts == 0
+
+        assert _worker(db_session).run_pending() == 1
+        db_session.refresh(job)
+        assert job.status == "succeeded"
+        assert job.result == {"echo": 1}
+        assert job.attempts == 1 and job.finished_at is not None and job.locked_by is None
+
+    def test_claim_is_exclusive(self, db_session: Session, handlers):
+        enqueue(db_session, "test.ok", {"n": 1})
+        assert claim_next(db_session, "w1", 60) is not None
+        assert claim_next(db_session, "w2", 60) is None
+
+    def test_claim_rows_batch(self, db_session: Session, handlers):
+        jobs = [enqueue(db_session, "test.ok", {"n": n}) for n in range(3)]
+        now = utc_now()
+        claimable = Job.status == "queued"
+
+        claimed = claim_rows(db_session, Job, claimable, order_by=(Job.id.desc(),),
+                             values={"status": "running", "locked_until": now}, worker_id="w1", limit=2)
+        assert [job.id for job in claimed] == [jobs[2].id, jobs[1].id]
+        assert all(job.status == "running" and job.locked_by == "w1" for job in claimed)
+
+        assert [job.id for job in claim_rows(db_session, Job, claimable, order_by=(Job.id,),
+                                             values={"status": "running"}, worker_id="w2", limit=5)] == [jobs[0].id]
+        # 没有可领取的行时返回 None（与「候选行都被抢先」的空列表区分）
+        assert claim_rows(db_session, Job, claimable, order_by=(Job.id,),
+                          values={"status": "running"}, worker_id="w3", limit=5) is None
+
+    def test_retry_with_backoff_then_fail(self, db_session: Session, handlers):
+        job = enqueue(db_session, "test.flaky", {"n": 1})
+        worker = _worker(db_session)
+
+        assert worker.run_pending() == 1
+        db_session.refresh(job)
+        assert job.status == "queued" and job.error_status == 500
+        # SQLite 读回的是 naive UTC 时间
+        assert job.run_after.replace(tzinfo=None) > utc_now().replace(tzinfo=None) + timedelta(seconds=1)
+        # 退避期内不会被领取
+        assert worker.run_pending() == 0
+
+        db_session.execute(update(Job).where(Job.id == job.id).values(run_after=utc_now()))
+        db_session.commit()
+        assert worker.run_pending() == 1
+        db_session.refresh(job)
+        assert job.status == "failed" and job.attempts == 2
+        assert "upstream timeout" in job.error
+        assert len(handlers["flaky"]) == 2
+
+    def test_job_error_not_retried(self, db_session: Session, handlers):
+        job = enqueue(db_session, "test.bad", {"n": 1})
+        _worker(db_session).run_pending()
+        db_session.refresh(job)
+        assert (job.status, job.error, job.error_status, job.attempts) == ("failed", "参数错误", 400, 1)
+
+    def test_dedupe_key(self, db_session: Session, handlers):
+        first = enqueue(db_session, "test.ok", {"n": 1}, dedupe_key="k")
+        assert enqueue(db_session, "test.ok", {"n": 2}, dedupe_key="k").id == first.id
+        _worker(db_session).run_pending()
+        # 已结束的任务不再参与去重
+        assert enqueue(db_session, "test.ok", {"n": 3}, dedupe_key="k").id != first.id
+
+    def test_expired_lease_reclaimed(self, db_session: Session, handlers):
+        job = enqueue(db_session, "test.ok", {"n": 1})
+        claim_next(db_session, "crashed", 60)
+        assert claim_next(db_session, "w2", 60) is None
+
+        db_session.execute(update(Job).where(Job.id == job.id).values(locked_until=utc_now() - timedelta(seconds=1)))
+        db_session.commit()
+        reclaimed = claim_next(db_session, "w2", 60)
+        assert reclaimed.id == job.id and reclaimed.attempts == 2
+
+        # 原 worker 恢复后写回结果不会覆盖接管者
+        assert finish_job(db_session, job.id, "crashed", result={"stale": True}) == "running"
+        assert finish_job(db_session, job.id, "w2", result={"ok": True}) == "succeeded"
+        db_session.refresh(job)
+        assert job.result == {"ok": True}
+
+    def test_expired_lease_without_attempts_left_fails(self, db_session: Session, handlers):
+        job = enqueue(db_session, "test.ok", {"n": 1})
+        db_session.execute(
+            update(Job).where(Job.id == job.id)
+            .values(status="running", attempts=job.max_attempts, locked_by="crashed",
+                    locked_until=utc_now() - timedelta(seconds=1))
+        )
+        db_session.commit()
+        assert claim_next(db_session, "w2", 60) is None
+        db_session.refresh(job)
+        assert job.status == "failed" and "失联" in job.error
+
+    def test_concurrent_workers_claim_each_job_once(self, tmp_path, handlers):
+        engine = create_engine(f"sqlite:///{tmp_path}/jobs.db", connect_args={"timeout": 30})
+        Base.metadata.create_all(engine)
+        factory = sessionmaker(engine)
+        with factory() as db:
+            for n in range(40):
+                enqueue(db, "test.ok", {"n": n})
+
+        worker = JobWorker(factory, lease_seconds=60)
+        threads = [threading.Thread(target=worker.run_pending) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with factory() as db:
+            jobs = db.query(Job).all()
+            assert {job.status for job in jobs} == {"succeeded"}
+            assert {job.attempts for job in jobs} == {1}
+        assert sorted(p["n"] for p in handlers["ok"]) == list(range(40))
+        engine.dispose()
+
+
+class TestJobsApi:
+    def test_poll_own_job(self, client: TestClient, auth_headers: dict, db_session: Session,
+                          test_user: User, handlers, run_jobs):
+        job = enqueue(db_session, "test.ok", {"n": 7}, user_id=test_user.id)
+        assert client.get(f"/api/jobs/{job.id}", headers=auth_headers).json()["status"] == "queued"
+
+        run_jobs()
+        data = client.get(f"/api/jobs/{job.id}", headers=auth_headers).json()
+        assert data["status"] == "succeeded"
+        assert data["result"] == {"echo": 7}
+
+    def test_other_users_job_hidden(self, client: TestClient, another_user_auth_headers: dict,
+                                    superuser_auth_headers: dict, db_session: Session, test_user: User, handlers):
+        job = enqueue(db_session, "test.ok", {"n": 1}, user_id=test_user.id)
+        assert client.get(f"/api/jobs/{job.id}", headers=another_user_auth_headers).status_code == 404
+        assert client.get(f"/api/jobs/{job.id}", headers=superuser_auth_headers).status_code == 200
+        assert client.get("/api/jobs/99999", headers=superuser_auth_headers).status_code == 404
@@ -0,0 +1,183 @@
+"""到期会议提醒分发器测试。"""
+import smtplib
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.timezone import utc_now
+from app.models.committee import Committee
+from app.models.community import Community
+from app.models.meeting import Meeting, MeetingParticipant, MeetingReminder
+from app.services import ics
+from app.services.meeting_reminders import claim_due_reminders, dispatch_due_reminders, run_reminder_dispatch
+
+
+def _now() -> datetime:
+    return utc_now().replace(tzinfo=None)
+
+
+@pytest.fixture
+def smtp_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(settings, "SMTP_FROM_EMAIL", "noreply@example.com")
+
+
+@pytest.fixture
+def sent_emails():
+    """拦截实际发送，记录每封邮件的收件人；同时统计 ICS 构建次数。"""
+    calls = {"emails": [], "ics": 0}
+
+    def fake_send(community, message):
+        calls["emails"].append(sorted(message.to_emails))
+
+    def counting_ics(*args, **kwargs):
+        calls["ics"] += 1
+        return ics.build_meeting_ics(*args, **kwargs)
+
+    with patch("app.services.notification.send_email", side_effect=fake_send), \
+         patch("app.services.notification.build_meeting_ics", side_effect=counting_ics):
+        yield calls
+
+
+@pytest.fixture
+def make_meeting(db_session: Session, test_community: Community):
+    committee = Committee(community_id=test_community.id, name="技术委员会", slug="tech", is_active=True)
+    db_session.add(committee)
+    db_session.commit()
+
+    def factory(title: str, emails: list[str], starts_in: timedelta = timedelta(hours=1)) -> Meeting:
+        meeting = Meeting(
+            community_id=test_community.id,
+            committee_id=committee.id,
+            title=title,
+            scheduled_at=_now() + starts_in,
+            duration=60,
+            status="scheduled",
+        )
+        db_session.add(meeting)
+        db_session.flush()
+        db_session.add_all(
+            MeetingParticipant(meeting_id=meeting.id, name=email.split("@")[0], email=email) for email in emails
+        )
+        db_session.commit()
+        return meeting
+
+    return factory
+
+
+def _reminder(db: Session, meeting: Meeting, due_in: timedelta, reminder_type: str = "one_day") -> MeetingReminder:
+    reminder = MeetingReminder(
+        meeting_id=meeting.id,
+        reminder_type=reminder_type,
+        scheduled_at=_now() + due_in,
+        notification_channels=["email"],
+        status="pending",
+    )
+    db.add(reminder)
+    db.commit()
+    return reminder
+
+
+def _reload(db: Session, reminder: MeetingReminder) -> MeetingReminder:
+    db.refresh(reminder)
+    return reminder
+
+
+class TestDispatch:
+    def test_groups_per_meeting(self, db_session: Session, make_meeting, smtp_enabled, sent_emails):
+        a = make_meeting("例会 A", ["a1@example.com", "a2@example.com"])
+        b = make_meeting("例会 B", ["b1@example.com"])
+        a_day = _reminder(db_session, a, -timedelta(hours=2), "one_day")
+        a_hours = _reminder(db_session, a, -timedelta(minutes=1), "two_hours")
+        b_day = _reminder(db_session, b, -timedelta(minutes=5))
+        future = _reminder(db_session, b, timedelta(hours=1), "two_hours")
+
+        assert dispatch_due_reminders(db_session, "w1") == 3
+        # 每场会议一封邮件、一次 ICS 构建；同一会议同时到期的提醒合并发送
+        assert sorted(sent_emails["emails"]) == [["a1@example.com", "a2@example.com"], ["b1@example.com"]]
+        assert sent_emails["ics"] == 2
+
+        for reminder in (a_day, a_hours, b_day):
+            reminder = _reload(db_session, reminder)
+            assert reminder.status == "sent" and reminder.sent_at is not None and reminder.locked_by is None
+        assert _reload(db_session, a_day).sent_at == _reload(db_session, a_hours).sent_at
+        assert _reload(db_session, future).status == "pending"
+        assert dispatch_due_reminders(db_session, "w1") == 0
+
+    def test_claim_is_exclusive(self, db_session: Session, make_meeting):
+        meeting = make_meeting("例会", ["a@example.com"])
+        _reminder(db_session, meeting, -timedelta(minutes=1))
+        _reminder(db_session, meeting, -timedelta(minutes=2), "three_days")
+
+        assert len(claim_due_reminders(db_session, "w1", 1)) == 1
+        assert len(claim_due_reminders(db_session, "w2", 10)) == 1
+        assert claim_due_reminders(db_session, "w3", 10) == []
+
+    def test_expired_lease_reclaimed(self, db_session: Session, make_meeting, smtp_enabled, sent_emails):
+        meeting = make_meeting("例会", ["a@example.com"])
+        reminder = _reminder(db_session, meeting, -timedelta(minutes=1))
+        claim_due_reminders(db_session, "crashed", 10)
+        assert dispatch_due_reminders(db_session, "w2") == 0
+
+        db_session.execute(
+            update(MeetingReminder)
+            .where(MeetingReminder.id == reminder.id)
+            .values(locked_until=utc_now() - timedelta(seconds=1))
+        )
+        db_session.commit()
+        assert dispatch_due_reminders(db_session, "w2") == 1
+        assert _reload(db_session, reminder).status == "sent"
+        assert len(sent_emails["emails"]) == 1
+
+    def test_meeting_already_started(self, db_session: Session, make_meeting, smtp_enabled, sent_emails):
+        meeting = make_meeting("例会", ["a@example.com"], starts_in=-timedelta(minutes=10))
+        reminder = _reminder(db_session, meeting, -timedelta(hours=2))
+
+        dispatch_due_reminders(db_session, "w1")
+        reminder = _reload(db_session, reminder)
+        assert (reminder.status, reminder.error_message) == ("failed", "Meeting already started")
+        assert sent_emails["emails"] == []
+
+    def test_send_failure_recorded(self, db_session: Session, make_meeting, smtp_enabled):
+        meeting = make_meeting("例会", ["a@example.com"])
+        reminder = _reminder(db_session, meeting, -timedelta(minutes=1))
+
+        with patch("app.services.notification.send_email", side_effect=smtplib.SMTPException("refused")):
+            dispatch_due_reminders(db_session, "w1")
+        reminder = _reload(db_session, reminder)
+        assert reminder.status == "failed" and "SMTP error" in reminder.error_message
+        assert reminder.locked_by is None
+
+    def test_run_drains_all_batches(
+        self, db_session: Session, make_meeting, smtp_enabled, sent_emails, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "MEETING_REMINDER_BATCH_SIZE", 1)
+        meetings = [make_meeting(f"例会 {n}", [f"m{n}@example.com"]) for n in range(3)]
+        for meeting in meetings:
+            _reminder(db_session, meeting, -timedelta(minutes=1))
+
+        assert run_reminder_dispatch(lambda: nullcontext(db_session)) == 3
+        assert len(sent_emails["emails"]) == 3
+
+
+class TestImmediateReminder:
+    def test_not_picked_up_by_dispatcher(
+        self, client: TestClient, auth_headers: dict, db_session: Session, make_meeting
+    ):
+        meeting = make_meeting("例会", ["a@example.com"])
+        r = client.post(
+            f"/api/meetings/{meeting.id}/reminders", json={"reminder_type": "immediate"}, headers=auth_headers
+        )
+        assert r.status_code == 201
+        # 未配置 SMTP：请求内发送失败并释放租约，分发器不会再次发送
+        assert (r.json()["status"], r.json()["error_message"]) == ("failed", "SMTP not configured")
+        reminder = db_session.get(MeetingReminder, r.json()["id"])
+        assert reminder.locked_by is None
+        assert abs((reminder.scheduled_at - _now()).total_seconds()) < 60
+        assert dispatch_due_reminders(db_session, "w1") == 0
@@ -0,0 +1,124 @@
+"""Prometheus 指标测试"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from app.config import settings
+from app.core.metrics import InstrumentedQueuePool, github_event_hooks, instrument_engine
+from app.services.ecosystem.sync_worker import RateLimiter
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestMetricsEndpoint:
+    def test_exports_route_metrics(self, client: TestClient):
+        before = sample(
+            "opengecko_http_requests_total", method="GET", route="/api/health", status="200"
+        )
+        client.get("/api/health")
+
+        resp = client.get("/api/metrics")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/plain")
+        assert "opengecko_http_request_duration_seconds_bucket" in resp.text
+        assert "opengecko_http_requests_in_flight" in resp.text
+        assert sample(
+            "opengecko_http_requests_total", method="GET", route="/api/health", status="200"
+        ) == before + 1
+
+    def test_route_label_uses_template(self, client: TestClient, auth_headers: dict):
+        client.get("/api/contents/987654", headers=auth_headers)
+        text_ = client.get("/api/metrics").text
+        assert 'route="/api/contents/{content_id}"' in text_
+        assert "987654" not in text_
+
+    def test_token_required(self, client: TestClient, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "scrape-secret")
+        assert client.get("/api/metrics").status_code == 401
+        resp = client.get("/api/metrics", headers={"Authorization": "Bearer scrape-secret"})
+        assert resp.status_code == 200
+
+    def test_disabled(self, client: TestClient, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_ENABLED", False)
+        assert client.get("/api/metrics").status_code == 404
+
+
+class TestPoolMetrics:
+    def test_checked_out_and_timeouts(self, tmp_path):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.01,
+        )
+        instrument_engine(engine, "pool-test")
+        before = sample("opengecko_db_pool_timeouts_total", engine="sync")
+
+        conn = engine.connect()
+        conn.execute(text("SELECT 1"))
+        assert sample("opengecko_db_pool_checked_out", engine="pool-test") == 1
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+        assert sample("opengecko_db_pool_timeouts_total", engine="sync") == before + 1
+
+        conn.close()
+        assert sample("opengecko_db_pool_checked_out", engine="pool-test") == 0
+        engine.dispose()
+
+
+class TestCollectorMetrics:
+    def test_rate_limiter_waits(self):
+        limiter = RateLimiter(rate_per_hour=36000)  # 10 tokens/s
+        limiter._tokens = 0.0
+        waits = sample("opengecko_collector_rate_limit_waits_total")
+        limiter.acquire()
+        assert sample("opengecko_collector_rate_limit_waits_total") == waits + 1
+        assert sample("opengecko_collector_rate_limit_wait_seconds_total") > 0
+
+    def test_github_calls_counted(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(403))
+        before = sample("opengecko_github_api_calls_total", status="403")
+        with httpx.Client(transport=transport, event_hooks=github_event_hooks()) as http:
+            http.get("https://api.github.com/repos/a/b")
+        assert sample("opengecko_github_api_calls_total", status="403") == before + 1
+
+
+_WORKER_SCRIPT = """
+from app.core.metrics import HTTP_REQUESTS, HTTP_IN_FLIGHT
+HTTP_REQUESTS.labels(method="GET", route="/api/health", status="200").inc(3)
+HTTP_IN_FLIGHT.inc()
+"""
+
+_SCRAPE_SCRIPT = """
+from app.core.metrics import render_metrics
+print(render_metrics()[0].decode())
+"""
+
+
+def test_multiprocess_aggregation(tmp_path):
+    env = {**os.environ, "PROMETHEUS_MULTIPROC_DIR": str(tmp_path)}
+    for _ in range(2):
+        subprocess.run([sys.executable, "-c", _WORKER_SCRIPT], cwd=BACKEND_DIR, env=env, check=True)
+
+    output = subprocess.run(
+        [sys.executable, "-c", _SCRAPE_SCRIPT],
+        cwd=BACKEND_DIR,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    assert 'opengecko_http_requests_total{method="GET",route="/api/health",status="200"} 6.0' in output
@@ -0,0 +1,193 @@
+"""通知邮件发件箱测试。
+
+覆盖：
+- TestOutboxWrite    — 通知与待发邮件在同一事务中写入
+- TestDispatcher     — 批量领取、单连接投递、失败退避与租约回收
+- TestSendMany       — SmtpEmailProvider.send_many 的逐封结果
+"""
+import smtplib
+from contextlib import nullcontext
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.config import settings
+from app.core.timezone import utc_now
+from app.models.notification import Notification, NotificationOutbox, NotificationType
+from app.models.user import User
+from app.services.email import EmailMessage, SmtpConfig, SmtpEmailProvider
+from app.services.notification_outbox import OutboxDispatcher, claim_batch
+from app.services.notify import create_notification, create_notifications
+
+
+@pytest.fixture
+def smtp_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "SMTP_HOST", "smtp.example.com")
+    monkeypatch.setattr(settings, "SMTP_PORT", 587)
+    monkeypatch.setattr(settings, "SMTP_FROM_EMAIL", "noreply@example.com")
+
+
+@pytest.fixture
+def mock_smtp():
+    server = MagicMock()
+    server.__enter__ = MagicMock(return_value=server)
+    server.__exit__ = MagicMock(return_value=False)
+    with patch("smtplib.SMTP", return_value=server) as smtp_cls:
+        server.cls = smtp_cls
+        yield server
+
+
+def _dispatcher(db: Session) -> OutboxDispatcher:
+    return OutboxDispatcher(lambda: nullcontext(db), worker_id="test-dispatcher")
+
+
+def _outbox(db: Session) -> list[NotificationOutbox]:
+    return db.query(NotificationOutbox).populate_existing().order_by(NotificationOutbox.id).all()
+
+
+def _notify(db: Session, user_ids: list[int]) -> list[Notification]:
+    return create_notifications(db, user_ids, NotificationType.TASK_ASSIGNED, "你被指派了任务：<整理材料>", "活动：峰会")
+
+
+class TestOutboxWrite:
+    def test_outbox_rows_written_with_notifications(
+        self, db_session: Session, test_user: User, test_another_user: User, smtp_enabled
+    ):
+        notifs = _notify(db_session, [test_user.id, test_another_user.id, test_user.id])
+        assert [n.user_id for n in notifs] == [test_user.id, test_another_user.id]
+
+        rows = _outbox(db_session)
+        assert [(r.notification_id, r.to_email, r.status) for r in rows] == [
+            (notifs[0].id, test_user.email, "pending"),
+            (notifs[1].id, test_another_user.email, "pending"),
+        ]
+        assert rows[0].text_body == "你被指派了任务：<整理材料>\n\n活动：峰会"
+        assert "&lt;整理材料&gt;" in rows[0].html_body
+
+    def test_no_outbox_without_smtp(self, db_session: Session, test_user: User):
+        create_notification(db_session, test_user.id, NotificationType.TASK_ASSIGNED, "标题")
+        assert db_session.query(Notification).count() == 1
+        assert _outbox(db_session) == []
+
+    def test_email_disabled(self, db_session: Session, test_user: User, smtp_enabled):
+        create_notifications(db_session, [test_user.id], NotificationType.MEETING_REMINDER, "会议", email=False)
+        assert db_session.query(Notification).count() == 1
+        assert _outbox(db_session) == []
+
+    def test_task_assignment_enqueues_email(
+        self, client: TestClient, db_session: Session, test_user: User, test_another_user: User,
+        test_community, user_token: str, smtp_enabled, mock_smtp
+    ):
+        from app.models.event import Event
+
+        event = Event(title="测试活动", community_id=test_community.id, event_type="offline")
+        db_session.add(event)
+        db_session.commit()
+
+        r = client.post(
+            f"/api/events/{event.id}/tasks",
+            json={"title": "整理材料", "assignee_ids": [test_user.id, test_another_user.id]},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert r.status_code == 201
+        # 请求中不发送邮件，只写入发件箱（不通知自己）
+        mock_smtp.cls.assert_not_called()
+        assert [row.to_email for row in _outbox(db_session)] == [test_another_user.email]
+
+
+class TestDispatcher:
+    def test_batch_shares_one_connection(
+        self, db_session: Session, test_user: User, test_another_user: User, smtp_enabled, mock_smtp
+    ):
+        _notify(db_session, [test_user.id, test_another_user.id])
+
+        assert _dispatcher(db_session).run_pending() == 2
+        mock_smtp.cls.assert_called_once_with("smtp.example.com", 587, timeout=30)
+        assert mock_smtp.sendmail.call_count == 2
+        assert [call.args[1] for call in mock_smtp.sendmail.call_args_list] == [
+            [test_user.email], [test_another_user.email]
+        ]
+        rows = _outbox(db_session)
+        assert {r.status for r in rows} == {"sent"}
+        assert all(r.sent_at is not None and r.locked_by is None and r.attempts == 1 for r in rows)
+
+    def test_rejected_recipient_retried_with_backoff(
+        self, db_session: Session, test_user: User, test_another_user: User, smtp_enabled, mock_smtp
+    ):
+        _notify(db_session, [test_user.id, test_another_user.id])
+        mock_smtp.sendmail.side_effect = [None, smtplib.SMTPRecipientsRefused({"x": (550, b"no such user")})]
+
+        _dispatcher(db_session).run_pending()
+        sent, retry = _outbox(db_session)
+        assert sent.status == "sent"
+        assert retry.status == "pending" and retry.attempts == 1
+        assert "SMTPRecipientsRefused" in retry.last_error
+        # SQLite 读回的是 naive UTC 时间
+        expected = utc_now().replace(tzinfo=None) + timedelta(seconds=settings.NOTIFY_OUTBOX_RETRY_BACKOFF_SECONDS - 5)
+        assert retry.next_attempt_at.replace(tzinfo=None) > expected
+
+    def test_failed_after_max_attempts(
+        self, db_session: Session, test_user: User, smtp_enabled, mock_smtp, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(settings, "NOTIFY_OUTBOX_MAX_ATTEMPTS", 2)
+        monkeypatch.setattr(settings, "NOTIFY_OUTBOX_RETRY_BACKOFF_SECONDS", 0)
+        mock_smtp.login.side_effect = smtplib.SMTPAuthenticationError(535, b"bad credentials")
+        monkeypatch.setattr(settings, "SMTP_PASSWORD", "secret")
+        _notify(db_session, [test_user.id])
+
+        assert _dispatcher(db_session).run_pending() == 2
+        (row,) = _outbox(db_session)
+        assert (row.status, row.attempts) == ("failed", 2)
+        assert "SMTPAuthenticationError" in row.last_error
+        mock_smtp.sendmail.assert_not_called()
+
+    def test_claim_is_exclusive(self, db_session: Session, test_user: User, test_another_user: User, smtp_enabled):
+        _notify(db_session, [test_user.id, test_another_user.id])
+        assert len(claim_batch(db_session, "w1", 1)) == 1
+        assert len(claim_batch(db_session, "w2", 10)) == 1
+        assert claim_batch(db_session, "w3", 10) == []
+
+    def test_expired_lease_reclaimed(self, db_session: Session, test_user: User, smtp_enabled, mock_smtp):
+        _notify(db_session, [test_user.id])
+        (claimed,) = claim_batch(db_session, "crashed", 10)
+        assert _dispatcher(db_session).run_pending() == 0
+
+        db_session.execute(
+            update(NotificationOutbox)
+            .where(NotificationOutbox.id == claimed.id)
+            .values(locked_until=utc_now() - timedelta(seconds=1))
+        )
+        db_session.commit()
+        assert _dispatcher(db_session).run_pending() == 1
+        (row,) = _outbox(db_session)
+        assert (row.status, row.attempts) == ("sent", 2)
+
+
+class TestSendMany:
+    def _provider(self) -> SmtpEmailProvider:
+        return SmtpEmailProvider(SmtpConfig("smtp.example.com", 587, "user", "pw", True))
+
+    def _message(self, to: str) -> EmailMessage:
+        return EmailMessage("subject", [to], "<p>hi</p>", "hi", "noreply@example.com")
+
+    def test_results_per_message(self, mock_smtp):
+        refused = smtplib.SMTPRecipientsRefused({"b@example.com": (550, b"no")})
+        mock_smtp.sendmail.side_effect = [None, refused, None]
+
+        messages = [self._message(f"{c}@example.com") for c in "abc"]
+        assert self._provider().send_many(messages) == [None, refused, None]
+        mock_smtp.cls.assert_called_once()
+        mock_smtp.starttls.assert_called_once()
+        mock_smtp.login.assert_called_once_with("user", "pw")
+
+    def test_disconnect_fails_remaining(self, mock_smtp):
+        lost = smtplib.SMTPServerDisconnected("lost")
+        mock_smtp.sendmail.side_effect = [None, lost]
+
+        messages = [self._message(f"{c}@example.com") for c in "abc"]
+        assert self._provider().send_many(messages) == [None, lost, lost]
+        assert mock_smtp.sendmail.call_count == 2
@@ -0,0 +1,215 @@
+"""游标（keyset）分页测试"""
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from app.api.contents import LIST_KEYSET as CONTENT_KEYSET
+from app.api.events import LIST_KEYSET as EVENT_KEYSET
+from app.core.pagination import Keyset
+from app.models import Content
+from app.models.community import Community
+from app.models.design import Asset
+from app.models.event import Event
+from app.models.notification import Notification
+from app.models.people import PersonProfile
+from app.models.user import User
+
+BASE = datetime(2026, 3, 1, 8, 0)
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+
+def _walk(client: TestClient, url: str, headers: dict, page_size: int = 3, items_key: str = "items") -> list[int]:
+    """从第一页起沿 next_cursor 翻到底，返回全部 id。"""
+    sep = "&" if "?" in url else "?"
+    data = client.get(f"{url}{sep}page_size={page_size}", headers=headers).json()
+    ids = [item["id"] for item in data[items_key]]
+    while data["next_cursor"]:
+        resp = client.get(f"{url}{sep}page_size={page_size}&cursor={data['next_cursor']}", headers=headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] is None
+        ids += [item["id"] for item in data[items_key]]
+    return ids
+
+
+class TestKeyset:
+    def test_cursor_round_trip(self):
+        row = Content(id=7, updated_at=BASE)
+        assert CONTENT_KEYSET.decode(CONTENT_KEYSET.encode(row)) == [BASE, 7]
+
+    @pytest.mark.parametrize("cursor", ["not-a-cursor", "e30", "W10"])
+    def test_invalid_cursor(self, cursor: str):
+        with pytest.raises(HTTPException) as exc:
+            CONTENT_KEYSET.after(cursor)
+        assert exc.value.status_code == 400
+
+    def test_cursor_from_other_list_rejected(self):
+        cursor = EVENT_KEYSET.encode(Event(id=1, planned_at=BASE))
+        with pytest.raises(HTTPException):
+            CONTENT_KEYSET.after(cursor)
+
+    def test_order_ends_with_tiebreaker(self):
+        clauses = [str(c) for c in EVENT_KEYSET.order_by()]
+        assert clauses == ["events.planned_at DESC NULLS LAST", "events.id DESC"]
+
+    def test_nullable_column_with_default_keeps_null_rows(self, db_session: Session, test_community: Community):
+        # created_at 有 Python 端默认值，但默认值加入前写入的行仍可能为 NULL
+        keyset = Keyset(Content.created_at, Content.id, descending=True)
+        ids = []
+        for i in range(4):
+            content = Content(title=f"c{i}", community_id=test_community.id, created_at=BASE + timedelta(hours=i))
+            db_session.add(content)
+            db_session.flush()
+            ids.append(content.id)
+        db_session.execute(update(Content).where(Content.id.in_(ids[:2])).values(created_at=None))
+        db_session.flush()
+
+        seen, cursor = [], None
+        while True:
+            query = keyset.apply(select(Content).where(Content.id.in_(ids)), cursor=cursor, offset=0, limit=1)
+            items, cursor = keyset.page(db_session.scalars(query).all(), 1)
+            seen += [item.id for item in items]
+            if not cursor:
+                break
+        assert seen == [ids[3], ids[2], ids[1], ids[0]]
+
+    def test_cursor_query_uses_index_range(self, db_session: Session):
+        cursor = CONTENT_KEYSET.encode(Content(id=5, updated_at=BASE))
+        stmt = CONTENT_KEYSET.apply(select(Content.id), cursor=cursor, offset=0, limit=20)
+        # 使用真实的绑定参数：各分支的参数相互独立，数据库无法假定它们相等
+        compiled = stmt.compile(db_session.get_bind())
+        params = tuple(str(compiled.params[name]) for name in compiled.positiontup)
+        rows = db_session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)
+        plan = " ".join(row[-1] for row in rows)
+        assert "SEARCH" in plan and "ix_contents_updated_at_id" in plan
+
+
+class TestListEndpoints:
+    def test_contents_with_ties(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community
+    ):
+        # 同一 updated_at 的多行需靠 id 打破平局，翻页不重不漏
+        for i in range(8):
+            db_session.add(Content(title=f"c{i}", community_id=test_community.id, updated_at=BASE + timedelta(i // 3)))
+        db_session.commit()
+
+        first = client.get("/api/contents?page_size=3", headers=auth_headers).json()
+        assert first["total"] == 8 and first["next_cursor"]
+
+        expected = [c["id"] for c in client.get("/api/contents?page_size=100", headers=auth_headers).json()["items"]]
+        assert _walk(client, "/api/contents", auth_headers) == expected
+        assert len(set(expected)) == 8
+
+    def test_offset_pages_match_cursor_pages(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community
+    ):
+        for i in range(7):
+            db_session.add(Content(title=f"c{i}", community_id=test_community.id, updated_at=BASE))
+        db_session.commit()
+
+        offset_ids = []
+        for page in (1, 2, 3):
+            data = client.get(f"/api/contents?page={page}&page_size=3", headers=auth_headers).json()
+            offset_ids += [c["id"] for c in data["items"]]
+        assert data["next_cursor"] is None
+        assert _walk(client, "/api/contents", auth_headers) == offset_ids
+
+    def test_include_total_flag(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community
+    ):
+        for i in range(4):
+            db_session.add(Content(title=f"c{i}", community_id=test_community.id, updated_at=BASE))
+        db_session.commit()
+        cursor = client.get("/api/contents?page_size=2", headers=auth_headers).json()["next_cursor"]
+
+        assert client.get("/api/contents?include_total=false", headers=auth_headers).json()["total"] is None
+        data = client.get(f"/api/contents?page_size=2&cursor={cursor}&include_total=true", headers=auth_headers).json()
+        assert data["total"] == 4
+        assert data["next_cursor"] is None
+
+    def test_events_nulls_last(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community
+    ):
+        planned = [BASE, None, BASE + timedelta(days=1), None, BASE, None, BASE - timedelta(days=1)]
+        for i, at in enumerate(planned):
+            db_session.add(Event(title=f"e{i}", community_id=test_community.id, planned_at=at))
+        db_session.commit()
+
+        ids = _walk(client, "/api/events", auth_headers, page_size=2)
+        events = {e.id: e for e in db_session.query(Event).all()}
+        assert len(ids) == len(planned) == len(set(ids))
+        # 有日期的在前（降序），无日期的在后（id 降序）
+        dated = [i for i in ids if events[i].planned_at is not None]
+        assert ids[: len(dated)] == dated
+        assert [events[i].planned_at for i in dated] == sorted((events[i].planned_at for i in dated), reverse=True)
+        assert ids[len(dated):] == sorted(ids[len(dated):], reverse=True)
+
+    def test_people_ascending(self, client: TestClient, auth_headers: dict, db_session: Session):
+        for name in ["王五", "Alice", "Bob", "Alice", "Carol"]:
+            db_session.add(PersonProfile(display_name=name, source="manual"))
+        db_session.commit()
+
+        ids = _walk(client, "/api/people", auth_headers, page_size=2)
+        people = {p.id: p.display_name for p in db_session.query(PersonProfile).all()}
+        assert [people[i] for i in ids] == sorted(people.values())
+
+    def test_notifications_cursor(self, client: TestClient, auth_headers: dict, db_session: Session, test_user: User):
+        for i in range(5):
+            db_session.add(Notification(user_id=test_user.id, type="system", title=f"n{i}", created_at=BASE))
+        db_session.commit()
+
+        data = client.get("/api/notifications?limit=2", headers=auth_headers).json()
+        assert data["total"] == 5 and data["unread_count"] == 5
+        ids = _walk(client, "/api/notifications?limit=2", auth_headers)
+        assert ids == sorted(ids, reverse=True) and len(ids) == 5
+
+    def test_assets_cursor_async(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community
+    ):
+        for i in range(5):
+            db_session.add(Asset(
+                name=f"a{i}", asset_type="image", file_url=f"/u/{i}.png", file_key=f"{i}.png",
+                community_id=test_community.id, created_at=BASE + timedelta(minutes=i % 2),
+            ))
+        db_session.commit()
+
+        ids = _walk(client, "/api/assets/", auth_headers, page_size=2)
+        assert len(ids) == len(set(ids)) == 5
+
+    def test_invalid_cursor_is_400(self, client: TestClient, auth_headers: dict):
+        resp = client.get("/api/events?cursor=garbage", headers=auth_headers)
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "无效的分页游标"
+
+
+class TestMigration:
+    def test_null_sort_timestamps_backfilled(self, tmp_path):
+        """排序时间戳列改为 NOT NULL 前回填存量 NULL，避免这些行从游标分页中丢失。"""
+        db_file = tmp_path / "upgrade.db"
+        env = {**os.environ, "DATABASE_URL": f"sqlite:///{db_file}"}
+
+        def alembic(*args: str) -> None:
+            subprocess.run([sys.executable, "-m", "alembic", *args], cwd=BACKEND_DIR, env=env,
+                           check=True, capture_output=True)
+
+        alembic("upgrade", "016_user_work_items")
+        created = BASE.isoformat(sep=" ")
+        with sqlite3.connect(db_file) as conn:
+            conn.execute("INSERT INTO contents (id, title, status, created_at) VALUES (1, '旧稿', 'draft', ?)", (created,))
+            conn.execute("INSERT INTO audit_logs (id, user_id, action, resource_type) VALUES (1, 1, 'login', 'user')")
+        alembic("upgrade", "017_keyset_sort_not_null")
+
+        with sqlite3.connect(db_file) as conn:
+            assert conn.execute("SELECT updated_at FROM contents").fetchone()[0].startswith(created)
+            assert conn.execute("SELECT created_at FROM audit_logs").fetchone()[0] is not None
+            with pytest.raises(sqlite3.IntegrityError):
+                conn.execute("UPDATE contents SET updated_at = NULL")
@@ -0,0 +1,189 @@
+"""认证主体缓存测试"""
+from contextlib import contextmanager
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session
+
+from app.core.principal_cache import (
+    PRINCIPAL_CACHE_NAME,
+    PrincipalCache,
+    cached_community_roles,
+    invalidate_principal_cache,
+    principal_cache,
+)
+from app.core.security import create_access_token, decode_access_token
+from app.models.community import Community
+from app.models.user import User, community_users
+from app.services.cache_version import get_cache_version
+
+
+@contextmanager
+def count_queries(db: Session):
+    statements: list[str] = []
+
+    def _before(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    engine = db.get_bind().engine
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+
+def _cache(**overrides) -> PrincipalCache:
+    options = {"maxsize": 16, "ttl_seconds": 60, "version_check_seconds": 0}
+    options.update(overrides)
+    return PrincipalCache(**options)
+
+
+class TestPrincipalCache:
+    def test_token_carries_iat(self):
+        payload = decode_access_token(create_access_token(data={"sub": "someone"}))
+        assert "iat" in payload
+
+    def test_hit_issues_no_user_or_membership_query(self, db_session: Session, test_user: User, test_community):
+        cache = _cache(version_check_seconds=3600)
+        first = cache.resolve(db_session, test_user.username, 1)
+        assert cached_community_roles(first) == {test_community.id: "admin"}
+
+        with count_queries(db_session) as statements:
+            second = cache.resolve(db_session, test_user.username, 1)
+        assert statements == []
+        assert second.id == test_user.id
+        assert cached_community_roles(second) == {test_community.id: "admin"}
+
+    def test_unknown_user_not_cached(self, db_session: Session):
+        cache = _cache()
+        assert cache.resolve(db_session, "ghost", 1) is None
+        assert len(cache) == 0
+
+    def test_key_includes_issued_at(self, db_session: Session, test_user: User):
+        cache = _cache()
+        cache.resolve(db_session, test_user.username, 1)
+        cache.resolve(db_session, test_user.username, 2)
+        assert len(cache) == 2
+
+    def test_lru_eviction(self, db_session: Session, test_user: User):
+        cache = _cache(maxsize=2)
+        for issued_at in range(3):
+            cache.resolve(db_session, test_user.username, issued_at)
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self, db_session: Session, test_user: User):
+        cache = _cache(ttl_seconds=-1)
+        cache.resolve(db_session, test_user.username, 1)
+        with count_queries(db_session) as statements:
+            cache.resolve(db_session, test_user.username, 1)
+        assert any("FROM users" in s for s in statements)
+
+    def test_disabled_cache_queries_every_time(self, db_session: Session, test_user: User):
+        cache = _cache(maxsize=0)
+        user = cache.resolve(db_session, test_user.username, 1)
+        assert user.id == test_user.id
+        assert cached_community_roles(user) is None
+
+    def test_version_bump_reaches_other_workers(self, db_session: Session, test_user: User, test_community):
+        # 两个缓存实例模拟两个 worker
+        worker_a = _cache()
+        worker_b = _cache()
+        worker_a.resolve(db_session, test_user.username, 1)
+        worker_b.resolve(db_session, test_user.username, 1)
+
+        db_session.execute(
+            community_users.update()
+            .where(community_users.c.user_id == test_user.id)
+            .values(role="user")
+        )
+        invalidate_principal_cache(db_session)
+        db_session.commit()
+        assert get_cache_version(db_session, PRINCIPAL_CACHE_NAME) == 1
+
+        user = worker_b.resolve(db_session, test_user.username, 1)
+        assert cached_community_roles(user) == {test_community.id: "user"}
+
+
+class TestPrincipalCacheApi:
+    def test_role_change_invalidates(
+        self,
+        client: TestClient,
+        db_session: Session,
+        superuser_auth_headers: dict,
+        auth_headers: dict,
+        test_user: User,
+        test_community: Community,
+    ):
+        other = Community(name="Other", slug="other", is_active=True)
+        db_session.add(other)
+        db_session.commit()
+
+        # 首次访问填充缓存：test_user 不是 other 的成员
+        headers = {**auth_headers, "X-Community-Id": str(other.id)}
+        resp = client.get("/api/committees", headers=headers)
+        assert resp.status_code == 403
+
+        resp = client.post(
+            f"/api/communities/{other.id}/users",
+            json={"user_id": test_user.id},
+            headers=superuser_auth_headers,
+        )
+        assert resp.status_code == 200
+        assert get_cache_version(db_session, PRINCIPAL_CACHE_NAME) >= 1
+
+        resp = client.get("/api/committees", headers=headers)
+        assert resp.status_code == 200
+
+    def test_deactivated_user_rejected(
+        self,
+        client: TestClient,
+        db_session: Session,
+        superuser_auth_headers: dict,
+        auth_headers: dict,
+        test_user: User,
+    ):
+        assert client.get("/api/auth/me", headers=auth_headers).status_code == 200
+        assert len(principal_cache) >= 1
+
+        resp = client.patch(
+            f"/api/auth/users/{test_user.id}",
+            json={"is_active": False},
+            headers=superuser_auth_headers,
+        )
+        assert resp.status_code == 200
+        assert client.get("/api/auth/me", headers=auth_headers).status_code == 403
+
+    def test_setup_revokes_default_admin_token(self, client: TestClient, db_session: Session):
+        default_admin = User(
+            username="admin", email="admin@example.com", hashed_password="x",
+            is_superuser=True, is_default_admin=True,
+        )
+        db_session.add(default_admin)
+        db_session.commit()
+        old_headers = {"Authorization": f"Bearer {create_access_token(data={'sub': 'admin'})}"}
+        assert client.get("/api/auth/me", headers=old_headers).status_code == 200
+
+        resp = client.post(
+            "/api/auth/setup",
+            json={"username": "newadmin", "email": "new@example.com", "password": "secret123"},
+            headers=old_headers,
+        )
+        assert resp.status_code == 200
+        assert client.get("/api/auth/me", headers=old_headers).status_code == 401
+
+    def test_membership_from_cache(self, client: TestClient, db_session: Session, test_user: User):
+        community = Community(name="Cached", slug="cached", is_active=True)
+        db_session.add(community)
+        db_session.flush()
+        db_session.execute(
+            insert(community_users).values(user_id=test_user.id, community_id=community.id, role="user")
+        )
+        db_session.commit()
+        token = create_access_token(data={"sub": test_user.username})
+        headers = {"Authorization": f"Bearer {token}", "X-Community-Id": str(community.id)}
+
+        assert client.get("/api/committees", headers=headers).status_code == 200
+        with count_queries(db_session) as statements:
+            assert client.get("/api/committees", headers=headers).status_code == 200
+        assert not any("FROM users" in s or "FROM community_users" in s for s in statements)
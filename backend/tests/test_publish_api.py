@@ -449,6 +449,7 @@ class TestPublishToWechat:
         db_session: Session,
         test_community: Community,
         auth_headers: dict,
+        complete_job,
     ):
         """Test publishing to WeChat without configuration returns error."""
         content = Content(
@@ -465,8 +466,10 @@ class TestPublishToWechat:
         response = client.post(
             f"/api/publish/{content.id}/wechat", headers=auth_headers
         )
-        # Should return error due to missing WeChat configuration
-        assert response.status_code in [400, 500]
+        job = complete_job(response)
+        # Should fail due to missing WeChat configuration
+        assert job["status"] == "failed"
+        assert job["error_status"] in [400, 500]
 
     def test_publish_to_wechat_nonexistent_content(
         self, client: TestClient, auth_headers: dict
@@ -484,6 +487,7 @@ class TestPublishToWechat:
         test_community: Community,
         auth_headers: dict,
         tmp_path,
+        complete_job,
     ):
         """Test complete WeChat publishing flow with mocked service calls."""
         from unittest.mock import patch, AsyncMock
@@ -533,18 +537,16 @@ class TestPublishToWechat:
             mock_upload.return_value = "mock_thumb_media_id_456"
             mock_draft.return_value = {"media_id": "mock_draft_media_id_789", "status": "draft"}
 
-            # 4. Execute: Call publish API
+            # 4. Execute: Call publish API, then run the queued job
             response = client.post(
                 f"/api/publish/{content.id}/wechat",
                 headers=auth_headers
             )
+            job = complete_job(response)
 
-        # 5. Assert: Check response
-        if response.status_code != 201:
-            print(f"Response status: {response.status_code}")
-            print(f"Response body: {response.text}")
-        assert response.status_code == 201
-        data = response.json()
+        # 5. Assert: Check job result
+        assert job["status"] == "succeeded", job["error"]
+        data = job["result"]
         assert data["channel"] == "wechat"
         assert data["status"] == "draft"
         assert data["platform_article_id"] == "mock_draft_media_id_789"
@@ -570,6 +572,7 @@ class TestPublishToWechat:
         test_community: Community,
         auth_headers: dict,
         tmp_path,
+        complete_job,
     ):
         """Test that failed publish records also include community_id."""
         from unittest.mock import patch, AsyncMock
@@ -618,14 +621,17 @@ class TestPublishToWechat:
             mock_upload.return_value = "thumb_123"
             mock_draft.side_effect = Exception("草稿创建失败 [errcode=40001]: invalid credential")
 
-            # Call API (should fail)
+            # Call API (job should fail)
             response = client.post(
                 f"/api/publish/{content.id}/wechat",
                 headers=auth_headers
             )
+            job = complete_job(response)
 
-        # Should return error
-        assert response.status_code == 502
+        # Should fail without retry (creating drafts is not idempotent)
+        assert job["status"] == "failed"
+        assert job["error_status"] == 502
+        assert job["attempts"] == job["max_attempts"] == 1
 
         # Verify failed record includes community_id
         from app.models.publish_record import PublishRecord
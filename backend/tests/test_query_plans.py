@@ -0,0 +1,239 @@
+"""热点查询的执行计划回归测试。
+
+调用接口时记录其发出的 SELECT，逐条执行 ``EXPLAIN``，被关注的表一旦出现全表扫描即失败：
+- SQLite：``EXPLAIN QUERY PLAN``，不允许 ``SCAN <table>``（含整索引扫描）；
+- PostgreSQL：设置 ``TEST_POSTGRES_URL`` 时在该库建表后 ``EXPLAIN (FORMAT JSON)``，
+  关闭 enable_seqscan，不允许对被关注的表出现 ``Seq Scan``。
+"""
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Select
+
+from app.core.count_cache import _Explain
+from app.database import Base
+from app.models.audit import AuditLog
+from app.models.campaign import Campaign, CampaignContact
+from app.models.committee import Committee
+from app.models.community import Community
+from app.models.content import Content
+from app.models.ecosystem import EcosystemProject, EcosystemSnapshot
+from app.models.meeting import Meeting
+from app.models.notification import Notification
+from app.models.people import PersonProfile
+from app.models.publish_record import PublishRecord
+from app.models.user import User
+from app.models.wechat_stats import WechatArticleStat
+
+NOW = datetime(2026, 10, 1, 8, 0)
+
+
+@contextmanager
+def _capture(test_engine) -> Iterator[list[Select]]:
+    """记录块内执行的 SELECT 语句（ORM 查询在此时已带上绑定值）。"""
+    statements: list[Select] = []
+
+    def before_execute(conn, clauseelement, multiparams, params, execution_options):
+        if isinstance(clauseelement, Select):
+            statements.append(clauseelement)
+
+    event.listen(test_engine, "before_execute", before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(test_engine, "before_execute", before_execute)
+
+
+def _sqlite_plan(db: Session, stmt: Select) -> list[str]:
+    compiled = stmt.compile(db.get_bind())
+    params = tuple(compiled.params[name] for name in compiled.positiontup or ())
+    return [row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}", params)]
+
+
+def _full_scans(plan: list[str], tables: set[str]) -> list[str]:
+    return [line for line in plan if (m := re.match(r"SCAN (\w+)", line)) and m.group(1) in tables]
+
+
+def _seq_scans(node: dict, tables: set[str]) -> Iterator[str]:
+    if node.get("Node Type") == "Seq Scan" and node.get("Relation Name") in tables:
+        yield node["Relation Name"]
+    for child in node.get("Plans", ()):
+        yield from _seq_scans(child, tables)
+
+
+@pytest.fixture(scope="module")
+def pg_engine():
+    url = os.environ.get("TEST_POSTGRES_URL")
+    if not url:
+        yield None
+        return
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    yield engine
+    Base.metadata.drop_all(engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def assert_indexed(db_session: Session, test_engine, pg_engine):
+    """``with assert_indexed("t1", "t2", uses=[...]): <调用接口>``：块内对这些表的查询都必须走索引，
+    且 uses 中的每个索引至少被一条查询用到。"""
+
+    @contextmanager
+    def check(*tables: str, uses: tuple[str, ...] = ()):
+        watched = set(tables)
+        with _capture(test_engine) as statements:
+            yield
+        relevant = [s for s in statements if any(re.search(rf"\b{name}\b", str(s)) for name in watched)]
+        assert relevant, "未捕获到相关查询"
+        plans = {str(stmt): _sqlite_plan(db_session, stmt) for stmt in relevant}
+        scans = {sql: _full_scans(plan, watched) for sql, plan in plans.items()}
+        assert {sql: lines for sql, lines in scans.items() if lines} == {}
+        used = " ".join(line for plan in plans.values() for line in plan)
+        assert [index for index in uses if index not in used] == [], plans
+
+        if pg_engine is not None:
+            with pg_engine.connect() as conn:
+                conn.execute(text("SET enable_seqscan = off"))
+                for stmt in relevant:
+                    plan = conn.execute(_Explain(stmt)).scalar()
+                    assert list(_seq_scans(plan[0]["Plan"], watched)) == [], str(stmt)
+                conn.rollback()
+
+    return check
+
+
+# ── 数据 ──────────────────────────────────────────────────────────────
+
+
+@pytest.fixture
+def published_records(db_session: Session, test_community: Community) -> list[PublishRecord]:
+    content = Content(title="发布内容", community_id=test_community.id, status="approved")
+    db_session.add(content)
+    db_session.flush()
+    records = [
+        PublishRecord(
+            content_id=content.id,
+            channel=channel,
+            status="published",
+            published_at=NOW - timedelta(days=days),
+            community_id=test_community.id,
+        )
+        for channel, days in (("wechat", 1), ("hugo", 40), ("wechat", 200))
+    ]
+    db_session.add_all(records)
+    db_session.commit()
+    return records
+
+
+class TestQueryPlans:
+    def test_community_dashboard(
+        self, assert_indexed, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community,
+        published_records,
+    ):
+        committee = Committee(community_id=test_community.id, name="技术委员会", slug="tech", is_active=True)
+        db_session.add(committee)
+        db_session.flush()
+        db_session.add_all(
+            Meeting(
+                community_id=test_community.id,
+                committee_id=committee.id,
+                title=f"例会 {n}",
+                scheduled_at=datetime.now() + timedelta(days=n),
+                status="scheduled",
+            )
+            for n in range(-2, 3)
+        )
+        db_session.commit()
+
+        with assert_indexed(
+            "publish_records", "meetings",
+            uses=("ix_publish_records_community_status_published_at", "ix_meetings_community_status_scheduled_at"),
+        ):
+            r = client.get(f"/api/communities/{test_community.id}/dashboard", headers=auth_headers)
+        assert r.status_code == 200
+
+    def test_notifications(self, assert_indexed, client: TestClient, auth_headers: dict, db_session: Session, test_user: User):
+        db_session.add_all(
+            Notification(user_id=test_user.id, type="system", title=f"通知 {n}", is_read=n % 2 == 0)
+            for n in range(5)
+        )
+        db_session.commit()
+
+        with assert_indexed("notifications", uses=("ix_notifications_user_read_created_at",)):
+            assert client.get("/api/notifications/unread-count", headers=auth_headers).json()["count"] == 2
+            assert client.get("/api/notifications?unread_only=true", headers=auth_headers).status_code == 200
+
+    def test_wechat_stats(
+        self, assert_indexed, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community,
+        published_records,
+    ):
+        record = published_records[0]
+        db_session.add_all(
+            WechatArticleStat(
+                publish_record_id=record.id,
+                community_id=test_community.id,
+                stat_date=date(2026, 9, day),
+                read_count=day * 10,
+            )
+            for day in (1, 2, 3)
+        )
+        db_session.commit()
+
+        with assert_indexed("wechat_article_stats", uses=("ix_wechat_stats_community_date",)):
+            assert client.get("/api/wechat-stats/overview", headers=auth_headers).status_code == 200
+            r = client.get(f"/api/wechat-stats/articles/{record.id}/daily", headers=auth_headers)
+        assert len(r.json()) == 3
+
+    def test_ecosystem_trend(self, assert_indexed, client: TestClient, auth_headers: dict, db_session: Session):
+        project = EcosystemProject(name="gecko", platform="github", org_name="opengecko")
+        db_session.add(project)
+        db_session.flush()
+        db_session.add_all(
+            EcosystemSnapshot(project_id=project.id, snapshot_at=NOW - timedelta(days=n), stars=100 - n)
+            for n in range(3)
+        )
+        db_session.commit()
+
+        with assert_indexed("ecosystem_snapshots", uses=("ix_ecosystem_snapshots_project_snapshot_at",)):
+            r = client.get(f"/api/insights/trends/{project.id}", headers=auth_headers)
+        assert r.status_code == 200
+
+    def test_audit_logs_by_community(
+        self, assert_indexed, client: TestClient, superuser_auth_headers: dict, db_session: Session,
+        test_community: Community, test_superuser: User,
+    ):
+        db_session.add_all(
+            AuditLog(user_id=test_superuser.id, community_id=test_community.id, action="update", resource_type="content")
+            for _ in range(3)
+        )
+        db_session.commit()
+
+        with assert_indexed("audit_logs", uses=("ix_audit_logs_community_created_at",)):
+            r = client.get(f"/api/admin/audit-logs?community_id={test_community.id}", headers=superuser_auth_headers)
+        assert r.status_code == 200
+
+    def test_campaign_contacts_by_status(
+        self, assert_indexed, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+    ):
+        campaign = Campaign(community_id=test_community.id, owner_ids=[test_user.id], name="推广", type="promotion")
+        db_session.add(campaign)
+        db_session.flush()
+        for n, status in enumerate(("pending", "contacted", "pending")):
+            person = PersonProfile(display_name=f"联系人 {n}", source="manual")
+            db_session.add(person)
+            db_session.flush()
+            db_session.add(CampaignContact(campaign_id=campaign.id, person_id=person.id, status=status))
+        db_session.commit()
+
+        with assert_indexed("campaign_contacts", uses=("ix_campaign_contacts_campaign_status",)):
+            assert client.get(f"/api/campaigns/{campaign.id}/funnel", headers=auth_headers).json()["pending"] == 2
+            r = client.get(f"/api/campaigns/{campaign.id}/contacts?status=pending", headers=auth_headers)
+        assert len(r.json()["items"]) == 2
@@ -0,0 +1,165 @@
+"""速率限制：限流键、共享存储后端与社区配额测试"""
+import pytest
+from fastapi.testclient import TestClient
+from limits import parse
+from limits.storage import storage_from_string
+from limits.strategies import FixedWindowRateLimiter, SlidingWindowCounterRateLimiter
+from starlette.requests import Request
+
+from app.core import dependencies
+from app.core.rate_limit import CommunityLimiter, client_key, community_key, limiter
+from app.core.rate_limit_storage import DatabaseStorage
+from app.core.security import create_access_token
+
+
+def _request(headers: dict[str, str] | None = None, client_ip: str = "10.0.0.1") -> Request:
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw, "client": (client_ip, 1234)})
+
+
+class TestKeyFunctions:
+    def test_anonymous_client_key(self):
+        assert client_key(_request()) == "10.0.0.1:anon"
+
+    def test_client_key_combines_ip_and_user(self):
+        token = create_access_token(data={"sub": "alice"})
+        request = _request({"Authorization": f"Bearer {token}"})
+        assert client_key(request) == "10.0.0.1:alice"
+
+    def test_client_key_ignores_community_header(self):
+        # 请求头可随意更换，不能成为限流键的一部分
+        assert client_key(_request({"X-Community-Id": "7"})) == client_key(_request({"X-Community-Id": "8"}))
+
+    def test_invalid_token_is_anonymous(self):
+        request = _request({"Authorization": "Bearer not-a-jwt"})
+        assert client_key(request) == "10.0.0.1:anon"
+
+    def test_community_key(self):
+        assert community_key(3) == "community:3"
+
+
+@pytest.fixture
+def db_storage(tmp_path) -> DatabaseStorage:
+    storage = storage_from_string(f"sqlalchemy+sqlite:///{tmp_path / 'ratelimit.db'}")
+    assert isinstance(storage, DatabaseStorage)
+    return storage
+
+
+class TestDatabaseStorage:
+    def test_incr_get_clear(self, db_storage: DatabaseStorage):
+        assert db_storage.incr("k", 60) == 1
+        assert db_storage.incr("k", 60, amount=2) == 3
+        assert db_storage.get("k") == 3
+        assert db_storage.get_expiry("k") > 0
+        db_storage.clear("k")
+        assert db_storage.get("k") == 0
+
+    def test_expired_counter_restarts(self, db_storage: DatabaseStorage):
+        db_storage.incr("k", -1)
+        assert db_storage.get("k") == 0
+        assert db_storage.incr("k", 60) == 1
+
+    def test_decr_never_negative(self, db_storage: DatabaseStorage):
+        db_storage.incr("k", 60)
+        assert db_storage.decr("k", 5) == 0
+
+    def test_fixed_window_shared_between_workers(self, db_storage: DatabaseStorage, tmp_path):
+        # 两个 Storage 实例指向同一个库，模拟两个 gunicorn worker
+        other = storage_from_string(f"sqlalchemy+sqlite:///{tmp_path / 'ratelimit.db'}")
+        limit = parse("3/minute")
+        worker_a = FixedWindowRateLimiter(db_storage)
+        worker_b = FixedWindowRateLimiter(other)
+
+        assert worker_a.hit(limit, "client")
+        assert worker_b.hit(limit, "client")
+        assert worker_a.hit(limit, "client")
+        assert not worker_b.hit(limit, "client")
+
+    def test_sliding_window_counter(self, db_storage: DatabaseStorage):
+        limiter = SlidingWindowCounterRateLimiter(db_storage)
+        limit = parse("2/minute")
+        assert limiter.hit(limit, "client")
+        assert limiter.hit(limit, "client")
+        assert not limiter.hit(limit, "client")
+        assert limiter.get_window_stats(limit, "client").remaining == 0
+        limiter.clear(limit, "client")
+        assert limiter.hit(limit, "client")
+
+    def test_reset_and_check(self, db_storage: DatabaseStorage):
+        db_storage.incr("a", 60)
+        db_storage.incr("b", 60)
+        assert db_storage.check() is True
+        assert db_storage.reset() == 2
+
+
+class TestRedisStorage:
+    """Redis 协议存储：使用 fakeredis 作为本地替身"""
+
+    def test_sliding_window_counter(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        import redis
+
+        pool = redis.ConnectionPool(connection_class=fakeredis.FakeConnection, server=fakeredis.FakeServer())
+        storage = storage_from_string("redis://localhost:6379/0", connection_pool=pool)
+        limiter = SlidingWindowCounterRateLimiter(storage)
+        limit = parse("2/minute")
+
+        assert limiter.hit(limit, "community:1")
+        assert limiter.hit(limit, "community:1")
+        assert not limiter.hit(limit, "community:1")
+        assert limiter.hit(limit, "community:2")
+
+
+@pytest.fixture
+def fresh_limiter():
+    limiter.reset()
+    yield limiter
+    limiter.reset()
+
+
+class TestLoginLimit:
+    def test_community_header_does_not_bypass_login_limit(self, client: TestClient, fresh_limiter):
+        def attempt(i: int) -> int:
+            return client.post(
+                "/api/auth/login",
+                json={"username": "nobody", "password": "wrongpass"},
+                headers={"X-Community-Id": str(i)},
+            ).status_code
+
+        assert [attempt(i) for i in range(10)] == [401] * 10
+        assert attempt(10) == 429
+
+
+class TestCommunityQuota:
+    @pytest.fixture
+    def quota(self, monkeypatch) -> CommunityLimiter:
+        quota = CommunityLimiter(key_func=client_key, community_limits=["3/minute"], storage_uri="memory://")
+        monkeypatch.setattr(dependencies, "limiter", quota)
+        return quota
+
+    def test_quota_shared_across_users(
+        self, client: TestClient, quota: CommunityLimiter, auth_headers: dict, superuser_auth_headers: dict
+    ):
+        assert client.get("/api/committees", headers=auth_headers).status_code == 200
+        assert client.get("/api/committees", headers=superuser_auth_headers).status_code == 200
+        assert client.get("/api/committees", headers=auth_headers).status_code == 200
+        assert client.get("/api/committees", headers=superuser_auth_headers).status_code == 429
+
+    def test_other_community_unaffected(
+        self, client: TestClient, quota: CommunityLimiter, auth_headers: dict, another_user_auth_headers: dict
+    ):
+        for _ in range(3):
+            client.get("/api/committees", headers=auth_headers)
+        assert client.get("/api/committees", headers=auth_headers).status_code == 429
+        assert client.get("/api/committees", headers=another_user_auth_headers).status_code == 200
+
+    def test_unverified_community_not_counted(
+        self, client: TestClient, quota: CommunityLimiter, auth_headers: dict, another_user_auth_headers: dict
+    ):
+        # 非成员伪造请求头既不消耗也不绕过目标社区的配额
+        forged = {**auth_headers, "X-Community-Id": another_user_auth_headers["X-Community-Id"]}
+        assert [client.get("/api/committees", headers=forged).status_code for _ in range(5)] == [403] * 5
+        for _ in range(3):
+            assert client.get("/api/committees", headers=another_user_auth_headers).status_code == 200
+        assert client.get("/api/committees", headers=another_user_auth_headers).status_code == 429
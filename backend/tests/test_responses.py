@@ -0,0 +1,83 @@
+"""JSON 响应快速路径测试"""
+import asyncio
+import json
+from datetime import UTC, datetime
+from types import SimpleNamespace
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import APIRoute, serialize_response
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.responses import model_response
+from app.main import app
+from app.models.committee import Committee
+from app.models.community import Community
+from app.models.meeting import Meeting
+from app.models.user import User
+from app.schemas.governance import MeetingOut
+
+
+def _meeting(**overrides) -> dict:
+    data = {
+        "id": 1,
+        "committee_id": 1,
+        "community_id": 1,
+        "title": "例会",
+        "description": None,
+        "scheduled_at": datetime(2026, 3, 1, 10, 0),
+        "duration": 60,
+        "location_type": "online",
+        "location": None,
+        "online_url": None,
+        "status": "scheduled",
+        "reminder_sent": False,
+        "created_by_user_id": None,
+        "created_at": datetime(2026, 1, 1, tzinfo=UTC),
+        "updated_at": datetime(2026, 1, 2, 3, 4, 5, 678000, tzinfo=UTC),
+        "assignee_ids": [1, 2],
+    }
+    return {**data, **overrides}
+
+
+def test_fast_path_matches_default_serialization():
+    route = next(r for r in app.routes if isinstance(r, APIRoute) and r.path == "/api/meetings" and "GET" in r.methods)
+    rows = [_meeting(), _meeting(id=2, title="含 \"引号\" 与中文", assignee_ids=[])]
+
+    default = asyncio.run(serialize_response(field=route.response_field, response_content=rows))
+    fast = model_response(list[MeetingOut], [SimpleNamespace(**r) for r in rows])
+
+    assert fast.media_type == "application/json"
+    assert json.loads(fast.body) == json.loads(JSONResponse(default).body)
+    assert fast.body == ORJSONResponse(default).body
+
+
+def test_default_response_class_is_orjson():
+    route = next(r for r in app.routes if isinstance(r, APIRoute) and r.path == "/api/communities")
+    assert route.response_class is ORJSONResponse
+
+
+def test_list_meetings_fast_path(
+    client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+):
+    committee = Committee(community_id=test_community.id, name="技术委员会", slug="tc")
+    db_session.add(committee)
+    db_session.flush()
+    meeting = Meeting(
+        committee_id=committee.id,
+        community_id=test_community.id,
+        title="周会",
+        scheduled_at=datetime(2026, 3, 1, 10, 0),
+        created_by_user_id=test_user.id,
+    )
+    meeting.assignees.append(test_user)
+    db_session.add(meeting)
+    db_session.commit()
+
+    resp = client.get("/api/meetings", headers=auth_headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/json"
+    [item] = resp.json()
+    assert item["title"] == "周会"
+    assert item["assignee_ids"] == [test_user.id]
+    assert item["scheduled_at"] == "2026-03-01T10:00:00"
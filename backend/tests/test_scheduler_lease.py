@@ -0,0 +1,174 @@
+"""调度器 Leader 租约与执行历史测试"""
+from datetime import timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy.orm import Session
+
+from app.core.timezone import utc_now
+from app.models.scheduler import SchedulerJobRun, SchedulerLease
+from app.services.scheduler_lease import (
+    SchedulerLeader,
+    record_job_run,
+    release_lease,
+    try_acquire_lease,
+)
+
+
+class _SessionFactory:
+    """把测试 Session 包装成 session_factory，close 不真正关闭（事务由 fixture 回滚）。"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def __call__(self):
+        return self
+
+    def __enter__(self) -> Session:
+        return self.db
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+class TestTryAcquireLease:
+    def test_first_holder_acquires(self, db_session: Session):
+        assert try_acquire_lease(db_session, "worker-a", ttl_seconds=60) is True
+        lease = db_session.get(SchedulerLease, "scheduler")
+        assert lease.holder_id == "worker-a"
+
+    def test_other_holder_blocked_while_valid(self, db_session: Session):
+        assert try_acquire_lease(db_session, "worker-a", ttl_seconds=60) is True
+        assert try_acquire_lease(db_session, "worker-b", ttl_seconds=60) is False
+        db_session.expire_all()
+        assert db_session.get(SchedulerLease, "scheduler").holder_id == "worker-a"
+
+    def test_holder_renews_and_keeps_acquired_at(self, db_session: Session):
+        try_acquire_lease(db_session, "worker-a", ttl_seconds=60)
+        first = db_session.get(SchedulerLease, "scheduler")
+        acquired_at, expires_at = first.acquired_at, first.expires_at
+
+        assert try_acquire_lease(db_session, "worker-a", ttl_seconds=120) is True
+        db_session.expire_all()
+        renewed = db_session.get(SchedulerLease, "scheduler")
+        assert renewed.acquired_at == acquired_at
+        assert renewed.expires_at > expires_at
+
+    def test_expired_lease_fails_over(self, db_session: Session):
+        past = utc_now() - timedelta(minutes=5)
+        db_session.add(
+            SchedulerLease(
+                name="scheduler",
+                holder_id="dead-worker",
+                acquired_at=past,
+                heartbeat_at=past,
+                expires_at=past + timedelta(seconds=60),
+            )
+        )
+        db_session.commit()
+
+        assert try_acquire_lease(db_session, "worker-b", ttl_seconds=60) is True
+        db_session.expire_all()
+        assert db_session.get(SchedulerLease, "scheduler").holder_id == "worker-b"
+
+    def test_leases_are_independent_by_name(self, db_session: Session):
+        assert try_acquire_lease(db_session, "worker-a", ttl_seconds=60, name="one") is True
+        assert try_acquire_lease(db_session, "worker-b", ttl_seconds=60, name="two") is True
+
+    def test_release_allows_immediate_takeover(self, db_session: Session):
+        try_acquire_lease(db_session, "worker-a", ttl_seconds=60)
+        assert release_lease(db_session, "worker-b") is False
+        assert release_lease(db_session, "worker-a") is True
+        assert try_acquire_lease(db_session, "worker-b", ttl_seconds=60) is True
+
+
+class TestRecordJobRun:
+    def test_success_records_result(self, db_session: Session):
+        factory = _SessionFactory(db_session)
+        result = record_job_run(factory, "issue_sync", "worker-a", lambda: {"updated": 3})
+
+        assert result == {"updated": 3}
+        run = db_session.query(SchedulerJobRun).filter_by(job_id="issue_sync").one()
+        assert run.status == "success"
+        assert run.result == {"updated": 3}
+        assert run.finished_at is not None
+        assert run.duration_ms >= 0
+
+    def test_failure_records_error_and_reraises(self, db_session: Session):
+        factory = _SessionFactory(db_session)
+
+        def boom():
+            raise RuntimeError("github down")
+
+        with pytest.raises(RuntimeError):
+            record_job_run(factory, "issue_sync", "worker-a", boom)
+
+        run = db_session.query(SchedulerJobRun).filter_by(job_id="issue_sync").one()
+        assert run.status == "failed"
+        assert "github down" in run.error
+
+    def test_exports_duration_and_failure_metrics(self, db_session: Session):
+        factory = _SessionFactory(db_session)
+        labels = {"job_id": "metrics_job"}
+
+        def boom():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            record_job_run(factory, "metrics_job", "worker-a", boom)
+        record_job_run(factory, "metrics_job", "worker-a", lambda: None)
+
+        assert REGISTRY.get_sample_value("opengecko_scheduler_job_failures_total", labels) == 1
+        assert REGISTRY.get_sample_value("opengecko_scheduler_job_duration_seconds_count", labels) == 2
+
+
+class TestSchedulerLeader:
+    def test_only_leader_runs_job(self, db_session: Session):
+        factory = _SessionFactory(db_session)
+        leader = SchedulerLeader(factory, ttl_seconds=60, holder_id="worker-a")
+        follower = SchedulerLeader(factory, ttl_seconds=60, holder_id="worker-b")
+        calls: list[str] = []
+
+        leader.leader_only("job", lambda: calls.append("a"))()
+        follower.leader_only("job", lambda: calls.append("b"))()
+
+        assert calls == ["a"]
+        assert leader.is_leader is True
+        assert follower.is_leader is False
+        assert db_session.query(SchedulerJobRun).filter_by(job_id="job").count() == 1
+
+    def test_release_hands_over(self, db_session: Session):
+        factory = _SessionFactory(db_session)
+        leader = SchedulerLeader(factory, ttl_seconds=60, holder_id="worker-a")
+        follower = SchedulerLeader(factory, ttl_seconds=60, holder_id="worker-b")
+
+        assert leader.heartbeat() is True
+        assert follower.heartbeat() is False
+        leader.release()
+        assert follower.heartbeat() is True
+
+
+class TestSchedulerAdminApi:
+    def test_list_runs(self, client: TestClient, db_session: Session, superuser_auth_headers: dict):
+        db_session.add_all([
+            SchedulerJobRun(job_id="issue_sync", holder_id="w", status="success", duration_ms=10),
+            SchedulerJobRun(job_id="ecosystem_sync", holder_id="w", status="failed", error="x"),
+        ])
+        db_session.commit()
+
+        resp = client.get("/api/admin/scheduler/runs", params={"job_id": "issue_sync"}, headers=superuser_auth_headers)
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total"] == 1
+        assert data["items"][0]["status"] == "success"
+
+    def test_list_leases(self, client: TestClient, db_session: Session, superuser_auth_headers: dict):
+        try_acquire_lease(db_session, "worker-a", ttl_seconds=60)
+        resp = client.get("/api/admin/scheduler/leases", headers=superuser_auth_headers)
+        assert resp.status_code == 200
+        assert [lease["holder_id"] for lease in resp.json()] == ["worker-a"]
+
+    def test_requires_superuser(self, client: TestClient, auth_headers: dict):
+        resp = client.get("/api/admin/scheduler/runs", headers=auth_headers)
+        assert resp.status_code == 403
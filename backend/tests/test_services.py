@@ -285,6 +285,113 @@ class TestEmailService:
                 send_email(community, message)
 
 
+# ──────────────────────────────────────────────────────────────────────────────
+# SMTP Connection Pool Tests
+# ──────────────────────────────────────────────────────────────────────────────
+
+
+class TestSmtpConnectionPool:
+    """测试 SMTP 连接复用、NOOP 健康检查与空闲回收"""
+
+    def _config(self, host="smtp.example.com"):
+        from app.services.email import SmtpConfig
+        return SmtpConfig(host=host, port=587, username="user", password="pw", use_tls=True)
+
+    def _message(self):
+        from app.services.email import EmailMessage
+        return EmailMessage("s", ["a@example.com"], "<p>hi</p>", "hi", "sender@example.com")
+
+    def _patch_smtp(self):
+        """每次连接返回一个新的 mock 服务器，记录在 servers 中。"""
+        servers = []
+
+        def factory(*args, **kwargs):
+            server = MagicMock()
+            server.noop.return_value = (250, b"OK")
+            servers.append(server)
+            return server
+
+        return patch("smtplib.SMTP", side_effect=factory), servers
+
+    def _provider(self, config=None, **pool_kwargs):
+        from app.services.email import SmtpConnectionPool, SmtpEmailProvider
+        pool_kwargs = {"max_idle": 2, "idle_timeout": 60, "noop_after": 60, **pool_kwargs}
+        return SmtpEmailProvider(config or self._config(), pool=SmtpConnectionPool(**pool_kwargs))
+
+    def test_connection_reused(self):
+        provider = self._provider()
+        patcher, servers = self._patch_smtp()
+        with patcher:
+            provider.send(self._message())
+            provider.send_many([self._message(), self._message()])
+        assert len(servers) == 1
+        servers[0].login.assert_called_once_with("user", "pw")
+        assert servers[0].sendmail.call_count == 3
+        servers[0].quit.assert_not_called()
+
+    def test_pool_keyed_by_config(self):
+        from app.services.email import SmtpConnectionPool, SmtpEmailProvider
+        pool = SmtpConnectionPool(max_idle=2, idle_timeout=60, noop_after=60)
+        patcher, servers = self._patch_smtp()
+        with patcher:
+            SmtpEmailProvider(self._config("a.example.com"), pool=pool).send(self._message())
+            SmtpEmailProvider(self._config("b.example.com"), pool=pool).send(self._message())
+            SmtpEmailProvider(self._config("a.example.com"), pool=pool).send(self._message())
+        assert len(servers) == 2
+        assert servers[0].sendmail.call_count == 2
+
+    def test_noop_health_check(self):
+        provider = self._provider(noop_after=-1)
+        patcher, servers = self._patch_smtp()
+        with patcher:
+            provider.send(self._message())
+            provider.send(self._message())
+            assert len(servers) == 1
+            servers[0].noop.assert_called_once()
+
+            servers[0].noop.return_value = (421, b"closing")
+            provider.send(self._message())
+        assert len(servers) == 2
+        servers[0].quit.assert_called_once()
+
+    def test_idle_timeout_evicts(self):
+        provider = self._provider(idle_timeout=-1)
+        patcher, servers = self._patch_smtp()
+        with patcher:
+            provider.send(self._message())
+            assert provider._pool.evict_idle() == 1
+            provider.send(self._message())
+            provider.send(self._message())
+        # 过期连接借出时同样会被关闭
+        assert len(servers) == 3
+        assert all(server.quit.called for server in servers[:2])
+
+    def test_broken_connection_not_returned(self):
+        provider = self._provider()
+        patcher, servers = self._patch_smtp()
+        with patcher:
+            provider.send(self._message())
+            servers[0].sendmail.side_effect = smtplib.SMTPDataError(554, b"rejected")
+            with pytest.raises(smtplib.SMTPDataError):
+                provider.send(self._message())
+            provider.send(self._message())
+
+            # smtplib 在断开时把 sock 置为 None
+            servers[1].sock = None
+            provider.send_many([self._message()])
+            provider.send(self._message())
+        assert len(servers) == 3
+
+    def test_max_idle_zero_disables_reuse(self):
+        provider = self._provider(max_idle=0)
+        patcher, servers = self._patch_smtp()
+        with patcher:
+            provider.send(self._message())
+            provider.send(self._message())
+        assert len(servers) == 2
+        assert all(server.quit.called for server in servers)
+
+
 # ──────────────────────────────────────────────────────────────────────────────
 # Notification Service Tests
 # ──────────────────────────────────────────────────────────────────────────────
@@ -0,0 +1,99 @@
+"""请求级 SQL 观测测试"""
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.core.sql_instrumentation import (
+    SqlInstrumentationMiddleware,
+    route_sql_summary,
+    statement_shape,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_summary():
+    route_sql_summary.clear()
+    yield
+    route_sql_summary.clear()
+
+
+class TestStatementShape:
+    def test_collapses_whitespace(self):
+        assert statement_shape("SELECT *\n  FROM users\tWHERE id = ?") == "SELECT * FROM users WHERE id = ?"
+
+    def test_folds_in_lists(self):
+        a = statement_shape("SELECT * FROM users WHERE id IN (?, ?, ?)")
+        b = statement_shape("SELECT * FROM users WHERE id IN (?, ?)")
+        c = statement_shape("SELECT * FROM users WHERE id IN (%(id_1_1)s, %(id_1_2)s)")
+        assert a == b == c == "SELECT * FROM users WHERE id IN (?)"
+
+
+class TestMiddleware:
+    @pytest.fixture
+    def perf_client(self, test_engine) -> TestClient:
+        app = FastAPI()
+        app.add_middleware(SqlInstrumentationMiddleware)
+
+        @app.get("/items/{item_id}")
+        def repeated(item_id: int):
+            with test_engine.connect() as conn:
+                for i in range(12):
+                    conn.execute(text("SELECT :i"), {"i": i})
+            return {"ok": True}
+
+        @app.get("/async")
+        async def async_route():
+            with test_engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return {"ok": True}
+
+        return TestClient(app)
+
+    def test_headers(self, perf_client: TestClient):
+        resp = perf_client.get("/items/1")
+        assert resp.headers["x-db-queries"] == "12"
+        assert resp.headers["server-timing"].startswith("db;dur=")
+        assert 'desc="12 queries"' in resp.headers["server-timing"]
+
+    def test_async_route_counted(self, perf_client: TestClient):
+        resp = perf_client.get("/async")
+        assert resp.headers["x-db-queries"] == "1"
+
+    def test_n_plus_one_warning_and_summary(self, perf_client: TestClient, caplog):
+        with caplog.at_level(logging.WARNING, logger="app.core.sql_instrumentation"):
+            perf_client.get("/items/1")
+            perf_client.get("/items/2")
+
+        records = [r for r in caplog.records if r.getMessage() == "请求 SQL 超出阈值"]
+        assert len(records) == 2
+        assert records[0].route == "GET /items/{item_id}"
+        assert records[0].repeated_statements[0]["count"] == 12
+
+        summary = {item["route"]: item for item in route_sql_summary.snapshot()}
+        route = summary["GET /items/{item_id}"]
+        assert route["requests"] == 2
+        assert route["avg_queries"] == 12
+        assert route["n_plus_one_requests"] == 2
+
+    def test_queries_outside_request_not_counted(self, perf_client: TestClient, test_engine):
+        with test_engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        assert route_sql_summary.snapshot() == []
+
+
+class TestPerfRoutesApi:
+    def test_admin_summary(self, client: TestClient, superuser_auth_headers: dict):
+        resp = client.get("/api/auth/me", headers=superuser_auth_headers)
+        assert int(resp.headers["x-db-queries"]) >= 1
+
+        resp = client.get("/api/admin/perf/routes", headers=superuser_auth_headers)
+        assert resp.status_code == 200
+        routes = {item["route"] for item in resp.json()["routes"]}
+        assert "GET /api/auth/me" in routes
+
+    def test_requires_superuser(self, client: TestClient, auth_headers: dict):
+        resp = client.get("/api/admin/perf/routes", headers=auth_headers)
+        assert resp.status_code == 403
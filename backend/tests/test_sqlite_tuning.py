@@ -0,0 +1,80 @@
+"""SQLite 调优与只读连接池测试"""
+import time
+
+import pytest
+from fastapi.routing import APIRoute
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import OperationalError
+
+from app.config import settings
+from app.database import configure_sqlite_engine, get_async_db, get_db
+from app.main import app
+
+
+@pytest.fixture
+def sqlite_url(tmp_path) -> str:
+    return f"sqlite:///{tmp_path / 'tuning.db'}"
+
+
+def _engine(url: str, read_only: bool = False):
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    configure_sqlite_engine(engine, read_only=read_only)
+    return engine
+
+
+class TestPragmas:
+    def test_connect_applies_pragmas(self, sqlite_url: str):
+        engine = _engine(sqlite_url)
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == settings.SQLITE_BUSY_TIMEOUT_MS
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA cache_size")).scalar() == settings.SQLITE_CACHE_SIZE
+            assert conn.execute(text("PRAGMA query_only")).scalar() == 0
+        engine.dispose()
+
+    def test_read_only_engine_rejects_writes(self, sqlite_url: str):
+        writer = _engine(sqlite_url)
+        with writer.begin() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+        reader = _engine(sqlite_url, read_only=True)
+        with reader.connect() as conn:
+            assert conn.execute(text("SELECT count(*) FROM t")).scalar() == 0
+            with pytest.raises(OperationalError, match="readonly"):
+                conn.execute(text("INSERT INTO t (id) VALUES (1)"))
+        reader.dispose()
+        writer.dispose()
+
+    def test_reader_not_blocked_by_open_write_transaction(self, sqlite_url: str):
+        writer = _engine(sqlite_url)
+        with writer.begin() as conn:
+            conn.execute(text("CREATE TABLE t (id INTEGER PRIMARY KEY)"))
+            conn.execute(text("INSERT INTO t (id) VALUES (1)"))
+        reader = _engine(sqlite_url, read_only=True)
+
+        with writer.connect() as write_conn:
+            write_conn.execute(text("BEGIN IMMEDIATE"))
+            write_conn.execute(text("INSERT INTO t (id) VALUES (2)"))
+            start = time.perf_counter()
+            with reader.connect() as read_conn:
+                # WAL：读到的是已提交快照，不等待写锁
+                assert read_conn.execute(text("SELECT count(*) FROM t")).scalar() == 1
+            assert time.perf_counter() - start < 1
+            write_conn.execute(text("COMMIT"))
+
+        with reader.connect() as read_conn:
+            assert read_conn.execute(text("SELECT count(*) FROM t")).scalar() == 2
+        reader.dispose()
+        writer.dispose()
+
+
+def test_get_routes_use_read_sessions():
+    """GET 接口的 Session 参数应来自只读连接池（认证等依赖项除外）。"""
+    offenders = []
+    for route in app.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        for dep in route.dependant.dependencies:
+            if dep.call in (get_db, get_async_db):
+                offenders.append(f"{route.path} ({route.endpoint.__name__})")
+    assert offenders == []
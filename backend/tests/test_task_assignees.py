@@ -0,0 +1,117 @@
+"""任务责任人关联表测试（活动任务 / 清单项 / 运营任务）。"""
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign, CampaignTask, campaign_task_assignees
+from app.models.community import Community
+from app.models.event import ChecklistItem, Event, EventTask, event_task_assignees
+from app.models.user import User
+
+
+def _event(db: Session, community: Community) -> Event:
+    event = Event(community_id=community.id, title="线下沙龙", event_type="offline", status="planning")
+    db.add(event)
+    db.commit()
+    return event
+
+
+def _links(db: Session, table, task_id: int) -> list[int]:
+    return list(db.scalars(select(table.c.user_id).where(table.c.task_id == task_id).order_by(table.c.id)))
+
+
+class TestAssigneeIds:
+    def test_round_trip_dedups_and_keeps_order(
+        self, db_session: Session, test_community: Community, test_user: User, test_superuser: User
+    ):
+        task = EventTask(
+            event_id=_event(db_session, test_community).id,
+            title="场地",
+            assignee_ids=[test_superuser.id, test_user.id, test_superuser.id],
+        )
+        db_session.add(task)
+        db_session.commit()
+        assert task.assignee_ids == [test_superuser.id, test_user.id]
+        assert _links(db_session, event_task_assignees, task.id) == [test_superuser.id, test_user.id]
+
+        task.assignee_ids = [test_user.id]
+        db_session.commit()
+        assert _links(db_session, event_task_assignees, task.id) == [test_user.id]
+
+    def test_reassign_bumps_updated_at_only_on_change(
+        self, db_session: Session, test_community: Community, test_user: User, test_superuser: User
+    ):
+        item = ChecklistItem(event_id=_event(db_session, test_community).id, phase="pre", title="物料",
+                             assignee_ids=[test_user.id])
+        db_session.add(item)
+        db_session.commit()
+        stamp = item.updated_at
+
+        item.assignee_ids = [test_user.id]
+        assert item.updated_at == stamp
+        item.assignee_ids = [test_user.id, test_superuser.id]
+        assert item.updated_at != stamp
+
+    def test_delete_task_removes_links(self, db_session: Session, test_community: Community, test_user: User):
+        campaign = Campaign(community_id=test_community.id, owner_ids=[test_user.id], name="推广", type="promotion")
+        db_session.add(campaign)
+        db_session.flush()
+        task = CampaignTask(campaign_id=campaign.id, title="海报", assignee_ids=[test_user.id])
+        db_session.add(task)
+        db_session.commit()
+
+        db_session.delete(task)
+        db_session.commit()
+        assert _links(db_session, campaign_task_assignees, task.id) == []
+
+
+class TestApi:
+    def test_unknown_users_are_dropped(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+    ):
+        event = _event(db_session, test_community)
+        r = client.post(
+            f"/api/events/{event.id}/tasks",
+            json={"title": "签到", "assignee_ids": [99999, test_user.id]},
+            headers=auth_headers,
+        )
+        assert r.status_code == 201
+        assert r.json()["assignee_ids"] == [test_user.id]
+
+        r = client.patch(
+            f"/api/events/{event.id}/tasks/{r.json()['id']}", json={"assignee_ids": [99998]}, headers=auth_headers
+        )
+        assert r.json()["assignee_ids"] == []
+
+    def test_dashboard_not_truncated_by_other_users_tasks(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community,
+        test_user: User, test_superuser: User,
+    ):
+        """其他人的任务再多，也不会挤掉当前用户的任务（过滤在 SQL 中完成，limit 作用于过滤之后）。"""
+        event = _event(db_session, test_community)
+        db_session.add_all(
+            EventTask(event_id=event.id, title=f"他人任务 {n}", assignee_ids=[test_superuser.id]) for n in range(210)
+        )
+        db_session.add(EventTask(event_id=event.id, title="我的任务", assignee_ids=[test_user.id]))
+        db_session.commit()
+
+        r = client.get("/api/users/me/dashboard", headers=auth_headers)
+        assert r.status_code == 200
+        tasks = r.json()["event_tasks"]
+        assert [t["title"] for t in tasks] == ["我的任务"]
+        assert tasks[0]["event_title"] == "线下沙龙"
+
+    def test_workload_groups_shared_task_under_each_user(
+        self, client: TestClient, superuser_auth_headers: dict, db_session: Session, test_community: Community,
+        test_user: User, test_superuser: User,
+    ):
+        event = _event(db_session, test_community)
+        db_session.add(EventTask(event_id=event.id, title="共同任务", status="in_progress",
+                                 assignee_ids=[test_user.id, test_superuser.id]))
+        db_session.commit()
+
+        r = client.get("/api/users/me/workload-overview", headers=superuser_auth_headers)
+        assert r.status_code == 200
+        stats = {u["user_id"]: u["event_task_stats"]["in_progress"] for u in r.json()["users"]}
+        assert stats[test_user.id] == 1
+        assert stats[test_superuser.id] == 1
@@ -20,7 +20,8 @@ from app.services.storage import LocalStorage
 def use_local_storage(tmp_path):
     """测试期间强制使用本地存储，避免依赖 boto3 / S3 配置"""
     storage = LocalStorage(str(tmp_path))
-    with patch("app.api.upload.get_storage", return_value=storage):
+    with patch("app.api.upload.get_storage", return_value=storage), \
+            patch("app.services.jobs.handlers.get_storage", return_value=storage):
         yield
 
 
@@ -34,6 +35,7 @@ class TestUploadFile:
         test_community: Community,
         auth_headers: dict,
         tmp_path,
+        complete_job,
     ):
         """Test uploading a markdown file creates content."""
         md_content = b"# Hello World\n\nThis is test content.\n"
@@ -44,8 +46,9 @@ class TestUploadFile:
             files={"file": ("test_article.md", md_file, "text/markdown")},
             headers=auth_headers,
         )
-        assert response.status_code == 201
-        data = response.json()
+        job = complete_job(response)
+        assert job["status"] == "succeeded"
+        data = job["result"]
         assert data["title"] == "test_article"
         assert "Hello World" in data["content_markdown"] or "Hello World" in data["content_html"]
 
@@ -83,6 +86,7 @@ class TestUploadFile:
         client: TestClient,
         db_session: Session,
         auth_headers: dict,
+        complete_job,
     ):
         """Test uploading .markdown extension (alternative to .md) works."""
         md_content = b"# Title\n\nParagraph text.\n"
@@ -93,9 +97,9 @@ class TestUploadFile:
             files={"file": ("article.markdown", md_file, "text/markdown")},
             headers=auth_headers,
         )
-        assert response.status_code == 201
-        data = response.json()
+        data = complete_job(response)["result"]
         assert data["title"] == "article"
+        assert db_session.get(Content, data["id"]).source_file.endswith(".markdown")
 
 
 class TestUploadCoverImage:
@@ -0,0 +1,216 @@
+"""个人负责事项投影（user_work_items）测试。"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete, select, update
+from sqlalchemy.orm import Session
+
+from app.models.committee import Committee
+from app.models.community import Community
+from app.models.content import Content
+from app.models.design import DesignTask
+from app.models.event import Event, EventTask, event_task_assignees
+from app.models.meeting import Meeting
+from app.models.user import User
+from app.models.user_work_item import UserWorkItem
+from app.services.user_work_items import reconcile_work_items
+
+NOW = datetime(2026, 10, 17, 9, 0)
+
+
+def _rows(db: Session, user_id: int, item_type: str | None = None) -> dict:
+    """(item_type, item_id) -> 投影行。"""
+    db.expire_all()
+    stmt = select(UserWorkItem).where(UserWorkItem.user_id == user_id)
+    if item_type is not None:
+        stmt = stmt.where(UserWorkItem.item_type == item_type)
+    return {(row.item_type, row.item_id): row for row in db.scalars(stmt)}
+
+
+def _content(db: Session, community: Community, assignees: list[User], **kwargs) -> Content:
+    content = Content(community_id=community.id, **{"title": "稿件", **kwargs})
+    content.assignees.extend(assignees)
+    db.add(content)
+    db.commit()
+    return content
+
+
+@pytest.fixture
+def event(db_session: Session, test_community: Community) -> Event:
+    event = Event(community_id=test_community.id, title="线下沙龙", event_type="offline", status="planning")
+    db_session.add(event)
+    db_session.commit()
+    return event
+
+
+class TestWriteHooks:
+    def test_content_lifecycle(self, db_session: Session, test_community: Community, test_user: User):
+        content = _content(db_session, test_community, [test_user], work_status="in_progress",
+                           scheduled_publish_at=NOW)
+        row = _rows(db_session, test_user.id)[("content", content.id)]
+        assert (row.title, row.status, row.work_status, row.due_at) == ("稿件", "draft", "in_progress", NOW)
+
+        content.title = "改名"
+        content.status = "reviewing"
+        content.scheduled_publish_at = None
+        db_session.commit()
+        row = _rows(db_session, test_user.id)[("content", content.id)]
+        assert (row.title, row.status, row.due_at) == ("改名", "reviewing", None)
+
+        content.assignees.clear()
+        db_session.commit()
+        assert _rows(db_session, test_user.id) == {}
+
+        content.assignees.append(test_user)
+        db_session.commit()
+        assert ("content", content.id) in _rows(db_session, test_user.id)
+
+        db_session.delete(content)
+        db_session.commit()
+        assert _rows(db_session, test_user.id) == {}
+
+    def test_assignment_from_user_side(
+        self, db_session: Session, test_community: Community, test_user: User, test_superuser: User
+    ):
+        content = _content(db_session, test_community, [test_superuser])
+        test_user.assigned_contents.append(content)
+        db_session.commit()
+        assert set(_rows(db_session, test_user.id)) == {("content", content.id)}
+        assert set(_rows(db_session, test_superuser.id)) == {("content", content.id)}
+
+    def test_meeting_status_mapping(self, db_session: Session, test_community: Community, test_user: User):
+        committee = Committee(community_id=test_community.id, name="技术委员会", slug="tech")
+        db_session.add(committee)
+        db_session.flush()
+        meeting = Meeting(committee_id=committee.id, community_id=test_community.id, title="例会",
+                          scheduled_at=NOW, status="scheduled")
+        meeting.assignees.append(test_user)
+        db_session.add(meeting)
+        db_session.commit()
+        assert _rows(db_session, test_user.id)[("meeting", meeting.id)].work_status == "planning"
+
+        meeting.status = "cancelled"
+        db_session.commit()
+        assert _rows(db_session, test_user.id)[("meeting", meeting.id)].work_status == "completed"
+
+    def test_task_assignee_ids(
+        self, db_session: Session, event: Event, test_user: User, test_superuser: User
+    ):
+        task = EventTask(event_id=event.id, title="场地", status="blocked", end_date=date(2026, 10, 20),
+                         assignee_ids=[test_user.id])
+        db_session.add(task)
+        db_session.commit()
+        row = _rows(db_session, test_user.id)[("event_task", task.id)]
+        assert (row.parent_id, row.work_status, row.due_at) == (event.id, "in_progress", datetime(2026, 10, 20))
+
+        task.assignee_ids = [test_superuser.id]
+        db_session.commit()
+        assert _rows(db_session, test_user.id) == {}
+        assert set(_rows(db_session, test_superuser.id)) == {("event_task", task.id)}
+
+    def test_design_task_assignee(
+        self, db_session: Session, test_community: Community, test_user: User, test_superuser: User
+    ):
+        task = DesignTask(title="封面", community_id=test_community.id, status="review", assignee_id=test_user.id)
+        db_session.add(task)
+        db_session.commit()
+        assert _rows(db_session, test_user.id)[("design_task", task.id)].work_status == "in_progress"
+
+        task.assignee_id = test_superuser.id
+        db_session.commit()
+        assert _rows(db_session, test_user.id) == {}
+        assert set(_rows(db_session, test_superuser.id)) == {("design_task", task.id)}
+
+    def test_unrelated_changes_do_not_rewrite(self, db_session: Session, test_community: Community, test_user: User):
+        content = _content(db_session, test_community, [test_user])
+        before = _rows(db_session, test_user.id)[("content", content.id)].updated_at
+        content.content_markdown = "正文"
+        db_session.commit()
+        assert _rows(db_session, test_user.id)[("content", content.id)].updated_at == before
+
+
+class TestWorkItemsEndpoint:
+    @pytest.fixture
+    def items(self, db_session: Session, test_community: Community, event: Event, test_user: User) -> dict:
+        late = _content(db_session, test_community, [test_user], title="晚", scheduled_publish_at=NOW + timedelta(days=5))
+        undated = _content(db_session, test_community, [test_user], title="无截止", work_status="completed")
+        task = EventTask(event_id=event.id, title="场地", end_date=date(2026, 10, 18), assignee_ids=[test_user.id])
+        early = _content(db_session, test_community, [test_user], title="早", scheduled_publish_at=NOW)
+        db_session.add(task)
+        db_session.commit()
+        return {"late": late.id, "undated": undated.id, "task": task.id, "early": early.id}
+
+    def test_sorted_by_due_date_nulls_last(self, client: TestClient, auth_headers: dict, items: dict):
+        data = client.get("/api/users/me/work-items", headers=auth_headers).json()
+        assert [(i["item_type"], i["item_id"]) for i in data["items"]] == [
+            ("content", items["early"]), ("event_task", items["task"]),
+            ("content", items["late"]), ("content", items["undated"]),
+        ]
+        assert data["total"] == 4
+        assert data["next_cursor"] is None
+
+    def test_filters(self, client: TestClient, auth_headers: dict, items: dict):
+        url = "/api/users/me/work-items"
+        tasks = client.get(f"{url}?item_type=event_task", headers=auth_headers).json()["items"]
+        assert [i["item_id"] for i in tasks] == [items["task"]]
+        assert tasks[0]["parent_id"] is not None
+
+        done = client.get(f"{url}?work_status=completed", headers=auth_headers).json()["items"]
+        assert [i["item_id"] for i in done] == [items["undated"]]
+
+        assert client.get(f"{url}?item_type=nope", headers=auth_headers).status_code == 400
+
+    def test_cursor_pagination(self, client: TestClient, auth_headers: dict, items: dict):
+        seen, cursor = [], None
+        while True:
+            suffix = f"&cursor={cursor}" if cursor else ""
+            data = client.get(f"/api/users/me/work-items?limit=1{suffix}", headers=auth_headers).json()
+            seen += [(i["item_type"], i["item_id"]) for i in data["items"]]
+            cursor = data["next_cursor"]
+            if not cursor:
+                break
+        assert len(seen) == 4
+        assert seen[-1] == ("content", items["undated"])
+
+    def test_assigned_contents_paginated_by_due_date(self, client: TestClient, auth_headers: dict, items: dict):
+        url = "/api/users/me/assigned/contents"
+        first = client.get(f"{url}?limit=2", headers=auth_headers).json()
+        second = client.get(f"{url}?skip=2&limit=2", headers=auth_headers).json()
+        assert [c["id"] for c in first + second] == [items["early"], items["late"], items["undated"]]
+
+
+class TestReconcile:
+    def test_repairs_writes_that_bypass_the_session(
+        self, db_session: Session, test_community: Community, event: Event, test_user: User
+    ):
+        content = _content(db_session, test_community, [test_user])
+        task = EventTask(event_id=event.id, title="场地", assignee_ids=[test_user.id])
+        db_session.add(task)
+        db_session.commit()
+
+        db_session.execute(update(Content).where(Content.id == content.id).values(title="批量改名"))
+        db_session.execute(delete(event_task_assignees).where(event_task_assignees.c.task_id == task.id))
+        db_session.commit()
+        assert _rows(db_session, test_user.id)[("content", content.id)].title == "稿件"
+
+        assert reconcile_work_items(db_session) == 2
+        rows = _rows(db_session, test_user.id)
+        assert set(rows) == {("content", content.id)}
+        assert rows[("content", content.id)].title == "批量改名"
+        assert reconcile_work_items(db_session) == 0
+
+    def test_repair_changes_dashboard_etag(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+    ):
+        content = _content(db_session, test_community, [test_user])
+        # 投影被绕过 Session 的写入弄丢
+        db_session.execute(delete(UserWorkItem).where(UserWorkItem.user_id == test_user.id))
+        db_session.commit()
+        stale = client.get("/api/users/me/dashboard", headers=auth_headers)
+        assert stale.json()["contents"] == []
+
+        reconcile_work_items(db_session)
+        resp = client.get("/api/users/me/dashboard", headers={**auth_headers, "If-None-Match": stale.headers["etag"]})
+        assert resp.status_code == 200
+        assert [c["id"] for c in resp.json()["contents"]] == [content.id]
@@ -521,12 +521,11 @@ class TestRebuildAggregates:
     """测试 POST /api/wechat-stats/aggregates/rebuild 端点。"""
 
     def test_rebuild_aggregates_no_data(
-        self, client: TestClient, auth_headers: dict
+        self, client: TestClient, auth_headers: dict, complete_job
     ):
         """无数据时重建应返回 rebuilt_count=0。"""
         resp = client.post("/api/wechat-stats/aggregates/rebuild", headers=auth_headers)
-        assert resp.status_code == 200, resp.json()
-        data = resp.json()
+        data = complete_job(resp)["result"]
         assert "rebuilt_count" in data
         assert "period_type" in data
         assert data["period_type"] == "daily"
@@ -536,6 +535,7 @@ class TestRebuildAggregates:
         client: TestClient,
         auth_headers: dict,
         wechat_stat: WechatArticleStat,
+        complete_job,
     ):
         """有数据时应成功重建聚合。"""
         resp = client.post(
@@ -547,8 +547,7 @@ class TestRebuildAggregates:
             },
             headers=auth_headers,
         )
-        assert resp.status_code == 200
-        assert resp.json()["rebuilt_count"] >= 1
+        assert complete_job(resp)["result"]["rebuilt_count"] >= 1
 
     def test_rebuild_aggregates_invalid_period(
         self, client: TestClient, auth_headers: dict
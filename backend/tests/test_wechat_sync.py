@@ -17,7 +17,7 @@ class TestSyncArticlesAPI:
 
     @patch("app.services.wechat_sync.wechat_service.fetch_published_articles", new_callable=AsyncMock)
     def test_sync_articles_success(
-        self, mock_fetch, client, auth_headers, test_community, test_user
+        self, mock_fetch, client, auth_headers, complete_job, test_community, test_user
     ):
         """成功同步文章，创建 Content 和 PublishRecord。"""
         mock_fetch.return_value = {
@@ -54,15 +54,14 @@ class TestSyncArticlesAPI:
         }
 
         resp = client.post("/api/wechat-stats/sync/articles", headers=auth_headers)
-        assert resp.status_code == 200
-        data = resp.json()
+        data = complete_job(resp)["result"]
         assert data["synced"] == 2
         assert data["skipped"] == 0
         assert data["total"] == 2
 
     @patch("app.services.wechat_sync.wechat_service.fetch_published_articles", new_callable=AsyncMock)
     def test_sync_articles_skips_existing(
-        self, mock_fetch, client, auth_headers, db_session, test_community, test_user
+        self, mock_fetch, client, auth_headers, complete_job, db_session, test_community, test_user
     ):
         """已存在的文章会跳过不重复创建。"""
         from app.models.content import Content
@@ -120,31 +119,32 @@ class TestSyncArticlesAPI:
         }
 
         resp = client.post("/api/wechat-stats/sync/articles", headers=auth_headers)
-        assert resp.status_code == 200
-        data = resp.json()
+        data = complete_job(resp)["result"]
         assert data["synced"] == 1
         assert data["skipped"] == 1
 
     @patch("app.services.wechat_sync.wechat_service.fetch_published_articles", new_callable=AsyncMock)
-    def test_sync_articles_empty(self, mock_fetch, client, auth_headers):
+    def test_sync_articles_empty(self, mock_fetch, client, auth_headers, complete_job):
         """微信端无文章时返回全零。"""
         mock_fetch.return_value = {"total_count": 0, "item_count": 0, "item": []}
 
         resp = client.post("/api/wechat-stats/sync/articles", headers=auth_headers)
-        assert resp.status_code == 200
-        data = resp.json()
+        data = complete_job(resp)["result"]
         assert data["synced"] == 0
         assert data["skipped"] == 0
         assert data["total"] == 0
 
     @patch("app.services.wechat_sync.wechat_service.fetch_published_articles", new_callable=AsyncMock)
-    def test_sync_articles_wechat_error(self, mock_fetch, client, auth_headers):
-        """微信 API 报错时返回 502。"""
+    def test_sync_articles_wechat_error(self, mock_fetch, client, auth_headers, complete_job):
+        """微信 API 报错时任务记录 502，退避后重试。"""
         mock_fetch.side_effect = Exception("获取已发布文章失败 [errcode=40001]: invalid credential")
 
         resp = client.post("/api/wechat-stats/sync/articles", headers=auth_headers)
-        assert resp.status_code == 502
-        assert "40001" in resp.json()["detail"]
+        job = complete_job(resp)
+        # 外部接口故障可重试：首次失败后退避重新入队
+        assert job["status"] == "queued"
+        assert job["error_status"] == 502
+        assert "40001" in job["error"]
 
     def test_sync_articles_no_auth(self, client, test_community):
         """未认证请求返回 401。"""
@@ -156,7 +156,7 @@ class TestSyncArticlesAPI:
 
     @patch("app.services.wechat_sync.wechat_service.fetch_published_articles", new_callable=AsyncMock)
     def test_sync_articles_multi_news_item(
-        self, mock_fetch, client, auth_headers
+        self, mock_fetch, client, auth_headers, complete_job
     ):
         """多图文推送（一次推送多篇）每篇都创建。"""
         mock_fetch.return_value = {
@@ -177,8 +177,7 @@ class TestSyncArticlesAPI:
         }
 
         resp = client.post("/api/wechat-stats/sync/articles", headers=auth_headers)
-        assert resp.status_code == 200
-        data = resp.json()
+        data = complete_job(resp)["result"]
         assert data["synced"] == 2
 
 
@@ -190,7 +189,7 @@ class TestSyncStatsAPI:
 
     @patch("app.services.wechat_sync.wechat_service.fetch_article_total_stats", new_callable=AsyncMock)
     def test_sync_stats_success(
-        self, mock_fetch_stats, client, auth_headers, db_session, test_community, test_user
+        self, mock_fetch_stats, client, auth_headers, complete_job, db_session, test_community, test_user
     ):
         """成功同步统计数据。"""
         from app.models.content import Content
@@ -246,8 +245,7 @@ class TestSyncStatsAPI:
             json={"start_date": "2026-02-20", "end_date": "2026-02-20"},
             headers=auth_headers,
         )
-        assert resp.status_code == 200
-        data = resp.json()
+        data = complete_job(resp)["result"]
         assert data["days_processed"] == 1
         assert data["stats_written"] == 1
 
@@ -272,7 +270,7 @@ class TestSyncStatsAPI:
 
     @patch("app.services.wechat_sync.wechat_service.fetch_article_total_stats", new_callable=AsyncMock)
     def test_sync_stats_no_matching_article(
-        self, mock_fetch_stats, client, auth_headers
+        self, mock_fetch_stats, client, auth_headers, complete_job
     ):
         """找不到匹配文章时统计条数为 0。"""
         mock_fetch_stats.return_value = {
@@ -293,8 +291,7 @@ class TestSyncStatsAPI:
             json={"start_date": "2026-02-20", "end_date": "2026-02-20"},
             headers=auth_headers,
         )
-        assert resp.status_code == 200
-        data = resp.json()
+        data = complete_job(resp)["result"]
         assert data["days_processed"] == 1
         assert data["stats_written"] == 0
 
@@ -0,0 +1,145 @@
+"""工作状态统计（数据库分组计数）测试。"""
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models.campaign import Campaign, CampaignContact, CampaignTask
+from app.models.committee import Committee
+from app.models.community import Community
+from app.models.content import Content
+from app.models.design import DesignTask
+from app.models.event import ChecklistItem, Event, EventTask
+from app.models.meeting import Meeting
+from app.models.people import PersonProfile
+from app.models.user import User
+from app.services.work_status_stats import WORK_ITEM_KINDS, work_status_query
+
+TODAY = datetime.utcnow().date()
+PAST = TODAY - timedelta(days=3)
+FUTURE = TODAY + timedelta(days=3)
+
+
+def _stats(planning=0, in_progress=0, completed=0, overdue=0) -> dict:
+    return {"planning": planning, "in_progress": in_progress, "completed": completed, "overdue": overdue}
+
+
+@pytest.fixture
+def assigned_items(db_session: Session, test_community: Community, test_user: User):
+    """test_user 负责的各类事项（覆盖状态映射与逾期边界）。"""
+    community_id = test_community.id
+    event = Event(community_id=community_id, title="线下沙龙", event_type="offline", status="planning")
+    campaign = Campaign(community_id=community_id, owner_ids=[test_user.id], name="推广", type="promotion")
+    committee = Committee(community_id=community_id, name="技术委员会", slug="tech")
+    person = PersonProfile(display_name="张三", source="manual")
+    db_session.add_all([event, campaign, committee, person])
+    db_session.flush()
+
+    mine = [test_user.id]
+    now = datetime.utcnow()
+    db_session.add_all([
+        EventTask(event_id=event.id, title="场地", status="not_started", end_date=PAST, assignee_ids=mine),
+        EventTask(event_id=event.id, title="嘉宾", status="blocked", end_date=FUTURE, assignee_ids=mine),
+        EventTask(event_id=event.id, title="宣传", status="completed", end_date=PAST, assignee_ids=mine),
+        ChecklistItem(event_id=event.id, phase="pre", title="物料", status="pending", due_date=PAST, assignee_ids=mine),
+        ChecklistItem(event_id=event.id, phase="post", title="复盘", status="skipped", due_date=PAST, assignee_ids=mine),
+        CampaignTask(campaign_id=campaign.id, title="海报", status="in_progress", deadline=PAST, assignee_ids=mine),
+        DesignTask(title="封面", community_id=community_id, status="review", due_date=PAST, assignee_id=test_user.id),
+        DesignTask(title="图标", community_id=community_id, assignee_id=test_user.id),
+        Meeting(committee_id=committee.id, community_id=community_id, title="例会",
+                scheduled_at=now - timedelta(hours=1), status="scheduled"),
+        Meeting(committee_id=committee.id, community_id=community_id, title="取消的会",
+                scheduled_at=now - timedelta(hours=1), status="cancelled"),
+        CampaignContact(campaign_id=campaign.id, person_id=person.id, status="pending", assigned_to_id=test_user.id),
+        CampaignContact(campaign_id=campaign.id, person_id=person.id, status="blocked", assigned_to_id=test_user.id),
+        CampaignContact(campaign_id=campaign.id, person_id=person.id, status="converted", assigned_to_id=test_user.id),
+    ])
+    for i, (work_status, scheduled) in enumerate(
+        [("planning", now - timedelta(days=1)), ("in_progress", None), ("completed", now - timedelta(days=1))]
+    ):
+        content = Content(title=f"内容{i}", community_id=community_id, work_status=work_status,
+                          scheduled_publish_at=scheduled, source_type="release_note" if i == 0 else None)
+        content.assignees.append(test_user)
+        db_session.add(content)
+    db_session.commit()
+    for meeting in db_session.query(Meeting).all():
+        meeting.assignees.append(test_user)
+    db_session.commit()
+
+
+class TestDashboardStats:
+    def test_each_kind_maps_statuses_and_overdue(self, client: TestClient, auth_headers: dict, assigned_items):
+        data = client.get("/api/users/me/dashboard", headers=auth_headers).json()
+
+        assert data["event_task_stats"] == _stats(planning=1, in_progress=1, completed=1, overdue=1)
+        assert data["checklist_item_stats"] == _stats(planning=1, completed=1, overdue=1)
+        assert data["campaign_task_stats"] == _stats(in_progress=1, overdue=1)
+        assert data["design_task_stats"] == _stats(planning=1, in_progress=1, overdue=1)
+        assert data["meeting_stats"] == _stats(planning=1, completed=1, overdue=1)
+        assert data["content_stats"] == _stats(planning=1, in_progress=1, completed=1, overdue=1)
+        assert data["care_contact_stats"] == _stats(planning=1, in_progress=1)
+        # 关怀联系人不计入负责事项总数
+        assert data["total_assigned_items"] == 3 + 2 + 1 + 2 + 2 + 3
+
+    def test_stats_cover_items_beyond_displayed_list(
+        self, client: TestClient, auth_headers: dict, db_session: Session, test_community: Community, test_user: User
+    ):
+        for i in range(55):
+            content = Content(title=f"稿件{i}", community_id=test_community.id, work_status="in_progress")
+            content.assignees.append(test_user)
+            db_session.add(content)
+        db_session.commit()
+
+        data = client.get("/api/users/me/dashboard", headers=auth_headers).json()
+        assert len(data["contents"]) == 50
+        assert data["content_stats"]["in_progress"] == 55
+        assert data["total_assigned_items"] == 55
+
+
+class TestWorkloadOverviewStats:
+    def _entry(self, client: TestClient, headers: dict, user_id: int) -> dict:
+        response = client.get("/api/users/me/workload-overview", headers=headers)
+        assert response.status_code == 200
+        return next(u for u in response.json()["users"] if u["user_id"] == user_id)
+
+    def test_per_user_stats(
+        self, client: TestClient, superuser_auth_headers: dict, test_user: User, test_superuser: User, assigned_items
+    ):
+        entry = self._entry(client, superuser_auth_headers, test_user.id)
+        assert entry["event_task_stats"] == _stats(planning=1, in_progress=1, completed=1, overdue=1)
+        assert entry["care_contact_stats"] == _stats(planning=1, in_progress=1)
+        assert entry["content_by_type"] == {"contribution": 2, "release_note": 1, "event_summary": 0}
+        assert entry["total"] == 3 + 2 + 1 + 2 + 2 + 3 + 3
+
+        other = self._entry(client, superuser_auth_headers, test_superuser.id)
+        assert other["total"] == 0
+        assert other["content_stats"] == _stats()
+
+    def test_query_count_independent_of_users(
+        self, client: TestClient, superuser_auth_headers: dict, db_session: Session, assigned_items
+    ):
+        def queries() -> int:
+            response = client.get("/api/users/me/workload-overview", headers=superuser_auth_headers)
+            return int(response.headers["x-db-queries"])
+
+        queries()  # 预热认证缓存
+        before = queries()
+        db_session.add_all(
+            User(username=f"member{i}", email=f"member{i}@example.com", hashed_password="x") for i in range(20)
+        )
+        db_session.commit()
+        assert queries() == before
+
+
+def test_one_grouped_statement_per_kind():
+    for kind in WORK_ITEM_KINDS.values():
+        sql = str(work_status_query(kind, [1, 2], datetime.utcnow())).upper()
+        assert "CASE" in sql and "GROUP BY" in sql
+        assert sql.count("SELECT") == 1
+
+
+def test_date_deadlines_compare_against_today():
+    now = datetime(2026, 10, 17, 23, 0)
+    assert WORK_ITEM_KINDS["event_task"].overdue_before(now) == date(2026, 10, 17)
+    assert WORK_ITEM_KINDS["meeting"].overdue_before(now) == now
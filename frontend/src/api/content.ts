@@ -1,4 +1,5 @@
 import apiClient from './index'
+import { postAndWait } from './jobs'
 
 const api = apiClient
 
@@ -21,6 +22,7 @@ export interface Content {
   assignee_ids: number[]
   community_ids: number[]
   scheduled_publish_at: string | null
+  auto_publish_status: string | null
   created_at: string
   updated_at: string
 }
@@ -100,10 +102,9 @@ export async function updateContentStatus(id: number, status: string): Promise<C
 export async function uploadFile(file: File): Promise<Content> {
   const formData = new FormData()
   formData.append('file', file)
-  const { data } = await api.post('/contents/upload', formData, {
+  return postAndWait<Content>('/contents/upload', formData, {
     headers: { 'Content-Type': 'multipart/form-data' },
   })
-  return data
 }
 
 export async function uploadCoverImage(contentId: number, file: File): Promise<Content> {
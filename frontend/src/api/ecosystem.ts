@@ -1,4 +1,5 @@
 import apiClient from './index'
+import { postAndWait } from './jobs'
 
 export interface EcosystemProject {
   id: number
@@ -83,7 +84,7 @@ export const updateProject = (pid: number, data: ProjectUpdateData) =>
   apiClient.patch<EcosystemProject>(`/ecosystem/${pid}`, data).then(r => r.data)
 
 export const syncProject = (pid: number) =>
-  apiClient.post<SyncResult>(`/ecosystem/${pid}/sync`).then(r => r.data)
+  postAndWait<SyncResult>(`/ecosystem/${pid}/sync`)
 
 export const listContributors = (pid: number, params?: {
   q?: string
@@ -0,0 +1,52 @@
+import type { AxiosRequestConfig } from 'axios'
+import apiClient from './index'
+
+// ─── 类型定义 ────────────────────────────────────────────────────────────────
+
+export type JobStatus = 'queued' | 'running' | 'succeeded' | 'failed'
+
+export interface Job<T = unknown> {
+  id: number
+  kind: string
+  status: JobStatus
+  attempts: number
+  max_attempts: number
+  result: T | null
+  error: string | null
+  error_status: number | null
+  created_at: string
+  started_at: string | null
+  finished_at: string | null
+}
+
+// ─── API 函数 ─────────────────────────────────────────────────────────────────
+
+export const getJob = <T = unknown>(id: number) =>
+  apiClient.get<Job<T>>(`/jobs/${id}`).then(r => r.data)
+
+const sleep = (ms: number) => new Promise(resolve => setTimeout(resolve, ms))
+
+/**
+ * 轮询后台任务直至结束，返回任务结果（即原同步接口的响应体）。
+ * 任务失败时抛出与接口错误相同结构的异常，调用方仍可读取 e.response.data.detail。
+ */
+export async function waitForJob<T>(job: Job<T>, intervalMs = 1000): Promise<T> {
+  let current = job
+  while (current.status === 'queued' || current.status === 'running') {
+    await sleep(intervalMs)
+    current = await getJob<T>(current.id)
+  }
+  if (current.status === 'failed') {
+    const detail = current.error || '后台任务执行失败'
+    throw Object.assign(new Error(detail), {
+      response: { status: current.error_status ?? 500, data: { detail } },
+    })
+  }
+  return current.result as T
+}
+
+/** POST 返回 202 + 任务后等待其完成 */
+export async function postAndWait<T>(url: string, data?: unknown, config?: AxiosRequestConfig): Promise<T> {
+  const { data: job } = await apiClient.post<Job<T>>(url, data, config)
+  return waitForJob(job)
+}
@@ -1,4 +1,5 @@
 import apiClient from './index'
+import { postAndWait } from './jobs'
 
 const api = apiClient
 
@@ -43,8 +44,7 @@ export interface ChannelConfig {
 }
 
 export async function publishToWechat(contentId: number): Promise<PublishRecord> {
-  const { data } = await api.post(`/publish/${contentId}/wechat`)
-  return data
+  return postAndWait<PublishRecord>(`/publish/${contentId}/wechat`)
 }
 
 export async function publishToHugo(contentId: number): Promise<PublishRecord> {
@@ -1,4 +1,5 @@
 import apiClient from './index'
+import { postAndWait } from './jobs'
 
 const api = apiClient
 
@@ -165,21 +166,18 @@ export async function rebuildAggregates(params: {
   start_date?: string
   end_date?: string
 }): Promise<{ rebuilt_count: number; period_type: string }> {
-  const { data } = await api.post('/wechat-stats/aggregates/rebuild', null, { params })
-  return data
+  return postAndWait('/wechat-stats/aggregates/rebuild', null, { params })
 }
 
 // ── Sync Functions ──
 
 export async function syncWechatArticles(): Promise<SyncArticlesResponse> {
-  const { data } = await api.post('/wechat-stats/sync/articles')
-  return data
+  return postAndWait<SyncArticlesResponse>('/wechat-stats/sync/articles')
 }
 
 export async function syncWechatStats(params: {
   start_date: string
   end_date: string
 }): Promise<SyncStatsResponse> {
-  const { data } = await api.post('/wechat-stats/sync/stats', params)
-  return data
+  return postAndWait<SyncStatsResponse>('/wechat-stats/sync/stats', params)
 }